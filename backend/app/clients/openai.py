@@ -5,7 +5,7 @@ from __future__ import annotations
 import asyncio
 import io
 import logging
-from typing import Optional
+from typing import List, Optional, Sequence
 
 from openai import AsyncOpenAI
 
@@ -134,3 +134,35 @@ class OpenAIClient:
             key_points=fallback.key_points,
             action_items=fallback.action_items,
         )
+
+    async def embed_texts(
+        self,
+        texts: Sequence[str],
+        model: str,
+        dimensions: Optional[int] = None,
+    ) -> List[List[float]]:
+        """Embed texts with the embeddings API.
+
+        Args:
+            texts: Texts to embed, in one request.
+            model: Embedding model name.
+            dimensions: Output size for models that can shorten embeddings
+                (text-embedding-3-*); None keeps the model default.
+
+        Returns:
+            One vector per text, in input order.
+
+        Raises:
+            AIProcessingError: If the embeddings API call fails.
+        """
+        try:
+            response = await self._client.embeddings.create(
+                model=model,
+                input=list(texts),
+                extra_body={"dimensions": dimensions} if dimensions else None,
+            )
+        except Exception as exc:
+            logger.error("Embedding request failed: %s", exc)
+            raise AIProcessingError(detail=f"Embedding failed: {exc}") from exc
+        ordered = sorted(response.data, key=lambda item: item.index)
+        return [list(item.embedding) for item in ordered]
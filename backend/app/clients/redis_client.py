@@ -1,18 +1,16 @@
-"""Redis client for pub/sub event notifications."""
+"""Redis client for pub/sub event notifications and small cached values."""
 
 from __future__ import annotations
 
 import json
 import logging
-from typing import Optional, Any, Dict
-
-try:
-    import redis.asyncio as redis
-except ImportError:
-    redis = None  # type: ignore[assignment]
+from typing import TYPE_CHECKING, Optional, Any, Dict, List
 
 from app.config import Settings
 
+if TYPE_CHECKING:
+    import redis.asyncio as redis
+
 logger = logging.getLogger(__name__)
 
 
@@ -34,6 +32,24 @@ class NullRedisClient:
     async def get_next_event(self) -> Optional[Dict[str, Any]]:
         raise RuntimeError("Redis is disabled in this environment")
 
+    async def cache_get(self, key: str) -> Optional[str]:
+        return None
+
+    async def cache_set(self, key: str, value: str, ttl_seconds: int) -> None:
+        pass
+
+    async def cache_delete(self, *keys: str) -> None:
+        pass
+
+    async def cache_incr(self, key: str) -> int:
+        return 0
+
+    async def cache_get_many(self, *keys: str) -> List[Optional[str]]:
+        return [None] * len(keys)
+
+    async def cache_bump(self, keys: List[str], ttl_seconds: int) -> None:
+        pass
+
 
 class RedisClient:
     """Redis client for publishing and subscribing to memory events."""
@@ -53,6 +69,9 @@ class RedisClient:
     async def connect(self) -> None:
         """Establish connection to Redis."""
         if not self._client:
+            # Imported here so NullRedisClient users (the Lambda worker) never load redis
+            import redis.asyncio as redis
+
             self._client = await redis.from_url(
                 self.settings.redis_url,
                 encoding="utf-8",
@@ -137,3 +156,98 @@ class RedisClient:
                 logger.error("Failed to parse Redis message: %s", message["data"])
                 return None
         return None
+
+    async def cache_get(self, key: str) -> Optional[str]:
+        """Return a cached string value, or None if missing or Redis fails."""
+        if not self._client:
+            await self.connect()
+        try:
+            return await self._client.get(key)
+        except Exception as e:
+            logger.warning("Redis GET %s failed: %s", key, e)
+            return None
+
+    async def cache_set(self, key: str, value: str, ttl_seconds: int) -> None:
+        """Store a string value with a TTL. Failures are logged, not raised."""
+        if not self._client:
+            await self.connect()
+        try:
+            await self._client.set(key, value, ex=ttl_seconds)
+        except Exception as e:
+            logger.warning("Redis SET %s failed: %s", key, e)
+
+    async def cache_delete(self, *keys: str) -> None:
+        """Delete cached keys. Failures are logged, not raised."""
+        if not keys:
+            return
+        if not self._client:
+            await self.connect()
+        try:
+            await self._client.delete(*keys)
+        except Exception as e:
+            logger.warning("Redis DEL failed: %s", e)
+
+    async def cache_incr(self, key: str) -> int:
+        """Atomically increment a counter key and return the new value.
+
+        Returns 0 if Redis is unavailable.
+        """
+        if not self._client:
+            await self.connect()
+        try:
+            return await self._client.incr(key)
+        except Exception as e:
+            logger.warning("Redis INCR %s failed: %s", key, e)
+            return 0
+
+    async def cache_get_many(self, *keys: str) -> List[Optional[str]]:
+        """Return several cached values in one round trip (None for misses or on failure)."""
+        if not self._client:
+            await self.connect()
+        try:
+            return await self._client.mget(*keys)
+        except Exception as e:
+            logger.warning("Redis MGET failed: %s", e)
+            return [None] * len(keys)
+
+    async def cache_bump(self, keys: List[str], ttl_seconds: int) -> None:
+        """Increment counter keys and refresh their TTL in one pipeline.
+
+        Failures are logged, not raised.
+        """
+        if not keys:
+            return
+        if not self._client:
+            await self.connect()
+        try:
+            async with self._client.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.incr(key)
+                    pipe.expire(key, ttl_seconds)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning("Redis INCR/EXPIRE of %d keys failed: %s", len(keys), e)
+
+
+_shared_client: Optional[RedisClient] = None
+
+
+def get_shared_redis_client(settings: Settings) -> RedisClient:
+    """Get or create the process-wide RedisClient (lazy singleton).
+
+    Request handlers share its connection pool instead of opening one per
+    request; ``close_shared_redis_client`` releases it on shutdown. SSE
+    streams keep their own client, since each holds a subscription.
+    """
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = RedisClient(settings)
+    return _shared_client
+
+
+async def close_shared_redis_client() -> None:
+    """Disconnect the process-wide RedisClient, if one was created."""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.disconnect()
+        _shared_client = None
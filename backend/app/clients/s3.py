@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Optional
+from typing import List, Optional, Sequence
 
 import aioboto3
 
@@ -12,6 +12,9 @@ from app.exceptions import S3UploadError
 
 logger = logging.getLogger(__name__)
 
+# S3 DeleteObjects accepts at most 1000 keys per call
+S3_DELETE_BATCH_SIZE = 1000
+
 
 class S3Client:
     """Async wrapper around S3 operations using aioboto3."""
@@ -65,6 +68,123 @@ class S3Client:
             logger.error("S3 upload failed for key=%s: %s", key, exc)
             raise S3UploadError(detail=f"Failed to upload {key}: {exc}") from exc
 
+    async def create_multipart_upload(
+        self,
+        key: str,
+        content_type: str = "audio/mpeg",
+    ) -> str:
+        """Start a multipart upload and return its UploadId.
+
+        Raises:
+            S3UploadError: If the upload cannot be started.
+        """
+        bucket = self._settings.s3_bucket_name
+        try:
+            async with self._session.client(
+                "s3",
+                endpoint_url=self._settings.aws_endpoint_url,
+            ) as s3:
+                response = await s3.create_multipart_upload(
+                    Bucket=bucket, Key=key, ContentType=content_type,
+                )
+            return response["UploadId"]
+        except Exception as exc:
+            logger.error("S3 multipart start failed for key=%s: %s", key, exc)
+            raise S3UploadError(
+                detail=f"Failed to start multipart upload of {key}: {exc}"
+            ) from exc
+
+    async def upload_part(
+        self,
+        key: str,
+        upload_id: str,
+        part_number: int,
+        data: bytes,
+    ) -> str:
+        """Upload one part of a multipart upload and return its ETag.
+
+        Every part but the last must be at least 5 MiB.
+
+        Raises:
+            S3UploadError: If the part upload fails.
+        """
+        bucket = self._settings.s3_bucket_name
+        try:
+            async with self._session.client(
+                "s3",
+                endpoint_url=self._settings.aws_endpoint_url,
+            ) as s3:
+                response = await s3.upload_part(
+                    Bucket=bucket,
+                    Key=key,
+                    UploadId=upload_id,
+                    PartNumber=part_number,
+                    Body=data,
+                )
+            return response["ETag"]
+        except Exception as exc:
+            logger.error(
+                "S3 part upload failed for key=%s part=%d: %s", key, part_number, exc
+            )
+            raise S3UploadError(
+                detail=f"Failed to upload part {part_number} of {key}: {exc}"
+            ) from exc
+
+    async def complete_multipart_upload(
+        self,
+        key: str,
+        upload_id: str,
+        parts: Sequence[dict],
+    ) -> str:
+        """Assemble uploaded parts into the object and return its S3 URL.
+
+        Args:
+            parts: ``{"PartNumber": n, "ETag": etag}`` for every part, in order.
+
+        Raises:
+            S3UploadError: If S3 rejects the parts.
+        """
+        bucket = self._settings.s3_bucket_name
+        try:
+            async with self._session.client(
+                "s3",
+                endpoint_url=self._settings.aws_endpoint_url,
+            ) as s3:
+                await s3.complete_multipart_upload(
+                    Bucket=bucket,
+                    Key=key,
+                    UploadId=upload_id,
+                    MultipartUpload={"Parts": list(parts)},
+                )
+            url = f"s3://{bucket}/{key}"
+            logger.info("Completed multipart upload %s (%d parts)", url, len(parts))
+            return url
+        except Exception as exc:
+            logger.error("S3 multipart completion failed for key=%s: %s", key, exc)
+            raise S3UploadError(
+                detail=f"Failed to complete multipart upload of {key}: {exc}"
+            ) from exc
+
+    async def abort_multipart_upload(self, key: str, upload_id: str) -> bool:
+        """Abort a multipart upload, discarding its parts.
+
+        Returns:
+            False if S3 could not be reached or refused (logged, not raised).
+        """
+        bucket = self._settings.s3_bucket_name
+        try:
+            async with self._session.client(
+                "s3",
+                endpoint_url=self._settings.aws_endpoint_url,
+            ) as s3:
+                await s3.abort_multipart_upload(
+                    Bucket=bucket, Key=key, UploadId=upload_id,
+                )
+            return True
+        except Exception as exc:
+            logger.error("S3 multipart abort failed for key=%s: %s", key, exc)
+            return False
+
     async def get_file(self, key: str) -> bytes:
         """Download a file from S3 and return its bytes.
 
@@ -91,6 +211,51 @@ class S3Client:
             logger.error("S3 download failed for key=%s: %s", key, exc)
             raise S3UploadError(detail=f"Failed to download {key}: {exc}") from exc
 
+    async def delete_objects(self, keys: Sequence[str]) -> List[str]:
+        """Delete many objects with DeleteObjects, 1000 keys per call.
+
+        Args:
+            keys: S3 object keys to delete.
+
+        Returns:
+            Keys that could not be deleted (empty on success).
+        """
+        if not keys:
+            return []
+        bucket = self._settings.s3_bucket_name
+        failed: List[str] = []
+        try:
+            async with self._session.client(
+                "s3",
+                endpoint_url=self._settings.aws_endpoint_url,
+            ) as s3:
+                for start in range(0, len(keys), S3_DELETE_BATCH_SIZE):
+                    chunk = keys[start:start + S3_DELETE_BATCH_SIZE]
+                    try:
+                        response = await s3.delete_objects(
+                            Bucket=bucket,
+                            Delete={
+                                "Objects": [{"Key": key} for key in chunk],
+                                "Quiet": True,
+                            },
+                        )
+                    except Exception as exc:
+                        logger.error("S3 batch delete failed (%d keys): %s", len(chunk), exc)
+                        failed.extend(chunk)
+                        continue
+                    for error in response.get("Errors", []):
+                        logger.error(
+                            "S3 delete failed for key=%s: %s",
+                            error.get("Key"),
+                            error.get("Message"),
+                        )
+                        failed.append(error.get("Key"))
+        except Exception as exc:
+            logger.error("S3 batch delete failed: %s", exc)
+            return list(keys)
+        logger.info("Deleted %d objects from s3://%s", len(keys) - len(failed), bucket)
+        return failed
+
     async def generate_presigned_url(
         self,
         key: str,
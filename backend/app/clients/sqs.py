@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Dict, List
+from typing import Dict, List, Sequence
+from uuid import UUID
 
 import aioboto3
 
@@ -13,6 +15,9 @@ from app.models.memory import MemoryProcessRequest
 
 logger = logging.getLogger(__name__)
 
+# SQS SendMessageBatch accepts at most 10 entries per call
+SQS_BATCH_SIZE = 10
+
 
 class SQSClient:
     """Async wrapper around SQS operations using aioboto3."""
@@ -73,6 +78,123 @@ class SQSClient:
                 detail=f"Failed to enqueue processing for memory {payload.memory_id}: {exc}"
             ) from exc
 
+    async def send_message_batch(
+        self,
+        payloads: Sequence[MemoryProcessRequest],
+        max_concurrency: int = 4,
+    ) -> List[UUID]:
+        """Send many processing jobs with SendMessageBatch.
+
+        Payloads go out in chunks of 10 over one client, with at most
+        ``max_concurrency`` batch calls in flight to stay under SQS and
+        downstream throughput limits.
+
+        Args:
+            payloads: Jobs to enqueue.
+            max_concurrency: Maximum concurrent SendMessageBatch calls.
+
+        Returns:
+            Memory IDs whose message could not be sent (empty on success).
+        """
+        if not payloads:
+            return []
+        queue_url = self._settings.sqs_queue_url
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def send_chunk(sqs, chunk: Sequence[MemoryProcessRequest]) -> List[UUID]:
+            entries = [
+                {
+                    "Id": str(index),
+                    "MessageBody": payload.model_dump_json(),
+                    "MessageAttributes": {
+                        "correlation_id": {
+                            "DataType": "String",
+                            "StringValue": payload.correlation_id,
+                        },
+                    },
+                }
+                for index, payload in enumerate(chunk)
+            ]
+            async with semaphore:
+                try:
+                    response = await sqs.send_message_batch(
+                        QueueUrl=queue_url, Entries=entries,
+                    )
+                except Exception as exc:
+                    logger.error("SQS batch publish failed (%d jobs): %s", len(chunk), exc)
+                    return [payload.memory_id for payload in chunk]
+            failed = response.get("Failed", [])
+            for entry in failed:
+                logger.error(
+                    "SQS batch entry failed for memory_id=%s: %s",
+                    chunk[int(entry["Id"])].memory_id,
+                    entry.get("Message", entry.get("Code")),
+                )
+            return [chunk[int(entry["Id"])].memory_id for entry in failed]
+
+        chunks = [
+            payloads[start:start + SQS_BATCH_SIZE]
+            for start in range(0, len(payloads), SQS_BATCH_SIZE)
+        ]
+        try:
+            async with self._session.client(
+                "sqs",
+                endpoint_url=self._settings.aws_endpoint_url,
+            ) as sqs:
+                results = await asyncio.gather(
+                    *(send_chunk(sqs, chunk) for chunk in chunks)
+                )
+        except Exception as exc:
+            logger.error("SQS batch publish failed: %s", exc)
+            return [payload.memory_id for payload in payloads]
+
+        failed_ids = [memory_id for result in results for memory_id in result]
+        logger.info(
+            "SQS batch sent: %d jobs in %d batches, %d failed",
+            len(payloads), len(chunks), len(failed_ids),
+        )
+        return failed_ids
+
+    async def release_messages(self, receipt_handles: Sequence[str]) -> None:
+        """Make received messages visible again right away.
+
+        Sets their visibility timeout to 0 with ChangeMessageVisibilityBatch,
+        so a message the consumer gave back without trying is redelivered
+        now instead of after the queue's visibility timeout. Best-effort:
+        failures are logged.
+
+        Args:
+            receipt_handles: Receipt handles of the messages to release.
+        """
+        if not receipt_handles:
+            return
+        queue_url = self._settings.sqs_queue_url
+        try:
+            async with self._session.client(
+                "sqs",
+                endpoint_url=self._settings.aws_endpoint_url,
+            ) as sqs:
+                for start in range(0, len(receipt_handles), SQS_BATCH_SIZE):
+                    chunk = receipt_handles[start:start + SQS_BATCH_SIZE]
+                    response = await sqs.change_message_visibility_batch(
+                        QueueUrl=queue_url,
+                        Entries=[
+                            {
+                                "Id": str(index),
+                                "ReceiptHandle": handle,
+                                "VisibilityTimeout": 0,
+                            }
+                            for index, handle in enumerate(chunk)
+                        ],
+                    )
+                    for entry in response.get("Failed", []):
+                        logger.warning(
+                            "SQS visibility reset failed: %s",
+                            entry.get("Message", entry.get("Code")),
+                        )
+        except Exception as exc:
+            logger.warning("SQS visibility reset failed: %s", exc)
+
     async def receive_messages(
         self,
         max_messages: int = 1,
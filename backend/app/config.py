@@ -33,11 +33,98 @@ class Settings(BaseSettings):
     db_user: str = "postgres"
     db_password: str = ""
 
+    # Connection pool (per engine). pool_recycle < 0 disables recycling;
+    # pre-ping trades a round trip per checkout for never handing out a
+    # dead connection. Statement cache size 0 is needed behind PgBouncer
+    # in transaction mode.
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout_seconds: float = 30.0
+    db_pool_recycle_seconds: int = 1800
+    db_pool_pre_ping: bool = True
+    db_statement_cache_size: int = 100
+
+    # SQL logging, independent of debug; slow-query log threshold (0 = off)
+    db_echo: bool = False
+    db_slow_query_ms: float = 500.0
+
+    # Read replica for read-only queries (same credentials and database name).
+    # Unset means every query goes to the primary.
+    db_replica_host: Optional[str] = None
+    db_replica_port: Optional[int] = None
+    db_replica_retry_seconds: float = 30.0
+    db_replica_max_lag_seconds: float = 5.0
+    db_replica_check_interval_seconds: float = 10.0
+
+    # Transcript storage compression: "gzip", or "zstd" (needs zstandard)
+    transcript_compression: str = "gzip"
+
+    # GET /memories/stats: seconds between refreshes of the Postgres
+    # memory_daily_stats view (0 disables the API's refresh loop)
+    stats_refresh_seconds: float = 60.0
+
+    # List totals: exact below the threshold, planner estimate above it
+    count_exact_threshold: int = 10_000
+    count_cache_ttl_seconds: int = 60
+
+    # GET /memories/{id} cache: TTL for "ready" memories, and for memories
+    # still uploading/processing (or failed), which clients poll
+    memory_cache_ready_ttl_seconds: int = 600
+    memory_cache_pending_ttl_seconds: int = 5
+
+    # Share one query among concurrent identical GET /memories and
+    # GET /memories/{id} requests within this process
+    single_flight_enabled: bool = True
+
+    # GET /memories/changes and the semantic index only read changes at
+    # least this old, since timestamps are taken at write time and commits
+    # land out of order; keep it above the longest write transaction (and
+    # host clock skew)
+    sync_settle_seconds: float = 30.0
+
+    # Deletion tombstones are kept this long; GET /memories/changes answers
+    # older cursors with 410 (the client resyncs from scratch). Seconds
+    # between prune sweeps (0 disables)
+    tombstone_retention_seconds: int = 30 * 24 * 3600
+    tombstone_prune_seconds: float = 3600.0
+
     # OpenAI
     openai_api_key: str = ""
     openai_model: str = "gpt-4-turbo-preview"
     whisper_model: str = "whisper-1"
 
+    # Semantic search: embedding provider ("openai", "hashing" or "none"),
+    # and where the API keeps its memory-mapped vector index
+    embedding_provider: str = "openai"
+    embedding_model: str = "text-embedding-3-small"
+    embedding_dimensions: int = 512
+    vector_index_dir: str = "/tmp/rawk-vector-index"
+    vector_index_sync_seconds: float = 5.0
+
+    # Worker (Lambda SQS batch processing)
+    worker_max_concurrency: int = 5
+    worker_time_margin_seconds: float = 15.0
+
+    # Bulk operations: rows per request, concurrent SQS batch calls
+    bulk_max_items: int = 1000
+    bulk_max_concurrency: int = 4
+
+    # POST /upload/bulk: concurrent S3 uploads, largest accepted file
+    # (zip entries are checked before they are decompressed)
+    bulk_upload_concurrency: int = 8
+    bulk_upload_max_file_bytes: int = 200 * 1024 * 1024
+
+    # POST /upload with audio that is already stored (same SHA-256):
+    # "existing" returns the existing memory, "reuse" creates a new memory
+    # sharing its S3 object and processing results, "off" stores it again
+    upload_dedup_policy: str = "existing"
+
+    # Resumable uploads: chunk (S3 part) size, at least 5 MiB; idle time
+    # before a session expires; seconds between expiry sweeps (0 disables)
+    upload_chunk_size_bytes: int = 8 * 1024 * 1024
+    upload_session_ttl_seconds: int = 24 * 3600
+    upload_session_reap_seconds: float = 300.0
+
     # App
     environment: str = "development"
     debug: bool = True
@@ -50,6 +137,17 @@ class Settings(BaseSettings):
             f"@{self.db_host}:{self.db_port}/{self.db_name}"
         )
 
+    @property
+    def replica_database_url(self) -> Optional[str]:
+        """Build the read replica connection string, or None if not configured."""
+        if not self.db_replica_host:
+            return None
+        return (
+            f"postgresql+asyncpg://{self.db_user}:{self.db_password}"
+            f"@{self.db_replica_host}:{self.db_replica_port or self.db_port}"
+            f"/{self.db_name}"
+        )
+
     model_config = SettingsConfigDict(
         env_file=".env", case_sensitive=False, extra="ignore"
     )
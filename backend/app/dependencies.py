@@ -7,17 +7,34 @@ into a clean dependency graph using FastAPI's Depends().
 from __future__ import annotations
 
 from collections.abc import AsyncGenerator
+from typing import TYPE_CHECKING, Optional
 
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.clients.redis_client import NullRedisClient, RedisClient
+from app.clients.redis_client import (
+    NullRedisClient,
+    RedisClient,
+    get_shared_redis_client,
+)
 from app.clients.s3 import S3Client
 from app.clients.sqs import SQSClient
 from app.config import Settings, get_settings
-from app.repositories.database import get_db_session
+from app.repositories.database import get_db_session, get_replica_session
 from app.repositories.memory_repository import MemoryRepository
+from app.repositories.replica import get_replica_health
+from app.repositories.upload_session_repository import UploadSessionRepository
+from app.services.count_strategy import MemoryCountStrategy
+from app.services.embeddings import EmbeddingProvider
+from app.services.embeddings import get_embedding_provider as _get_embedding_provider
+from app.services.memory_cache import MemoryCache
 from app.services.memory_service import MemoryService
+from app.services.upload_session_service import UploadSessionService
+from app.utils.single_flight import SingleFlight
+from app.utils.single_flight import get_single_flight as _get_single_flight
+
+if TYPE_CHECKING:
+    from app.services.semantic_index import SemanticIndex
 
 
 def get_s3_client(
@@ -37,17 +54,79 @@ def get_sqs_client(
 def get_redis_client(
     settings: Settings = Depends(get_settings),
 ) -> RedisClient:
-    """Provide a RedisClient or NullRedisClient based on settings."""
+    """Provide the process-wide RedisClient, or a NullRedisClient when disabled."""
     if not settings.redis_enabled:
         return NullRedisClient()
-    return RedisClient(settings)
+    return get_shared_redis_client(settings)
 
 
 def get_memory_repository(
     session: AsyncSession = Depends(get_db_session),
+    replica_session: Optional[AsyncSession] = Depends(get_replica_session),
+    settings: Settings = Depends(get_settings),
 ) -> MemoryRepository:
-    """Provide a MemoryRepository instance."""
-    return MemoryRepository(session)
+    """Provide a MemoryRepository that reads from the replica when configured."""
+    return MemoryRepository(
+        session,
+        replica_session,
+        get_replica_health(settings),
+        transcript_encoding=settings.transcript_compression,
+    )
+
+
+def get_count_strategy(
+    repository: MemoryRepository = Depends(get_memory_repository),
+    redis_client: RedisClient = Depends(get_redis_client),
+    settings: Settings = Depends(get_settings),
+) -> MemoryCountStrategy:
+    """Provide the list-total strategy configured from settings."""
+    return MemoryCountStrategy(
+        repository,
+        redis_client,
+        exact_threshold=settings.count_exact_threshold,
+        cache_ttl_seconds=settings.count_cache_ttl_seconds,
+    )
+
+
+def get_memory_cache(
+    redis_client: RedisClient = Depends(get_redis_client),
+    settings: Settings = Depends(get_settings),
+) -> MemoryCache:
+    """Provide the GET /memories/{id} response cache configured from settings."""
+    return MemoryCache(
+        redis_client,
+        ready_ttl_seconds=settings.memory_cache_ready_ttl_seconds,
+        pending_ttl_seconds=settings.memory_cache_pending_ttl_seconds,
+    )
+
+
+def get_embedding_provider(
+    settings: Settings = Depends(get_settings),
+) -> Optional[EmbeddingProvider]:
+    """Provide the configured embedding provider, or None when disabled."""
+    return _get_embedding_provider(settings)
+
+
+def get_semantic_index(
+    provider: Optional[EmbeddingProvider] = Depends(get_embedding_provider),
+    settings: Settings = Depends(get_settings),
+) -> Optional[SemanticIndex]:
+    """Provide the process-wide vector index for the provider's model."""
+    if provider is None:
+        return None
+    # Imported here so NumPy is only loaded when semantic search is enabled
+    from app.services.semantic_index import get_semantic_index as _get_index
+
+    return _get_index(provider.model, provider.dimensions, settings)
+
+
+def get_single_flight(
+    settings: Settings = Depends(get_settings),
+) -> Optional[SingleFlight]:
+    """Provide the process-wide read coalescer, or None when disabled."""
+    if not settings.single_flight_enabled:
+        return None
+    return _get_single_flight()
 
 
 def get_memory_service(
@@ -55,6 +134,45 @@ def get_memory_service(
     s3_client: S3Client = Depends(get_s3_client),
     sqs_client: SQSClient = Depends(get_sqs_client),
     redis_client: RedisClient = Depends(get_redis_client),
+    count_strategy: MemoryCountStrategy = Depends(get_count_strategy),
+    embedding_provider: Optional[EmbeddingProvider] = Depends(get_embedding_provider),
+    semantic_index: Optional[SemanticIndex] = Depends(get_semantic_index),
+    memory_cache: MemoryCache = Depends(get_memory_cache),
+    single_flight: Optional[SingleFlight] = Depends(get_single_flight),
+    settings: Settings = Depends(get_settings),
 ) -> MemoryService:
     """Provide a fully-wired MemoryService instance."""
-    return MemoryService(repository, s3_client, sqs_client, redis_client)
+    return MemoryService(
+        repository,
+        s3_client,
+        sqs_client,
+        redis_client,
+        count_strategy,
+        bulk_max_items=settings.bulk_max_items,
+        bulk_max_concurrency=settings.bulk_max_concurrency,
+        bulk_upload_concurrency=settings.bulk_upload_concurrency,
+        bulk_upload_max_file_bytes=settings.bulk_upload_max_file_bytes,
+        embedding_provider=embedding_provider,
+        semantic_index=semantic_index,
+        memory_cache=memory_cache,
+        single_flight=single_flight,
+        dedup_policy=settings.upload_dedup_policy,
+        sync_settle_seconds=settings.sync_settle_seconds,
+        tombstone_retention_seconds=settings.tombstone_retention_seconds,
+    )
+
+
+def get_upload_session_service(
+    session: AsyncSession = Depends(get_db_session),
+    memory_service: MemoryService = Depends(get_memory_service),
+    s3_client: S3Client = Depends(get_s3_client),
+    settings: Settings = Depends(get_settings),
+) -> UploadSessionService:
+    """Provide the resumable upload service configured from settings."""
+    return UploadSessionService(
+        UploadSessionRepository(session),
+        memory_service,
+        s3_client,
+        chunk_size=settings.upload_chunk_size_bytes,
+        ttl_seconds=settings.upload_session_ttl_seconds,
+    )
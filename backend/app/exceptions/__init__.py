@@ -5,15 +5,29 @@ from app.exceptions.base import (
     AIValidationError,
     AudioProcessingError,
     DatabaseError,
+    DuplicateContentError,
+    FeatureDisabledError,
+    InvalidRequestError,
     RawkException,
     ResourceNotFoundError,
     S3UploadError,
     SQSPublishError,
+    StatusConflictError,
+    SyncCursorExpiredError,
+    UploadOffsetConflictError,
+    UploadSessionExpiredError,
 )
 
 __all__ = [
     "RawkException",
     "ResourceNotFoundError",
+    "InvalidRequestError",
+    "StatusConflictError",
+    "DuplicateContentError",
+    "UploadOffsetConflictError",
+    "UploadSessionExpiredError",
+    "SyncCursorExpiredError",
+    "FeatureDisabledError",
     "S3UploadError",
     "SQSPublishError",
     "AIProcessingError",
@@ -26,6 +26,55 @@ class ResourceNotFoundError(RawkException):
     detail = "Resource not found"
 
 
+class InvalidRequestError(RawkException):
+    """Raised when request parameters are well-formed but unusable (e.g. a bad cursor)."""
+
+    status_code = 400
+    detail = "Invalid request"
+
+
+class StatusConflictError(RawkException):
+    """Raised when a memory is not in the status a transition expects."""
+
+    status_code = 409
+    detail = "Memory status changed concurrently"
+
+
+class DuplicateContentError(RawkException):
+    """Raised when identical audio is being stored concurrently by another upload."""
+
+    status_code = 409
+    detail = "The same audio is already being uploaded"
+
+
+class UploadOffsetConflictError(RawkException):
+    """Raised when a resumable upload chunk does not start at the committed offset."""
+
+    status_code = 409
+    detail = "Chunk offset does not match the committed offset"
+
+
+class UploadSessionExpiredError(RawkException):
+    """Raised when a resumable upload session has expired or was aborted."""
+
+    status_code = 410
+    detail = "Upload session is no longer open"
+
+
+class SyncCursorExpiredError(RawkException):
+    """Raised when a delta-sync cursor predates the retained tombstones."""
+
+    status_code = 410
+    detail = "Sync cursor expired; sync again from the beginning"
+
+
+class FeatureDisabledError(RawkException):
+    """Raised when an endpoint depends on a feature turned off in settings."""
+
+    status_code = 503
+    detail = "Feature is not enabled"
+
+
 class S3UploadError(RawkException):
     """Raised when an S3 upload or download fails."""
 
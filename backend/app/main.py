@@ -2,18 +2,23 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from collections.abc import AsyncGenerator
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
+from app.clients.redis_client import close_shared_redis_client
 from app.config import get_settings
 from app.exceptions import RawkException
 from app.repositories.database import dispose_engine, init_db
-from app.routers import events, memories, processing, upload
+from app.routers import action_items, events, memories, metrics, processing, upload
+from app.services.stats_refresher import start_stats_refresher
+from app.services.tombstone_pruner import start_tombstone_pruner
+from app.services.upload_session_service import start_upload_session_reaper
 
 logger = logging.getLogger(__name__)
 
@@ -25,7 +30,21 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     if settings.environment == "development":
         await init_db(settings)
         logger.info("Database tables created (development mode)")
+    background = [
+        task
+        for task in (
+            start_stats_refresher(settings),
+            start_upload_session_reaper(settings),
+            start_tombstone_pruner(settings),
+        )
+        if task is not None
+    ]
     yield
+    for task in background:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+    await close_shared_redis_client()
     await dispose_engine()
     logger.info("Database engine disposed")
 
@@ -64,8 +83,10 @@ async def rawk_exception_handler(request: Request, exc: RawkException) -> JSONRe
 # Routers
 app.include_router(upload.router)
 app.include_router(memories.router)
+app.include_router(action_items.router)
 app.include_router(processing.router)
 app.include_router(events.router)
+app.include_router(metrics.router)
 
 
 @app.get("/health")
@@ -82,9 +103,11 @@ async def root() -> dict:
         "version": "0.1.0",
         "endpoints": {
             "health": "/health",
+            "metrics": "/metrics",
             "docs": "/docs",
             "upload": "/upload",
             "memories": "/memories",
+            "action_items": "/action-items",
             "events": "/events/memories",
         },
     }
@@ -0,0 +1,44 @@
+"""Pydantic models for action items extracted from memories."""
+
+from datetime import datetime
+from enum import Enum
+from typing import List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict
+
+
+class ActionItemStatus(str, Enum):
+    """Whether an action item still needs doing."""
+
+    OPEN = "open"
+    DONE = "done"
+
+
+class ActionItemResponse(BaseModel):
+    """An action item with a reference to the memory it came from."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    memory_id: UUID
+    memory_title: Optional[str] = None
+    position: int
+    text: str
+    status: ActionItemStatus
+    created_at: datetime
+    updated_at: datetime
+
+
+class ActionItemListResponse(BaseModel):
+    """A keyset page of action items, newest first."""
+
+    items: List[ActionItemResponse]
+    next_cursor: Optional[str] = None
+    has_more: bool
+
+
+class ActionItemUpdate(BaseModel):
+    """Fields of an action item a client may change."""
+
+    status: ActionItemStatus
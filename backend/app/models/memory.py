@@ -1,11 +1,11 @@
 """Pydantic models for the Memory domain."""
 
-from datetime import datetime
+from datetime import date, datetime, timezone
 from enum import Enum
-from typing import List, Optional
+from typing import Dict, List, Optional
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 
 class MemoryStatus(str, Enum):
@@ -41,20 +41,180 @@ class MemoryResponse(MemoryBase):
     key_points: Optional[List[str]] = None
     action_items: Optional[List[str]] = None
     duration: Optional[float] = None
+    duplicate_of: Optional[UUID] = None
     created_at: datetime
     updated_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
 
 
+class MemoryListItem(MemoryBase):
+    """Lightweight memory projection for list responses.
+
+    The heavy fields (transcript, key points, action items) are only
+    present when requested with ``include=``; otherwise they are left
+    unset and omitted from the JSON.
+    """
+
+    id: UUID
+    audio_url: str
+    status: MemoryStatus
+    summary: Optional[str] = None
+    duration: Optional[float] = None
+    created_at: datetime
+    updated_at: datetime
+    transcript: Optional[str] = None
+    key_points: Optional[List[str]] = None
+    action_items: Optional[List[str]] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class MemoryListResponse(BaseModel):
-    """Paginated list of memories."""
+    """Paginated list of memories.
 
-    items: List[MemoryResponse]
-    total: int
-    page: int
+    Page-number requests always carry ``total`` and ``page``. Cursor
+    requests leave them unset unless the total is explicitly requested;
+    ``next_cursor`` continues the listing from the last item.
+    ``total_is_exact`` is False when ``total`` is a planner estimate.
+    """
+
+    items: List[MemoryListItem]
+    total: Optional[int] = None
+    total_is_exact: Optional[bool] = None
+    page: Optional[int] = None
     page_size: int
     has_next: bool
+    next_cursor: Optional[str] = None
+
+
+class MemoryChangesResponse(BaseModel):
+    """Memories changed and deleted since a sync cursor, oldest first.
+
+    Pass ``next_cursor`` as ``since`` on the next call; keep calling while
+    ``has_more`` is True.
+    """
+
+    items: List[MemoryListItem]
+    deleted: List[UUID]
+    next_cursor: Optional[str] = None
+    has_more: bool
+
+
+class MemorySearchHit(MemoryListItem):
+    """A memory matched by full-text search, with its relevance."""
+
+    rank: float
+    snippet: Optional[str] = None
+
+
+class MemorySearchResponse(BaseModel):
+    """Ranked full-text search results."""
+
+    query: str
+    items: List[MemorySearchHit]
+
+
+class MemorySemanticHit(MemoryListItem):
+    """A memory matched by semantic search, with its cosine similarity."""
+
+    score: float
+
+
+class MemorySemanticSearchResponse(BaseModel):
+    """Semantic search results, most similar first."""
+
+    query: str
+    items: List[MemorySemanticHit]
+
+
+class MemoryDailyStats(BaseModel):
+    """Memories created on one day (UTC), by current status."""
+
+    day: date
+    count: int
+    by_status: Dict[str, int]
+
+
+class MemoryStatsResponse(BaseModel):
+    """Dashboard aggregates over memories created in a date range.
+
+    ``refreshed_at`` is when the pre-aggregated figures were computed, or
+    None when they were computed for this request.
+    """
+
+    date_from: Optional[date] = None
+    date_to: Optional[date] = None
+    total: int
+    by_status: Dict[str, int]
+    average_duration: Optional[float] = None
+    daily: List[MemoryDailyStats]
+    refreshed_at: Optional[datetime] = None
+
+
+# Upper bound on ids per batch-get request (one IN (...) query)
+MAX_BATCH_GET_IDS = 100
+
+
+class MemoryBatchGetRequest(BaseModel):
+    """Ids to fetch in one batch-get call."""
+
+    ids: List[UUID] = Field(..., min_length=1, max_length=MAX_BATCH_GET_IDS)
+
+
+class MemoryBatchGetResponse(BaseModel):
+    """Memories in request order, plus the requested ids that do not exist."""
+
+    items: List[MemoryResponse]
+    missing: List[UUID]
+
+
+# Upper bound on explicit ids in one bulk request
+MAX_BULK_IDS = 1000
+
+
+class MemoryBulkFilter(BaseModel):
+    """Selects the memories a bulk operation applies to.
+
+    Criteria are combined with AND; at least one is required so an empty
+    body can never match the whole table. ``created_to`` is exclusive.
+    """
+
+    ids: Optional[List[UUID]] = Field(default=None, min_length=1, max_length=MAX_BULK_IDS)
+    status: Optional[MemoryStatus] = None
+    created_from: Optional[datetime] = None
+    created_to: Optional[datetime] = None
+
+    @model_validator(mode="after")
+    def _check_criteria(self) -> "MemoryBulkFilter":
+        if (
+            self.ids is None
+            and self.status is None
+            and self.created_from is None
+            and self.created_to is None
+        ):
+            raise ValueError("At least one of ids, status, created_from, created_to is required")
+        # Timestamps are stored as naive UTC
+        for field in ("created_from", "created_to"):
+            value = getattr(self, field)
+            if value is not None and value.tzinfo is not None:
+                setattr(self, field, value.astimezone(timezone.utc).replace(tzinfo=None))
+        return self
+
+
+class MemoryBulkReport(BaseModel):
+    """Outcome of one bulk call.
+
+    ``processed`` memories were deleted or re-queued; ``failed`` lists the
+    re-queued ones whose job was not enqueued (deleted memories' audio is
+    removed after commit, so deletes never fail here). ``has_more`` means
+    more memories still match the filter: repeat the call to continue.
+    """
+
+    processed: int
+    succeeded: int
+    failed: List[UUID]
+    has_more: bool
 
 
 class MemoryProcessRequest(BaseModel):
@@ -71,3 +231,28 @@ class UploadResponse(BaseModel):
     memory_id: UUID
     status: MemoryStatus
     message: str
+
+
+class BulkUploadItem(BaseModel):
+    """Outcome for one file of a bulk upload.
+
+    ``filename`` is "<archive>/<entry>" for files taken from a zip.
+    Without ``memory_id`` the file was not stored. Stored files are
+    enqueued once the upload commits; one whose job cannot be sent moves
+    back to "uploading" and can be re-triggered. With upload dedup on, a
+    file whose audio is already stored gets the memory the dedup policy
+    gives it (the original, or a new duplicate) instead.
+    """
+
+    filename: str
+    memory_id: Optional[UUID] = None
+    status: Optional[MemoryStatus] = None
+    error: Optional[str] = None
+
+
+class BulkUploadResponse(BaseModel):
+    """Per-file results of a bulk upload, in request (and archive) order."""
+
+    items: List[BulkUploadItem]
+    succeeded: int
+    failed: int
@@ -0,0 +1,42 @@
+"""Pydantic models for resumable chunked uploads."""
+
+from datetime import datetime
+from enum import Enum
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class UploadSessionStatus(str, Enum):
+    """Lifecycle of a resumable upload session."""
+
+    OPEN = "open"
+    COMPLETED = "completed"
+    ABORTED = "aborted"
+    EXPIRED = "expired"
+
+
+class UploadSessionCreate(BaseModel):
+    """Request body that starts a resumable upload of ``size`` bytes."""
+
+    filename: str = Field(min_length=1, max_length=255)
+    size: int = Field(gt=0)
+
+
+class UploadSessionResponse(BaseModel):
+    """State of a resumable upload.
+
+    Send the next chunk at ``offset``: ``chunk_size`` bytes, or whatever
+    remains for the last one. Once ``offset == size``, complete the upload.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    memory_id: UUID
+    filename: str
+    size: int
+    chunk_size: int
+    offset: int
+    status: UploadSessionStatus
+    expires_at: datetime
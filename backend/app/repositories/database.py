@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import logging
 from collections.abc import AsyncGenerator
-from typing import Optional
+from typing import Awaitable, Callable, Optional
 
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
@@ -14,6 +15,18 @@ from sqlalchemy.ext.asyncio import (
 from sqlalchemy.orm import DeclarativeBase
 
 from app.config import Settings, get_settings
+from app.repositories.instrumentation import (
+    InstrumentedAsyncQueuePool,
+    forget_engine,
+    instrument_engine,
+)
+
+logger = logging.getLogger(__name__)
+
+# Session.info key of the callbacks to run once the transaction commits
+AFTER_COMMIT_KEY = "rawk_after_commit"
+
+AfterCommitCallback = Callable[[], Awaitable[None]]
 
 
 class Base(DeclarativeBase):
@@ -24,6 +37,28 @@ class Base(DeclarativeBase):
 
 _engine: Optional[AsyncEngine] = None
 _async_session: Optional[async_sessionmaker[AsyncSession]] = None
+_replica_engine: Optional[AsyncEngine] = None
+_replica_session: Optional[async_sessionmaker[AsyncSession]] = None
+
+
+def _create_engine(url: str, settings: Settings, label: str) -> AsyncEngine:
+    """Create an instrumented engine with the pool settings from ``settings``."""
+    engine = create_async_engine(
+        url,
+        echo=settings.db_echo,
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout_seconds,
+        pool_recycle=settings.db_pool_recycle_seconds,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        connect_args={
+            # asyncpg's own cache, and SQLAlchemy's prepared-statement cache
+            "statement_cache_size": settings.db_statement_cache_size,
+            "prepared_statement_cache_size": settings.db_statement_cache_size,
+        },
+    )
+    return instrument_engine(engine, label, settings.db_slow_query_ms)
 
 
 def _get_engine(settings: Optional[Settings] = None) -> AsyncEngine:
@@ -31,11 +66,7 @@ def _get_engine(settings: Optional[Settings] = None) -> AsyncEngine:
     global _engine
     if _engine is None:
         s = settings or get_settings()
-        _engine = create_async_engine(
-            s.database_url,
-            echo=s.debug,
-            pool_pre_ping=True,
-        )
+        _engine = _create_engine(s.database_url, s, "primary")
     return _engine
 
 
@@ -53,18 +84,90 @@ def _get_session_factory(
     return _async_session
 
 
+def _get_replica_engine(settings: Optional[Settings] = None) -> Optional[AsyncEngine]:
+    """Get or create the read replica engine, or None without a replica."""
+    global _replica_engine
+    if _replica_engine is None:
+        s = settings or get_settings()
+        if s.replica_database_url is None:
+            return None
+        _replica_engine = _create_engine(s.replica_database_url, s, "replica")
+    return _replica_engine
+
+
+def _get_replica_session_factory(
+    settings: Optional[Settings] = None,
+) -> Optional[async_sessionmaker[AsyncSession]]:
+    """Get or create the replica session factory, or None without a replica."""
+    global _replica_session
+    if _replica_session is None:
+        engine = _get_replica_engine(settings)
+        if engine is None:
+            return None
+        _replica_session = async_sessionmaker(
+            engine,
+            class_=AsyncSession,
+            expire_on_commit=False,
+        )
+    return _replica_session
+
+
+def after_commit(session: AsyncSession, callback: AfterCommitCallback) -> None:
+    """Run ``callback`` once the session's transaction has committed.
+
+    For side effects other processes must not see before the data they
+    describe: events, cache invalidation, deleting S3 objects. Callbacks
+    run in order from ``commit``; ``rollback`` drops them.
+    """
+    session.info.setdefault(AFTER_COMMIT_KEY, []).append(callback)
+
+
+async def commit(session: AsyncSession) -> None:
+    """Commit the session, then run its ``after_commit`` callbacks.
+
+    A failing callback is logged and the rest still run: the transaction
+    is already committed, so there is nothing left to undo.
+    """
+    await session.commit()
+    callbacks = session.info.pop(AFTER_COMMIT_KEY, [])
+    for callback in callbacks:
+        try:
+            await callback()
+        except Exception:
+            logger.warning("After-commit callback %r failed", callback, exc_info=True)
+
+
+async def rollback(session: AsyncSession) -> None:
+    """Roll the session back and drop its ``after_commit`` callbacks."""
+    session.info.pop(AFTER_COMMIT_KEY, None)
+    await session.rollback()
+
+
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     """Yield an async database session for FastAPI Depends() injection."""
     factory = _get_session_factory()
     async with factory() as session:
         try:
             yield session
-            await session.commit()
+            await commit(session)
         except Exception:
-            await session.rollback()
+            await rollback(session)
             raise
 
 
+async def get_replica_session() -> AsyncGenerator[Optional[AsyncSession], None]:
+    """Yield a read replica session, or None when no replica is configured.
+
+    Replica sessions only ever read; closing one rolls its transaction back.
+    """
+    factory = _get_replica_session_factory()
+    if factory is None:
+        yield None
+        return
+    async with factory() as session:
+        yield session
+
+
 async def init_db(settings: Optional[Settings] = None) -> None:
     """Create all tables. For development only — production uses Alembic."""
     engine = _get_engine(settings)
@@ -73,9 +176,15 @@ async def init_db(settings: Optional[Settings] = None) -> None:
 
 
 async def dispose_engine() -> None:
-    """Dispose the engine on shutdown."""
-    global _engine, _async_session
+    """Dispose the primary and replica engines on shutdown."""
+    global _engine, _async_session, _replica_engine, _replica_session
     if _engine is not None:
         await _engine.dispose()
+        forget_engine("primary")
         _engine = None
         _async_session = None
+    if _replica_engine is not None:
+        await _replica_engine.dispose()
+        forget_engine("replica")
+        _replica_engine = None
+        _replica_session = None
@@ -0,0 +1,29 @@
+"""EXPLAIN as an executable SQLAlchemy construct (Postgres)."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.elements import ClauseElement
+
+
+class Explain(Executable, ClauseElement):
+    """``EXPLAIN (FORMAT JSON[, ANALYZE]) <statement>`` keeping bound parameters.
+
+    Unlike compiling the statement with literal binds, this works for
+    every parameter type (e.g. the REGCONFIG argument of to_tsquery).
+    """
+
+    inherit_cache = False
+
+    def __init__(self, statement: ClauseElement, analyze: bool = False) -> None:
+        self.statement = statement
+        self.analyze = analyze
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element: Explain, compiler: Any, **kw: Any) -> str:
+    options = "ANALYZE, FORMAT JSON" if element.analyze else "FORMAT JSON"
+    return f"EXPLAIN ({options}) " + compiler.process(element.statement, **kw)
@@ -0,0 +1,141 @@
+"""Connection-pool and query instrumentation for the async engines.
+
+Records how long requests wait for a pooled connection, per-statement
+latency, and logs slow statements. Pool occupancy is sampled when
+``GET /metrics`` is scraped.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any, Dict
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.utils.metrics import REGISTRY, Counter, Gauge, Histogram
+
+logger = logging.getLogger(__name__)
+
+# Statement text is truncated in slow-query logs
+_SLOW_QUERY_LOG_CHARS = 500
+
+POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time to obtain a pooled connection, including opening a new one.",
+    ("engine",),
+)
+POOL_CHECKOUT_TIMEOUTS = Counter(
+    "db_pool_checkout_timeouts_total",
+    "Checkouts that gave up after pool_timeout.",
+    ("engine",),
+)
+POOL_CONNECTIONS = Gauge(
+    "db_pool_connections",
+    "Pool connections by state (checked_out, idle, overflow, size).",
+    ("engine", "state"),
+)
+QUERY_DURATION = Histogram(
+    "db_query_duration_seconds",
+    "Statement execution time, measured at the cursor.",
+    ("engine",),
+)
+SLOW_QUERIES = Counter(
+    "db_slow_queries_total",
+    "Statements slower than the db_slow_query_ms threshold.",
+    ("engine",),
+)
+
+_instrumented: Dict[str, AsyncEngine] = {}
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that records checkout wait time.
+
+    ``_do_get`` is where the queue pool blocks when every connection is
+    checked out, so timing it measures pool starvation directly.
+    """
+
+    engine_label = "primary"
+
+    def _do_get(self) -> Any:
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            POOL_CHECKOUT_TIMEOUTS.inc(engine=self.engine_label)
+            raise
+        finally:
+            POOL_CHECKOUT_WAIT.observe(
+                time.perf_counter() - start, engine=self.engine_label
+            )
+
+
+def instrument_engine(
+    engine: AsyncEngine, label: str, slow_query_ms: float
+) -> AsyncEngine:
+    """Attach query timing and slow-query logging to ``engine``.
+
+    Args:
+        engine: Engine to instrument; its pool also reports checkout waits
+            when it is an InstrumentedAsyncQueuePool.
+        label: Value of the ``engine`` metric label (e.g. "primary").
+        slow_query_ms: Statements at or above this duration are logged at
+            WARNING and counted; 0 or less disables the log.
+
+    Returns:
+        The same engine, for chaining.
+    """
+    sync_engine: Engine = engine.sync_engine
+    if isinstance(sync_engine.pool, InstrumentedAsyncQueuePool):
+        sync_engine.pool.engine_label = label
+    slow_seconds = slow_query_ms / 1000
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _start(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _stop(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_start"].pop()
+        QUERY_DURATION.observe(elapsed, engine=label)
+        if slow_seconds > 0 and elapsed >= slow_seconds:
+            SLOW_QUERIES.inc(engine=label)
+            logger.warning(
+                "Slow query (%.0f ms, %s): %s",
+                elapsed * 1000,
+                label,
+                statement[:_SLOW_QUERY_LOG_CHARS],
+            )
+
+    @event.listens_for(sync_engine, "handle_error")
+    def _discard(context):
+        starts = context.connection.info.get("query_start") if context.connection else None
+        if starts:
+            starts.pop()
+
+    _instrumented[label] = engine
+    return engine
+
+
+def forget_engine(label: str) -> None:
+    """Stop reporting pool gauges for a disposed engine."""
+    _instrumented.pop(label, None)
+
+
+def _collect_pool_stats() -> None:
+    for label, engine in _instrumented.items():
+        pool = engine.sync_engine.pool
+        if not isinstance(pool, AsyncAdaptedQueuePool):
+            continue
+        POOL_CONNECTIONS.set(pool.checkedout(), engine=label, state="checked_out")
+        POOL_CONNECTIONS.set(pool.checkedin(), engine=label, state="idle")
+        POOL_CONNECTIONS.set(max(pool.overflow(), 0), engine=label, state="overflow")
+        POOL_CONNECTIONS.set(pool.size(), engine=label, state="size")
+
+
+REGISTRY.add_collector(_collect_pool_stats)
@@ -2,44 +2,863 @@
 
 from __future__ import annotations
 
-from typing import List, Optional, Tuple
-from uuid import UUID
+import json
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from functools import reduce
+from types import SimpleNamespace
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+from uuid import UUID, uuid4
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import (
+    Date,
+    Select,
+    Text,
+    and_,
+    cast,
+    delete,
+    exists,
+    func,
+    insert,
+    literal,
+    literal_column,
+    select,
+    text,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Result, Row
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
 
-from app.exceptions import ResourceNotFoundError
-from app.repositories.models import MemoryORM
+from app.exceptions import (
+    DuplicateContentError,
+    ResourceNotFoundError,
+    StatusConflictError,
+)
+from app.repositories.database import AfterCommitCallback, after_commit, commit
+from app.repositories.explain import Explain
+from app.repositories.models import (
+    MEMORY_DAILY_STATS_VIEW,
+    ActionItemORM,
+    MaterializedViewRefreshORM,
+    MemoryEmbeddingORM,
+    MemoryORM,
+    MemoryTombstoneORM,
+    MemoryTranscriptORM,
+    _utcnow,
+    memory_daily_stats,
+)
+from app.repositories.replica import (
+    ReplicaHealth,
+    has_written,
+    is_unavailable_error,
+)
+from app.utils.compression import GZIP, compress_text, decompress_text
+from app.utils.search import (
+    HIGHLIGHT_START,
+    HIGHLIGHT_STOP,
+    highlight_snippet,
+    to_prefix_tsquery,
+    tokenize_query,
+)
+
+# pg_try_advisory_xact_lock key serializing stats refreshes across processes
+STATS_REFRESH_LOCK_ID = 0x5241574B
+
+# ts_headline options matching utils.search.highlight_snippet output
+_HEADLINE_OPTIONS = (
+    f"StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_STOP}, "
+    "MaxWords=30, MinWords=10, MaxFragments=2"
+)
+
+# Matches scored in Python on databases without full-text search
+_FALLBACK_SEARCH_LIMIT = 500
+
+# Columns selected for list rows; transcripts and JSON lists are opt-in.
+# Transcripts are stored compressed in memory_transcripts and attached
+# after the list query, so they are an include field but not a column.
+LIST_COLUMNS = (
+    MemoryORM.id,
+    MemoryORM.title,
+    MemoryORM.audio_url,
+    MemoryORM.status,
+    MemoryORM.summary,
+    MemoryORM.duration,
+    MemoryORM.created_at,
+    MemoryORM.updated_at,
+)
+HEAVY_COLUMNS = {
+    "key_points": MemoryORM.key_points,
+    "action_items": MemoryORM.action_items,
+}
+HEAVY_FIELDS = ("transcript", *HEAVY_COLUMNS)
+
+# setweight() labels of the search document fields, in document order
+SEARCH_DOCUMENT_WEIGHTS = (
+    ("title", "A"),
+    ("summary", "B"),
+    ("key_points", "B"),
+    ("transcript", "D"),
+)
+
+
+# Columns of an action-item list row; the memory contributes only its title
+ACTION_ITEM_COLUMNS = (
+    ActionItemORM.id,
+    ActionItemORM.memory_id,
+    MemoryORM.title.label("memory_title"),
+    ActionItemORM.position,
+    ActionItemORM.text,
+    ActionItemORM.status,
+    ActionItemORM.created_at,
+    ActionItemORM.updated_at,
+)
+
+
+def _action_item_select() -> Select:
+    return select(*ACTION_ITEM_COLUMNS).join(
+        MemoryORM, MemoryORM.id == ActionItemORM.memory_id
+    )
+
+
+def _list_select(include: Sequence[str] = ()) -> Select:
+    """SELECT the list projection plus the requested heavy columns."""
+    return select(
+        *LIST_COLUMNS,
+        *(HEAVY_COLUMNS[field] for field in include if field in HEAVY_COLUMNS),
+    )
+
+
+@dataclass(frozen=True)
+class StatusChange:
+    """Row state returned by a status write (``UPDATE ... RETURNING``)."""
+
+    id: UUID
+    status: str
+    updated_at: datetime
+
+
+@dataclass(frozen=True)
+class MemoryChange:
+    """One entry of the delta-sync stream: an upsert, or a deletion."""
+
+    changed_at: datetime
+    id: UUID
+    row: Optional[Row] = None
+
+    @property
+    def deleted(self) -> bool:
+        return self.row is None
+
+    @property
+    def position(self) -> Tuple[datetime, UUID]:
+        return self.changed_at, self.id
+
+
+@dataclass(frozen=True)
+class EmbeddingChange:
+    """One entry of the embedding sync stream: a new vector, or a deletion."""
+
+    changed_at: datetime
+    id: UUID
+    vector: Optional[bytes] = None
+
+    @property
+    def deleted(self) -> bool:
+        return self.vector is None
+
+    @property
+    def position(self) -> Tuple[datetime, UUID]:
+        return self.changed_at, self.id
+
+
+def _settled_before(settle_seconds: float) -> Optional[datetime]:
+    """Newest change time a delta sync may return, or None for no bound.
+
+    ``updated_at`` and ``deleted_at`` are taken when a row is written, not
+    when its transaction commits, so changes commit out of timestamp
+    order. Holding back the last ``settle_seconds`` keeps a cursor from
+    moving past a change that is still uncommitted.
+    """
+    if settle_seconds <= 0:
+        return None
+    return _utcnow() - timedelta(seconds=settle_seconds)
+
+
+def _tombstones_after(
+    since: Optional[Tuple[datetime, UUID]],
+    limit: int,
+    until: Optional[datetime] = None,
+) -> Select:
+    """SELECT (deleted_at, memory_id) of deletions after a position, oldest first.
+
+    Args:
+        until: Only deletions at or before this time.
+    """
+    stmt = select(MemoryTombstoneORM.deleted_at, MemoryTombstoneORM.memory_id)
+    if since is not None:
+        stmt = stmt.where(
+            tuple_(MemoryTombstoneORM.deleted_at, MemoryTombstoneORM.memory_id)
+            > tuple_(*since)
+        )
+    if until is not None:
+        stmt = stmt.where(MemoryTombstoneORM.deleted_at <= until)
+    return stmt.order_by(
+        MemoryTombstoneORM.deleted_at, MemoryTombstoneORM.memory_id
+    ).limit(limit)
 
 
 class MemoryRepository:
-    """All database operations for the memories table."""
+    """All database operations for the memories table.
+
+    Read-only queries go to ``replica_session`` when one is given, unless
+    the primary session has already written (read-your-writes) or the
+    replica is unhealthy, in which case they run on the primary.
+    """
 
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(
+        self,
+        session: AsyncSession,
+        replica_session: Optional[AsyncSession] = None,
+        replica_health: Optional[ReplicaHealth] = None,
+        transcript_encoding: str = GZIP,
+    ) -> None:
         self._session = session
+        self._replica = replica_session
+        self._replica_health = replica_health or ReplicaHealth()
+        self._transcript_encoding = transcript_encoding
+
+    async def _drop_replica(self, exc: BaseException) -> None:
+        """Stop using a failed replica for this repository and the retry window."""
+        self._replica_health.mark_unhealthy(type(exc).__name__)
+        replica, self._replica = self._replica, None
+        try:
+            await replica.close()
+        except Exception:
+            pass
+
+    async def _read_session(self) -> AsyncSession:
+        """Pick the session for a read-only query."""
+        if (
+            self._replica is None
+            or has_written(self._session)
+            or not self._replica_health.available
+        ):
+            return self._session
+        try:
+            healthy = await self._replica_health.check_lag(self._replica)
+        except Exception as exc:
+            if not is_unavailable_error(exc):
+                raise
+            await self._drop_replica(exc)
+            return self._session
+        return self._replica if healthy else self._session
+
+    def after_commit(self, callback: AfterCommitCallback) -> None:
+        """Run ``callback`` once the current transaction commits."""
+        after_commit(self._session, callback)
+
+    async def commit(self) -> None:
+        """Commit the current transaction, then run its after-commit callbacks.
+
+        For follow-up writes made by an after-commit callback, once the
+        transaction they react to is over.
+        """
+        await commit(self._session)
+
+    async def _read(self, stmt: Any, primary: bool = False) -> Result:
+        """Execute a read-only statement, on the replica when possible.
+
+        Falls back to the primary if the replica cannot be reached.
+
+        Args:
+            primary: Always read from the primary, e.g. for results that
+                are cached and must not carry replica lag.
+        """
+        session = self._session if primary else await self._read_session()
+        if session is self._session:
+            return await session.execute(stmt)
+        try:
+            return await session.execute(stmt)
+        except Exception as exc:
+            if not is_unavailable_error(exc):
+                raise
+            await self._drop_replica(exc)
+        return await self._session.execute(stmt)
 
     async def create(
         self,
         audio_url: str,
         title: Optional[str] = None,
         duration: Optional[float] = None,
+        memory_id: Optional[UUID] = None,
+        content_hash: Optional[str] = None,
     ) -> MemoryORM:
-        """Create a new memory record with status 'uploading'."""
+        """Create a new memory record with status 'uploading'.
+
+        Args:
+            memory_id: Id to use instead of a generated one, for callers
+                that need it before the row exists (e.g. as an S3 key).
+            content_hash: SHA-256 of the audio. The row becomes the
+                original for that hash; the insert runs in a savepoint so
+                losing a race for it leaves the transaction usable.
+
+        Raises:
+            DuplicateContentError: If another memory is already the
+                original for ``content_hash``.
+        """
         memory = MemoryORM(
+            id=memory_id or uuid4(),
             audio_url=audio_url,
             title=title,
             duration=duration,
             status="uploading",
+            search_vector=self._search_document(title=title),
+            content_hash=content_hash,
         )
-        self._session.add(memory)
-        await self._session.flush()
+        if content_hash is None:
+            self._session.add(memory)
+            await self._session.flush()
+            return memory
+        try:
+            async with self._session.begin_nested():
+                self._session.add(memory)
+                await self._session.flush()
+        except IntegrityError as exc:
+            raise DuplicateContentError(
+                detail=f"Audio {content_hash[:12]}… is already being uploaded"
+            ) from exc
         return memory
 
-    async def get_by_id(self, memory_id: UUID) -> Optional[MemoryORM]:
-        """Get a memory by ID, or None if not found."""
-        stmt = select(MemoryORM).where(MemoryORM.id == str(memory_id))
-        result = await self._session.execute(stmt)
-        return result.scalar_one_or_none()
+    async def get_by_content_hash(self, content_hash: str) -> Optional[MemoryORM]:
+        """Get the original (non-duplicate) memory for an audio hash, if any."""
+        return await self._session.scalar(
+            select(MemoryORM).where(
+                MemoryORM.content_hash == content_hash,
+                MemoryORM.duplicate_of.is_(None),
+            )
+        )
+
+    async def lock(self, memory_id: UUID) -> Optional[MemoryORM]:
+        """Re-read a memory with ``SELECT ... FOR UPDATE``, or None if gone.
+
+        Status writes to the row wait until the caller's transaction ends
+        (Postgres; other dialects take no lock).
+        """
+        return await self._session.scalar(
+            select(MemoryORM)
+            .where(MemoryORM.id == memory_id)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
+
+    async def create_duplicate(self, memory_id: UUID, original: MemoryORM) -> StatusChange:
+        """Create a memory for re-uploaded audio, sharing ``original``'s S3 object.
+
+        The row starts as "processing"; its results are copied from the
+        original with ``copy_processing_results``, now or once the
+        original's processing finishes.
+        """
+        stmt = (
+            insert(MemoryORM)
+            .values(
+                id=memory_id,
+                audio_url=original.audio_url,
+                status="processing",
+                duration=original.duration,
+                content_hash=original.content_hash,
+                duplicate_of=original.id,
+                search_vector=self._search_document(),
+            )
+            .returning(MemoryORM.id, MemoryORM.status, MemoryORM.updated_at)
+        )
+        row = (await self._session.execute(stmt)).one()
+        return StatusChange(id=row.id, status=row.status, updated_at=row.updated_at)
+
+    async def list_waiting_duplicates(self, original_id: UUID) -> List[UUID]:
+        """Duplicates of ``original_id`` still waiting for its results."""
+        result = await self._session.execute(
+            select(MemoryORM.id).where(
+                MemoryORM.duplicate_of == original_id,
+                MemoryORM.status == "processing",
+            )
+        )
+        return list(result.scalars())
+
+    async def copy_processing_results(
+        self,
+        source_id: UUID,
+        target_id: UUID,
+        *,
+        expected_status: Optional[Union[str, Sequence[str]]] = None,
+    ) -> StatusChange:
+        """Give ``target_id`` the results, status and embedding of ``source_id``.
+
+        Raises:
+            ResourceNotFoundError: If either memory does not exist.
+            StatusConflictError: If the target is not in an expected status.
+        """
+        source = await self._session.scalar(
+            select(MemoryORM).where(MemoryORM.id == source_id)
+        )
+        if source is None:
+            raise ResourceNotFoundError(detail=f"Memory {source_id} not found")
+        change = await self.update_processing_results(
+            target_id,
+            transcript=await self.get_transcript(source_id, primary=True),
+            summary=source.summary,
+            key_points=source.key_points,
+            action_items=source.action_items,
+            title=source.title,
+            status=source.status,
+            expected_status=expected_status,
+        )
+        embedding = await self._session.get(MemoryEmbeddingORM, source_id)
+        if embedding is not None:
+            await self.save_embedding(
+                target_id,
+                model=embedding.model,
+                dimensions=embedding.dimensions,
+                vector=embedding.vector,
+            )
+        return change
+
+    async def audio_urls_in_use(self, audio_urls: Sequence[str]) -> List[str]:
+        """Which of ``audio_urls`` are still stored on some memory.
+
+        Duplicate uploads share their original's S3 object, so deleting a
+        memory must not delete audio another memory still points at.
+        """
+        if not audio_urls:
+            return []
+        result = await self._session.execute(
+            select(MemoryORM.audio_url)
+            .where(MemoryORM.audio_url.in_(list(audio_urls)))
+            .distinct()
+        )
+        return list(result.scalars())
+
+    async def create_many(
+        self,
+        audio_urls: Mapping[UUID, str],
+        status: str = "uploading",
+        content_hashes: Optional[Mapping[UUID, str]] = None,
+    ) -> List[StatusChange]:
+        """Create several memories with one multi-row ``INSERT ... RETURNING``.
+
+        Args:
+            audio_urls: S3 URL of each new memory, keyed by its id.
+            status: Initial status of every row.
+            content_hashes: SHA-256 of each memory's audio, keyed by id.
+                Rows whose hash already has an original (a concurrent
+                upload won the race) are skipped with ``ON CONFLICT DO
+                NOTHING`` and missing from the result.
+
+        Returns:
+            One StatusChange per created memory, in ``audio_urls`` order.
+        """
+        if not audio_urls:
+            return []
+        search_vector = self._search_document()
+        hashes = content_hashes or {}
+        insert_stmt = pg_insert if self._is_postgres else sqlite_insert
+        stmt = insert_stmt(MemoryORM).values(
+            [
+                {
+                    "id": memory_id,
+                    "audio_url": audio_url,
+                    "status": status,
+                    "search_vector": search_vector,
+                    "content_hash": hashes.get(memory_id),
+                }
+                for memory_id, audio_url in audio_urls.items()
+            ]
+        )
+        if hashes:
+            stmt = stmt.on_conflict_do_nothing()
+        stmt = stmt.returning(MemoryORM.id, MemoryORM.status, MemoryORM.updated_at)
+        changes = {
+            row.id: StatusChange(id=row.id, status=row.status, updated_at=row.updated_at)
+            for row in await self._session.execute(stmt)
+        }
+        return [changes[memory_id] for memory_id in audio_urls if memory_id in changes]
+
+    async def get_by_id(
+        self, memory_id: UUID, with_transcript: bool = False, primary: bool = False
+    ) -> Optional[MemoryORM]:
+        """Get a memory by ID, or None if not found.
+
+        Args:
+            with_transcript: Also load the transcript into ``memory.transcript``.
+            primary: Read from the primary even when a replica is available.
+        """
+        stmt = select(MemoryORM).where(MemoryORM.id == memory_id)
+        result = await self._read(stmt, primary=primary)
+        memory = result.scalar_one_or_none()
+        if memory is not None and with_transcript:
+            await self.load_transcripts([memory], primary=primary)
+        return memory
+
+    async def get_many(
+        self, memory_ids: Sequence[UUID], with_transcript: bool = False
+    ) -> List[MemoryORM]:
+        """Get several memories with one ``WHERE id IN (...)`` query.
+
+        Args:
+            with_transcript: Also load transcripts, with one more query.
+
+        Returns:
+            The memories that exist, in the order of ``memory_ids``
+            (duplicates collapsed to their first position).
+        """
+        ordered = list(dict.fromkeys(memory_ids))
+        if not ordered:
+            return []
+        stmt = select(MemoryORM).where(MemoryORM.id.in_(ordered))
+        result = await self._read(stmt)
+        by_id = {memory.id: memory for memory in result.scalars().all()}
+        memories = [by_id[memory_id] for memory_id in ordered if memory_id in by_id]
+        if with_transcript:
+            await self.load_transcripts(memories)
+        return memories
+
+    async def get_transcripts(
+        self, memory_ids: Sequence[UUID], primary: bool = False
+    ) -> Dict[UUID, str]:
+        """Load and decompress the transcripts of several memories.
+
+        Returns:
+            Transcript text by memory ID; memories without one are absent.
+        """
+        if not memory_ids:
+            return {}
+        stmt = select(
+            MemoryTranscriptORM.memory_id,
+            MemoryTranscriptORM.encoding,
+            MemoryTranscriptORM.content,
+        ).where(MemoryTranscriptORM.memory_id.in_(set(memory_ids)))
+        return {
+            memory_id: decompress_text(encoding, content)
+            for memory_id, encoding, content in (
+                await self._read(stmt, primary=primary)
+            ).all()
+        }
+
+    async def get_transcript(
+        self, memory_id: UUID, primary: bool = False
+    ) -> Optional[str]:
+        """Load and decompress one memory's transcript, or None."""
+        return (await self.get_transcripts([memory_id], primary=primary)).get(memory_id)
+
+    async def load_transcripts(
+        self, memories: Sequence[MemoryORM], primary: bool = False
+    ) -> None:
+        """Fill ``transcript`` on each memory with one query."""
+        transcripts = await self.get_transcripts(
+            [memory.id for memory in memories], primary=primary
+        )
+        for memory in memories:
+            memory.transcript = transcripts.get(memory.id)
+
+    async def _with_transcripts(
+        self, rows: Sequence[Row], include: Sequence[str]
+    ) -> List[Any]:
+        """Attach transcripts to list rows when ``include`` asks for them.
+
+        Rows are returned unchanged otherwise; with transcripts they become
+        namespaces with the same attributes plus ``transcript``.
+        """
+        if "transcript" not in include:
+            return list(rows)
+        transcripts = await self.get_transcripts([row.id for row in rows])
+        return [
+            SimpleNamespace(**row._mapping, transcript=transcripts.get(row.id))
+            for row in rows
+        ]
+
+    async def _save_transcript(self, memory_id: UUID, transcript: str) -> None:
+        """Compress and upsert a memory's transcript."""
+        encoding, content = compress_text(transcript, self._transcript_encoding)
+        insert_stmt = pg_insert if self._is_postgres else sqlite_insert
+        stmt = insert_stmt(MemoryTranscriptORM).values(
+            memory_id=memory_id,
+            encoding=encoding,
+            content=content,
+            size_bytes=len(transcript.encode("utf-8")),
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[MemoryTranscriptORM.memory_id],
+            set_={
+                "encoding": stmt.excluded.encoding,
+                "content": stmt.excluded.content,
+                "size_bytes": stmt.excluded.size_bytes,
+            },
+        )
+        await self._session.execute(stmt)
+
+    def _search_document(
+        self, keep_transcript: bool = False, **fields: Any
+    ) -> ColumnElement:
+        """Build the search_vector value from SEARCH_DOCUMENT_WEIGHTS fields.
+
+        Each field is a Python value or a SQL expression (e.g. the current
+        column); missing fields count as empty. Postgres gets the weighted
+        tsvector, other dialects the concatenated text.
+
+        Args:
+            keep_transcript: Postgres only; take the transcript's lexemes
+                from the current search_vector rather than ``transcript``.
+        """
+        parts = []
+        for name, _ in SEARCH_DOCUMENT_WEIGHTS:
+            value = fields.get(name)
+            if value is None or isinstance(value, str):
+                parts.append(literal(value or "", Text))
+            else:
+                parts.append(func.coalesce(value, ""))
+        if self._is_postgres:
+            vectors = [
+                func.coalesce(
+                    func.ts_filter(
+                        MemoryORM.search_vector,
+                        literal_column(f"'{{{weight.lower()}}}'"),
+                    ),
+                    literal_column("''::tsvector"),
+                )
+                if keep_transcript and name == "transcript"
+                else func.setweight(
+                    func.to_tsvector("english", part), literal_column(f"'{weight}'")
+                )
+                for part, (name, weight) in zip(parts, SEARCH_DOCUMENT_WEIGHTS)
+            ]
+            return reduce(lambda left, right: left.op("||")(right), vectors)
+        return reduce(lambda left, right: left + "\n" + right, parts)
+
+    @property
+    def _is_postgres(self) -> bool:
+        """True when the session is bound to Postgres (full-text search, planner stats)."""
+        bind = self._session.bind
+        return bind is not None and bind.dialect.name == "postgresql"
+
+    def _search_clause(self, terms: List[str]) -> ColumnElement[bool]:
+        """Match all terms against the search document.
+
+        Postgres uses the GIN-indexed tsvector with prefix matching. Other
+        dialects fall back to a LIKE per term over the plain-text document.
+        """
+        if self._is_postgres:
+            tsquery = func.to_tsquery("english", to_prefix_tsquery(terms))
+            return MemoryORM.search_vector.op("@@")(tsquery)
+
+        return and_(*(MemoryORM.search_vector.ilike(f"%{term}%") for term in terms))
+
+    def _apply_filters(
+        self,
+        stmt: Select,
+        search: Optional[str] = None,
+        status: Optional[str] = None,
+    ) -> Select:
+        """Apply the shared list filters to a SELECT over memories."""
+        terms = tokenize_query(search) if search else []
+        if terms:
+            stmt = stmt.where(self._search_clause(terms))
+        if status:
+            stmt = stmt.where(MemoryORM.status == status)
+        return stmt
+
+    async def count(
+        self,
+        search: Optional[str] = None,
+        status: Optional[str] = None,
+    ) -> int:
+        """Return the number of memories matching the list filters."""
+        base = self._apply_filters(select(MemoryORM.id), search, status)
+        count_stmt = select(func.count()).select_from(base.subquery())
+        result = await self._read(count_stmt)
+        return result.scalar_one()
+
+    async def estimate_count(
+        self,
+        search: Optional[str] = None,
+        status: Optional[str] = None,
+    ) -> Optional[int]:
+        """Return the planner's row estimate for the list filters.
+
+        Unfiltered lists read ``pg_class.reltuples``; filtered ones use the
+        row estimate from EXPLAIN. Both are O(1) in table size.
+
+        Returns:
+            The estimate, or None when unavailable (non-Postgres backends
+            or a table that has never been analyzed).
+        """
+        if not self._is_postgres:
+            return None
+
+        if not search and not status:
+            result = await self._read(
+                text(
+                    "SELECT reltuples::bigint FROM pg_class "
+                    "WHERE oid = 'memories'::regclass"
+                )
+            )
+            estimate = result.scalar_one_or_none()
+        else:
+            stmt = self._apply_filters(select(MemoryORM.id), search, status)
+            result = await self._read(Explain(stmt))
+            plan = result.scalar_one()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            estimate = plan[0]["Plan"]["Plan Rows"]
+
+        if estimate is None or estimate < 0:
+            return None
+        return int(estimate)
+
+    async def daily_stats(
+        self,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+    ) -> List[Row]:
+        """Return memory counts and durations per (creation day, status).
+
+        Postgres reads the memory_daily_stats materialized view, so the
+        cost depends on the number of days, not memories; figures are as
+        of its last refresh, recorded in materialized_view_refreshes.
+        Other dialects aggregate memories directly.
+
+        Args:
+            date_from: First creation day to include (UTC).
+            date_to: Last creation day to include (UTC).
+
+        Returns:
+            Rows of (day, status, memory_count, duration_total,
+            duration_count, refreshed_at), oldest day first;
+            ``refreshed_at`` is None when computed live.
+        """
+        if self._is_postgres:
+            view = memory_daily_stats.c
+            day = view.day
+            stmt = select(
+                view.day,
+                view.status,
+                view.memory_count,
+                view.duration_total,
+                view.duration_count,
+                select(MaterializedViewRefreshORM.refreshed_at)
+                .where(MaterializedViewRefreshORM.view_name == MEMORY_DAILY_STATS_VIEW)
+                .scalar_subquery()
+                .label("refreshed_at"),
+            )
+        else:
+            day = func.date(MemoryORM.created_at, type_=Date)
+            stmt = select(
+                day.label("day"),
+                MemoryORM.status,
+                func.count().label("memory_count"),
+                func.sum(MemoryORM.duration).label("duration_total"),
+                func.count(MemoryORM.duration).label("duration_count"),
+                literal(None).label("refreshed_at"),
+            ).group_by(day, MemoryORM.status)
+        if date_from is not None:
+            stmt = stmt.where(day >= date_from)
+        if date_to is not None:
+            stmt = stmt.where(day <= date_to)
+        result = await self._read(stmt.order_by(day))
+        return list(result.all())
+
+    async def refresh_daily_stats(self) -> bool:
+        """Refresh the memory_daily_stats view if no other process is.
+
+        Takes a transaction-scoped advisory lock, so the refresh is
+        serialized across API processes and the lock is released when the
+        caller commits. CONCURRENTLY keeps the view readable meanwhile.
+
+        Returns:
+            True if refreshed; False if another process holds the lock or
+            the backend has no materialized view.
+        """
+        if not self._is_postgres:
+            return False
+        locked = await self._session.scalar(
+            select(func.pg_try_advisory_xact_lock(STATS_REFRESH_LOCK_ID))
+        )
+        if not locked:
+            return False
+        await self._session.execute(
+            text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {MEMORY_DAILY_STATS_VIEW}")
+        )
+        stmt = pg_insert(MaterializedViewRefreshORM).values(
+            view_name=MEMORY_DAILY_STATS_VIEW, refreshed_at=_utcnow()
+        )
+        await self._session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[MaterializedViewRefreshORM.view_name],
+                set_={"refreshed_at": stmt.excluded.refreshed_at},
+            )
+        )
+        return True
+
+    def _list_page_query(
+        self,
+        page: int,
+        page_size: int,
+        search: Optional[str],
+        status: Optional[str],
+        include: Sequence[str] = (),
+    ) -> Select:
+        """Build the OFFSET page query (one extra row to detect a next page)."""
+        return (
+            self._apply_filters(_list_select(include), search, status)
+            .order_by(MemoryORM.created_at.desc(), MemoryORM.id.desc())
+            .offset((page - 1) * page_size)
+            .limit(page_size + 1)
+        )
+
+    def _list_after_query(
+        self,
+        after: Optional[Tuple[datetime, UUID]],
+        page_size: int,
+        search: Optional[str],
+        status: Optional[str],
+        include: Sequence[str] = (),
+    ) -> Select:
+        """Build the keyset page query.
+
+        The position is a row-value comparison so Postgres can use it as
+        an index condition on ix_memories_(status_)created_at_id.
+        """
+        stmt = self._apply_filters(_list_select(include), search, status)
+        if after is not None:
+            stmt = stmt.where(
+                tuple_(MemoryORM.created_at, MemoryORM.id) < tuple_(*after)
+            )
+        return stmt.order_by(
+            MemoryORM.created_at.desc(), MemoryORM.id.desc()
+        ).limit(page_size + 1)
+
+    async def list_page(
+        self,
+        page: int = 1,
+        page_size: int = 20,
+        search: Optional[str] = None,
+        status: Optional[str] = None,
+        include: Sequence[str] = (),
+    ) -> Tuple[List[Row], bool]:
+        """Return one page-number page and whether another page follows.
+
+        Rows carry LIST_COLUMNS plus the HEAVY_FIELDS named in
+        ``include``. Fetches one extra row instead of relying on a total
+        count.
+        """
+        stmt = self._list_page_query(page, page_size, search, status, include)
+        result = await self._read(stmt)
+        items = list(result.all())
+        page_items = await self._with_transcripts(items[:page_size], include)
+        return page_items, len(items) > page_size
 
     async def list_all(
         self,
@@ -47,47 +866,352 @@ class MemoryRepository:
         page_size: int = 20,
         search: Optional[str] = None,
         status: Optional[str] = None,
-    ) -> Tuple[List[MemoryORM], int]:
-        """Return a paginated list of memories and the total count.
+        include: Sequence[str] = (),
+    ) -> Tuple[List[Row], int]:
+        """Return a paginated list of memory rows and the exact total count.
 
         Args:
-            search: ILIKE filter on title and summary columns.
+            search: Full-text filter over title, summary, key points and
+                transcript (every word must match, as a prefix).
             status: Exact match filter on status column.
         """
-        base = select(MemoryORM)
+        total = await self.count(search=search, status=status)
+        items, _ = await self.list_page(
+            page=page, page_size=page_size, search=search, status=status,
+            include=include,
+        )
+        return items, total
 
-        if search:
-            pattern = f"%{search}%"
-            base = base.where(
-                or_(
-                    MemoryORM.title.ilike(pattern),
-                    MemoryORM.summary.ilike(pattern),
-                )
+    async def list_after(
+        self,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        page_size: int = 20,
+        search: Optional[str] = None,
+        status: Optional[str] = None,
+        include: Sequence[str] = (),
+    ) -> Tuple[List[Row], bool]:
+        """Return the page that follows a (created_at, id) keyset position.
+
+        Unlike list_all this never scans skipped rows and runs no count
+        query, so each page costs the same regardless of depth.
+
+        Args:
+            after: Sort key of the last item already seen, or None for the
+                first page.
+
+        Returns:
+            Tuple of (items, has_next).
+        """
+        stmt = self._list_after_query(after, page_size, search, status, include)
+        result = await self._read(stmt)
+        items = list(result.all())
+        page_items = await self._with_transcripts(items[:page_size], include)
+        return page_items, len(items) > page_size
+
+    async def list_changes(
+        self,
+        since: Optional[Tuple[datetime, UUID]] = None,
+        limit: int = 100,
+        include: Sequence[str] = (),
+        settle_seconds: float = 0.0,
+    ) -> Tuple[List[MemoryChange], bool]:
+        """Return memory updates and deletions after a (timestamp, id) position.
+
+        Reads memories by (updated_at, id) and tombstones by
+        (deleted_at, memory_id), each with one index range scan, then
+        merges both streams in that order.
+
+        Args:
+            since: Position of the last change already seen, or None to
+                start from the beginning.
+            limit: Maximum number of changes to return.
+            include: HEAVY_FIELDS to add to the list projection.
+            settle_seconds: Leave out changes newer than this, which may
+                still be followed by older ones committing late.
+
+        Returns:
+            Tuple of (changes oldest first, has_more).
+        """
+        until = _settled_before(settle_seconds)
+        memories = _list_select(include)
+        if since is not None:
+            memories = memories.where(
+                tuple_(MemoryORM.updated_at, MemoryORM.id) > tuple_(*since)
             )
+        if until is not None:
+            memories = memories.where(MemoryORM.updated_at <= until)
+        memories = memories.order_by(MemoryORM.updated_at, MemoryORM.id).limit(limit + 1)
+        tombstones = _tombstones_after(since, limit + 1, until)
+
+        rows = await self._with_transcripts((await self._read(memories)).all(), include)
+        changes = [
+            MemoryChange(changed_at=row.updated_at, id=row.id, row=row)
+            for row in rows
+        ]
+        changes.extend(
+            MemoryChange(changed_at=deleted_at, id=memory_id)
+            for deleted_at, memory_id in (await self._read(tombstones)).all()
+        )
+        changes.sort(key=lambda change: change.position)
+        return changes[:limit], len(changes) > limit
+
+    async def list_by_ids(
+        self,
+        memory_ids: Sequence[UUID],
+        status: Optional[str] = None,
+    ) -> List[Row]:
+        """Return list-projection rows for ``memory_ids``, in that order.
+
+        Args:
+            status: Only return memories in this status.
+        """
+        if not memory_ids:
+            return []
+        stmt = _list_select().where(MemoryORM.id.in_(memory_ids))
         if status:
-            base = base.where(MemoryORM.status == status)
+            stmt = stmt.where(MemoryORM.status == status)
+        by_id = {row.id: row for row in (await self._read(stmt)).all()}
+        return [by_id[memory_id] for memory_id in memory_ids if memory_id in by_id]
 
-        # Total count
-        count_stmt = select(func.count()).select_from(base.subquery())
-        total_result = await self._session.execute(count_stmt)
-        total = total_result.scalar_one()
+    async def save_embedding(
+        self,
+        memory_id: UUID,
+        model: str,
+        dimensions: int,
+        vector: bytes,
+    ) -> None:
+        """Insert or replace a memory's embedding (little-endian float32 bytes).
 
-        # Paginated results
-        offset = (page - 1) * page_size
-        stmt = base.order_by(MemoryORM.created_at.desc()).offset(offset).limit(page_size)
-        result = await self._session.execute(stmt)
-        items = list(result.scalars().all())
+        Runs in a savepoint so a failure (e.g. the memory was deleted
+        meanwhile) leaves the caller's transaction usable.
+        """
+        insert_stmt = pg_insert if self._is_postgres else sqlite_insert
+        stmt = insert_stmt(MemoryEmbeddingORM).values(
+            memory_id=memory_id,
+            model=model,
+            dimensions=dimensions,
+            vector=vector,
+            updated_at=_utcnow(),
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[MemoryEmbeddingORM.memory_id],
+            set_={
+                "model": stmt.excluded.model,
+                "dimensions": stmt.excluded.dimensions,
+                "vector": stmt.excluded.vector,
+                "updated_at": stmt.excluded.updated_at,
+            },
+        )
+        async with self._session.begin_nested():
+            await self._session.execute(stmt)
 
-        return items, total
+    async def list_embedding_changes(
+        self,
+        model: str,
+        dimensions: int,
+        since: Optional[Tuple[datetime, UUID]] = None,
+        limit: int = 1000,
+        settle_seconds: float = 0.0,
+    ) -> Tuple[List[EmbeddingChange], bool]:
+        """Return embeddings written and memories deleted after a position.
+
+        Same merge as list_changes, over memory_embeddings by
+        (updated_at, memory_id) and tombstones by (deleted_at, memory_id),
+        including the ``settle_seconds`` hold-back. Embeddings from another
+        model or size are skipped.
+
+        Returns:
+            Tuple of (changes oldest first, has_more).
+        """
+        embeddings = select(
+            MemoryEmbeddingORM.updated_at,
+            MemoryEmbeddingORM.memory_id,
+            MemoryEmbeddingORM.vector,
+        ).where(
+            MemoryEmbeddingORM.model == model,
+            MemoryEmbeddingORM.dimensions == dimensions,
+        )
+        until = _settled_before(settle_seconds)
+        if since is not None:
+            embeddings = embeddings.where(
+                tuple_(MemoryEmbeddingORM.updated_at, MemoryEmbeddingORM.memory_id)
+                > tuple_(*since)
+            )
+        if until is not None:
+            embeddings = embeddings.where(MemoryEmbeddingORM.updated_at <= until)
+        embeddings = embeddings.order_by(
+            MemoryEmbeddingORM.updated_at, MemoryEmbeddingORM.memory_id
+        ).limit(limit + 1)
+
+        changes = [
+            EmbeddingChange(changed_at=updated_at, id=memory_id, vector=vector)
+            for updated_at, memory_id, vector in (await self._read(embeddings)).all()
+        ]
+        changes.extend(
+            EmbeddingChange(changed_at=deleted_at, id=memory_id)
+            for deleted_at, memory_id in (
+                await self._read(_tombstones_after(since, limit + 1, until))
+            ).all()
+        )
+        changes.sort(key=lambda change: change.position)
+        return changes[:limit], len(changes) > limit
+
+    async def search(
+        self,
+        query: str,
+        limit: int = 20,
+        status: Optional[str] = None,
+    ) -> List[Tuple[Mapping[str, Any], float, Optional[str]]]:
+        """Full-text search ranked by relevance.
+
+        On Postgres this ranks with ts_rank_cd over the weighted tsvector
+        and builds snippets with ts_headline over the summary for the
+        returned rows only; hits whose summary does not match get a snippet
+        from their transcript. Other dialects score matches in Python with
+        the same weights.
+
+        Returns:
+            List of (LIST_COLUMNS mapping, rank, highlighted snippet),
+            best match first.
+        """
+        terms = tokenize_query(query)
+        if not terms:
+            return []
+
+        if self._is_postgres:
+            tsquery = func.to_tsquery("english", to_prefix_tsquery(terms))
+            rank = func.ts_rank_cd(MemoryORM.search_vector, tsquery)
+            ranked = (
+                self._apply_filters(
+                    select(MemoryORM.id, rank.label("rank")), query, status
+                )
+                .order_by(rank.desc(), MemoryORM.created_at.desc())
+                .limit(limit)
+                .subquery()
+            )
+            stmt = (
+                select(
+                    *LIST_COLUMNS,
+                    ranked.c.rank.label("search_rank"),
+                    func.ts_headline(
+                        "english", MemoryORM.summary, tsquery, _HEADLINE_OPTIONS
+                    ).label("search_snippet"),
+                )
+                .join(ranked, MemoryORM.id == ranked.c.id)
+                .order_by(ranked.c.rank.desc(), MemoryORM.created_at.desc())
+            )
+            rows = (await self._read(stmt)).all()
+            unmatched = [
+                row.id
+                for row in rows
+                if HIGHLIGHT_START not in (row.search_snippet or "")
+            ]
+            transcripts = await self.get_transcripts(unmatched)
+            return [
+                (
+                    {column.key: row._mapping[column.key] for column in LIST_COLUMNS},
+                    float(row.search_rank),
+                    highlight_snippet(transcripts.get(row.id), terms)
+                    or row.search_snippet
+                    or None,
+                )
+                for row in rows
+            ]
+
+        stmt = (
+            self._apply_filters(_list_select(("key_points",)), query, status)
+            .order_by(MemoryORM.created_at.desc())
+            .limit(_FALLBACK_SEARCH_LIMIT)
+        )
+        rows = await self._with_transcripts(
+            (await self._read(stmt)).all(), ("transcript",)
+        )
+        scored = []
+        for row in rows:
+            weighted = (
+                (row.title, 1.0),
+                (row.summary, 0.4),
+                (" ".join(row.key_points or []), 0.4),
+                (row.transcript, 0.1),
+            )
+            rank = sum(
+                weight * (text or "").lower().count(term)
+                for text, weight in weighted
+                for term in terms
+            )
+            snippet = highlight_snippet(row.summary, terms) or highlight_snippet(
+                row.transcript, terms
+            )
+            fields = {column.key: getattr(row, column.key) for column in LIST_COLUMNS}
+            scored.append((fields, rank, snippet))
+        scored.sort(key=lambda hit: hit[1], reverse=True)
+        return scored[:limit]
+
+    async def _write_status(
+        self,
+        memory_id: UUID,
+        values: Dict[str, Any],
+        expected_status: Optional[Union[str, Sequence[str]]],
+    ) -> StatusChange:
+        """Apply ``values`` in one ``UPDATE ... RETURNING`` round trip.
+
+        With ``expected_status`` the UPDATE only matches while the row is
+        still in one of those statuses (compare-and-set). A second query
+        runs only when nothing matched, to tell a missing row from a
+        conflicting one.
+
+        Raises:
+            ResourceNotFoundError: If the memory does not exist.
+            StatusConflictError: If the memory is not in an expected status.
+        """
+        stmt = update(MemoryORM).where(MemoryORM.id == memory_id)
+        if expected_status is not None:
+            if isinstance(expected_status, str):
+                expected_status = (expected_status,)
+            stmt = stmt.where(MemoryORM.status.in_(expected_status))
+        stmt = stmt.values(**values).returning(
+            MemoryORM.id, MemoryORM.status, MemoryORM.updated_at
+        )
+
+        row = (await self._session.execute(stmt)).one_or_none()
+        if row is not None:
+            return StatusChange(id=row.id, status=row.status, updated_at=row.updated_at)
 
-    async def update_status(self, memory_id: UUID, status: str) -> MemoryORM:
-        """Update the status of a memory. Raises ResourceNotFoundError if not found."""
-        memory = await self.get_by_id(memory_id)
-        if memory is None:
+        current = await self._session.scalar(
+            select(MemoryORM.status).where(MemoryORM.id == memory_id)
+        )
+        if current is None:
             raise ResourceNotFoundError(detail=f"Memory {memory_id} not found")
-        memory.status = status
-        await self._session.flush()
-        return memory
+        raise StatusConflictError(
+            detail=(
+                f"Memory {memory_id} is {current}, expected "
+                f"{' or '.join(expected_status)}"
+            )
+        )
+
+    async def update_status(
+        self,
+        memory_id: UUID,
+        status: str,
+        *,
+        expected_status: Optional[Union[str, Sequence[str]]] = None,
+        audio_url: Optional[str] = None,
+    ) -> StatusChange:
+        """Set a memory's status (and optionally its audio URL) in one statement.
+
+        Args:
+            expected_status: Status or statuses the memory must currently
+                have; None skips the check.
+            audio_url: New S3 URL to store alongside the status.
+
+        Raises:
+            ResourceNotFoundError: If the memory does not exist.
+            StatusConflictError: If the memory is not in an expected status.
+        """
+        values: Dict[str, Any] = {"status": status}
+        if audio_url is not None:
+            values["audio_url"] = audio_url
+        return await self._write_status(memory_id, values, expected_status)
 
     async def update_processing_results(
         self,
@@ -99,31 +1223,297 @@ class MemoryRepository:
         action_items: Optional[List[str]] = None,
         title: Optional[str] = None,
         status: str = "ready",
-    ) -> MemoryORM:
-        """Save processing results (transcript, summary, etc.) to a memory."""
-        memory = await self.get_by_id(memory_id)
-        if memory is None:
-            raise ResourceNotFoundError(detail=f"Memory {memory_id} not found")
+        expected_status: Optional[Union[str, Sequence[str]]] = None,
+    ) -> StatusChange:
+        """Save processing results (transcript, summary, etc.) and the final status.
 
+        Fields left as None are not written. The transcript is compressed
+        into memory_transcripts and the search document is rebuilt in the
+        same UPDATE as the other fields; without a new transcript, Postgres
+        keeps the transcript's lexemes from the current document instead of
+        reading the transcript back.
+
+        Raises:
+            ResourceNotFoundError: If the memory does not exist.
+            StatusConflictError: If the memory is not in an expected status.
+        """
+        results = {
+            "summary": summary,
+            "key_points": key_points,
+            "action_items": action_items,
+            "title": title,
+        }
+        values = {key: value for key, value in results.items() if value is not None}
+        values["status"] = status
+        values["search_vector"] = self._search_document(
+            title=MemoryORM.title if title is None else title,
+            summary=MemoryORM.summary if summary is None else summary,
+            key_points=(
+                cast(MemoryORM.key_points, Text)
+                if key_points is None
+                else " ".join(key_points)
+            ),
+            transcript=(
+                transcript
+                if transcript is not None or self._is_postgres
+                # SQLite (single database) has no weights to filter on
+                else await self.get_transcript(memory_id, primary=True)
+            ),
+            keep_transcript=transcript is None and self._is_postgres,
+        )
+        change = await self._write_status(memory_id, values, expected_status)
         if transcript is not None:
-            memory.transcript = transcript
-        if summary is not None:
-            memory.summary = summary
-        if key_points is not None:
-            memory.key_points = key_points
+            await self._save_transcript(memory_id, transcript)
         if action_items is not None:
-            memory.action_items = action_items
-        if title is not None:
-            memory.title = title
-        memory.status = status
+            await self._sync_action_items(memory_id, action_items)
+        return change
 
-        await self._session.flush()
-        return memory
+    async def _sync_action_items(self, memory_id: UUID, texts: Sequence[str]) -> None:
+        """Make the memory's action_items rows match ``texts``.
+
+        Items whose text is unchanged keep their id, status and created_at
+        (only the position moves), so reprocessing a memory does not
+        reopen items that were marked done.
+        """
+        existing = await self._session.execute(
+            select(ActionItemORM.id, ActionItemORM.text, ActionItemORM.position)
+            .where(ActionItemORM.memory_id == memory_id)
+            .order_by(ActionItemORM.position)
+        )
+        by_text: Dict[str, List[Row]] = {}
+        for row in existing.all():
+            by_text.setdefault(row.text, []).append(row)
+
+        moved: List[Dict[str, Any]] = []
+        added: List[Dict[str, Any]] = []
+        for position, item_text in enumerate(texts):
+            matches = by_text.get(item_text)
+            if matches:
+                row = matches.pop(0)
+                if row.position != position:
+                    moved.append({"id": row.id, "position": position})
+            else:
+                added.append(
+                    {"memory_id": memory_id, "position": position, "text": item_text}
+                )
+        stale = [row.id for rows in by_text.values() for row in rows]
+
+        if stale:
+            await self._session.execute(
+                delete(ActionItemORM).where(ActionItemORM.id.in_(stale))
+            )
+        if moved:
+            await self._session.execute(update(ActionItemORM), moved)
+        if added:
+            await self._session.execute(insert(ActionItemORM), added)
+
+    async def list_action_items(
+        self,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        page_size: int = 50,
+        status: Optional[str] = None,
+        memory_id: Optional[UUID] = None,
+    ) -> Tuple[List[Row], bool]:
+        """Return a keyset page of action items, newest first.
+
+        Reads only action_items and the parent memory's title, using
+        ix_action_items_(status_)created_at_id.
+
+        Args:
+            after: (created_at, id) of the last item of the previous page.
+            status: Only items in this status ("open" or "done").
+            memory_id: Only items of this memory.
+
+        Returns:
+            Tuple of (rows, has_more).
+        """
+        stmt = _action_item_select()
+        if status:
+            stmt = stmt.where(ActionItemORM.status == status)
+        if memory_id is not None:
+            stmt = stmt.where(ActionItemORM.memory_id == memory_id)
+        if after is not None:
+            stmt = stmt.where(
+                tuple_(ActionItemORM.created_at, ActionItemORM.id) < tuple_(*after)
+            )
+        stmt = stmt.order_by(
+            ActionItemORM.created_at.desc(), ActionItemORM.id.desc()
+        ).limit(page_size + 1)
+        rows = list((await self._read(stmt)).all())
+        return rows[:page_size], len(rows) > page_size
+
+    async def update_action_item_status(self, item_id: UUID, status: str) -> Row:
+        """Set an action item's status and return its list row.
+
+        Raises:
+            ResourceNotFoundError: If the action item does not exist.
+        """
+        result = await self._session.execute(
+            update(ActionItemORM)
+            .where(ActionItemORM.id == item_id)
+            .values(status=status, updated_at=_utcnow())
+            .returning(ActionItemORM.id)
+        )
+        if result.scalar_one_or_none() is None:
+            raise ResourceNotFoundError(detail=f"Action item {item_id} not found")
+        row = (
+            await self._session.execute(
+                _action_item_select().where(ActionItemORM.id == item_id)
+            )
+        ).one_or_none()
+        if row is None:
+            raise ResourceNotFoundError(detail=f"Action item {item_id} not found")
+        return row
+
+    def _bulk_conditions(
+        self,
+        ids: Optional[Sequence[UUID]] = None,
+        statuses: Optional[Sequence[str]] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+    ) -> List[ColumnElement[bool]]:
+        """WHERE conditions for bulk operations; None skips a criterion."""
+        conditions: List[ColumnElement[bool]] = []
+        if ids is not None:
+            conditions.append(MemoryORM.id.in_(ids))
+        if statuses is not None:
+            conditions.append(MemoryORM.status.in_(statuses))
+        if created_from is not None:
+            conditions.append(MemoryORM.created_at >= created_from)
+        if created_to is not None:
+            conditions.append(MemoryORM.created_at < created_to)
+        return conditions
+
+    def _bulk_target(self, conditions: List[ColumnElement[bool]], limit: int):
+        """``id IN (...)`` over the oldest ``limit`` rows matching ``conditions``."""
+        return MemoryORM.id.in_(
+            select(MemoryORM.id)
+            .where(*conditions)
+            .order_by(MemoryORM.created_at, MemoryORM.id)
+            .limit(limit)
+        )
+
+    async def exists_matching(
+        self,
+        *,
+        ids: Optional[Sequence[UUID]] = None,
+        statuses: Optional[Sequence[str]] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+    ) -> bool:
+        """True if any memory matches the bulk filter."""
+        conditions = self._bulk_conditions(ids, statuses, created_from, created_to)
+        return bool(
+            await self._session.scalar(select(exists().where(*conditions)))
+        )
+
+    async def delete_matching(
+        self,
+        *,
+        limit: int,
+        ids: Optional[Sequence[UUID]] = None,
+        statuses: Optional[Sequence[str]] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+    ) -> List[Tuple[UUID, str]]:
+        """Delete up to ``limit`` matching memories with one statement.
+
+        Oldest memories go first. Tombstones for delta sync are written
+        with one multi-row INSERT.
+
+        Returns:
+            (id, audio_url) of every deleted memory.
+        """
+        conditions = self._bulk_conditions(ids, statuses, created_from, created_to)
+        stmt = (
+            delete(MemoryORM)
+            .where(self._bulk_target(conditions, limit))
+            .returning(MemoryORM.id, MemoryORM.audio_url)
+        )
+        deleted = [(row.id, row.audio_url) for row in await self._session.execute(stmt)]
+        if deleted:
+            await self._session.execute(
+                insert(MemoryTombstoneORM),
+                [{"memory_id": memory_id} for memory_id, _ in deleted],
+            )
+        return deleted
+
+    async def transition_matching(
+        self,
+        status: str,
+        *,
+        from_status: str,
+        limit: int,
+        ids: Optional[Sequence[UUID]] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+    ) -> List[Tuple[StatusChange, str]]:
+        """Move up to ``limit`` memories from ``from_status`` to ``status``.
+
+        One UPDATE ... RETURNING; the status condition makes it a bulk
+        compare-and-set, so rows changed concurrently are left alone.
+
+        Returns:
+            (StatusChange, audio_url) for every updated memory.
+        """
+        conditions = self._bulk_conditions(ids, [from_status], created_from, created_to)
+        stmt = (
+            update(MemoryORM)
+            .where(self._bulk_target(conditions, limit))
+            .where(MemoryORM.status == from_status)
+            .values(status=status)
+            .returning(
+                MemoryORM.id, MemoryORM.status, MemoryORM.updated_at, MemoryORM.audio_url
+            )
+        )
+        return [
+            (
+                StatusChange(id=row.id, status=row.status, updated_at=row.updated_at),
+                row.audio_url,
+            )
+            for row in await self._session.execute(stmt)
+        ]
+
+    async def set_status_many(self, memory_ids: Sequence[UUID], status: str) -> None:
+        """Set the status of several memories with one UPDATE."""
+        if not memory_ids:
+            return
+        await self._session.execute(
+            update(MemoryORM)
+            .where(MemoryORM.id.in_(memory_ids))
+            .values(status=status)
+        )
+
+    async def discard(self, memory_id: UUID) -> None:
+        """Delete a memory that was never exposed, without a tombstone.
+
+        For undoing a create in the same transaction (e.g. a failed
+        upload); a missing row is ignored.
+        """
+        await self._session.execute(delete(MemoryORM).where(MemoryORM.id == memory_id))
 
     async def delete(self, memory_id: UUID) -> None:
-        """Delete a memory by ID. Raises ResourceNotFoundError if not found."""
-        memory = await self.get_by_id(memory_id)
-        if memory is None:
+        """Delete a memory by ID and leave a tombstone for delta sync.
+
+        Raises ResourceNotFoundError if not found.
+        """
+        stmt = (
+            delete(MemoryORM)
+            .where(MemoryORM.id == memory_id)
+            .returning(MemoryORM.id)
+        )
+        if (await self._session.execute(stmt)).one_or_none() is None:
             raise ResourceNotFoundError(detail=f"Memory {memory_id} not found")
-        await self._session.delete(memory)
+        self._session.add(MemoryTombstoneORM(memory_id=memory_id))
         await self._session.flush()
+
+    async def prune_tombstones(self, before: datetime) -> int:
+        """Delete tombstones of memories deleted before ``before``.
+
+        Returns:
+            Number of tombstones removed.
+        """
+        result = await self._session.execute(
+            delete(MemoryTombstoneORM).where(MemoryTombstoneORM.deleted_at < before)
+        )
+        return result.rowcount
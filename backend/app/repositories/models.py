@@ -1,38 +1,320 @@
 """SQLAlchemy ORM models for the RAWK database."""
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import List, Optional
-from uuid import uuid4
+from uuid import UUID, uuid4
 
-from sqlalchemy import Float, JSON, String, Text, func
+from sqlalchemy import (
+    DDL,
+    BigInteger,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    JSON,
+    LargeBinary,
+    Date,
+    String,
+    Text,
+    Uuid,
+    column,
+    event,
+    table,
+)
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.repositories.database import Base
 
 
+def _utcnow() -> datetime:
+    """Naive UTC timestamp with microsecond precision.
+
+    Generated in Python rather than with now() so every backend stores the
+    same precision, which keeps (created_at, id) keyset cursors exact.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+# JSONB on Postgres (binary storage, GIN-indexable), plain JSON elsewhere
+JSONType = JSON().with_variant(JSONB(), "postgresql")
+
+# Full-text search document: a weighted tsvector on Postgres, the plain
+# searchable text elsewhere. Written by MemoryRepository, never mapped for
+# reading (see SEARCH_DOCUMENT_WEIGHTS in memory_repository.py).
+SearchDocumentType = Text().with_variant(TSVECTOR(), "postgresql")
+
+
 class MemoryORM(Base):
     """Represents a memory (recorded meeting) in the database."""
 
     __tablename__ = "memories"
 
-    id: Mapped[str] = mapped_column(
-        String(36),
+    id: Mapped[UUID] = mapped_column(
+        Uuid,
         primary_key=True,
-        default=lambda: str(uuid4()),
+        default=uuid4,
     )
     title: Mapped[Optional[str]] = mapped_column(String(200), nullable=True)
     audio_url: Mapped[str] = mapped_column(String(500), nullable=False)
     status: Mapped[str] = mapped_column(
         String(20), default="uploading", nullable=False
     )
-    transcript: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     summary: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    key_points: Mapped[Optional[List]] = mapped_column(JSON, nullable=True)
-    action_items: Mapped[Optional[List]] = mapped_column(JSON, nullable=True)
+    key_points: Mapped[Optional[List]] = mapped_column(JSONType, nullable=True)
+    action_items: Mapped[Optional[List]] = mapped_column(JSONType, nullable=True)
     duration: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
-        default=func.now(), nullable=False
+        default=_utcnow, nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        default=_utcnow, onupdate=_utcnow, nullable=False
+    )
+    search_vector: Mapped[Optional[str]] = mapped_column(
+        SearchDocumentType, nullable=True, deferred=True
+    )
+    # SHA-256 (hex) of the uploaded audio; duplicates of an earlier upload
+    # point at it and share its audio object (see MemoryService.upload_audio)
+    content_hash: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+    duplicate_of: Mapped[Optional[UUID]] = mapped_column(Uuid, nullable=True)
+
+    # Transcripts live compressed in memory_transcripts; MemoryRepository
+    # fills this plain attribute only when a caller asks for them.
+    transcript = None
+
+
+class MemoryTranscriptORM(Base):
+    """Compressed transcript of a memory, kept out of the hot memories table."""
+
+    __tablename__ = "memory_transcripts"
+
+    memory_id: Mapped[UUID] = mapped_column(
+        Uuid, ForeignKey("memories.id", ondelete="CASCADE"), primary_key=True
     )
+    encoding: Mapped[str] = mapped_column(String(10), nullable=False)
+    content: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    size_bytes: Mapped[int] = mapped_column(Integer, nullable=False)
+
+
+class MemoryTombstoneORM(Base):
+    """Marks a deleted memory so delta sync can report the deletion."""
+
+    __tablename__ = "memory_tombstones"
+
+    memory_id: Mapped[UUID] = mapped_column(Uuid, primary_key=True)
+    deleted_at: Mapped[datetime] = mapped_column(default=_utcnow, nullable=False)
+
+
+class MemoryEmbeddingORM(Base):
+    """Semantic-search embedding of a memory, as little-endian float32 bytes."""
+
+    __tablename__ = "memory_embeddings"
+
+    memory_id: Mapped[UUID] = mapped_column(
+        Uuid, ForeignKey("memories.id", ondelete="CASCADE"), primary_key=True
+    )
+    model: Mapped[str] = mapped_column(String(100), nullable=False)
+    dimensions: Mapped[int] = mapped_column(Integer, nullable=False)
+    vector: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
     updated_at: Mapped[datetime] = mapped_column(
-        default=func.now(), onupdate=func.now(), nullable=False
+        default=_utcnow, onupdate=_utcnow, nullable=False
+    )
+
+
+class ActionItemORM(Base):
+    """One action item extracted from a memory, with its own open/done status.
+
+    Mirrors the memory's ``action_items`` JSON list (``position`` is the
+    index in it) so action items can be listed without loading memories.
+    """
+
+    __tablename__ = "action_items"
+
+    id: Mapped[UUID] = mapped_column(Uuid, primary_key=True, default=uuid4)
+    memory_id: Mapped[UUID] = mapped_column(
+        Uuid, ForeignKey("memories.id", ondelete="CASCADE"), nullable=False
     )
+    position: Mapped[int] = mapped_column(Integer, nullable=False)
+    text: Mapped[str] = mapped_column(Text, nullable=False)
+    status: Mapped[str] = mapped_column(String(10), default="open", nullable=False)
+    created_at: Mapped[datetime] = mapped_column(default=_utcnow, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        default=_utcnow, onupdate=_utcnow, nullable=False
+    )
+
+
+class UploadSessionORM(Base):
+    """A resumable upload: an S3 multipart upload fed chunk by chunk.
+
+    ``offset`` is the number of bytes committed so far; ``parts`` holds
+    the ``{"PartNumber", "ETag"}`` of every uploaded part, in order. The
+    memory (``memory_id``, also the S3 key) is created on completion.
+    """
+
+    __tablename__ = "upload_sessions"
+
+    id: Mapped[UUID] = mapped_column(Uuid, primary_key=True, default=uuid4)
+    memory_id: Mapped[UUID] = mapped_column(Uuid, nullable=False)
+    filename: Mapped[str] = mapped_column(String(255), nullable=False)
+    s3_key: Mapped[str] = mapped_column(String(500), nullable=False)
+    s3_upload_id: Mapped[str] = mapped_column(String(1024), nullable=False)
+    size: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    chunk_size: Mapped[int] = mapped_column(Integer, nullable=False)
+    offset: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+    parts: Mapped[List] = mapped_column(JSONType, default=list, nullable=False)
+    status: Mapped[str] = mapped_column(String(10), default="open", nullable=False)
+    created_at: Mapped[datetime] = mapped_column(default=_utcnow, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        default=_utcnow, onupdate=_utcnow, nullable=False
+    )
+    expires_at: Mapped[datetime] = mapped_column(nullable=False)
+
+
+# Lists sort by (created_at DESC, id DESC), optionally filtered by status.
+# Keep in sync with migrations/versions/0002_memories_list_indexes.py.
+Index("ix_memories_created_at_id", MemoryORM.created_at.desc(), MemoryORM.id.desc())
+Index(
+    "ix_memories_status_created_at_id",
+    MemoryORM.status,
+    MemoryORM.created_at.desc(),
+    MemoryORM.id.desc(),
+)
+
+# Delta sync walks changes in (timestamp, id) order.
+# Keep in sync with migrations/versions/0004_memory_changes.py.
+Index("ix_memories_updated_at_id", MemoryORM.updated_at, MemoryORM.id)
+Index(
+    "ix_memory_tombstones_deleted_at_id",
+    MemoryTombstoneORM.deleted_at,
+    MemoryTombstoneORM.memory_id,
+)
+
+# Upload dedup: at most one original (non-duplicate) memory per content
+# hash, which is also how an upload finds it; duplicates are looked up by
+# the memory they copy results from. Both partial, so memories without a
+# hash cost nothing. Keep in sync with
+# migrations/versions/0010_memory_content_hash.py.
+Index(
+    "ux_memories_content_hash",
+    MemoryORM.content_hash,
+    unique=True,
+    postgresql_where=MemoryORM.duplicate_of.is_(None),
+    sqlite_where=MemoryORM.duplicate_of.is_(None),
+)
+Index(
+    "ix_memories_duplicate_of",
+    MemoryORM.duplicate_of,
+    postgresql_where=MemoryORM.duplicate_of.isnot(None),
+    sqlite_where=MemoryORM.duplicate_of.isnot(None),
+)
+
+# The vector index syncs embeddings incrementally in (updated_at, id) order.
+# Keep in sync with migrations/versions/0006_memory_embeddings.py.
+Index(
+    "ix_memory_embeddings_updated_at_id",
+    MemoryEmbeddingORM.updated_at,
+    MemoryEmbeddingORM.memory_id,
+)
+
+
+# Action items list like memories: (created_at DESC, id DESC), optionally
+# by status; per-memory lookups use memory_id.
+# Keep in sync with migrations/versions/0008_action_items.py.
+Index(
+    "ix_action_items_created_at_id",
+    ActionItemORM.created_at.desc(),
+    ActionItemORM.id.desc(),
+)
+Index(
+    "ix_action_items_status_created_at_id",
+    ActionItemORM.status,
+    ActionItemORM.created_at.desc(),
+    ActionItemORM.id.desc(),
+)
+Index("ix_action_items_memory_id", ActionItemORM.memory_id)
+
+# The reaper looks for open sessions past their expiry.
+# Keep in sync with migrations/versions/0009_upload_sessions.py.
+Index(
+    "ix_upload_sessions_status_expires_at",
+    UploadSessionORM.status,
+    UploadSessionORM.expires_at,
+)
+
+
+# GIN index over the search document (Postgres only; SQLite searches with LIKE).
+event.listen(
+    MemoryORM.__table__,
+    "after_create",
+    DDL(
+        "CREATE INDEX ix_memories_search_vector ON memories USING GIN (search_vector)"
+    ).execute_if(dialect="postgresql"),
+)
+
+# Containment queries over action items (action_items @> '["..."]')
+event.listen(
+    MemoryORM.__table__,
+    "after_create",
+    DDL(
+        "CREATE INDEX ix_memories_action_items ON memories "
+        "USING GIN (action_items jsonb_path_ops)"
+    ).execute_if(dialect="postgresql"),
+)
+
+
+class MaterializedViewRefreshORM(Base):
+    """When a materialized view was last refreshed, one row per view.
+
+    Kept out of the view itself, where a refresh timestamp column would
+    make every REFRESH ... CONCURRENTLY rewrite every row.
+    """
+
+    __tablename__ = "materialized_view_refreshes"
+
+    view_name: Mapped[str] = mapped_column(String(63), primary_key=True)
+    refreshed_at: Mapped[datetime] = mapped_column(nullable=False)
+
+
+# Per-day, per-status rollup behind GET /memories/stats (Postgres only;
+# SQLite aggregates memories directly). Refreshed on a schedule, see
+# app/services/stats_refresher.py. The unique index is what allows
+# REFRESH ... CONCURRENTLY. Keep in sync with
+# migrations/versions/0011_stats_refreshed_at.py.
+MEMORY_DAILY_STATS_VIEW = "memory_daily_stats"
+
+memory_daily_stats = table(
+    MEMORY_DAILY_STATS_VIEW,
+    column("day", Date),
+    column("status", String),
+    column("memory_count", BigInteger),
+    column("duration_total", Float),
+    column("duration_count", BigInteger),
+)
+
+event.listen(
+    MemoryORM.__table__,
+    "after_create",
+    DDL(
+        f"CREATE MATERIALIZED VIEW {MEMORY_DAILY_STATS_VIEW} AS "
+        "SELECT date(created_at) AS day, status, "
+        "count(*) AS memory_count, "
+        "sum(duration) AS duration_total, "
+        "count(duration) AS duration_count "
+        "FROM memories GROUP BY 1, 2"
+    ).execute_if(dialect="postgresql"),
+)
+event.listen(
+    MemoryORM.__table__,
+    "after_create",
+    DDL(
+        "CREATE UNIQUE INDEX ix_memory_daily_stats_day_status "
+        f"ON {MEMORY_DAILY_STATS_VIEW} (day, status)"
+    ).execute_if(dialect="postgresql"),
+)
+event.listen(
+    MemoryORM.__table__,
+    "before_drop",
+    DDL(f"DROP MATERIALIZED VIEW IF EXISTS {MEMORY_DAILY_STATS_VIEW}").execute_if(
+        dialect="postgresql"
+    ),
+)
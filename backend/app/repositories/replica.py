@@ -0,0 +1,120 @@
+"""Read-replica health tracking and read-your-writes stickiness."""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import Optional
+
+from sqlalchemy import event, text
+from sqlalchemy.exc import DBAPIError, InterfaceError, OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from app.config import Settings, get_settings
+
+logger = logging.getLogger(__name__)
+
+# Session.info flag set once the session has written to the primary
+WROTE_KEY = "rawk_wrote"
+
+# Seconds the replica is behind the primary; 0 when fully replayed
+_REPLICA_LAG_QUERY = text(
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE coalesce(extract(epoch FROM now() - pg_last_xact_replay_timestamp()), 0) "
+    "END"
+)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_dml(state: ORMExecuteState) -> None:
+    """Flag sessions that ran INSERT/UPDATE/DELETE statements."""
+    if state.is_insert or state.is_update or state.is_delete:
+        state.session.info[WROTE_KEY] = True
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_flush(session: Session, flush_context) -> None:
+    """Flag sessions that flushed pending ORM changes."""
+    session.info[WROTE_KEY] = True
+
+
+def has_written(session: AsyncSession) -> bool:
+    """True once the session wrote, so its reads must see the primary."""
+    return bool(session.info.get(WROTE_KEY))
+
+
+def is_unavailable_error(exc: BaseException) -> bool:
+    """True for errors that mean the replica itself is unreachable or broken."""
+    if isinstance(exc, DBAPIError):
+        return exc.connection_invalidated or isinstance(
+            exc, (OperationalError, InterfaceError)
+        )
+    return isinstance(exc, (OSError, TimeoutError))
+
+
+class ReplicaHealth:
+    """Process-wide view of whether the read replica should take reads.
+
+    The replica is skipped for ``retry_seconds`` after a connection
+    failure, and while its replay lag (sampled at most every
+    ``check_interval_seconds``) exceeds ``max_lag_seconds``.
+    """
+
+    def __init__(
+        self,
+        retry_seconds: float = 30.0,
+        max_lag_seconds: float = 5.0,
+        check_interval_seconds: float = 10.0,
+    ) -> None:
+        self._retry_seconds = retry_seconds
+        self._max_lag_seconds = max_lag_seconds
+        self._check_interval_seconds = check_interval_seconds
+        self._unhealthy_until = 0.0
+        self._next_check = 0.0
+
+    @property
+    def available(self) -> bool:
+        """False while a recent failure or excessive lag is being waited out."""
+        return time.monotonic() >= self._unhealthy_until
+
+    def mark_unhealthy(self, reason: str) -> None:
+        """Route reads to the primary for the retry window."""
+        logger.warning(
+            "Read replica unavailable (%s); using primary for %.0fs",
+            reason,
+            self._retry_seconds,
+        )
+        self._unhealthy_until = time.monotonic() + self._retry_seconds
+
+    async def check_lag(self, session: AsyncSession) -> bool:
+        """Sample replication lag when due; False if the replica is too far behind.
+
+        Only Postgres replicas are checked. Failures of the check itself
+        propagate so the caller can treat them as an unavailable replica.
+        """
+        now = time.monotonic()
+        if now < self._next_check or session.bind.dialect.name != "postgresql":
+            return self.available
+        self._next_check = now + self._check_interval_seconds
+        lag = float((await session.execute(_REPLICA_LAG_QUERY)).scalar_one() or 0)
+        if lag > self._max_lag_seconds:
+            self.mark_unhealthy(f"replication lag {lag:.1f}s")
+            return False
+        return True
+
+
+_health: Optional[ReplicaHealth] = None
+
+
+def get_replica_health(settings: Optional[Settings] = None) -> ReplicaHealth:
+    """Get or create the process-wide ReplicaHealth (lazy singleton)."""
+    global _health
+    if _health is None:
+        s = settings or get_settings()
+        _health = ReplicaHealth(
+            retry_seconds=s.db_replica_retry_seconds,
+            max_lag_seconds=s.db_replica_max_lag_seconds,
+            check_interval_seconds=s.db_replica_check_interval_seconds,
+        )
+    return _health
@@ -0,0 +1,126 @@
+"""Data access for resumable upload sessions. Only SQLAlchemy here."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import List, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repositories.models import UploadSessionORM
+
+
+class UploadSessionRepository:
+    """Reads and compare-and-set writes of upload_sessions rows.
+
+    Writes are conditional UPDATEs (on the committed offset or the
+    status), so concurrent chunk PUTs or a finalize racing the reaper
+    cannot both succeed.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def create(
+        self,
+        *,
+        memory_id: UUID,
+        filename: str,
+        s3_key: str,
+        s3_upload_id: str,
+        size: int,
+        chunk_size: int,
+        expires_at: datetime,
+    ) -> UploadSessionORM:
+        """Create an open session with nothing committed yet."""
+        upload = UploadSessionORM(
+            memory_id=memory_id,
+            filename=filename,
+            s3_key=s3_key,
+            s3_upload_id=s3_upload_id,
+            size=size,
+            chunk_size=chunk_size,
+            offset=0,
+            parts=[],
+            status="open",
+            expires_at=expires_at,
+        )
+        self._session.add(upload)
+        await self._session.flush()
+        return upload
+
+    async def get(self, session_id: UUID) -> Optional[UploadSessionORM]:
+        """Get a session by id, or None if not found."""
+        return await self._session.scalar(
+            select(UploadSessionORM)
+            .where(UploadSessionORM.id == session_id)
+            .execution_options(populate_existing=True)
+        )
+
+    async def lock(self, session_id: UUID) -> Optional[UploadSessionORM]:
+        """Re-read a session with ``SELECT ... FOR UPDATE``, or None if not found.
+
+        Other lockers and writes to the row wait until the caller's
+        transaction ends (Postgres; other dialects take no lock).
+        """
+        return await self._session.scalar(
+            select(UploadSessionORM)
+            .where(UploadSessionORM.id == session_id)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
+
+    async def commit_part(
+        self,
+        session_id: UUID,
+        *,
+        expected_offset: int,
+        offset: int,
+        parts: Sequence[dict],
+        expires_at: datetime,
+    ) -> bool:
+        """Record an uploaded part if the session is still open at ``expected_offset``.
+
+        Returns:
+            False if another chunk was committed first or the session closed.
+        """
+        result = await self._session.execute(
+            update(UploadSessionORM)
+            .where(
+                UploadSessionORM.id == session_id,
+                UploadSessionORM.offset == expected_offset,
+                UploadSessionORM.status == "open",
+            )
+            .values(offset=offset, parts=list(parts), expires_at=expires_at)
+        )
+        return result.rowcount == 1
+
+    async def transition(
+        self, session_id: UUID, status: str, *, from_status: str = "open"
+    ) -> bool:
+        """Move a session from ``from_status`` to ``status``.
+
+        Returns:
+            False if the session was not in ``from_status``.
+        """
+        result = await self._session.execute(
+            update(UploadSessionORM)
+            .where(
+                UploadSessionORM.id == session_id,
+                UploadSessionORM.status == from_status,
+            )
+            .values(status=status)
+        )
+        return result.rowcount == 1
+
+    async def list_expired(self, now: datetime, limit: int) -> List[UploadSessionORM]:
+        """Open sessions whose ``expires_at`` has passed, oldest first."""
+        result = await self._session.execute(
+            select(UploadSessionORM)
+            .where(UploadSessionORM.status == "open", UploadSessionORM.expires_at < now)
+            .order_by(UploadSessionORM.expires_at)
+            .limit(limit)
+        )
+        return list(result.scalars())
@@ -0,0 +1,47 @@
+"""Action items router — list action items across memories and update them."""
+
+from __future__ import annotations
+
+from typing import Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query
+
+from app.dependencies import get_memory_service
+from app.models.action_item import (
+    ActionItemListResponse,
+    ActionItemResponse,
+    ActionItemStatus,
+    ActionItemUpdate,
+)
+from app.services.memory_service import MemoryService
+
+router = APIRouter(prefix="/action-items", tags=["action-items"])
+
+
+@router.get("", response_model=ActionItemListResponse)
+async def list_action_items(
+    status: Optional[ActionItemStatus] = Query(default=None),
+    memory_id: Optional[UUID] = Query(default=None),
+    cursor: Optional[str] = Query(default=None, min_length=1, max_length=500),
+    page_size: int = Query(default=50, ge=1, le=200),
+    service: MemoryService = Depends(get_memory_service),
+) -> ActionItemListResponse:
+    """List action items, newest first, optionally by status or memory.
+
+    Pass the previous response's ``next_cursor`` as ``cursor`` for the
+    next page.
+    """
+    return await service.list_action_items(
+        cursor=cursor, page_size=page_size, status=status, memory_id=memory_id
+    )
+
+
+@router.patch("/{item_id}", response_model=ActionItemResponse)
+async def update_action_item(
+    item_id: UUID,
+    changes: ActionItemUpdate,
+    service: MemoryService = Depends(get_memory_service),
+) -> ActionItemResponse:
+    """Mark an action item open or done."""
+    return await service.update_action_item(item_id, changes)
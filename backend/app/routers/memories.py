@@ -2,39 +2,212 @@
 
 from __future__ import annotations
 
+from datetime import date
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, Response
+from fastapi import APIRouter, Depends, Header, Query, Request, Response
 
 from app.dependencies import get_memory_service
-from app.models.memory import MemoryListResponse, MemoryResponse
+from app.models.memory import (
+    MemoryBatchGetRequest,
+    MemoryBatchGetResponse,
+    MemoryBulkFilter,
+    MemoryBulkReport,
+    MemoryChangesResponse,
+    MemoryListResponse,
+    MemoryResponse,
+    MemorySearchResponse,
+    MemorySemanticSearchResponse,
+    MemoryStatsResponse,
+)
 from app.services.memory_service import MemoryService
+from app.utils.http_cache import (
+    REVALIDATE_CACHE_CONTROL,
+    etag_matches,
+    list_etag,
+    memory_cache_control,
+    memory_etag,
+)
 
 router = APIRouter(prefix="/memories", tags=["memories"])
 
 
-@router.get("", response_model=MemoryListResponse)
+def _conditional(
+    response: Response,
+    if_none_match: Optional[str],
+    etag: str,
+    cache_control: str,
+) -> Optional[Response]:
+    """Return a 304 if the client's ETag is current, else set cache headers."""
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
+
+
+@router.get(
+    "", response_model=MemoryListResponse, response_model_exclude_unset=True
+)
 async def list_memories(
+    request: Request,
+    response: Response,
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=20, ge=1, le=100),
     search: Optional[str] = Query(default=None, min_length=1, max_length=200),
     status: Optional[str] = Query(default=None),
+    cursor: Optional[str] = Query(default=None, min_length=1, max_length=500),
+    include_total: bool = Query(default=False),
+    include: Optional[str] = Query(default=None, max_length=100),
+    if_none_match: Optional[str] = Header(default=None),
     service: MemoryService = Depends(get_memory_service),
 ) -> MemoryListResponse:
-    """List all memories with pagination, optional search and status filter."""
-    return await service.list_memories(
-        page=page, page_size=page_size, search=search, status=status,
+    """List all memories with pagination, optional search and status filter.
+
+    Pass the previous response's ``next_cursor`` as ``cursor`` for keyset
+    pagination (``page`` is then ignored); ``include_total`` adds the
+    total count in that mode. Items omit transcript, key points and
+    action items unless named in ``include`` (comma-separated).
+
+    Responses carry an ETag; send it back as ``If-None-Match`` to get a
+    304 while the page is unchanged.
+    """
+    result = await service.list_memories(
+        page=page,
+        page_size=page_size,
+        search=search,
+        status=status,
+        cursor=cursor,
+        include_total=include_total,
+        include=include,
+    )
+    etag = list_etag(
+        dict(request.query_params),
+        ((item.id, item.updated_at) for item in result.items),
+        result.total,
     )
+    not_modified = _conditional(
+        response, if_none_match, etag, REVALIDATE_CACHE_CONTROL
+    )
+    return not_modified or result
+
+
+@router.get(
+    "/search", response_model=MemorySearchResponse, response_model_exclude_unset=True
+)
+async def search_memories(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(default=20, ge=1, le=100),
+    status: Optional[str] = Query(default=None),
+    service: MemoryService = Depends(get_memory_service),
+) -> MemorySearchResponse:
+    """Full-text search over title, summary, key points and transcript.
+
+    Results are ranked by relevance and carry a highlighted snippet.
+    """
+    return await service.search_memories(q, limit=limit, status=status)
+
+
+@router.get(
+    "/search/semantic",
+    response_model=MemorySemanticSearchResponse,
+    response_model_exclude_unset=True,
+)
+async def semantic_search_memories(
+    q: str = Query(..., min_length=1, max_length=1000),
+    limit: int = Query(default=20, ge=1, le=100),
+    status: Optional[str] = Query(default=None),
+    service: MemoryService = Depends(get_memory_service),
+) -> MemorySemanticSearchResponse:
+    """Find memories by meaning rather than exact words.
+
+    Results are ordered by cosine similarity between the query's and
+    each memory's embedding. Returns 503 when embeddings are disabled.
+    """
+    return await service.semantic_search(q, limit=limit, status=status)
+
+
+@router.get("/stats", response_model=MemoryStatsResponse)
+async def get_memory_stats(
+    date_from: Optional[date] = Query(default=None),
+    date_to: Optional[date] = Query(default=None),
+    service: MemoryService = Depends(get_memory_service),
+) -> MemoryStatsResponse:
+    """Counts by status, memories per day and average duration.
+
+    Limited to memories created between ``date_from`` and ``date_to``
+    (inclusive, UTC) when given. On Postgres the figures come from a
+    view refreshed every STATS_REFRESH_SECONDS; see ``refreshed_at``.
+    """
+    return await service.get_stats(date_from=date_from, date_to=date_to)
+
+
+@router.get(
+    "/changes", response_model=MemoryChangesResponse, response_model_exclude_unset=True
+)
+async def list_memory_changes(
+    since: Optional[str] = Query(default=None, min_length=1, max_length=500),
+    limit: int = Query(default=100, ge=1, le=500),
+    include: Optional[str] = Query(default=None, max_length=100),
+    service: MemoryService = Depends(get_memory_service),
+) -> MemoryChangesResponse:
+    """Delta sync: memories updated and deleted since the ``since`` cursor.
+
+    Omit ``since`` for the first sync, then pass the previous
+    ``next_cursor``. Items use the list projection; ``include`` adds
+    transcript, key points or action items. A cursor older than
+    TOMBSTONE_RETENTION_SECONDS gets 410; sync again without ``since``.
+    """
+    return await service.list_changes(since=since, limit=limit, include=include)
+
+
+@router.post("/batch-get", response_model=MemoryBatchGetResponse)
+async def batch_get_memories(
+    request: MemoryBatchGetRequest,
+    service: MemoryService = Depends(get_memory_service),
+) -> MemoryBatchGetResponse:
+    """Get up to 100 memories by ID in one call.
+
+    Items come back in request order; unknown ids are listed in ``missing``.
+    """
+    return await service.get_memories(request.ids)
+
+
+@router.post("/bulk-delete", response_model=MemoryBulkReport)
+async def bulk_delete_memories(
+    selection: MemoryBulkFilter,
+    service: MemoryService = Depends(get_memory_service),
+) -> MemoryBulkReport:
+    """Delete the memories matching a filter (ids, status, created range).
+
+    Each call removes at most BULK_MAX_ITEMS memories, oldest first;
+    repeat while ``has_more`` is True.
+    """
+    return await service.bulk_delete(selection)
 
 
 @router.get("/{memory_id}", response_model=MemoryResponse)
 async def get_memory(
     memory_id: UUID,
+    response: Response,
+    if_none_match: Optional[str] = Header(default=None),
     service: MemoryService = Depends(get_memory_service),
 ) -> MemoryResponse:
-    """Get a single memory by ID."""
-    return await service.get_memory(memory_id)
+    """Get a single memory by ID.
+
+    Responses carry a strong ETag (from id and updated_at); send it back
+    as ``If-None-Match`` to get a 304 while the memory is unchanged.
+    Ready memories may be reused by the client for a short while.
+    """
+    memory = await service.get_memory(memory_id)
+    not_modified = _conditional(
+        response,
+        if_none_match,
+        memory_etag(memory.id, memory.updated_at),
+        memory_cache_control(memory.status.value),
+    )
+    return not_modified or memory
 
 
 @router.delete("/{memory_id}")
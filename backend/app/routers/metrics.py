@@ -0,0 +1,19 @@
+"""Prometheus scrape endpoint for in-process metrics."""
+
+from __future__ import annotations
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.utils.metrics import REGISTRY
+
+router = APIRouter(tags=["metrics"])
+
+# Prometheus text exposition format
+_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics() -> PlainTextResponse:
+    """Render pool, query and cache metrics for this process."""
+    return PlainTextResponse(REGISTRY.render(), media_type=_CONTENT_TYPE)
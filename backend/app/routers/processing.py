@@ -7,12 +7,25 @@ from uuid import UUID
 from fastapi import APIRouter, Depends
 
 from app.dependencies import get_memory_service
-from app.models.memory import UploadResponse
+from app.models.memory import MemoryBulkFilter, MemoryBulkReport, UploadResponse
 from app.services.memory_service import MemoryService
 
 router = APIRouter(tags=["processing"])
 
 
+@router.post("/process/bulk", response_model=MemoryBulkReport)
+async def bulk_trigger_processing(
+    selection: MemoryBulkFilter,
+    service: MemoryService = Depends(get_memory_service),
+) -> MemoryBulkReport:
+    """Re-trigger processing for failed/uploading memories matching a filter.
+
+    Each call re-queues at most BULK_MAX_ITEMS memories, oldest first;
+    repeat while ``has_more`` is True.
+    """
+    return await service.bulk_retrigger(selection)
+
+
 @router.post("/process/{audio_id}", response_model=UploadResponse)
 async def trigger_processing(
     audio_id: UUID,
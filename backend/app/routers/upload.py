@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, File, UploadFile
+from typing import List
+from uuid import UUID
 
-from app.dependencies import get_memory_service
-from app.models.memory import UploadResponse
+from fastapi import APIRouter, Depends, File, Query, Request, Response, UploadFile
+
+from app.dependencies import get_memory_service, get_upload_session_service
+from app.models.memory import BulkUploadResponse, UploadResponse
+from app.models.upload_session import UploadSessionCreate, UploadSessionResponse
 from app.services.memory_service import MemoryService
+from app.services.upload_session_service import UploadSessionService
 
 router = APIRouter(tags=["upload"])
 
@@ -18,3 +23,60 @@ async def upload_audio(
 ) -> UploadResponse:
     """Upload an audio file for processing."""
     return await service.upload_audio(file)
+
+
+@router.post("/upload/bulk", response_model=BulkUploadResponse, status_code=201)
+async def bulk_upload_audio(
+    files: List[UploadFile] = File(...),
+    service: MemoryService = Depends(get_memory_service),
+) -> BulkUploadResponse:
+    """Upload several audio files, or zip archives of them, in one request."""
+    return await service.bulk_upload(files)
+
+
+@router.post("/upload/sessions", response_model=UploadSessionResponse, status_code=201)
+async def create_upload_session(
+    body: UploadSessionCreate,
+    service: UploadSessionService = Depends(get_upload_session_service),
+) -> UploadSessionResponse:
+    """Start a resumable upload; send chunks of the returned chunk_size."""
+    return await service.create_session(body)
+
+
+@router.get("/upload/sessions/{session_id}", response_model=UploadSessionResponse)
+async def get_upload_session(
+    session_id: UUID,
+    service: UploadSessionService = Depends(get_upload_session_service),
+) -> UploadSessionResponse:
+    """Get a resumable upload's committed offset, to resume after a drop."""
+    return await service.get_session(session_id)
+
+
+@router.put("/upload/sessions/{session_id}", response_model=UploadSessionResponse)
+async def put_upload_chunk(
+    session_id: UUID,
+    request: Request,
+    offset: int = Query(ge=0),
+    service: UploadSessionService = Depends(get_upload_session_service),
+) -> UploadSessionResponse:
+    """Append the raw request body as the chunk starting at ``offset``."""
+    return await service.put_chunk(session_id, offset, await request.body())
+
+
+@router.post("/upload/sessions/{session_id}/complete", response_model=UploadResponse)
+async def complete_upload_session(
+    session_id: UUID,
+    service: UploadSessionService = Depends(get_upload_session_service),
+) -> UploadResponse:
+    """Finish a resumable upload and enqueue processing."""
+    return await service.complete(session_id)
+
+
+@router.delete("/upload/sessions/{session_id}")
+async def abort_upload_session(
+    session_id: UUID,
+    service: UploadSessionService = Depends(get_upload_session_service),
+) -> Response:
+    """Abandon a resumable upload and discard its chunks."""
+    await service.abort(session_id)
+    return Response(status_code=204)
@@ -0,0 +1,102 @@
+"""Total-count strategy for memory list queries.
+
+Exact ``count(*)`` over a filtered subquery often costs more than fetching
+the page itself. This layer answers from, in order:
+
+1. A per-filter Redis cache, namespaced by a version counter that is bumped
+   whenever a memory is created, deleted or changes status.
+2. The planner's estimate (``pg_class.reltuples`` / EXPLAIN) when it says
+   the result is large; large totals are reported as approximate.
+3. An exact count for small results.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from dataclasses import dataclass
+from typing import Optional, Union
+
+from app.clients.redis_client import NullRedisClient, RedisClient
+from app.repositories.memory_repository import MemoryRepository
+
+logger = logging.getLogger(__name__)
+
+COUNT_VERSION_KEY = "memories:count:version"
+COUNT_KEY_PREFIX = "memories:count"
+
+DEFAULT_EXACT_THRESHOLD = 10_000
+DEFAULT_CACHE_TTL_SECONDS = 60
+
+
+@dataclass(frozen=True)
+class CountResult:
+    """A list total and whether it is exact or a planner estimate."""
+
+    total: int
+    exact: bool
+
+
+async def invalidate_counts(
+    redis_client: Optional[Union[RedisClient, NullRedisClient]],
+) -> None:
+    """Invalidate every cached count by bumping the namespace version."""
+    if redis_client is None:
+        return
+    await redis_client.cache_incr(COUNT_VERSION_KEY)
+
+
+class MemoryCountStrategy:
+    """Chooses between cached, estimated and exact totals for list queries.
+
+    Built per request; ``redis_client`` should be the process-wide client
+    (get_shared_redis_client), as every list request reads the cache.
+    """
+
+    def __init__(
+        self,
+        repository: MemoryRepository,
+        redis_client: Optional[Union[RedisClient, NullRedisClient]] = None,
+        exact_threshold: int = DEFAULT_EXACT_THRESHOLD,
+        cache_ttl_seconds: int = DEFAULT_CACHE_TTL_SECONDS,
+    ) -> None:
+        self._repository = repository
+        self._redis = redis_client
+        self._exact_threshold = exact_threshold
+        self._cache_ttl = cache_ttl_seconds
+
+    async def _cache_key(self, search: Optional[str], status: Optional[str]) -> str:
+        version = await self._redis.cache_get(COUNT_VERSION_KEY) or "0"
+        digest = hashlib.sha1(f"{status or ''}\x00{search or ''}".encode()).hexdigest()
+        return f"{COUNT_KEY_PREFIX}:v{version}:{digest}"
+
+    async def count(
+        self,
+        search: Optional[str] = None,
+        status: Optional[str] = None,
+    ) -> CountResult:
+        """Return the total for the given list filters."""
+        key = None
+        if self._redis is not None:
+            key = await self._cache_key(search, status)
+            cached = await self._redis.cache_get(key)
+            if cached is not None:
+                total, _, exact = cached.partition(":")
+                return CountResult(total=int(total), exact=exact == "1")
+
+        estimate = await self._repository.estimate_count(search=search, status=status)
+        if estimate is not None and estimate >= self._exact_threshold:
+            result = CountResult(total=estimate, exact=False)
+        else:
+            total = await self._repository.count(search=search, status=status)
+            result = CountResult(total=total, exact=True)
+
+        if key is not None:
+            await self._redis.cache_set(
+                key, f"{result.total}:{int(result.exact)}", self._cache_ttl
+            )
+        return result
+
+    async def invalidate(self) -> None:
+        """Invalidate all cached counts (call after any status change)."""
+        await invalidate_counts(self._redis)
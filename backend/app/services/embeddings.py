@@ -0,0 +1,162 @@
+"""Embedding providers for semantic search.
+
+Providers turn text into unit-length vectors. ``OpenAIEmbeddingProvider``
+calls the embeddings API; ``HashingEmbeddingProvider`` is a deterministic,
+offline feature-hashing model for tests and local development. Vectors
+are stored as little-endian float32 bytes (see pack_vector).
+
+Only the standard library is used here so the Lambda worker can embed
+without importing NumPy; the search index (app.utils.vector_index) reads
+the packed bytes directly.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import re
+import sys
+from array import array
+from typing import TYPE_CHECKING, List, Optional, Protocol, Sequence
+
+from app.config import Settings
+
+if TYPE_CHECKING:
+    from app.clients.openai import OpenAIClient
+
+# Characters of transcript embedded when a memory has no summary
+_TRANSCRIPT_EMBED_CHARS = 4000
+
+_WORD_RE = re.compile(r"\w+")
+
+
+class EmbeddingProvider(Protocol):
+    """Turns texts into unit-length vectors of a fixed size."""
+
+    model: str
+    dimensions: int
+
+    async def embed(self, texts: Sequence[str]) -> List[List[float]]:
+        """Embed texts; one vector per text, in input order."""
+        ...
+
+
+def _normalize(vector: Sequence[float]) -> List[float]:
+    norm = math.sqrt(sum(value * value for value in vector))
+    if norm == 0:
+        return list(vector)
+    return [value / norm for value in vector]
+
+
+def pack_vector(vector: Sequence[float]) -> bytes:
+    """Serialize a vector as little-endian float32 bytes."""
+    packed = array("f", vector)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def memory_embedding_text(
+    title: Optional[str] = None,
+    summary: Optional[str] = None,
+    key_points: Optional[Sequence[str]] = None,
+    action_items: Optional[Sequence[str]] = None,
+    transcript: Optional[str] = None,
+) -> str:
+    """The text a memory is embedded from.
+
+    The analysis output describes a meeting more densely than its raw
+    transcript, so the transcript is only used (truncated) when there is
+    no summary.
+    """
+    parts = [title or "", summary or ""]
+    parts.extend(key_points or ())
+    parts.extend(action_items or ())
+    if not summary and transcript:
+        parts.append(transcript[:_TRANSCRIPT_EMBED_CHARS])
+    return "\n".join(part for part in parts if part)
+
+
+class HashingEmbeddingProvider:
+    """Deterministic bag-of-words embeddings via signed feature hashing.
+
+    Each word and word bigram is hashed to a dimension and sign, so texts
+    sharing vocabulary get similar vectors. No model or network needed.
+    """
+
+    model = "hashing-v1"
+
+    def __init__(self, dimensions: int = 256) -> None:
+        self.dimensions = dimensions
+
+    def _embed_one(self, text: str) -> List[float]:
+        vector = [0.0] * self.dimensions
+        words = _WORD_RE.findall(text.lower())
+        features = words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+        for feature in features:
+            digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+            value = int.from_bytes(digest, "little")
+            sign = 1.0 if value & 1 else -1.0
+            vector[(value >> 1) % self.dimensions] += sign
+        return _normalize(vector)
+
+    async def embed(self, texts: Sequence[str]) -> List[List[float]]:
+        return [self._embed_one(text) for text in texts]
+
+
+class OpenAIEmbeddingProvider:
+    """Embeddings from the OpenAI embeddings API."""
+
+    def __init__(
+        self, openai_client: "OpenAIClient", model: str, dimensions: int
+    ) -> None:
+        self._openai = openai_client
+        self.model = model
+        self.dimensions = dimensions
+
+    async def embed(self, texts: Sequence[str]) -> List[List[float]]:
+        vectors = await self._openai.embed_texts(
+            texts, model=self.model, dimensions=self.dimensions
+        )
+        return [_normalize(vector) for vector in vectors]
+
+
+def build_embedding_provider(
+    settings: Settings,
+    openai_client: Optional["OpenAIClient"] = None,
+) -> Optional[EmbeddingProvider]:
+    """Create the provider named by ``settings.embedding_provider``.
+
+    Returns:
+        The provider, or None when embeddings are disabled ("none").
+
+    Raises:
+        ValueError: If the provider name is unknown.
+    """
+    name = settings.embedding_provider
+    if name == "none":
+        return None
+    if name == "hashing":
+        return HashingEmbeddingProvider(settings.embedding_dimensions)
+    if name == "openai":
+        if openai_client is None:
+            from app.clients.openai import OpenAIClient
+
+            openai_client = OpenAIClient(settings)
+        return OpenAIEmbeddingProvider(
+            openai_client, settings.embedding_model, settings.embedding_dimensions
+        )
+    raise ValueError(f"Unknown embedding provider: {name}")
+
+
+_provider: Optional[EmbeddingProvider] = None
+_provider_built = False
+
+
+def get_embedding_provider(settings: Settings) -> Optional[EmbeddingProvider]:
+    """Get or create the process-wide embedding provider (lazy singleton)."""
+    global _provider, _provider_built
+    if not _provider_built:
+        _provider = build_embedding_provider(settings)
+        _provider_built = True
+    return _provider
@@ -0,0 +1,138 @@
+"""Read-through Redis cache for single-memory responses (GET /memories/{id}).
+
+Entries hold the serialized MemoryResponse. A memory still moving through
+the pipeline is cached briefly, since clients poll it and it is about to
+change; a "ready" memory only changes again if it is deleted, so it is
+cached for longer. Entries are only filled from the primary, and are
+invalidated once a status change or delete commits (in the worker too,
+when it shares the API's Redis).
+
+Each entry is stamped with the memory's cache version, read before the
+database lookup; invalidation bumps the version. A fill that read the row
+before a change committed but writes after its invalidation therefore
+carries the old stamp and is treated as a miss, instead of serving e.g. a
+deleted memory for the whole ready TTL.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Awaitable, Callable, Optional, Union
+from uuid import UUID
+
+from pydantic import ValidationError
+
+from app.clients.redis_client import NullRedisClient, RedisClient
+from app.models.memory import MemoryResponse, MemoryStatus
+from app.utils.metrics import Counter
+
+logger = logging.getLogger(__name__)
+
+MEMORY_CACHE_KEY_PREFIX = "memories:detail"
+MEMORY_CACHE_VERSION_PREFIX = "memories:detail-version"
+
+DEFAULT_READY_TTL_SECONDS = 600
+DEFAULT_PENDING_TTL_SECONDS = 5
+# Outlives any entry stamped before the bump, however slow its fill
+VERSION_TTL_SECONDS = 86_400
+
+MEMORY_CACHE_REQUESTS = Counter(
+    "memory_cache_requests_total",
+    "GET /memories/{id} cache lookups by result (hit or miss).",
+    ("result",),
+)
+
+RedisLike = Union[RedisClient, NullRedisClient]
+
+
+def memory_cache_key(memory_id: UUID) -> str:
+    """Redis key of a memory's cached response."""
+    return f"{MEMORY_CACHE_KEY_PREFIX}:{memory_id}"
+
+
+def memory_version_key(memory_id: UUID) -> str:
+    """Redis key of the version counter that stamps a memory's cache entries."""
+    return f"{MEMORY_CACHE_VERSION_PREFIX}:{memory_id}"
+
+
+async def invalidate_memories(
+    redis_client: Optional[RedisLike], *memory_ids: UUID
+) -> None:
+    """Drop cached responses for memories that changed or were deleted.
+
+    Bumps each memory's version first, so an in-flight fill that read the
+    old row cannot be served once it lands.
+    """
+    if redis_client is None or not memory_ids:
+        return
+    await redis_client.cache_bump(
+        [memory_version_key(m) for m in memory_ids], VERSION_TTL_SECONDS
+    )
+    await redis_client.cache_delete(*(memory_cache_key(m) for m in memory_ids))
+
+
+class MemoryCache:
+    """Caches MemoryResponse objects in Redis, keyed by memory id.
+
+    With no Redis (None or NullRedisClient) every lookup goes straight to
+    the loader and no metrics are recorded.
+    """
+
+    def __init__(
+        self,
+        redis_client: Optional[RedisLike],
+        ready_ttl_seconds: int = DEFAULT_READY_TTL_SECONDS,
+        pending_ttl_seconds: int = DEFAULT_PENDING_TTL_SECONDS,
+    ) -> None:
+        self._redis = redis_client
+        self._ready_ttl = ready_ttl_seconds
+        self._pending_ttl = pending_ttl_seconds
+
+    @property
+    def enabled(self) -> bool:
+        return self._redis is not None and not isinstance(self._redis, NullRedisClient)
+
+    def _ttl(self, status: MemoryStatus) -> int:
+        return self._ready_ttl if status is MemoryStatus.READY else self._pending_ttl
+
+    async def get_or_load(
+        self,
+        memory_id: UUID,
+        load: Callable[[], Awaitable[MemoryResponse]],
+    ) -> MemoryResponse:
+        """Return the cached response, or ``load()`` it and cache the result.
+
+        Errors from ``load`` (e.g. not found) propagate and nothing is
+        cached, so a missing memory is looked up again on the next call.
+        """
+        if not self.enabled:
+            return await load()
+
+        key = memory_cache_key(memory_id)
+        version, cached = await self._redis.cache_get_many(
+            memory_version_key(memory_id), key
+        )
+        version = version or "0"
+        if cached is not None:
+            stamp, _, payload = cached.partition(":")
+            if stamp == version:
+                try:
+                    response = MemoryResponse.model_validate_json(payload)
+                except ValidationError:
+                    logger.warning("Discarding unreadable cache entry %s", key)
+                else:
+                    MEMORY_CACHE_REQUESTS.inc(result="hit")
+                    return response
+
+        MEMORY_CACHE_REQUESTS.inc(result="miss")
+        response = await load()
+        ttl = self._ttl(response.status)
+        if ttl > 0:
+            await self._redis.cache_set(
+                key, f"{version}:{response.model_dump_json()}", ttl
+            )
+        return response
+
+    async def invalidate(self, *memory_ids: UUID) -> None:
+        """Drop cached responses for ``memory_ids``."""
+        await invalidate_memories(self._redis, *memory_ids)
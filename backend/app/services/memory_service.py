@@ -2,28 +2,130 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Optional
-from uuid import UUID
+from collections import Counter
+from datetime import date
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    NoReturn,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+)
+from uuid import UUID, uuid4
+from zipfile import BadZipFile, ZipFile
 
 from fastapi import UploadFile
 
 from app.clients.redis_client import RedisClient
 from app.clients.s3 import S3Client
 from app.clients.sqs import SQSClient
-from app.exceptions import ResourceNotFoundError, SQSPublishError
+from app.exceptions import (
+    DuplicateContentError,
+    FeatureDisabledError,
+    InvalidRequestError,
+    ResourceNotFoundError,
+    StatusConflictError,
+    SyncCursorExpiredError,
+)
+from app.models.action_item import (
+    ActionItemListResponse,
+    ActionItemResponse,
+    ActionItemStatus,
+    ActionItemUpdate,
+)
 from app.models.memory import (
+    BulkUploadItem,
+    BulkUploadResponse,
+    MemoryBatchGetResponse,
+    MemoryBulkFilter,
+    MemoryBulkReport,
+    MemoryChangesResponse,
+    MemoryDailyStats,
+    MemoryListItem,
     MemoryListResponse,
     MemoryProcessRequest,
     MemoryResponse,
+    MemorySearchHit,
+    MemorySearchResponse,
+    MemorySemanticHit,
+    MemorySemanticSearchResponse,
+    MemoryStatsResponse,
     MemoryStatus,
     UploadResponse,
 )
-from app.repositories.memory_repository import MemoryRepository
-from app.utils.s3_helpers import generate_s3_key, get_content_type
+from app.repositories.memory_repository import (
+    HEAVY_FIELDS,
+    MemoryRepository,
+    StatusChange,
+)
+from app.services.count_strategy import MemoryCountStrategy
+from app.services.embeddings import EmbeddingProvider
+from app.services.memory_cache import MemoryCache
+from app.services.tombstone_pruner import tombstone_horizon
+from app.utils.archives import audio_entries, is_audio_filename, is_zip_upload
+from app.utils.content_hash import read_with_sha256, sha256_hex
+from app.utils.pagination import decode_cursor, encode_cursor
+from app.utils.s3_helpers import generate_s3_key, get_content_type, s3_key_from_url
+from app.utils.single_flight import SingleFlight
+
+if TYPE_CHECKING:
+    from app.repositories.models import MemoryORM
+    from app.services.semantic_index import SemanticIndex
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Nearest neighbours fetched per requested result when filtering by status
+_SEMANTIC_STATUS_OVERFETCH = 4
+
+# Reads one bulk-upload file (or zip entry) into memory
+_ReadFile = Callable[[], Awaitable[bytes]]
+
+# What POST /upload does with audio that is already stored (see
+# MemoryService._upload_duplicate): nothing special, return the existing
+# memory, or create a new memory reusing its S3 object and results
+DEDUP_OFF = "off"
+DEDUP_EXISTING = "existing"
+DEDUP_REUSE = "reuse"
+DEDUP_POLICIES = (DEDUP_OFF, DEDUP_EXISTING, DEDUP_REUSE)
+
+# Statuses bulk re-trigger claims memories from
+_RETRIGGERABLE_STATUSES = (MemoryStatus.FAILED, MemoryStatus.UPLOADING)
+
+
+def _parse_include(include: Optional[str]) -> Tuple[str, ...]:
+    """Parse the comma-separated ``include`` list of heavy list fields.
+
+    Raises:
+        InvalidRequestError: If a field is not one of HEAVY_FIELDS.
+    """
+    if not include:
+        return ()
+    fields = tuple(
+        dict.fromkeys(part.strip() for part in include.split(",") if part.strip())
+    )
+    unknown = [field for field in fields if field not in HEAVY_FIELDS]
+    if unknown:
+        raise InvalidRequestError(
+            detail=(
+                f"Unknown include field(s): {', '.join(unknown)}. "
+                f"Allowed: {', '.join(HEAVY_FIELDS)}"
+            )
+        )
+    return fields
+
 
 class MemoryService:
     """Orchestrates memory upload, retrieval, and processing triggers."""
@@ -34,91 +136,521 @@ class MemoryService:
         s3_client: S3Client,
         sqs_client: SQSClient,
         redis_client: Optional[RedisClient] = None,
+        count_strategy: Optional[MemoryCountStrategy] = None,
+        bulk_max_items: int = 1000,
+        bulk_max_concurrency: int = 4,
+        bulk_upload_concurrency: int = 8,
+        bulk_upload_max_file_bytes: int = 200 * 1024 * 1024,
+        embedding_provider: Optional[EmbeddingProvider] = None,
+        semantic_index: Optional[SemanticIndex] = None,
+        memory_cache: Optional[MemoryCache] = None,
+        single_flight: Optional[SingleFlight] = None,
+        dedup_policy: str = DEDUP_OFF,
+        sync_settle_seconds: float = 0.0,
+        tombstone_retention_seconds: Optional[float] = None,
     ) -> None:
+        if dedup_policy not in DEDUP_POLICIES:
+            raise ValueError(f"dedup_policy must be one of {', '.join(DEDUP_POLICIES)}")
         self._repository = repository
         self._s3 = s3_client
         self._sqs = sqs_client
         self._redis = redis_client
+        self._counts = count_strategy or MemoryCountStrategy(repository, redis_client)
+        self._bulk_max_items = bulk_max_items
+        self._bulk_max_concurrency = bulk_max_concurrency
+        self._bulk_upload_concurrency = bulk_upload_concurrency
+        self._bulk_upload_max_file_bytes = bulk_upload_max_file_bytes
+        self._embeddings = embedding_provider
+        self._semantic_index = semantic_index
+        self._cache = memory_cache or MemoryCache(redis_client)
+        self._single_flight = single_flight
+        self._dedup_policy = dedup_policy
+        self._sync_settle_seconds = sync_settle_seconds
+        self._tombstone_retention_seconds = tombstone_retention_seconds
 
-    async def _publish_status_event(self, memory_id: UUID, status: str) -> None:
-        """Publish memory status change event to Redis.
+    def _publish_status_event(self, change: StatusChange) -> None:
+        """Publish memory status change event to Redis once committed.
 
         Args:
-            memory_id: UUID of the memory.
-            status: New status value.
+            change: Row state returned by the repository write.
+        """
+        self._publish_status_events([change])
+
+    def _publish_status_events(self, changes: Iterable[StatusChange]) -> None:
+        """Publish several status changes once the transaction commits.
+
+        Until then neither clients refetching on the event nor a cache
+        fill could see the new state.
         """
         if not self._redis:
             return
+        self._repository.after_commit(partial(self._send_status_events, list(changes)))
 
-        memory = await self._repository.get_by_id(memory_id)
-        if memory:
+    async def _invalidate(self, memory_ids: List[UUID]) -> None:
+        """Drop cached counts and the cached responses of changed memories."""
+        await self._counts.invalidate()
+        await self._cache.invalidate(*memory_ids)
+
+    async def _send_status_events(self, changes: List[StatusChange]) -> None:
+        """Invalidate caches and publish events for committed status changes."""
+        await self._invalidate([change.id for change in changes])
+        for change in changes:
             await self._redis.publish_memory_event(
-                memory_id=str(memory_id),
-                status=status,
-                updated_at=memory.updated_at.isoformat() if memory.updated_at else "",
+                memory_id=str(change.id),
+                status=change.status,
+                updated_at=change.updated_at.isoformat(),
             )
 
     async def upload_audio(self, file: UploadFile) -> UploadResponse:
         """Upload audio to S3, create DB record, and enqueue processing.
 
-        1. Create a memory record (status=uploading)
-        2. Upload file to S3
-        3. Update memory with S3 URL
-        4. Enqueue SQS processing job
-        5. Update status to processing
+        The memory id is generated up front so the S3 key is known before
+        the row exists, letting the two slow steps overlap:
 
-        If SQS fails, the memory is still saved and can be re-triggered.
-        """
-        filename = file.filename or "audio.webm"
-        file_data = await file.read()
+        1. Upload to S3 and insert the memory (status=uploading) concurrently
+        2. Store the S3 URL with status=processing (one UPDATE)
+        3. Enqueue the SQS job once the transaction commits (see _enqueue)
 
-        # Create DB record first
-        memory = await self._repository.create(audio_url="")
-        memory_id = UUID(memory.id)
+        If one step of (1) fails, the other is undone: the uploaded object
+        is deleted, or the new row is discarded. If the UPDATE in (2)
+        fails, the object is deleted too.
 
-        # Upload to S3
+        Unless ``dedup_policy`` is "off", the audio's SHA-256 is computed
+        while it is read and stored on the memory. Audio that is already
+        stored is neither uploaded nor processed again; see
+        _upload_duplicate. Two concurrent uploads of the same audio race
+        on the unique hash index, and the loser is treated as a duplicate.
+        """
+        filename = file.filename or "audio.webm"
+        content_hash: Optional[str] = None
+        if self._dedup_policy == DEDUP_OFF:
+            file_data = await file.read()
+        else:
+            file_data, content_hash = await read_with_sha256(file)
+            original = await self._repository.get_by_content_hash(content_hash)
+            if original is not None:
+                return await self._upload_duplicate(original)
+        memory_id = uuid4()
         s3_key = generate_s3_key(filename, memory_id)
-        content_type = get_content_type(filename)
-        audio_url = await self._s3.upload_file(file_data, s3_key, content_type)
 
-        # Update memory with the S3 URL
-        memory.audio_url = audio_url
-        await self._repository.update_status(memory_id, MemoryStatus.PROCESSING.value)
-        await self._publish_status_event(memory_id, MemoryStatus.PROCESSING.value)
+        created, uploaded = await asyncio.gather(
+            self._repository.create(
+                audio_url="", memory_id=memory_id, content_hash=content_hash
+            ),
+            self._s3.upload_file(file_data, s3_key, get_content_type(filename)),
+            return_exceptions=True,
+        )
+        if isinstance(created, DuplicateContentError) and not isinstance(
+            uploaded, BaseException
+        ):
+            original = await self._repository.get_by_content_hash(content_hash)
+            if original is not None:
+                await self._delete_upload(s3_key)
+                return await self._upload_duplicate(original)
+        if isinstance(created, BaseException) or isinstance(uploaded, BaseException):
+            await self._undo_upload(
+                memory_id,
+                s3_key,
+                uploaded if isinstance(uploaded, BaseException) else created,
+                discard=not isinstance(created, BaseException),
+                delete=not isinstance(uploaded, BaseException),
+            )
+        audio_url = uploaded
 
-        # Enqueue processing job (non-fatal if it fails)
+        # Store the S3 URL with the status transition
         try:
-            payload = MemoryProcessRequest(
-                memory_id=memory_id,
+            change = await self._repository.update_status(
+                memory_id,
+                MemoryStatus.PROCESSING.value,
+                expected_status=MemoryStatus.UPLOADING.value,
                 audio_url=audio_url,
             )
-            await self._sqs.send_message(payload)
-        except SQSPublishError:
-            logger.warning(
-                "SQS enqueue failed for memory %s — can be re-triggered manually",
-                memory_id,
+        except Exception as exc:
+            # The row is left to the transaction rollback
+            await self._undo_upload(memory_id, s3_key, exc, discard=False)
+        self._publish_status_event(change)
+        self._enqueue_after_commit(
+            [MemoryProcessRequest(memory_id=memory_id, audio_url=audio_url)]
+        )
+
+        return UploadResponse(
+            memory_id=memory_id,
+            status=MemoryStatus(change.status),
+            message="Audio uploaded and processing enqueued",
+        )
+
+    async def _upload_duplicate(self, original: MemoryORM) -> UploadResponse:
+        """Answer an upload of audio already stored as ``original``.
+
+        An original whose processing failed, or was never enqueued, is
+        re-triggered first. Then, by ``dedup_policy``:
+
+        - "existing": the original memory is returned
+        - "reuse": a new memory is created on the original's S3 object.
+          Its results are copied from the original, now if it is ready,
+          otherwise by the worker once it is; Whisper and the LLM are not
+          run again.
+
+        Raises:
+            StatusConflictError: If the original changed while re-triggering,
+                or was deleted meanwhile.
+        """
+        status = MemoryStatus(original.status)
+        if status == MemoryStatus.FAILED or (
+            status == MemoryStatus.UPLOADING and original.audio_url
+        ):
+            status = (await self.trigger_processing(original.id)).status
+        if self._dedup_policy == DEDUP_EXISTING:
+            return UploadResponse(
+                memory_id=original.id,
+                status=status,
+                message="Audio already uploaded",
+            )
+
+        # Lock the original so its worker cannot finish between the status
+        # check and the insert: either it is ready now and its results are
+        # copied here, or its ready UPDATE waits for this transaction and
+        # then finds the duplicate waiting
+        locked = await self._repository.lock(original.id)
+        if locked is None:
+            raise StatusConflictError(
+                detail=f"Memory {original.id} was deleted; upload the audio again"
             )
-            await self._repository.update_status(
-                memory_id, MemoryStatus.UPLOADING.value
+        status = MemoryStatus(locked.status)
+        memory_id = uuid4()
+        change = await self._repository.create_duplicate(memory_id, locked)
+        if status == MemoryStatus.READY:
+            change = await self._repository.copy_processing_results(
+                original.id, memory_id, expected_status=MemoryStatus.PROCESSING.value
             )
-            await self._publish_status_event(memory_id, MemoryStatus.UPLOADING.value)
+        self._publish_status_event(change)
+        return UploadResponse(
+            memory_id=memory_id,
+            status=MemoryStatus(change.status),
+            message=f"Audio already uploaded; reusing memory {original.id}",
+        )
+
+    def _enqueue_after_commit(self, payloads: List[MemoryProcessRequest]) -> None:
+        """Send processing jobs once the memories they name are committed.
+
+        Sent any earlier, a worker could look for a row it cannot see yet.
+        """
+        if payloads:
+            self._repository.after_commit(partial(self._enqueue, payloads))
+
+    async def _enqueue(self, payloads: List[MemoryProcessRequest]) -> None:
+        """Send processing jobs for committed memories in "processing".
+
+        Memories whose job could not be sent are moved back to uploading,
+        in a transaction of their own, and can be re-triggered.
+        """
+        try:
+            if len(payloads) == 1:
+                await self._sqs.send_message(payloads[0])
+                not_enqueued: Sequence[UUID] = []
+            else:
+                not_enqueued = await self._sqs.send_message_batch(
+                    payloads, max_concurrency=self._bulk_max_concurrency
+                )
+        except Exception as exc:
+            logger.warning("SQS enqueue failed: %s", exc)
+            not_enqueued = [payload.memory_id for payload in payloads]
+        if not not_enqueued:
+            return
+        logger.warning(
+            "SQS enqueue failed for %d memories — can be re-triggered manually",
+            len(not_enqueued),
+        )
+        moved = await self._repository.transition_matching(
+            MemoryStatus.UPLOADING.value,
+            from_status=MemoryStatus.PROCESSING.value,
+            limit=len(not_enqueued),
+            ids=list(not_enqueued),
+        )
+        self._publish_status_events(change for change, _ in moved)
+        await self._repository.commit()
+
+    async def _delete_upload(self, s3_key: str) -> None:
+        """Delete an uploaded object that no memory will point at."""
+        if await self._s3.delete_objects([s3_key]):
+            logger.error("Could not delete orphaned upload %s", s3_key)
+
+    async def _undo_upload(
+        self,
+        memory_id: UUID,
+        s3_key: str,
+        error: BaseException,
+        *,
+        discard: bool = True,
+        delete: bool = True,
+    ) -> NoReturn:
+        """Undo what an upload stored before ``error``, then raise it.
+
+        Args:
+            discard: Discard the memory row (it was inserted).
+            delete: Delete the S3 object (it was uploaded).
+        """
+        if delete:
+            await self._delete_upload(s3_key)
+        if discard:
+            await self._repository.discard(memory_id)
+        raise error
+
+    async def register_upload(self, memory_id: UUID, audio_url: str) -> UploadResponse:
+        """Create the memory for audio already in S3 and enqueue processing.
+
+        For uploads that reached S3 some other way (e.g. a completed
+        resumable upload). The row is inserted as processing and the job
+        is sent once it commits (see _enqueue).
+        """
+        (change,) = await self._repository.create_many(
+            {memory_id: audio_url}, status=MemoryStatus.PROCESSING.value
+        )
+        self._publish_status_event(change)
+        self._enqueue_after_commit(
+            [MemoryProcessRequest(memory_id=memory_id, audio_url=audio_url)]
+        )
 
         return UploadResponse(
             memory_id=memory_id,
-            status=MemoryStatus(memory.status),
+            status=MemoryStatus(change.status),
             message="Audio uploaded and processing enqueued",
         )
 
+    async def bulk_upload(self, files: Sequence[UploadFile]) -> BulkUploadResponse:
+        """Upload many audio files, given directly or inside zip archives.
+
+        1. Expand zip archives into their audio entries
+        2. Upload every file to S3, ``bulk_upload_concurrency`` at a time;
+           a file (or zip entry) is only read once its upload starts, so
+           at most that many are held in memory
+        3. Create the memories (status=processing) with one multi-row INSERT
+        4. Enqueue them with batched SQS sends once the transaction
+           commits (see _enqueue)
+
+        Unless ``dedup_policy`` is "off", each file is hashed once read and
+        deduplicated like upload_audio: audio already stored, or repeated
+        within the request, is not uploaded and goes through
+        _upload_duplicate instead. A file whose hash a concurrent upload
+        inserts first is skipped by the INSERT, its object deleted, and it
+        is treated as a duplicate too.
+
+        A file that is unsupported, too large or fails to upload only
+        fails its own item. If the insert fails, the uploaded objects are
+        deleted and the error is raised.
+
+        Raises:
+            InvalidRequestError: If there are more than ``bulk_max_items``
+                files to upload.
+        """
+        dedup = self._dedup_policy != DEDUP_OFF
+        content_hashes: Dict[UUID, str] = {}
+        duplicates: List[Tuple[BulkUploadItem, str]] = []
+        seen_hashes: Set[str] = set()
+        # The session cannot run two queries at once
+        lookup_lock = asyncio.Lock()
+
+        archives: List[ZipFile] = []
+        try:
+            entries = await self._bulk_upload_entries(files, archives)
+            accepted = sum(1 for _, read in entries if read is not None)
+            if accepted > self._bulk_max_items:
+                raise InvalidRequestError(
+                    detail=f"{accepted} files to upload, at most {self._bulk_max_items} allowed"
+                )
+
+            semaphore = asyncio.Semaphore(self._bulk_upload_concurrency)
+
+            async def upload(
+                item: BulkUploadItem, read: _ReadFile
+            ) -> Optional[Tuple[UUID, str]]:
+                memory_id = uuid4()
+                async with semaphore:
+                    try:
+                        data = await read()
+                        if dedup:
+                            content_hash = await sha256_hex(data)
+                            if content_hash in seen_hashes:
+                                duplicates.append((item, content_hash))
+                                return None
+                            seen_hashes.add(content_hash)
+                            async with lookup_lock:
+                                original = await self._repository.get_by_content_hash(
+                                    content_hash
+                                )
+                            if original is not None:
+                                duplicates.append((item, content_hash))
+                                return None
+                        audio_url = await self._s3.upload_file(
+                            data,
+                            generate_s3_key(item.filename, memory_id),
+                            get_content_type(item.filename),
+                        )
+                    except Exception as exc:
+                        logger.warning("Bulk upload of %s failed: %s", item.filename, exc)
+                        item.error = f"Upload failed: {exc}"
+                        return None
+                if dedup:
+                    content_hashes[memory_id] = content_hash
+                item.memory_id = memory_id
+                return memory_id, audio_url
+
+            uploaded = await asyncio.gather(
+                *(upload(item, read) for item, read in entries if read is not None)
+            )
+        finally:
+            for archive in archives:
+                archive.close()
+
+        audio_urls = dict(result for result in uploaded if result is not None)
+        try:
+            changes = await self._repository.create_many(
+                audio_urls,
+                status=MemoryStatus.PROCESSING.value,
+                content_hashes=content_hashes,
+            )
+        except Exception:
+            failed_keys = await self._s3.delete_objects(
+                [s3_key_from_url(url) for url in audio_urls.values()]
+            )
+            if failed_keys:
+                logger.error("Could not delete %d orphaned uploads", len(failed_keys))
+            raise
+
+        created = {change.id for change in changes}
+        lost = [memory_id for memory_id in audio_urls if memory_id not in created]
+        if lost:
+            # A concurrent upload stored the same audio first
+            for item, _ in entries:
+                if item.memory_id in lost:
+                    duplicates.append((item, content_hashes[item.memory_id]))
+                    item.memory_id = None
+            failed_keys = await self._s3.delete_objects(
+                [s3_key_from_url(audio_urls.pop(memory_id)) for memory_id in lost]
+            )
+            if failed_keys:
+                logger.error("Could not delete %d orphaned uploads", len(failed_keys))
+
+        self._publish_status_events(changes)
+        self._enqueue_after_commit(
+            [
+                MemoryProcessRequest(memory_id=memory_id, audio_url=audio_url)
+                for memory_id, audio_url in audio_urls.items()
+            ]
+        )
+        for item, _ in entries:
+            if item.memory_id is not None:
+                item.status = MemoryStatus.PROCESSING
+
+        for item, content_hash in duplicates:
+            original = await self._repository.get_by_content_hash(content_hash)
+            if original is None:
+                item.error = "Same audio as a file that failed to upload"
+                continue
+            try:
+                response = await self._upload_duplicate(original)
+            except (ResourceNotFoundError, StatusConflictError) as exc:
+                item.error = exc.detail
+                continue
+            item.memory_id, item.status = response.memory_id, response.status
+
+        items = [item for item, _ in entries]
+        succeeded = sum(1 for item in items if item.error is None)
+        logger.info(
+            "Bulk upload: %d files, %d stored, %d duplicates",
+            len(items), len(audio_urls), len(duplicates),
+        )
+        return BulkUploadResponse(
+            items=items, succeeded=succeeded, failed=len(items) - succeeded
+        )
+
+    async def _bulk_upload_entries(
+        self, files: Sequence[UploadFile], archives: List[ZipFile]
+    ) -> List[Tuple[BulkUploadItem, Optional[_ReadFile]]]:
+        """Expand uploads into one (result item, reader) pair per file.
+
+        Zip archives contribute one pair per audio entry and are appended
+        to ``archives`` for the caller to close. Files that will not be
+        uploaded (unsupported, too large, unreadable archive) get their
+        error set and no reader.
+        """
+        entries: List[Tuple[BulkUploadItem, Optional[_ReadFile]]] = []
+
+        def add(filename: str, size: Optional[int], read: _ReadFile) -> None:
+            item = BulkUploadItem(filename=filename)
+            if not is_audio_filename(filename):
+                item.error = "Unsupported file type"
+            elif size is not None and size > self._bulk_upload_max_file_bytes:
+                item.error = f"File exceeds {self._bulk_upload_max_file_bytes} bytes"
+            entries.append((item, read if item.error is None else None))
+
+        for file in files:
+            filename = file.filename or "audio.webm"
+            if not is_zip_upload(filename, file.content_type):
+                add(filename, file.size, file.read)
+                continue
+            try:
+                archive = await asyncio.to_thread(ZipFile, file.file)
+            except (BadZipFile, OSError) as exc:
+                item = BulkUploadItem(filename=filename, error=f"Unreadable zip: {exc}")
+                entries.append((item, None))
+                continue
+            archives.append(archive)
+            for info in audio_entries(archive):
+                add(
+                    f"{filename}/{info.filename}",
+                    info.file_size,
+                    partial(asyncio.to_thread, archive.read, info),
+                )
+        return entries
+
+    async def _coalesce(
+        self, operation: str, key: Hashable, call: Callable[[], Awaitable[T]]
+    ) -> T:
+        """Run ``call`` through the single-flight group, if one is configured."""
+        if self._single_flight is None:
+            return await call()
+        return await self._single_flight.do(operation, key, call)
+
     async def get_memory(self, memory_id: UUID) -> MemoryResponse:
-        """Get a single memory by ID.
+        """Get a single memory by ID, through the response cache.
+
+        Concurrent requests for the same memory share one lookup. Cache
+        misses read from the primary, so a lagging replica cannot put a
+        stale response in the cache for the length of its TTL.
 
         Raises:
             ResourceNotFoundError: If the memory does not exist.
         """
-        memory = await self._repository.get_by_id(memory_id)
-        if memory is None:
-            raise ResourceNotFoundError(detail=f"Memory {memory_id} not found")
-        return MemoryResponse.model_validate(memory)
+
+        async def load() -> MemoryResponse:
+            memory = await self._repository.get_by_id(
+                memory_id, with_transcript=True, primary=self._cache.enabled
+            )
+            if memory is None:
+                raise ResourceNotFoundError(detail=f"Memory {memory_id} not found")
+            return MemoryResponse.model_validate(memory)
+
+        return await self._coalesce(
+            "get_memory", memory_id, lambda: self._cache.get_or_load(memory_id, load)
+        )
+
+    async def get_memories(self, memory_ids: List[UUID]) -> MemoryBatchGetResponse:
+        """Get several memories in one query, in request order.
+
+        Ids that do not exist are reported in ``missing`` instead of
+        raising, so one deleted memory does not fail the whole batch.
+        """
+        memories = await self._repository.get_many(memory_ids, with_transcript=True)
+        found = {memory.id for memory in memories}
+        return MemoryBatchGetResponse(
+            items=[MemoryResponse.model_validate(memory) for memory in memories],
+            missing=[
+                memory_id
+                for memory_id in dict.fromkeys(memory_ids)
+                if memory_id not in found
+            ],
+        )
 
     async def list_memories(
         self,
@@ -126,38 +658,290 @@ class MemoryService:
         page_size: int = 20,
         search: Optional[str] = None,
         status: Optional[str] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = False,
+        include: Optional[str] = None,
     ) -> MemoryListResponse:
-        """List memories with pagination, optional search and status filter."""
-        items, total = await self._repository.list_all(
-            page=page, page_size=page_size, search=search, status=status,
+        """List memories with pagination, optional search and status filter.
+
+        Without a cursor this is classic page-number pagination (always
+        counted). With a cursor it switches to keyset pagination, which
+        skips the count unless ``include_total`` is set. Totals come from
+        MemoryCountStrategy and may be planner estimates for large results.
+
+        Items are a column projection without transcript, key points and
+        action items; ``include`` (comma-separated) opts back into those.
+        Concurrent requests with identical parameters share one query.
+
+        Raises:
+            InvalidRequestError: If the cursor cannot be decoded or
+                ``include`` names an unknown field.
+        """
+        fields = _parse_include(include)
+        key = (page, page_size, search, status, cursor, include_total, fields)
+        return await self._coalesce(
+            "list_memories",
+            key,
+            lambda: self._list_memories(
+                page, page_size, search, status, cursor, include_total, fields
+            ),
         )
+
+    async def _list_memories(
+        self,
+        page: int,
+        page_size: int,
+        search: Optional[str],
+        status: Optional[str],
+        cursor: Optional[str],
+        include_total: bool,
+        fields: Tuple[str, ...],
+    ) -> MemoryListResponse:
+        total = total_is_exact = None
+        if cursor is None:
+            items, has_next = await self._repository.list_page(
+                page=page, page_size=page_size, search=search, status=status,
+                include=fields,
+            )
+        else:
+            try:
+                after = decode_cursor(cursor)
+            except ValueError as exc:
+                raise InvalidRequestError(detail=str(exc)) from exc
+            items, has_next = await self._repository.list_after(
+                after=after, page_size=page_size, search=search, status=status,
+                include=fields,
+            )
+
+        if cursor is None or include_total:
+            counted = await self._counts.count(search=search, status=status)
+            total, total_is_exact = counted.total, counted.exact
+
+        next_cursor = None
+        if has_next and items:
+            last = items[-1]
+            next_cursor = encode_cursor(last.created_at, last.id)
+
         return MemoryListResponse(
-            items=[MemoryResponse.model_validate(m) for m in items],
+            items=[MemoryListItem.model_validate(row) for row in items],
             total=total,
-            page=page,
+            total_is_exact=total_is_exact,
+            page=page if cursor is None else None,
             page_size=page_size,
-            has_next=(page * page_size) < total,
+            has_next=has_next,
+            next_cursor=next_cursor,
+        )
+
+    async def list_changes(
+        self,
+        since: Optional[str] = None,
+        limit: int = 100,
+        include: Optional[str] = None,
+    ) -> MemoryChangesResponse:
+        """Return memories changed or deleted after a sync cursor.
+
+        Without ``since`` the stream starts at the beginning. When nothing
+        changed, ``next_cursor`` echoes ``since`` so clients can keep it.
+        Changes appear ``sync_settle_seconds`` after they are made, once
+        every earlier change has committed.
+
+        Raises:
+            InvalidRequestError: If the cursor cannot be decoded or
+                ``include`` names an unknown field.
+            SyncCursorExpiredError: If the cursor is older than
+                ``tombstone_retention_seconds``, so deletions after it may
+                have been pruned; the client must sync from the beginning.
+        """
+        fields = _parse_include(include)
+        position = None
+        if since is not None:
+            try:
+                position = decode_cursor(since)
+            except ValueError as exc:
+                raise InvalidRequestError(detail=str(exc)) from exc
+            retention = self._tombstone_retention_seconds
+            if retention is not None and position[0] < tombstone_horizon(retention):
+                raise SyncCursorExpiredError(
+                    detail="Sync cursor is older than the retained deletions; "
+                    "sync again without since"
+                )
+
+        changes, has_more = await self._repository.list_changes(
+            since=position,
+            limit=limit,
+            include=fields,
+            settle_seconds=self._sync_settle_seconds,
+        )
+        next_cursor = since
+        if changes:
+            next_cursor = encode_cursor(*changes[-1].position)
+
+        return MemoryChangesResponse(
+            items=[
+                MemoryListItem.model_validate(change.row)
+                for change in changes
+                if not change.deleted
+            ],
+            deleted=[change.id for change in changes if change.deleted],
+            next_cursor=next_cursor,
+            has_more=has_more,
+        )
+
+    async def get_stats(
+        self,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+    ) -> MemoryStatsResponse:
+        """Counts by status, memories per day and average duration.
+
+        Raises:
+            InvalidRequestError: If ``date_from`` is after ``date_to``.
+        """
+        if date_from and date_to and date_from > date_to:
+            raise InvalidRequestError(detail="date_from must not be after date_to")
+        rows = await self._repository.daily_stats(date_from, date_to)
+
+        by_status: Counter = Counter()
+        daily: Dict[date, Counter] = {}
+        duration_total = 0.0
+        duration_count = 0
+        for row in rows:
+            by_status[row.status] += row.memory_count
+            daily.setdefault(row.day, Counter())[row.status] += row.memory_count
+            duration_total += row.duration_total or 0.0
+            duration_count += row.duration_count
+        refreshed = [row.refreshed_at for row in rows if row.refreshed_at]
+
+        return MemoryStatsResponse(
+            date_from=date_from,
+            date_to=date_to,
+            total=sum(by_status.values()),
+            by_status=dict(by_status),
+            average_duration=(
+                duration_total / duration_count if duration_count else None
+            ),
+            daily=[
+                MemoryDailyStats(day=day, count=sum(counts.values()), by_status=counts)
+                for day, counts in daily.items()
+            ],
+            refreshed_at=min(refreshed) if refreshed else None,
         )
 
+    async def search_memories(
+        self,
+        query: str,
+        limit: int = 20,
+        status: Optional[str] = None,
+    ) -> MemorySearchResponse:
+        """Full-text search over memories, ranked by relevance with snippets."""
+        hits = await self._repository.search(query, limit=limit, status=status)
+        return MemorySearchResponse(
+            query=query,
+            items=[
+                MemorySearchHit.model_validate(
+                    {**fields, "rank": rank, "snippet": snippet}
+                )
+                for fields, rank, snippet in hits
+            ],
+        )
+
+    async def semantic_search(
+        self,
+        query: str,
+        limit: int = 20,
+        status: Optional[str] = None,
+    ) -> MemorySemanticSearchResponse:
+        """Find memories whose content is closest in meaning to ``query``.
+
+        Raises:
+            FeatureDisabledError: If no embedding provider is configured.
+        """
+        if self._embeddings is None or self._semantic_index is None:
+            raise FeatureDisabledError(detail="Semantic search is not enabled")
+        [vector] = await self._embeddings.embed([query])
+        k = limit * _SEMANTIC_STATUS_OVERFETCH if status else limit
+        neighbours = await self._semantic_index.search(self._repository, vector, k)
+        scores = dict(neighbours)
+        rows = await self._repository.list_by_ids(list(scores), status=status)
+        return MemorySemanticSearchResponse(
+            query=query,
+            items=[
+                MemorySemanticHit.model_validate(
+                    {**row._mapping, "score": scores[row.id]}
+                )
+                for row in rows[:limit]
+            ],
+        )
+
+    async def list_action_items(
+        self,
+        cursor: Optional[str] = None,
+        page_size: int = 50,
+        status: Optional[ActionItemStatus] = None,
+        memory_id: Optional[UUID] = None,
+    ) -> ActionItemListResponse:
+        """List action items across memories, newest first, by keyset cursor.
+
+        Raises:
+            InvalidRequestError: If the cursor is malformed.
+        """
+        after = None
+        if cursor is not None:
+            try:
+                after = decode_cursor(cursor)
+            except ValueError as exc:
+                raise InvalidRequestError(detail=str(exc)) from exc
+
+        rows, has_more = await self._repository.list_action_items(
+            after=after,
+            page_size=page_size,
+            status=status.value if status else None,
+            memory_id=memory_id,
+        )
+        return ActionItemListResponse(
+            items=[ActionItemResponse.model_validate(row) for row in rows],
+            next_cursor=(
+                encode_cursor(rows[-1].created_at, rows[-1].id) if has_more else None
+            ),
+            has_more=has_more,
+        )
+
+    async def update_action_item(
+        self, item_id: UUID, changes: ActionItemUpdate
+    ) -> ActionItemResponse:
+        """Mark an action item open or done.
+
+        Raises:
+            ResourceNotFoundError: If the action item does not exist.
+        """
+        row = await self._repository.update_action_item_status(
+            item_id, changes.status.value
+        )
+        return ActionItemResponse.model_validate(row)
+
     async def trigger_processing(self, memory_id: UUID) -> UploadResponse:
         """Manually trigger processing for a memory in uploading/failed state.
 
+        The job is enqueued once the move to "processing" commits, so a
+        request that loses the compare-and-set queues nothing.
+
         Raises:
             ResourceNotFoundError: If the memory does not exist.
+            StatusConflictError: If the status changed while re-triggering.
         """
         memory = await self._repository.get_by_id(memory_id)
         if memory is None:
             raise ResourceNotFoundError(detail=f"Memory {memory_id} not found")
 
-        payload = MemoryProcessRequest(
-            memory_id=memory_id,
-            audio_url=memory.audio_url,
+        change = await self._repository.update_status(
+            memory_id,
+            MemoryStatus.PROCESSING.value,
+            expected_status=memory.status,
         )
-        await self._sqs.send_message(payload)
-        await self._repository.update_status(
-            memory_id, MemoryStatus.PROCESSING.value
+        self._publish_status_event(change)
+        self._enqueue_after_commit(
+            [MemoryProcessRequest(memory_id=memory_id, audio_url=memory.audio_url)]
         )
-        await self._publish_status_event(memory_id, MemoryStatus.PROCESSING.value)
 
         return UploadResponse(
             memory_id=memory_id,
@@ -165,14 +949,138 @@ class MemoryService:
             message="Processing re-triggered",
         )
 
+    async def bulk_retrigger(self, selection: MemoryBulkFilter) -> MemoryBulkReport:
+        """Re-queue every failed/uploading memory matching the filter.
+
+        Claims up to ``bulk_max_items`` memories with one UPDATE per source
+        status (compare-and-set to "processing"), enqueues them with
+        batched SQS sends, and puts memories whose job could not be sent
+        back into their previous status.
+
+        Raises:
+            InvalidRequestError: If the filter names a status that cannot
+                be re-triggered.
+        """
+        if selection.status is not None and selection.status not in _RETRIGGERABLE_STATUSES:
+            raise InvalidRequestError(
+                detail=f"Only failed or uploading memories can be re-triggered, not {selection.status.value}"
+            )
+        from_statuses = (
+            [selection.status] if selection.status is not None else list(_RETRIGGERABLE_STATUSES)
+        )
+
+        claimed: List[Tuple[StatusChange, str, MemoryStatus]] = []
+        for from_status in from_statuses:
+            remaining = self._bulk_max_items - len(claimed)
+            if remaining <= 0:
+                break
+            rows = await self._repository.transition_matching(
+                MemoryStatus.PROCESSING.value,
+                from_status=from_status.value,
+                limit=remaining,
+                ids=selection.ids,
+                created_from=selection.created_from,
+                created_to=selection.created_to,
+            )
+            claimed.extend((change, audio_url, from_status) for change, audio_url in rows)
+
+        failed = set(
+            await self._sqs.send_message_batch(
+                [
+                    MemoryProcessRequest(memory_id=change.id, audio_url=audio_url)
+                    for change, audio_url, _ in claimed
+                ],
+                max_concurrency=self._bulk_max_concurrency,
+            )
+        )
+        for from_status in from_statuses:
+            await self._repository.set_status_many(
+                [change.id for change, _, status in claimed if status is from_status and change.id in failed],
+                from_status.value,
+            )
+        self._publish_status_events(
+            change for change, _, _ in claimed if change.id not in failed
+        )
+
+        has_more = await self._repository.exists_matching(
+            ids=selection.ids,
+            statuses=[status.value for status in from_statuses],
+            created_from=selection.created_from,
+            created_to=selection.created_to,
+        )
+        logger.info(
+            "Bulk re-trigger: %d claimed, %d enqueue failures, has_more=%s",
+            len(claimed), len(failed), has_more,
+        )
+        return MemoryBulkReport(
+            processed=len(claimed),
+            succeeded=len(claimed) - len(failed),
+            failed=[change.id for change, _, _ in claimed if change.id in failed],
+            has_more=has_more,
+        )
+
+    async def bulk_delete(self, selection: MemoryBulkFilter) -> MemoryBulkReport:
+        """Delete every memory matching the filter, and its audio.
+
+        Deletes up to ``bulk_max_items`` rows with one DELETE ... RETURNING
+        (tombstones included). Their audio is removed with batched S3
+        DeleteObjects calls once the transaction commits, so a request
+        that fails later keeps both the rows and their audio. Objects that
+        cannot be removed are logged and left behind, unreferenced.
+        """
+        statuses = [selection.status.value] if selection.status is not None else None
+        deleted = await self._repository.delete_matching(
+            limit=self._bulk_max_items,
+            ids=selection.ids,
+            statuses=statuses,
+            created_from=selection.created_from,
+            created_to=selection.created_to,
+        )
+
+        keys = dict.fromkeys(s3_key_from_url(audio_url) for _, audio_url in deleted)
+        keys.pop("", None)
+        # Duplicate uploads share one object; keep it while a memory uses it
+        for audio_url in await self._repository.audio_urls_in_use(
+            [audio_url for _, audio_url in deleted]
+        ):
+            keys.pop(s3_key_from_url(audio_url), None)
+        if keys:
+            self._repository.after_commit(partial(self._delete_audio, list(keys)))
+        if deleted:
+            self._repository.after_commit(
+                partial(self._invalidate, [memory_id for memory_id, _ in deleted])
+            )
+
+        has_more = await self._repository.exists_matching(
+            ids=selection.ids,
+            statuses=statuses,
+            created_from=selection.created_from,
+            created_to=selection.created_to,
+        )
+        logger.info("Bulk delete: %d deleted, has_more=%s", len(deleted), has_more)
+        return MemoryBulkReport(
+            processed=len(deleted),
+            succeeded=len(deleted),
+            failed=[],
+            has_more=has_more,
+        )
+
+    async def _delete_audio(self, keys: List[str]) -> None:
+        """Remove the S3 objects of committed deletions (best-effort)."""
+        failed_keys = await self._s3.delete_objects(keys)
+        if failed_keys:
+            logger.warning(
+                "Bulk delete: %d audio objects not removed: %s",
+                len(failed_keys), ", ".join(failed_keys),
+            )
+
     async def delete_memory(self, memory_id: UUID) -> None:
         """Delete a memory by ID.
 
+        The repository leaves a tombstone so delta sync reports the deletion.
+
         Raises:
             ResourceNotFoundError: If the memory does not exist.
         """
-        memory = await self._repository.get_by_id(memory_id)
-        if memory is None:
-            raise ResourceNotFoundError(detail=f"Memory {memory_id} not found")
-
         await self._repository.delete(memory_id)
+        self._repository.after_commit(partial(self._invalidate, [memory_id]))
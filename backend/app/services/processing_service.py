@@ -3,18 +3,39 @@
 from __future__ import annotations
 
 import logging
-from typing import Optional
+from functools import partial
+from typing import Awaitable, Callable, Optional
 from uuid import UUID
 
 from app.clients.openai import OpenAIClient
 from app.clients.redis_client import RedisClient
 from app.clients.s3 import S3Client
-from app.exceptions import AIProcessingError, S3UploadError
+from app.exceptions import (
+    AIProcessingError,
+    ResourceNotFoundError,
+    S3UploadError,
+    StatusConflictError,
+)
 from app.models.memory import MemoryStatus
-from app.repositories.memory_repository import MemoryRepository
+from app.repositories.memory_repository import MemoryRepository, StatusChange
+from app.services.count_strategy import invalidate_counts
+from app.services.embeddings import (
+    EmbeddingProvider,
+    memory_embedding_text,
+    pack_vector,
+)
+from app.services.memory_cache import invalidate_memories
 
 logger = logging.getLogger(__name__)
 
+# Statuses a memory may be in when a processing job starts; a "ready"
+# memory means the message is a redelivery of an already processed job
+_STARTABLE_STATUSES = (
+    MemoryStatus.UPLOADING.value,
+    MemoryStatus.PROCESSING.value,
+    MemoryStatus.FAILED.value,
+)
+
 
 class ProcessingService:
     """Orchestrates the full async processing pipeline for a memory."""
@@ -25,29 +46,101 @@ class ProcessingService:
         s3_client: S3Client,
         openai_client: OpenAIClient,
         redis_client: Optional[RedisClient] = None,
+        embedding_provider: Optional[EmbeddingProvider] = None,
+        commit: Optional[Callable[[], Awaitable[None]]] = None,
     ) -> None:
         self._repository = repository
         self._s3 = s3_client
         self._openai = openai_client
         self._redis = redis_client
+        self._embeddings = embedding_provider
+        self._commit = commit
 
-    async def _publish_status_event(self, memory_id: UUID, status: str) -> None:
-        """Publish memory status change event to Redis.
+    def _publish_status_event(self, change: StatusChange) -> None:
+        """Publish memory status change event to Redis once committed.
 
         Args:
-            memory_id: UUID of the memory.
-            status: New status value.
+            change: Row state returned by the repository write.
         """
         if not self._redis:
             return
+        self._repository.after_commit(partial(self._send_status_event, change))
+
+    async def _send_status_event(self, change: StatusChange) -> None:
+        """Invalidate caches and publish the event for a committed change."""
+        await invalidate_counts(self._redis)
+        await invalidate_memories(self._redis, change.id)
+        await self._redis.publish_memory_event(
+            memory_id=str(change.id),
+            status=change.status,
+            updated_at=change.updated_at.isoformat(),
+        )
+
+    async def _fail(self, memory_id: UUID) -> None:
+        """Move a memory, and duplicates waiting on it, from processing to failed."""
+        waiting = await self._repository.list_waiting_duplicates(memory_id)
+        for failed_id in (memory_id, *waiting):
+            try:
+                change = await self._repository.update_status(
+                    failed_id,
+                    MemoryStatus.FAILED.value,
+                    expected_status=MemoryStatus.PROCESSING.value,
+                )
+            except (ResourceNotFoundError, StatusConflictError):
+                if failed_id == memory_id:
+                    raise
+                continue
+            self._publish_status_event(change)
+
+    async def _share_results(self, memory_id: UUID, log_ctx: str) -> None:
+        """Copy a processed memory's results to the duplicates waiting on it.
+
+        Duplicate uploads (``upload_dedup_policy="reuse"``) of audio that
+        was still processing are created in "processing" and finished
+        here, without running Whisper or the LLM again.
+        """
+        for duplicate_id in await self._repository.list_waiting_duplicates(memory_id):
+            try:
+                change = await self._repository.copy_processing_results(
+                    memory_id,
+                    duplicate_id,
+                    expected_status=MemoryStatus.PROCESSING.value,
+                )
+            except (ResourceNotFoundError, StatusConflictError) as exc:
+                logger.info(
+                    "Duplicate %s skipped: %s — %s", duplicate_id, log_ctx, exc.detail
+                )
+                continue
+            self._publish_status_event(change)
+            logger.info("Results shared with duplicate %s: %s", duplicate_id, log_ctx)
+
+    async def _commit_ready(self) -> None:
+        """Commit the "ready" transition before the follow-up steps.
 
-        memory = await self._repository.get_by_id(memory_id)
-        if memory:
-            await self._redis.publish_memory_event(
-                memory_id=str(memory_id),
-                status=status,
-                updated_at=memory.updated_at.isoformat() if memory.updated_at else "",
+        The results are then visible (and their events sent) without
+        waiting for the embedding call, and the row lock is released.
+        """
+        if self._commit is not None:
+            await self._commit()
+
+    async def _save_embedding(self, memory_id: UUID, text: str, log_ctx: str) -> None:
+        """Embed a processed memory for semantic search.
+
+        Best-effort: the memory is already "ready", so a failure is logged
+        and the memory is simply missing from semantic search results.
+        """
+        if self._embeddings is None or not text:
+            return
+        try:
+            [vector] = await self._embeddings.embed([text])
+            await self._repository.save_embedding(
+                memory_id,
+                model=self._embeddings.model,
+                dimensions=self._embeddings.dimensions,
+                vector=pack_vector(vector),
             )
+        except Exception as exc:
+            logger.warning("Embedding failed: %s — %s", log_ctx, exc)
 
     async def process_memory(
         self,
@@ -64,22 +157,45 @@ class ProcessingService:
             4. Analyze transcript with LLM
             5. Save results to database
             6. Update status to "ready"
+            7. Embed the results for semantic search (if configured)
+            8. Copy the results to duplicate uploads waiting on this memory
+
+        With a ``commit`` callable (the worker), step 6 is committed
+        before steps 7 and 8 start.
 
         Fallbacks:
             - Whisper fails: status → "failed", audio preserved in S3
             - LLM fails: transcript saved, summary=None, status → "ready"
 
+        Every write is a compare-and-set on the expected prior status, so a
+        redelivered message for a memory that is already "ready" is skipped.
+        A skipped "ready" memory still finishes duplicates left waiting, in
+        case the steps after its commit failed.
+
         Args:
             memory_id: UUID of the memory to process.
             audio_url: S3 URL of the audio file.
             correlation_id: Tracing ID from the SQS message.
+
+        Raises:
+            ResourceNotFoundError: If the memory does not exist, so the
+                message is retried (and ends in the DLQ if it never does).
         """
         log_ctx = f"memory_id={memory_id}, correlation_id={correlation_id}"
         logger.info("Processing started: %s", log_ctx)
 
         # 1. Update status
-        await self._repository.update_status(memory_id, MemoryStatus.PROCESSING.value)
-        await self._publish_status_event(memory_id, MemoryStatus.PROCESSING.value)
+        try:
+            change = await self._repository.update_status(
+                memory_id,
+                MemoryStatus.PROCESSING.value,
+                expected_status=_STARTABLE_STATUSES,
+            )
+        except StatusConflictError as exc:
+            logger.info("Processing skipped: %s — %s", log_ctx, exc.detail)
+            await self._share_results(memory_id, log_ctx)
+            return
+        self._publish_status_event(change)
 
         # 2. Download audio from S3
         s3_key = audio_url.replace(f"s3://{self._s3._settings.s3_bucket_name}/", "")
@@ -88,10 +204,7 @@ class ProcessingService:
             logger.info("Audio downloaded: %s (%d bytes)", log_ctx, len(audio_data))
         except S3UploadError as exc:
             logger.error("Audio download failed: %s — %s", log_ctx, exc)
-            await self._repository.update_status(
-                memory_id, MemoryStatus.FAILED.value
-            )
-            await self._publish_status_event(memory_id, MemoryStatus.FAILED.value)
+            await self._fail(memory_id)
             return
 
         # 3. Transcribe with Whisper
@@ -106,10 +219,7 @@ class ProcessingService:
             )
         except AIProcessingError as exc:
             logger.error("Transcription failed: %s — %s", log_ctx, exc)
-            await self._repository.update_status(
-                memory_id, MemoryStatus.FAILED.value
-            )
-            await self._publish_status_event(memory_id, MemoryStatus.FAILED.value)
+            await self._fail(memory_id)
             return
 
         # 4. Analyze transcript with LLM
@@ -123,16 +233,22 @@ class ProcessingService:
                 log_ctx,
                 exc,
             )
-            await self._repository.update_processing_results(
+            change = await self._repository.update_processing_results(
                 memory_id,
                 transcript=transcription.text,
                 status=MemoryStatus.READY.value,
+                expected_status=MemoryStatus.PROCESSING.value,
+            )
+            self._publish_status_event(change)
+            await self._commit_ready()
+            await self._save_embedding(
+                memory_id, memory_embedding_text(transcript=transcription.text), log_ctx
             )
-            await self._publish_status_event(memory_id, MemoryStatus.READY.value)
+            await self._share_results(memory_id, log_ctx)
             return
 
         # 5. Save all results
-        await self._repository.update_processing_results(
+        change = await self._repository.update_processing_results(
             memory_id,
             transcript=transcription.text,
             summary=analysis.summary,
@@ -140,6 +256,24 @@ class ProcessingService:
             action_items=analysis.action_items,
             title=analysis.title,
             status=MemoryStatus.READY.value,
+            expected_status=MemoryStatus.PROCESSING.value,
         )
-        await self._publish_status_event(memory_id, MemoryStatus.READY.value)
+        self._publish_status_event(change)
+        await self._commit_ready()
+
+        # 7. Embed for semantic search
+        await self._save_embedding(
+            memory_id,
+            memory_embedding_text(
+                title=analysis.title,
+                summary=analysis.summary,
+                key_points=analysis.key_points,
+                action_items=analysis.action_items,
+                transcript=transcription.text,
+            ),
+            log_ctx,
+        )
+
+        # 8. Finish duplicate uploads of the same audio
+        await self._share_results(memory_id, log_ctx)
         logger.info("Processing complete: %s", log_ctx)
@@ -0,0 +1,183 @@
+"""Process-wide semantic search index, kept in sync with memory_embeddings.
+
+The index is loaded memory-mapped from ``vector_index_dir`` on first use,
+then brought up to date incrementally: new or replaced embeddings and
+deleted memories are read after the last applied (timestamp, id)
+position, at most every ``vector_index_sync_seconds``. Changes newer
+than ``sync_settle_seconds`` are left for a later sync, so the position
+never passes one that commits late. The position is saved with the
+index, so a restart only replays what changed since the last save; a
+saved index older than ``tombstone_retention_seconds`` may have missed
+pruned deletions and is rebuilt from scratch instead.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+from uuid import UUID
+
+import numpy as np
+
+from app.config import Settings, get_settings
+from app.repositories.memory_repository import MemoryRepository
+from app.services.tombstone_pruner import tombstone_horizon
+from app.utils.vector_index import VectorIndex
+
+logger = logging.getLogger(__name__)
+
+# Changes read per sync query
+SYNC_BATCH_SIZE = 1000
+# Applied changes that trigger writing a compacted index to disk
+PERSIST_EVERY = 5000
+
+
+class SemanticIndex:
+    """A VectorIndex for one embedding model, synced from the database."""
+
+    def __init__(
+        self,
+        directory: Path,
+        model: str,
+        dimensions: int,
+        sync_interval_seconds: float = 5.0,
+        persist_every: int = PERSIST_EVERY,
+        settle_seconds: float = 0.0,
+        tombstone_retention_seconds: Optional[float] = None,
+    ) -> None:
+        self._directory = Path(directory)
+        self._model = model
+        self._dimensions = dimensions
+        self._sync_interval = sync_interval_seconds
+        self._persist_every = persist_every
+        self._settle_seconds = settle_seconds
+        self._tombstone_retention = tombstone_retention_seconds
+        self._index: Optional[VectorIndex] = None
+        self._position: Optional[Tuple[datetime, UUID]] = None
+        self._unsaved = 0
+        self._next_sync = 0.0
+        self._lock = asyncio.Lock()
+
+    def _load(self) -> None:
+        loaded = VectorIndex.load(self._directory, self._dimensions)
+        position = None
+        if loaded is not None and loaded[1].get("model") == self._model:
+            saved = loaded[1].get("position")
+            if saved:
+                position = (datetime.fromisoformat(saved[0]), UUID(saved[1]))
+            if (
+                position is not None
+                and self._tombstone_retention is not None
+                and position[0] < tombstone_horizon(self._tombstone_retention)
+            ):
+                # Deletions after the position may have been pruned
+                logger.info("Vector index in %s is too old to sync; rebuilding", self._directory)
+                loaded = None
+        else:
+            loaded = None
+        if loaded is None:
+            self._index = VectorIndex(self._dimensions)
+            self._position = None
+            return
+        self._index, self._position = loaded[0], position
+        logger.info(
+            "Loaded vector index: %d vectors from %s", len(self._index), self._directory
+        )
+
+    def _save(self) -> VectorIndex:
+        """Write the index and return its memory-mapped reload.
+
+        Keeps the in-memory index if another process saved in between, as
+        that save's sync position need not match ours.
+        """
+        position = (
+            [self._position[0].isoformat(), str(self._position[1])]
+            if self._position
+            else None
+        )
+        generation = self._index.save(
+            self._directory, {"model": self._model, "position": position}
+        )
+        reloaded = VectorIndex.load(self._directory, self._dimensions)
+        if reloaded is None or reloaded[1].get("generation") != generation:
+            return self._index
+        return reloaded[0]
+
+    async def sync(self, repository: MemoryRepository, force: bool = False) -> None:
+        """Apply embedding changes since the last sync, if one is due.
+
+        Writes a compacted index to disk once enough changes accumulate.
+        """
+        if not force and time.monotonic() < self._next_sync:
+            return
+        async with self._lock:
+            if not force and time.monotonic() < self._next_sync:
+                return
+            if self._index is None:
+                await asyncio.to_thread(self._load)
+
+            has_more = True
+            while has_more:
+                changes, has_more = await repository.list_embedding_changes(
+                    self._model,
+                    self._dimensions,
+                    since=self._position,
+                    limit=SYNC_BATCH_SIZE,
+                    settle_seconds=self._settle_seconds,
+                )
+                if not changes:
+                    break
+                self._index.remove([c.id for c in changes if c.deleted])
+                upserts = [c for c in changes if not c.deleted]
+                if upserts:
+                    vectors = np.frombuffer(
+                        b"".join(c.vector for c in upserts), dtype="<f4"
+                    ).reshape(len(upserts), self._dimensions)
+                    self._index.upsert([c.id for c in upserts], vectors)
+                self._position = changes[-1].position
+                self._unsaved += len(changes)
+
+            if self._unsaved >= self._persist_every:
+                self._index = await asyncio.to_thread(self._save)
+                self._unsaved = 0
+            self._next_sync = time.monotonic() + self._sync_interval
+
+    async def search(
+        self,
+        repository: MemoryRepository,
+        vector: Sequence[float],
+        k: int,
+    ) -> List[Tuple[UUID, float]]:
+        """Sync if due, then return the ``k`` nearest (memory id, score) pairs.
+
+        The scan runs in a worker thread, holding the lock so a sync
+        cannot change the index under it.
+        """
+        await self.sync(repository)
+        async with self._lock:
+            return await asyncio.to_thread(self._index.search, vector, k)
+
+
+_semantic_index: Optional[SemanticIndex] = None
+
+
+def get_semantic_index(
+    model: str, dimensions: int, settings: Optional[Settings] = None
+) -> SemanticIndex:
+    """Get or create the process-wide SemanticIndex (lazy singleton)."""
+    global _semantic_index
+    if _semantic_index is None:
+        s = settings or get_settings()
+        _semantic_index = SemanticIndex(
+            Path(s.vector_index_dir),
+            model,
+            dimensions,
+            sync_interval_seconds=s.vector_index_sync_seconds,
+            settle_seconds=s.sync_settle_seconds,
+            tombstone_retention_seconds=s.tombstone_retention_seconds,
+        )
+    return _semantic_index
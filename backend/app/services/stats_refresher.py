@@ -0,0 +1,60 @@
+"""Background refresh of the memory_daily_stats materialized view.
+
+Every API process runs the loop; the repository's advisory lock makes
+sure only one of them refreshes at a time, so adding processes does not
+multiply the refresh load.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Optional
+
+from app.config import Settings
+from app.repositories.database import _get_session_factory
+from app.repositories.memory_repository import MemoryRepository
+from app.utils.metrics import Histogram
+
+logger = logging.getLogger(__name__)
+
+STATS_REFRESH_DURATION = Histogram(
+    "memory_stats_refresh_seconds",
+    "Time to refresh the memory_daily_stats materialized view.",
+)
+
+
+async def refresh_stats_once(settings: Settings) -> bool:
+    """Refresh the stats view in its own session and transaction.
+
+    Returns:
+        True if this process refreshed the view.
+    """
+    factory = _get_session_factory(settings)
+    start = time.perf_counter()
+    async with factory() as session:
+        refreshed = await MemoryRepository(session).refresh_daily_stats()
+        await session.commit()
+    if refreshed:
+        STATS_REFRESH_DURATION.observe(time.perf_counter() - start)
+    return refreshed
+
+
+async def refresh_stats_forever(settings: Settings) -> None:
+    """Refresh the stats view every ``stats_refresh_seconds`` until cancelled."""
+    while True:
+        try:
+            await refresh_stats_once(settings)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            logger.warning("Memory stats refresh failed: %s", exc)
+        await asyncio.sleep(settings.stats_refresh_seconds)
+
+
+def start_stats_refresher(settings: Settings) -> Optional[asyncio.Task]:
+    """Start the refresh loop, unless disabled (``stats_refresh_seconds <= 0``)."""
+    if settings.stats_refresh_seconds <= 0:
+        return None
+    return asyncio.create_task(refresh_stats_forever(settings))
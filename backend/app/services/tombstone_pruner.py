@@ -0,0 +1,63 @@
+"""Background pruning of delta-sync tombstones.
+
+Tombstones let GET /memories/changes and the semantic index report
+deletions. They are only needed by cursors newer than
+``tombstone_retention_seconds``, which is also the oldest cursor the
+changes endpoint accepts, so older ones are deleted. Every API process
+runs the loop; concurrent sweeps delete the same rows and are harmless.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from app.config import Settings
+from app.repositories.database import _get_session_factory
+from app.repositories.memory_repository import MemoryRepository
+
+logger = logging.getLogger(__name__)
+
+
+def tombstone_horizon(retention_seconds: float) -> datetime:
+    """Oldest deletion time still covered by a tombstone (naive UTC)."""
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    return now - timedelta(seconds=retention_seconds)
+
+
+async def prune_tombstones_once(settings: Settings) -> int:
+    """Delete expired tombstones in a transaction of its own.
+
+    Returns:
+        Number of tombstones removed.
+    """
+    factory = _get_session_factory(settings)
+    async with factory() as session:
+        pruned = await MemoryRepository(session).prune_tombstones(
+            tombstone_horizon(settings.tombstone_retention_seconds)
+        )
+        await session.commit()
+    if pruned:
+        logger.info("Pruned %d expired tombstones", pruned)
+    return pruned
+
+
+async def prune_tombstones_forever(settings: Settings) -> None:
+    """Prune tombstones every ``tombstone_prune_seconds`` until cancelled."""
+    while True:
+        try:
+            await prune_tombstones_once(settings)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            logger.warning("Tombstone pruning failed: %s", exc)
+        await asyncio.sleep(settings.tombstone_prune_seconds)
+
+
+def start_tombstone_pruner(settings: Settings) -> Optional[asyncio.Task]:
+    """Start the pruning loop, unless disabled (``tombstone_prune_seconds <= 0``)."""
+    if settings.tombstone_prune_seconds <= 0:
+        return None
+    return asyncio.create_task(prune_tombstones_forever(settings))
@@ -0,0 +1,302 @@
+"""Resumable chunked uploads on top of S3 multipart uploads.
+
+Protocol, for clients on unreliable networks:
+
+1. ``POST /upload/sessions`` with the file name and size; the response
+   gives the session id and the ``chunk_size`` to use.
+2. ``PUT /upload/sessions/{id}?offset=N`` with the next chunk as the raw
+   body. Each chunk becomes one S3 part; the committed offset only moves
+   once the part is stored.
+3. After a dropped connection, ``GET /upload/sessions/{id}`` returns the
+   committed offset to resume from.
+4. ``POST /upload/sessions/{id}/complete`` assembles the parts, creates
+   the memory and enqueues processing, like ``POST /upload``.
+
+Sessions expire ``upload_session_ttl_seconds`` after their last chunk;
+the reaper (start_upload_session_reaper), run by every API process,
+aborts their multipart uploads.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from uuid import UUID, uuid4
+
+from app.clients.s3 import S3Client
+from app.config import Settings
+from app.exceptions import (
+    InvalidRequestError,
+    ResourceNotFoundError,
+    StatusConflictError,
+    UploadOffsetConflictError,
+    UploadSessionExpiredError,
+)
+from app.models.memory import UploadResponse
+from app.models.upload_session import (
+    UploadSessionCreate,
+    UploadSessionResponse,
+    UploadSessionStatus,
+)
+from app.repositories.database import _get_session_factory
+from app.repositories.models import UploadSessionORM
+from app.repositories.upload_session_repository import UploadSessionRepository
+from app.services.memory_service import MemoryService
+from app.utils.s3_helpers import generate_s3_key, get_content_type
+
+logger = logging.getLogger(__name__)
+
+# S3 multipart limits: parts other than the last are at least 5 MiB,
+# and an upload has at most 10,000 parts
+MIN_CHUNK_SIZE = 5 * 1024 * 1024
+MAX_PARTS = 10_000
+
+# Expired sessions aborted per reaper query
+REAP_BATCH_SIZE = 100
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class UploadSessionService:
+    """Creates, feeds, completes and aborts resumable upload sessions."""
+
+    def __init__(
+        self,
+        sessions: UploadSessionRepository,
+        memory_service: MemoryService,
+        s3_client: S3Client,
+        chunk_size: int = 8 * 1024 * 1024,
+        ttl_seconds: int = 24 * 3600,
+    ) -> None:
+        if chunk_size < MIN_CHUNK_SIZE:
+            raise ValueError(f"chunk_size must be at least {MIN_CHUNK_SIZE} bytes")
+        self._sessions = sessions
+        self._memories = memory_service
+        self._s3 = s3_client
+        self._chunk_size = chunk_size
+        self._ttl = timedelta(seconds=ttl_seconds)
+
+    async def _get_open(self, session_id: UUID, lock: bool = False) -> UploadSessionORM:
+        """Get a session that can still take chunks.
+
+        Args:
+            lock: Lock the session row until the transaction ends.
+
+        Raises:
+            ResourceNotFoundError: If the session does not exist.
+            UploadSessionExpiredError: If it expired or was aborted.
+            StatusConflictError: If it was already completed.
+        """
+        if lock:
+            upload = await self._sessions.lock(session_id)
+        else:
+            upload = await self._sessions.get(session_id)
+        if upload is None:
+            raise ResourceNotFoundError(detail=f"Upload session {session_id} not found")
+        if upload.status == UploadSessionStatus.COMPLETED.value:
+            raise StatusConflictError(detail=f"Upload session {session_id} is completed")
+        if upload.status != UploadSessionStatus.OPEN.value:
+            raise UploadSessionExpiredError(
+                detail=f"Upload session {session_id} is {upload.status}"
+            )
+        if upload.expires_at < _utcnow():
+            raise UploadSessionExpiredError(detail=f"Upload session {session_id} expired")
+        return upload
+
+    async def create_session(self, request: UploadSessionCreate) -> UploadSessionResponse:
+        """Start a multipart upload for a file of ``request.size`` bytes.
+
+        Raises:
+            InvalidRequestError: If the file needs more than 10,000 chunks.
+        """
+        if request.size > self._chunk_size * MAX_PARTS:
+            raise InvalidRequestError(
+                detail=f"Files over {self._chunk_size * MAX_PARTS} bytes are not supported"
+            )
+        memory_id = uuid4()
+        s3_key = generate_s3_key(request.filename, memory_id)
+        upload_id = await self._s3.create_multipart_upload(
+            s3_key, get_content_type(request.filename)
+        )
+        upload = await self._sessions.create(
+            memory_id=memory_id,
+            filename=request.filename,
+            s3_key=s3_key,
+            s3_upload_id=upload_id,
+            size=request.size,
+            chunk_size=self._chunk_size,
+            expires_at=_utcnow() + self._ttl,
+        )
+        return UploadSessionResponse.model_validate(upload)
+
+    async def get_session(self, session_id: UUID) -> UploadSessionResponse:
+        """Get a session's state, including the committed offset.
+
+        Raises:
+            ResourceNotFoundError: If the session does not exist.
+        """
+        upload = await self._sessions.get(session_id)
+        if upload is None:
+            raise ResourceNotFoundError(detail=f"Upload session {session_id} not found")
+        return UploadSessionResponse.model_validate(upload)
+
+    async def put_chunk(
+        self, session_id: UUID, offset: int, data: bytes
+    ) -> UploadSessionResponse:
+        """Store the chunk starting at ``offset`` as the next S3 part.
+
+        The chunk must start at the committed offset and be exactly
+        ``chunk_size`` bytes, or the remainder of the file for the last one.
+        Each chunk extends the session's expiry. The session row stays
+        locked while the part uploads, so a concurrent retry of the same
+        chunk waits and then gets the offset conflict rather than uploading
+        the part again (and leaving S3 with an ETag the session lacks).
+
+        Raises:
+            ResourceNotFoundError: If the session does not exist.
+            UploadSessionExpiredError: If it expired or was aborted.
+            StatusConflictError: If it was already completed.
+            UploadOffsetConflictError: If ``offset`` is not the committed
+                offset (e.g. a retried chunk that was already stored).
+            InvalidRequestError: If the chunk has the wrong length.
+        """
+        upload = await self._get_open(session_id, lock=True)
+        if offset != upload.offset:
+            raise UploadOffsetConflictError(
+                detail=f"Expected offset {upload.offset}, got {offset}"
+            )
+        expected = min(upload.chunk_size, upload.size - offset)
+        if len(data) != expected:
+            raise InvalidRequestError(
+                detail=f"Chunk at offset {offset} must be {expected} bytes, got {len(data)}"
+            )
+
+        part_number = offset // upload.chunk_size + 1
+        etag = await self._s3.upload_part(
+            upload.s3_key, upload.s3_upload_id, part_number, data
+        )
+        parts = [*upload.parts, {"PartNumber": part_number, "ETag": etag}]
+        committed = await self._sessions.commit_part(
+            session_id,
+            expected_offset=offset,
+            offset=offset + len(data),
+            parts=parts,
+            expires_at=_utcnow() + self._ttl,
+        )
+        if not committed:
+            current = await self._sessions.get(session_id)
+            raise UploadOffsetConflictError(
+                detail=f"Chunk at offset {offset} was committed concurrently; "
+                f"offset is now {current.offset if current else 'unknown'}"
+            )
+        return await self.get_session(session_id)
+
+    async def complete(self, session_id: UUID) -> UploadResponse:
+        """Assemble the parts into the audio object and enqueue processing.
+
+        Completing an already completed session returns its memory again,
+        so a client can safely retry after losing the response.
+
+        Raises:
+            ResourceNotFoundError: If the session does not exist.
+            UploadSessionExpiredError: If it expired or was aborted.
+            InvalidRequestError: If not every byte has been uploaded.
+            StatusConflictError: If another request completed it concurrently.
+            S3UploadError: If S3 rejects the parts (the session stays open).
+        """
+        upload = await self._sessions.get(session_id)
+        if upload is not None and upload.status == UploadSessionStatus.COMPLETED.value:
+            memory = await self._memories.get_memory(upload.memory_id)
+            return UploadResponse(
+                memory_id=upload.memory_id,
+                status=memory.status,
+                message="Upload already completed",
+            )
+        upload = await self._get_open(session_id)
+        if upload.offset != upload.size:
+            raise InvalidRequestError(
+                detail=f"Upload incomplete: {upload.offset} of {upload.size} bytes"
+            )
+        # Claim the session first: the row lock serializes concurrent
+        # completions, and a failure below rolls the claim back.
+        if not await self._sessions.transition(
+            session_id, UploadSessionStatus.COMPLETED.value
+        ):
+            raise StatusConflictError(
+                detail=f"Upload session {session_id} changed concurrently"
+            )
+        audio_url = await self._s3.complete_multipart_upload(
+            upload.s3_key, upload.s3_upload_id, upload.parts
+        )
+        return await self._memories.register_upload(upload.memory_id, audio_url)
+
+    async def abort(self, session_id: UUID) -> None:
+        """Abort a session and discard its uploaded parts.
+
+        Aborting an aborted or expired session is a no-op.
+
+        Raises:
+            ResourceNotFoundError: If the session does not exist.
+            StatusConflictError: If it was already completed.
+        """
+        upload = await self._sessions.get(session_id)
+        if upload is None:
+            raise ResourceNotFoundError(detail=f"Upload session {session_id} not found")
+        if upload.status == UploadSessionStatus.COMPLETED.value:
+            raise StatusConflictError(detail=f"Upload session {session_id} is completed")
+        if await self._sessions.transition(session_id, UploadSessionStatus.ABORTED.value):
+            await self._s3.abort_multipart_upload(upload.s3_key, upload.s3_upload_id)
+
+
+async def expire_sessions(
+    sessions: UploadSessionRepository,
+    s3_client: S3Client,
+    limit: int = REAP_BATCH_SIZE,
+) -> int:
+    """Abort up to ``limit`` open sessions past their expiry.
+
+    Returns:
+        Number of sessions expired by this call.
+    """
+    expired = 0
+    for upload in await sessions.list_expired(_utcnow(), limit):
+        if await sessions.transition(upload.id, UploadSessionStatus.EXPIRED.value):
+            await s3_client.abort_multipart_upload(upload.s3_key, upload.s3_upload_id)
+            expired += 1
+    if expired:
+        logger.info("Expired %d abandoned upload sessions", expired)
+    return expired
+
+
+async def expire_upload_sessions_once(settings: Settings) -> int:
+    """Expire abandoned sessions in a transaction of its own."""
+    factory = _get_session_factory(settings)
+    async with factory() as session:
+        expired = await expire_sessions(
+            UploadSessionRepository(session), S3Client(settings)
+        )
+        await session.commit()
+    return expired
+
+
+async def expire_upload_sessions_forever(settings: Settings) -> None:
+    """Expire abandoned sessions every ``upload_session_reap_seconds`` until cancelled."""
+    while True:
+        try:
+            await expire_upload_sessions_once(settings)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            logger.warning("Upload session expiry failed: %s", exc)
+        await asyncio.sleep(settings.upload_session_reap_seconds)
+
+
+def start_upload_session_reaper(settings: Settings) -> Optional[asyncio.Task]:
+    """Start the expiry loop, unless disabled (``upload_session_reap_seconds <= 0``)."""
+    if settings.upload_session_reap_seconds <= 0:
+        return None
+    return asyncio.create_task(expire_upload_sessions_forever(settings))
@@ -0,0 +1,37 @@
+"""Helpers for reading audio files out of uploaded zip archives."""
+
+from pathlib import PurePosixPath
+from typing import List, Optional
+from zipfile import ZipFile, ZipInfo
+
+from app.utils.s3_helpers import CONTENT_TYPE_MAP
+
+ZIP_CONTENT_TYPES = frozenset(
+    {"application/zip", "application/x-zip-compressed", "application/x-zip"}
+)
+
+
+def is_zip_upload(filename: str, content_type: Optional[str]) -> bool:
+    """Whether an uploaded file is a zip archive, by extension or MIME type."""
+    return filename.lower().endswith(".zip") or content_type in ZIP_CONTENT_TYPES
+
+
+def is_audio_filename(filename: str) -> bool:
+    """Whether the extension is one of the supported audio types."""
+    return PurePosixPath(filename).suffix.lower() in CONTENT_TYPE_MAP
+
+
+def audio_entries(archive: ZipFile) -> List[ZipInfo]:
+    """Audio files in an archive, in archive order.
+
+    Directories, non-audio files and macOS metadata (``__MACOSX/`` and
+    ``._*`` files) are skipped.
+    """
+    entries = []
+    for info in archive.infolist():
+        path = PurePosixPath(info.filename)
+        if info.is_dir() or "__MACOSX" in path.parts or path.name.startswith("._"):
+            continue
+        if is_audio_filename(path.name):
+            entries.append(info)
+    return entries
@@ -0,0 +1,64 @@
+"""Compression for large text stored outside the memories table.
+
+gzip is always available; zstd is used when the optional ``zstandard``
+package is installed and falls back to gzip otherwise.
+"""
+
+from __future__ import annotations
+
+import gzip
+import logging
+from typing import Tuple
+
+try:
+    import zstandard
+except ImportError:  # optional dependency
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+GZIP = "gzip"
+ZSTD = "zstd"
+ENCODINGS = (GZIP, ZSTD)
+
+_GZIP_LEVEL = 6
+_ZSTD_LEVEL = 9
+
+
+def compress_text(text: str, encoding: str = GZIP) -> Tuple[str, bytes]:
+    """Compress UTF-8 text.
+
+    Args:
+        text: Text to compress.
+        encoding: Preferred encoding, "gzip" or "zstd".
+
+    Returns:
+        Tuple of (encoding actually used, compressed bytes).
+
+    Raises:
+        ValueError: If the encoding is unknown.
+    """
+    if encoding not in ENCODINGS:
+        raise ValueError(f"Unknown compression encoding: {encoding}")
+    raw = text.encode("utf-8")
+    if encoding == ZSTD:
+        if zstandard is not None:
+            return ZSTD, zstandard.ZstdCompressor(level=_ZSTD_LEVEL).compress(raw)
+        logger.warning("zstandard is not installed; compressing with gzip")
+    return GZIP, gzip.compress(raw, compresslevel=_GZIP_LEVEL, mtime=0)
+
+
+def decompress_text(encoding: str, data: bytes) -> str:
+    """Reverse compress_text.
+
+    Raises:
+        ValueError: If the encoding is unknown.
+        RuntimeError: If the data is zstd and zstandard is not installed.
+    """
+    if encoding == GZIP:
+        return gzip.decompress(data).decode("utf-8")
+    if encoding == ZSTD:
+        if zstandard is None:
+            raise RuntimeError("zstandard is required to read zstd-compressed text")
+        return zstandard.ZstdDecompressor().decompress(data).decode("utf-8")
+    raise ValueError(f"Unknown compression encoding: {encoding}")
@@ -0,0 +1,34 @@
+"""SHA-256 of uploaded audio, computed while the upload is read."""
+
+import asyncio
+import hashlib
+from typing import Tuple
+
+from fastapi import UploadFile
+
+# Bytes read (and hashed) per UploadFile.read() call
+READ_CHUNK_SIZE = 1024 * 1024
+
+
+async def read_with_sha256(
+    file: UploadFile, chunk_size: int = READ_CHUNK_SIZE
+) -> Tuple[bytes, str]:
+    """Read an upload to the end, hashing each chunk as it arrives.
+
+    Hashing chunk by chunk keeps the event loop free between reads of a
+    large spooled file, instead of a second full pass over the bytes.
+
+    Returns:
+        The file contents and their hex SHA-256 digest.
+    """
+    digest = hashlib.sha256()
+    chunks = []
+    while chunk := await file.read(chunk_size):
+        digest.update(chunk)
+        chunks.append(chunk)
+    return b"".join(chunks), digest.hexdigest()
+
+
+async def sha256_hex(data: bytes) -> str:
+    """Hex SHA-256 of bytes already in memory, hashed off the event loop."""
+    return (await asyncio.to_thread(hashlib.sha256, data)).hexdigest()
@@ -0,0 +1,75 @@
+"""Strong ETags, If-None-Match matching and Cache-Control values. No I/O here.
+
+A memory's representation changes exactly when its ``updated_at`` does,
+so (id, updated_at) identifies a version of GET /memories/{id}. A list
+page is identified by its filters plus the ids and newest ``updated_at``
+of its items (and the total, when present).
+"""
+
+from __future__ import annotations
+
+import hashlib
+from datetime import datetime
+from typing import Any, Iterable, Mapping, Optional, Tuple
+from uuid import UUID
+
+# Ready memories only change again if deleted: let clients reuse them briefly
+READY_CACHE_CONTROL = "private, max-age=60"
+# Everything else may change any moment: always revalidate (cheap with ETags)
+REVALIDATE_CACHE_CONTROL = "private, no-cache"
+
+
+def _etag(*parts: Any) -> str:
+    digest = hashlib.sha256("\x1f".join(str(part) for part in parts).encode())
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def memory_etag(memory_id: UUID, updated_at: datetime) -> str:
+    """Strong ETag of one version of a memory."""
+    return _etag(memory_id, updated_at.isoformat())
+
+
+def list_etag(
+    filters: Mapping[str, Any],
+    items: Iterable[Tuple[UUID, datetime]],
+    total: Optional[int] = None,
+) -> str:
+    """Strong ETag of a list page.
+
+    Args:
+        filters: The query parameters that selected the page.
+        items: (id, updated_at) of each item, in page order.
+        total: The page's total, when it reports one.
+    """
+    items = list(items)
+    newest = max((updated_at for _, updated_at in items), default=None)
+    return _etag(
+        sorted((key, str(value)) for key, value in filters.items() if value is not None),
+        [str(memory_id) for memory_id, _ in items],
+        newest.isoformat() if newest else "",
+        total,
+    )
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header matches ``etag``.
+
+    Uses the weak comparison RFC 9110 prescribes for If-None-Match, so
+    ``W/"x"`` matches ``"x"``; ``*`` matches any current representation.
+    """
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def memory_cache_control(status: str) -> str:
+    """Cache-Control for GET /memories/{id}, by memory status."""
+    return READY_CACHE_CONTROL if status == "ready" else REVALIDATE_CACHE_CONTROL
@@ -0,0 +1,44 @@
+"""Opaque keyset-pagination cursors. No I/O here."""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Tuple
+from uuid import UUID
+
+
+def encode_cursor(created_at: datetime, memory_id: UUID) -> str:
+    """Encode a (created_at, id) sort key as an opaque URL-safe cursor.
+
+    Args:
+        created_at: Sort timestamp of the last item on the page.
+        memory_id: ID of the last item on the page (tie-breaker).
+
+    Returns:
+        Base64url string without padding.
+    """
+    raw = json.dumps([created_at.isoformat(), str(memory_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: The opaque cursor string.
+
+    Returns:
+        Tuple of (created_at, memory_id).
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, memory_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), UUID(memory_id)
+    except (
+        binascii.Error, UnicodeDecodeError, AttributeError, TypeError, ValueError
+    ) as exc:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from exc
@@ -28,6 +28,21 @@ def generate_s3_key(filename: str, memory_id: UUID) -> str:
     return f"audio/{memory_id}{ext}"
 
 
+def s3_key_from_url(audio_url: str) -> str:
+    """Extract the object key from an "s3://bucket/key" URL.
+
+    Args:
+        audio_url: URL as stored on the memory.
+
+    Returns:
+        The key (e.g. "audio/<uuid>.webm"), or "" if the URL is empty.
+    """
+    if not audio_url.startswith("s3://"):
+        return ""
+    _, _, key = audio_url[len("s3://"):].partition("/")
+    return key
+
+
 def get_content_type(filename: str) -> str:
     """Determine MIME content type from filename extension.
 
@@ -0,0 +1,82 @@
+"""Pure helpers for full-text search queries and snippets. No I/O here."""
+
+import re
+from typing import List, Optional, Sequence
+
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_STOP = "</mark>"
+
+_TERM_RE = re.compile(r"\w+", re.UNICODE)
+_MAX_TERMS = 8
+
+
+def tokenize_query(query: str) -> List[str]:
+    """Split a user query into lower-cased word terms.
+
+    Punctuation and tsquery operators are dropped, so the result is safe
+    to embed in a tsquery string. At most 8 unique terms are kept.
+
+    Args:
+        query: Raw search text as typed by the user.
+
+    Returns:
+        Unique terms in input order.
+    """
+    terms: List[str] = []
+    for term in _TERM_RE.findall(query.lower()):
+        if term not in terms:
+            terms.append(term)
+    return terms[:_MAX_TERMS]
+
+
+def to_prefix_tsquery(terms: Sequence[str]) -> str:
+    """Build a Postgres tsquery matching all terms as prefixes.
+
+    Prefix matching keeps search-as-you-type working on partial words.
+
+    Args:
+        terms: Output of tokenize_query.
+
+    Returns:
+        A tsquery string like "sprint:* & plan:*".
+    """
+    return " & ".join(f"{term}:*" for term in terms)
+
+
+def highlight_snippet(
+    text: Optional[str],
+    terms: Sequence[str],
+    max_chars: int = 160,
+) -> Optional[str]:
+    """Return a window of text around the first term match, with matches marked.
+
+    Python counterpart of ts_headline for databases without full-text
+    search (SQLite in tests).
+
+    Args:
+        text: Document text to cut the snippet from.
+        terms: Search terms; each matches as a word prefix, case-insensitively.
+        max_chars: Approximate snippet length.
+
+    Returns:
+        The highlighted snippet, or None if no term occurs in the text.
+    """
+    if not text or not terms:
+        return None
+    pattern = re.compile(
+        r"\b(" + "|".join(re.escape(term) for term in terms) + r")\w*",
+        re.IGNORECASE,
+    )
+    match = pattern.search(text)
+    if match is None:
+        return None
+
+    start = max(0, match.start() - max_chars // 3)
+    end = min(len(text), start + max_chars)
+    window = pattern.sub(
+        lambda m: f"{HIGHLIGHT_START}{m.group(0)}{HIGHLIGHT_STOP}",
+        text[start:end],
+    )
+    prefix = "..." if start > 0 else ""
+    suffix = "..." if end < len(text) else ""
+    return f"{prefix}{window}{suffix}"
@@ -0,0 +1,121 @@
+"""In-process request coalescing ("single-flight") for identical reads.
+
+When an SSE status event fires, every connected client fetches the same
+memory at once. SingleFlight lets the first caller for a key run the
+query while concurrent callers with the same key await its result, so
+the burst costs one query and one response model. Nothing is kept once
+the call finishes: a request that arrives afterwards runs again, so a
+coalesced read is never older than one that was already in flight.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, Optional, TypeVar
+
+from app.utils.metrics import REGISTRY, Counter, Gauge
+
+T = TypeVar("T")
+
+# Operation labels seen so far, for the dedup-ratio gauge
+_operations: set = set()
+
+SINGLE_FLIGHT_CALLS = Counter(
+    "single_flight_calls_total",
+    "Coalesced reads by operation and result: 'leader' ran the query, "
+    "'shared' reused an in-flight one. Dedup ratio = shared / (leader + shared).",
+    ("operation", "result"),
+)
+SINGLE_FLIGHT_DEDUP_RATIO = Gauge(
+    "single_flight_dedup_ratio",
+    "Share of calls per operation served by another call's query.",
+    ("operation",),
+)
+
+
+class SingleFlight:
+    """Shares one in-flight call among concurrent callers with the same key.
+
+    The result (or exception) of the leading call is handed to every
+    caller that joined while it ran; callers must treat it as read-only.
+    If the leader is cancelled (e.g. its client disconnected), waiting
+    callers run the call themselves instead of failing.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def do(
+        self,
+        operation: str,
+        key: Hashable,
+        call: Callable[[], Awaitable[T]],
+    ) -> T:
+        """Run ``call()``, or join an identical call already in flight.
+
+        Args:
+            operation: Metrics label, e.g. "get_memory".
+            key: Identifies identical calls within ``operation``.
+            call: Produces the result; only invoked by the leader.
+        """
+        _operations.add(operation)
+        full_key = (operation, key)
+        while True:
+            future = self._calls.get(full_key)
+            if future is None:
+                break
+            SINGLE_FLIGHT_CALLS.inc(operation=operation, result="shared")
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # The leader was cancelled, not us: try again (possibly as leader)
+
+        SINGLE_FLIGHT_CALLS.inc(operation=operation, result="leader")
+        future = asyncio.get_running_loop().create_future()
+        self._calls[full_key] = future
+        try:
+            result = await call()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Mark retrieved so an exception nobody joined for is not logged
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._calls.pop(full_key, None)
+
+
+_single_flight: Optional[SingleFlight] = None
+
+
+def get_single_flight() -> SingleFlight:
+    """Get or create the process-wide SingleFlight (lazy singleton)."""
+    global _single_flight
+    if _single_flight is None:
+        _single_flight = SingleFlight()
+    return _single_flight
+
+
+def dedup_ratio(operation: str) -> float:
+    """Share of ``operation`` calls served by another call's query."""
+    shared = SINGLE_FLIGHT_CALLS.value(operation=operation, result="shared")
+    total = shared + SINGLE_FLIGHT_CALLS.value(operation=operation, result="leader")
+    return shared / total if total else 0.0
+
+
+def _collect_dedup_ratios() -> None:
+    for operation in _operations:
+        SINGLE_FLIGHT_DEDUP_RATIO.set(dedup_ratio(operation), operation=operation)
+
+
+REGISTRY.add_collector(_collect_dedup_ratios)
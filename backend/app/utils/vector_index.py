@@ -0,0 +1,280 @@
+"""Exact top-k cosine search over unit vectors, memory-mapped from disk.
+
+Vectors live in two segments: a base segment loaded read-only with
+``np.load(mmap_mode="r")``, and an in-memory append segment for vectors
+added since the last save. Replacing or removing a vector only clears its
+``alive`` flag; ``save`` writes a compacted copy of both segments so the
+next load is a single memory-mapped base again.
+
+Files in the index directory:
+    meta.json          dimensions, count, generation, ids checksum and
+                       caller metadata (e.g. sync position)
+    vectors-<gen>.npy  float32 (n, dimensions)
+    ids-<gen>.npy      uint8 (n, 16), the memory UUID bytes
+    index.lock         flock()ed: exclusively by saves, shared by loads
+
+Several processes may share the directory. Each save writes a new
+generation of data files and then points meta.json at it, so a load
+never pairs files from different saves.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+from uuid import UUID, uuid4
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: saves and loads are not serialized
+    fcntl = None
+
+META_FILE = "meta.json"
+LOCK_FILE = "index.lock"
+VECTORS_FILE = "vectors-{generation}.npy"
+IDS_FILE = "ids-{generation}.npy"
+
+# Base rows scored per matrix-vector product (bounds temporary memory)
+_SCORE_CHUNK_ROWS = 65_536
+# Rows copied per write when compacting to disk
+_SAVE_CHUNK_ROWS = 65_536
+
+PathLike = Union[str, Path]
+
+
+@contextmanager
+def _locked(directory: Path, exclusive: bool) -> Iterator[None]:
+    """Hold an exclusive or shared lock on the directory's lock file."""
+    if fcntl is None:
+        yield
+        return
+    with open(directory / LOCK_FILE, "a+b") as handle:
+        fcntl.flock(handle, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        yield
+
+
+def _remove_other_generations(directory: Path, generation: str) -> None:
+    """Delete data files and stray meta.json temporaries of other saves.
+
+    Processes that memory-mapped an older generation keep their mapping.
+    Files that cannot be removed yet (open on Windows) are left for a
+    later save.
+    """
+    keep = {
+        VECTORS_FILE.format(generation=generation),
+        IDS_FILE.format(generation=generation),
+    }
+    for pattern in ("vectors-*.npy", "ids-*.npy", f"{META_FILE}.*.tmp"):
+        for path in directory.glob(pattern):
+            if path.name in keep:
+                continue
+            try:
+                path.unlink(missing_ok=True)
+            except OSError:
+                pass
+
+
+class VectorIndex:
+    """Top-k inner-product index; with unit vectors, scores are cosines."""
+
+    def __init__(self, dimensions: int) -> None:
+        self.dimensions = dimensions
+        self._base: np.ndarray = np.empty((0, dimensions), dtype=np.float32)
+        self._base_alive = np.ones(0, dtype=bool)
+        self._extra = np.empty((64, dimensions), dtype=np.float32)
+        self._extra_alive = np.zeros(64, dtype=bool)
+        self._extra_count = 0
+        self._ids: List[UUID] = []
+        self._rows: Dict[UUID, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, memory_id: UUID) -> bool:
+        return memory_id in self._rows
+
+    @property
+    def dead_rows(self) -> int:
+        """Replaced or removed rows still occupying space until the next save."""
+        return len(self._ids) - len(self._rows)
+
+    def _kill(self, memory_id: UUID) -> None:
+        row = self._rows.pop(memory_id, None)
+        if row is None:
+            return
+        base_rows = len(self._base)
+        if row < base_rows:
+            self._base_alive[row] = False
+        else:
+            self._extra_alive[row - base_rows] = False
+
+    def upsert(self, memory_ids: Sequence[UUID], vectors: np.ndarray) -> None:
+        """Add vectors, replacing any existing vector for the same id.
+
+        Args:
+            memory_ids: One id per row of ``vectors``.
+            vectors: float32 array of shape (len(memory_ids), dimensions).
+        """
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(-1, self.dimensions)
+        if len(vectors) != len(memory_ids):
+            raise ValueError("memory_ids and vectors differ in length")
+        needed = self._extra_count + len(vectors)
+        if needed > len(self._extra):
+            capacity = max(needed, 2 * len(self._extra))
+            grown = np.empty((capacity, self.dimensions), dtype=np.float32)
+            grown[: self._extra_count] = self._extra[: self._extra_count]
+            alive = np.zeros(capacity, dtype=bool)
+            alive[: self._extra_count] = self._extra_alive[: self._extra_count]
+            self._extra, self._extra_alive = grown, alive
+
+        for offset, memory_id in enumerate(memory_ids):
+            self._kill(memory_id)
+            slot = self._extra_count + offset
+            self._extra[slot] = vectors[offset]
+            self._extra_alive[slot] = True
+            self._rows[memory_id] = len(self._ids)
+            self._ids.append(memory_id)
+        self._extra_count = needed
+
+    def remove(self, memory_ids: Sequence[UUID]) -> None:
+        """Drop vectors by id; unknown ids are ignored."""
+        for memory_id in memory_ids:
+            self._kill(memory_id)
+
+    def search(self, query: Sequence[float], k: int) -> List[Tuple[UUID, float]]:
+        """Return the ``k`` best (id, score) pairs, best first."""
+        k = min(k, len(self._rows))
+        if k <= 0:
+            return []
+        q = np.asarray(query, dtype=np.float32).reshape(self.dimensions)
+        base_rows = len(self._base)
+        scores = np.empty(base_rows + self._extra_count, dtype=np.float32)
+        for start in range(0, base_rows, _SCORE_CHUNK_ROWS):
+            stop = min(start + _SCORE_CHUNK_ROWS, base_rows)
+            np.dot(self._base[start:stop], q, out=scores[start:stop])
+        if self._extra_count:
+            np.dot(self._extra[: self._extra_count], q, out=scores[base_rows:])
+        scores[:base_rows][~self._base_alive] = -np.inf
+        scores[base_rows:][~self._extra_alive[: self._extra_count]] = -np.inf
+
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(self._ids[row], float(scores[row])) for row in top]
+
+    def _alive_segments(self):
+        """Yield (segment array, alive mask) pairs for compaction."""
+        yield self._base, self._base_alive
+        yield self._extra[: self._extra_count], self._extra_alive[: self._extra_count]
+
+    def save(self, directory: PathLike, meta: Optional[Dict[str, Any]] = None) -> str:
+        """Write a compacted copy of the index to ``directory``.
+
+        The data files are named after a new generation, and meta.json,
+        moved into place last, names that generation and the ids checksum
+        ``load`` verifies. Runs under the directory's exclusive lock, then
+        deletes the files of earlier generations. The in-memory index is
+        unchanged; load the directory to get a memory-mapped copy.
+
+        Returns:
+            The generation written.
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        with _locked(directory, exclusive=True):
+            generation = uuid4().hex
+            self._write(directory, generation, meta or {})
+            _remove_other_generations(directory, generation)
+        return generation
+
+    def _write(self, directory: Path, generation: str, meta: Dict[str, Any]) -> None:
+        """Write one generation's data files, then point meta.json at them."""
+        count = len(self._rows)
+        out = np.lib.format.open_memmap(
+            directory / VECTORS_FILE.format(generation=generation),
+            mode="w+",
+            dtype=np.float32,
+            shape=(count, self.dimensions),
+        )
+        written = 0
+        for segment, alive in self._alive_segments():
+            for start in range(0, len(segment), _SAVE_CHUNK_ROWS):
+                chunk = segment[start : start + _SAVE_CHUNK_ROWS]
+                chunk = chunk[alive[start : start + _SAVE_CHUNK_ROWS]]
+                out[written : written + len(chunk)] = chunk
+                written += len(chunk)
+        out.flush()
+        del out
+
+        alive_ids = [
+            memory_id
+            for row, memory_id in enumerate(self._ids)
+            if self._rows.get(memory_id) == row
+        ]
+        id_bytes = np.frombuffer(
+            b"".join(memory_id.bytes for memory_id in alive_ids), dtype=np.uint8
+        ).reshape(count, 16)
+        with open(directory / IDS_FILE.format(generation=generation), "wb") as handle:
+            np.save(handle, id_bytes)
+
+        meta_tmp = directory / f"{META_FILE}.{generation}.tmp"
+        meta_tmp.write_text(
+            json.dumps(
+                {
+                    **meta,
+                    "dimensions": self.dimensions,
+                    "count": count,
+                    "generation": generation,
+                    "ids_sha256": hashlib.sha256(id_bytes.tobytes()).hexdigest(),
+                }
+            )
+        )
+        os.replace(meta_tmp, directory / META_FILE)
+
+    @classmethod
+    def load(
+        cls, directory: PathLike, dimensions: int
+    ) -> Optional[Tuple["VectorIndex", Dict[str, Any]]]:
+        """Memory-map a saved index.
+
+        Reads under the directory's shared lock, so a concurrent save
+        cannot delete the files meta.json names before they are opened.
+
+        Returns:
+            Tuple of (index, meta), or None if the directory holds no
+            index, one of another size, or an inconsistent one.
+        """
+        directory = Path(directory)
+        try:
+            with _locked(directory, exclusive=False):
+                meta = json.loads((directory / META_FILE).read_text())
+                generation = meta["generation"]
+                if not str(generation).isalnum():
+                    return None
+                vectors = np.load(
+                    directory / VECTORS_FILE.format(generation=generation),
+                    mmap_mode="r",
+                )
+                id_bytes = np.load(directory / IDS_FILE.format(generation=generation))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        count = meta.get("count")
+        if (
+            meta.get("dimensions") != dimensions
+            or vectors.shape != (count, dimensions)
+            or id_bytes.shape != (count, 16)
+            or hashlib.sha256(id_bytes.tobytes()).hexdigest() != meta.get("ids_sha256")
+        ):
+            return None
+
+        index = cls(dimensions)
+        index._base = vectors
+        index._base_alive = np.ones(count, dtype=bool)
+        index._ids = [UUID(bytes=row.tobytes()) for row in id_bytes]
+        index._rows = {memory_id: row for row, memory_id in enumerate(index._ids)}
+        return index, meta
@@ -10,6 +10,7 @@ import asyncio
 import json
 import logging
 import sys
+from functools import partial
 
 from app.clients.openai import OpenAIClient
 from app.clients.redis_client import RedisClient
@@ -17,8 +18,9 @@ from app.clients.s3 import S3Client
 from app.clients.sqs import SQSClient
 from app.config import Settings
 from app.models.memory import MemoryProcessRequest
-from app.repositories.database import _get_session_factory, _get_engine
+from app.repositories.database import _get_session_factory, _get_engine, commit
 from app.repositories.memory_repository import MemoryRepository
+from app.services.embeddings import build_embedding_provider
 from app.services.processing_service import ProcessingService
 
 logging.basicConfig(
@@ -33,6 +35,7 @@ async def consume_forever(settings: Settings) -> None:
     sqs = SQSClient(settings)
     s3_client = S3Client(settings)
     openai_client = OpenAIClient(settings)
+    embedding_provider = build_embedding_provider(settings, openai_client)
     redis_client = RedisClient(settings)
     await redis_client.connect()
 
@@ -57,16 +60,23 @@ async def consume_forever(settings: Settings) -> None:
                 )
 
                 async with factory() as session:
-                    repository = MemoryRepository(session)
+                    repository = MemoryRepository(
+                        session, transcript_encoding=settings.transcript_compression
+                    )
                     service = ProcessingService(
-                        repository, s3_client, openai_client, redis_client
+                        repository,
+                        s3_client,
+                        openai_client,
+                        redis_client,
+                        embedding_provider,
+                        commit=partial(commit, session),
                     )
                     await service.process_memory(
                         memory_id=payload.memory_id,
                         audio_url=payload.audio_url,
                         correlation_id=payload.correlation_id,
                     )
-                    await session.commit()
+                    await commit(session)
 
                 await sqs.delete_message(receipt_handle)
                 logger.info("Processed and deleted: memory_id=%s", payload.memory_id)
@@ -2,33 +2,107 @@
 
 This module is the entry point for Lambda functions that consume
 SQS messages and run the audio processing pipeline.
+
+Only the standard library is imported at module load (about 0.1 s,
+under 200 modules). The pipeline (openai, SQLAlchemy, aioboto3,
+pydantic: about 1,160 modules, 1.1-1.5 s) is imported on first use
+instead. This does not shorten an on-demand cold start: the same import
+time moves from the init phase to the first invocation, which is that
+much slower. It does keep init well inside its time limit. Environments
+initialized ahead of traffic (provisioned concurrency, SnapStart) still
+import the pipeline during init, where it costs no request any latency;
+see _PRELOAD_INITIALIZATION_TYPES. The names that used to be module-level
+imports remain available as lazy attributes.
 """
 
 from __future__ import annotations
 
 import asyncio
+import importlib
 import json
 import logging
-from typing import Any, Dict, List
-from uuid import UUID
-
-from app.clients.openai import OpenAIClient
-from app.clients.redis_client import NullRedisClient, RedisClient
-from app.clients.s3 import S3Client
-from app.config import Settings
-from app.models.memory import MemoryProcessRequest
-from app.repositories.database import _get_session_factory, _get_engine, dispose_engine
-from app.repositories.memory_repository import MemoryRepository
-from app.services.processing_service import ProcessingService
+import os
+from functools import partial
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    from app.clients.openai import OpenAIClient
+    from app.clients.redis_client import NullRedisClient, RedisClient
+    from app.clients.s3 import S3Client
+    from app.services.embeddings import EmbeddingProvider
 
 logger = logging.getLogger(__name__)
 
+# Attribute name -> module it is lazily imported from (PEP 562)
+_LAZY_IMPORTS: Dict[str, str] = {
+    "OpenAIClient": "app.clients.openai",
+    "NullRedisClient": "app.clients.redis_client",
+    "RedisClient": "app.clients.redis_client",
+    "S3Client": "app.clients.s3",
+    "Settings": "app.config",
+    "MemoryProcessRequest": "app.models.memory",
+    "_get_session_factory": "app.repositories.database",
+    "dispose_engine": "app.repositories.database",
+    "MemoryRepository": "app.repositories.memory_repository",
+    "ProcessingService": "app.services.processing_service",
+}
+
+# Imported inside _process_batch but not exposed as lazy attributes
+_PIPELINE_MODULES = ("app.clients.sqs", "app.services.embeddings")
+
+# AWS_LAMBDA_INITIALIZATION_TYPE values whose init runs before any request
+_PRELOAD_INITIALIZATION_TYPES = ("provisioned-concurrency", "snap-start")
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the pipeline's former module-level imports on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def _load_pipeline() -> None:
+    """Import every module the pipeline needs now rather than on first use."""
+    for name in _LAZY_IMPORTS:
+        __getattr__(name)
+    for module_name in _PIPELINE_MODULES:
+        importlib.import_module(module_name)
+
 
-async def _process_record(record: Dict[str, Any]) -> None:
+def _remaining_seconds(context: Any) -> Optional[float]:
+    """Return the invocation's remaining time in seconds, if known."""
+    get_remaining = getattr(context, "get_remaining_time_in_millis", None)
+    if get_remaining is None:
+        return None
+    return get_remaining() / 1000.0
+
+
+async def _process_record(
+    record: Dict[str, Any],
+    s3_client: S3Client,
+    openai_client: OpenAIClient,
+    redis_client: Union[RedisClient, NullRedisClient],
+    factory: async_sessionmaker[AsyncSession],
+    transcript_encoding: str = "gzip",
+    embedding_provider: Optional[EmbeddingProvider] = None,
+) -> None:
     """Process a single SQS record through the full pipeline.
 
-    Parses the message body, creates dependencies, and runs processing.
+    Parses the message body and runs processing in its own DB session,
+    so concurrent records never share a session. The "ready" transition
+    is committed as soon as it is written; the embedding and duplicate
+    updates that follow are committed at the end.
     """
+    from app.models.memory import MemoryProcessRequest
+    from app.repositories.database import commit
+    from app.repositories.memory_repository import MemoryRepository
+    from app.services.processing_service import ProcessingService
+
     body = json.loads(record["body"])
     payload = MemoryProcessRequest.model_validate(body)
 
@@ -38,63 +112,155 @@ async def _process_record(record: Dict[str, Any]) -> None:
         payload.correlation_id,
     )
 
+    async with factory() as session:
+        repository = MemoryRepository(
+            session, transcript_encoding=transcript_encoding
+        )
+        service = ProcessingService(
+            repository,
+            s3_client,
+            openai_client,
+            redis_client,
+            embedding_provider,
+            commit=partial(commit, session),
+        )
+
+        await service.process_memory(
+            memory_id=payload.memory_id,
+            audio_url=payload.audio_url,
+            correlation_id=payload.correlation_id,
+        )
+        await commit(session)
+
+
+async def _process_batch(
+    records: List[Dict[str, Any]],
+    context: Any,
+) -> List[Dict[str, str]]:
+    """Process a batch of SQS records concurrently.
+
+    Records run under a semaphore of ``worker_max_concurrency`` and share
+    the AWS/OpenAI clients and the engine's connection pool. A record is
+    only started while more than ``worker_time_margin_seconds`` remain in
+    the invocation; in-flight records are cancelled at that margin. Both
+    cases are reported as failures so SQS redelivers them. Skipped
+    records were never tried, so their visibility is reset to 0 and they
+    are redelivered right away rather than after the visibility timeout.
+    The event source's batch size matches ``worker_max_concurrency`` (see
+    terraform/lambda.tf), so every record normally starts at once and
+    skips, which still count towards maxReceiveCount, stay rare.
+
+    Returns:
+        The "batchItemFailures" entries for records that did not succeed.
+    """
+    from app.clients.openai import OpenAIClient
+    from app.clients.redis_client import NullRedisClient, RedisClient
+    from app.clients.s3 import S3Client
+    from app.clients.sqs import SQSClient
+    from app.config import Settings
+    from app.repositories.database import _get_session_factory, dispose_engine
+    from app.services.embeddings import build_embedding_provider
+
     settings = Settings()
 
     s3_client = S3Client(settings)
     openai_client = OpenAIClient(settings)
+    embedding_provider = build_embedding_provider(settings, openai_client)
     if settings.redis_enabled:
-        redis_client = RedisClient(settings)
+        redis_client: Union[RedisClient, NullRedisClient] = RedisClient(settings)
         await redis_client.connect()
     else:
         redis_client = NullRedisClient()
 
-    engine = _get_engine(settings)
     factory = _get_session_factory(settings)
+    semaphore = asyncio.Semaphore(max(1, settings.worker_max_concurrency))
+    skipped: List[str] = []
 
-    async with factory() as session:
-        repository = MemoryRepository(session)
-        service = ProcessingService(repository, s3_client, openai_client, redis_client)
+    async def run(record: Dict[str, Any]) -> Optional[str]:
+        """Process one record; return its messageId on failure."""
+        message_id = record.get("messageId", "unknown")
+        async with semaphore:
+            remaining = _remaining_seconds(context)
+            budget = (
+                None if remaining is None
+                else remaining - settings.worker_time_margin_seconds
+            )
+            if budget is not None and budget <= 0:
+                logger.warning(
+                    "Skipping SQS record %s: only %.1fs left in invocation",
+                    message_id,
+                    remaining,
+                )
+                if record.get("receiptHandle"):
+                    skipped.append(record["receiptHandle"])
+                return message_id
+            try:
+                await asyncio.wait_for(
+                    _process_record(
+                        record, s3_client, openai_client, redis_client, factory,
+                        settings.transcript_compression, embedding_provider,
+                    ),
+                    timeout=budget,
+                )
+            except asyncio.TimeoutError:
+                logger.error(
+                    "SQS record %s ran out of time budget (%.1fs)",
+                    message_id,
+                    budget,
+                )
+                return message_id
+            except Exception as exc:
+                logger.error(
+                    "Failed to process SQS record %s: %s",
+                    message_id,
+                    exc,
+                    exc_info=True,
+                )
+                return message_id
+        return None
 
-        await service.process_memory(
-            memory_id=payload.memory_id,
-            audio_url=payload.audio_url,
-            correlation_id=payload.correlation_id,
-        )
-        await session.commit()
+    try:
+        results = await asyncio.gather(*(run(record) for record in records))
+        if skipped:
+            await SQSClient(settings).release_messages(skipped)
+    finally:
+        await redis_client.disconnect()
+        await dispose_engine()
 
-    await dispose_engine()
+    return [{"itemIdentifier": message_id} for message_id in results if message_id]
 
 
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, List]:
     """AWS Lambda entry point for SQS events.
 
-    Processes each SQS record independently. Returns partial batch
-    failures so only failed messages are retried.
+    Processes the batch's records concurrently inside a single event
+    loop. Returns partial batch failures so only failed messages are
+    retried.
 
     Args:
         event: SQS event with "Records" list.
-        context: Lambda context (unused).
+        context: Lambda context, used for the remaining-time budget.
 
     Returns:
         Dict with "batchItemFailures" for failed records.
     """
-    failures: List[Dict[str, str]] = []
-
-    for record in event.get("Records", []):
-        try:
-            asyncio.run(_process_record(record))
-        except Exception as exc:
-            message_id = record.get("messageId", "unknown")
-            logger.error(
-                "Failed to process SQS record %s: %s",
-                message_id,
-                exc,
-                exc_info=True,
-            )
-            failures.append({"itemIdentifier": message_id})
+    records = event.get("Records", [])
+
+    try:
+        failures = asyncio.run(_process_batch(records, context))
+    except Exception as exc:
+        logger.error("SQS batch setup failed: %s", exc, exc_info=True)
+        failures = [
+            {"itemIdentifier": record.get("messageId", "unknown")}
+            for record in records
+        ]
 
     if failures:
         logger.warning("Batch had %d failures out of %d records",
-                       len(failures), len(event.get("Records", [])))
+                       len(failures), len(records))
 
     return {"batchItemFailures": failures}
+
+
+if os.environ.get("AWS_LAMBDA_INITIALIZATION_TYPE") in _PRELOAD_INITIALIZATION_TYPES:
+    _load_pipeline()
@@ -0,0 +1,50 @@
+"""Add the full-text search column to memories.
+
+On Postgres, ``search_vector`` is a weighted tsvector generated from the
+title, summary, key points and transcript, with a GIN index. Databases
+created by ``init_db`` after full-text search was added already have
+both, so they are only created if missing; that way any ``init_db``
+database can be stamped at 0001 and upgraded. Other dialects keep
+matching with LIKE and need no column yet.
+
+Revision ID: 0001a
+Revises: 0001
+Create Date: 2026-10-19 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0001a"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(summary, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(key_points::text, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(transcript, '')), 'D')"
+)
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute(
+        "ALTER TABLE memories ADD COLUMN IF NOT EXISTS search_vector tsvector "
+        f"GENERATED ALWAYS AS ({SEARCH_VECTOR_EXPRESSION}) STORED"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_memories_search_vector ON memories "
+        "USING GIN (search_vector)"
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("DROP INDEX IF EXISTS ix_memories_search_vector")
+    op.execute("ALTER TABLE memories DROP COLUMN IF EXISTS search_vector")
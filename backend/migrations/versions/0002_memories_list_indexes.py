@@ -0,0 +1,53 @@
+"""Add composite indexes for memory list queries.
+
+Every list sorts by (created_at DESC, id DESC), optionally filtered by
+status; both indexes match that order so page and keyset queries become
+an index scan plus LIMIT instead of a full sort. On Postgres they are
+built CONCURRENTLY so existing tables stay writable.
+
+Revision ID: 0002
+Revises: 0001a
+Create Date: 2026-10-19 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, None] = "0001a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = {
+    "ix_memories_created_at_id": ["created_at DESC", "id DESC"],
+    "ix_memories_status_created_at_id": ["status", "created_at DESC", "id DESC"],
+}
+
+
+def _is_postgres() -> bool:
+    return op.get_bind().dialect.name == "postgresql"
+
+
+def upgrade() -> None:
+    if _is_postgres():
+        with op.get_context().autocommit_block():
+            for name, columns in INDEXES.items():
+                op.create_index(
+                    name,
+                    "memories",
+                    [sa.text(column) for column in columns],
+                    postgresql_concurrently=True,
+                    if_not_exists=True,
+                )
+        return
+
+    for name, columns in INDEXES.items():
+        op.create_index(name, "memories", [sa.text(column) for column in columns])
+
+
+def downgrade() -> None:
+    for name in INDEXES:
+        op.drop_index(name, table_name="memories")
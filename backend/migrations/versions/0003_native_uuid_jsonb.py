@@ -0,0 +1,93 @@
+"""Use native UUID and JSONB column types for memories.
+
+On Postgres, ``id`` becomes ``uuid`` (16 bytes instead of a 36-char
+varchar, so the primary key and the list indexes that include it shrink)
+and ``key_points``/``action_items`` become ``jsonb`` with a GIN index for
+containment queries over action items. The generated search_vector
+column depends on key_points, so it is dropped and re-added around the
+type change.
+
+On SQLite (tests) ``Uuid`` is stored as 32 hex characters, so ids lose
+their hyphens.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(summary, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(key_points::text, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(transcript, '')), 'D')"
+)
+
+
+def _recreate_search_vector() -> None:
+    op.execute(
+        "ALTER TABLE memories ADD COLUMN search_vector tsvector "
+        f"GENERATED ALWAYS AS ({SEARCH_VECTOR_EXPRESSION}) STORED"
+    )
+    op.execute(
+        "CREATE INDEX ix_memories_search_vector ON memories USING GIN (search_vector)"
+    )
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("ALTER TABLE memories DROP COLUMN search_vector")
+        op.execute(
+            "ALTER TABLE memories "
+            "ALTER COLUMN id TYPE uuid USING id::uuid, "
+            "ALTER COLUMN key_points TYPE jsonb USING key_points::jsonb, "
+            "ALTER COLUMN action_items TYPE jsonb USING action_items::jsonb"
+        )
+        _recreate_search_vector()
+        op.execute(
+            "CREATE INDEX ix_memories_action_items ON memories "
+            "USING GIN (action_items jsonb_path_ops)"
+        )
+        return
+
+    op.execute("UPDATE memories SET id = replace(id, '-', '')")
+    with op.batch_alter_table("memories") as batch:
+        batch.alter_column(
+            "id", type_=sa.Uuid(), existing_type=sa.String(length=36),
+            existing_nullable=False,
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("DROP INDEX ix_memories_action_items")
+        op.execute("ALTER TABLE memories DROP COLUMN search_vector")
+        op.execute(
+            "ALTER TABLE memories "
+            "ALTER COLUMN id TYPE varchar(36) USING id::text, "
+            "ALTER COLUMN key_points TYPE json USING key_points::json, "
+            "ALTER COLUMN action_items TYPE json USING action_items::json"
+        )
+        _recreate_search_vector()
+        return
+
+    with op.batch_alter_table("memories") as batch:
+        batch.alter_column(
+            "id", type_=sa.String(length=36), existing_type=sa.Uuid(),
+            existing_nullable=False,
+        )
+    op.execute(
+        "UPDATE memories SET id = substr(id, 1, 8) || '-' || substr(id, 9, 4) "
+        "|| '-' || substr(id, 13, 4) || '-' || substr(id, 17, 4) || '-' "
+        "|| substr(id, 21)"
+    )
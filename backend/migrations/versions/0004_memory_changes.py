@@ -0,0 +1,54 @@
+"""Add tombstones and an updated_at index for delta sync.
+
+``GET /memories/changes`` walks memories by (updated_at, id) and deleted
+memories by (deleted_at, memory_id); both get a matching index.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "memory_tombstones",
+        sa.Column("memory_id", sa.Uuid(), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("memory_id"),
+    )
+    op.create_index(
+        "ix_memory_tombstones_deleted_at_id",
+        "memory_tombstones",
+        ["deleted_at", "memory_id"],
+    )
+
+    if op.get_bind().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.create_index(
+                "ix_memories_updated_at_id",
+                "memories",
+                ["updated_at", "id"],
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        return
+    op.create_index("ix_memories_updated_at_id", "memories", ["updated_at", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_memories_updated_at_id", table_name="memories")
+    op.drop_index(
+        "ix_memory_tombstones_deleted_at_id", table_name="memory_tombstones"
+    )
+    op.drop_table("memory_tombstones")
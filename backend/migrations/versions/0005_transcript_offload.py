@@ -0,0 +1,161 @@
+"""Move transcripts to a compressed side table.
+
+Transcripts are the largest column of ``memories`` but only the detail
+views read them. They move, gzip-compressed, to ``memory_transcripts``
+(one row per memory, deleted with it) so list scans and row fetches stay
+small.
+
+The generated search_vector column referenced the transcript, so it
+becomes a plain column that MemoryRepository writes; it is filled here
+from the existing data before the transcript column is dropped. On
+SQLite (tests) it holds the plain searchable text.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-19 00:00:00
+
+"""
+import gzip
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 500
+
+SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(summary, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(key_points::text, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(transcript, '')), 'D')"
+)
+
+memories = sa.table(
+    "memories",
+    sa.column("id", sa.Uuid()),
+    sa.column("transcript", sa.Text()),
+)
+memory_transcripts = sa.table(
+    "memory_transcripts",
+    sa.column("memory_id", sa.Uuid()),
+    sa.column("encoding", sa.String()),
+    sa.column("content", sa.LargeBinary()),
+    sa.column("size_bytes", sa.Integer()),
+)
+
+
+def _copy_transcripts_out() -> None:
+    """Compress every inline transcript into memory_transcripts, by id batches."""
+    bind = op.get_bind()
+    last_id = None
+    while True:
+        stmt = (
+            sa.select(memories.c.id, memories.c.transcript)
+            .where(memories.c.transcript.isnot(None))
+            .order_by(memories.c.id)
+            .limit(BATCH_SIZE)
+        )
+        if last_id is not None:
+            stmt = stmt.where(memories.c.id > last_id)
+        rows = bind.execute(stmt).all()
+        if not rows:
+            return
+        bind.execute(
+            memory_transcripts.insert(),
+            [
+                {
+                    "memory_id": memory_id,
+                    "encoding": "gzip",
+                    "content": gzip.compress(text.encode("utf-8"), mtime=0),
+                    "size_bytes": len(text.encode("utf-8")),
+                }
+                for memory_id, text in rows
+            ],
+        )
+        last_id = rows[-1].id
+
+
+def _copy_transcripts_back() -> None:
+    """Decompress memory_transcripts into the inline transcript column."""
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.select(
+            memory_transcripts.c.memory_id,
+            memory_transcripts.c.encoding,
+            memory_transcripts.c.content,
+        )
+    )
+    for memory_id, encoding, content in rows.all():
+        if encoding == "zstd":
+            import zstandard
+
+            raw = zstandard.ZstdDecompressor().decompress(content)
+        else:
+            raw = gzip.decompress(content)
+        bind.execute(
+            memories.update()
+            .where(memories.c.id == memory_id)
+            .values(transcript=raw.decode("utf-8"))
+        )
+
+
+def upgrade() -> None:
+    op.create_table(
+        "memory_transcripts",
+        sa.Column("memory_id", sa.Uuid(), nullable=False),
+        sa.Column("encoding", sa.String(length=10), nullable=False),
+        sa.Column("content", sa.LargeBinary(), nullable=False),
+        sa.Column("size_bytes", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["memory_id"], ["memories.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("memory_id"),
+    )
+    _copy_transcripts_out()
+
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("DROP INDEX ix_memories_search_vector")
+        op.execute("ALTER TABLE memories DROP COLUMN search_vector")
+        op.add_column(
+            "memories", sa.Column("search_vector", postgresql.TSVECTOR(), nullable=True)
+        )
+        op.execute(f"UPDATE memories SET search_vector = {SEARCH_VECTOR_EXPRESSION}")
+        op.execute(
+            "CREATE INDEX ix_memories_search_vector ON memories USING GIN (search_vector)"
+        )
+        op.drop_column("memories", "transcript")
+        return
+
+    op.add_column("memories", sa.Column("search_vector", sa.Text(), nullable=True))
+    op.execute(
+        "UPDATE memories SET search_vector = coalesce(title, '') || char(10) || "
+        "coalesce(summary, '') || char(10) || coalesce(key_points, '') || "
+        "char(10) || coalesce(transcript, '')"
+    )
+    with op.batch_alter_table("memories") as batch:
+        batch.drop_column("transcript")
+
+
+def downgrade() -> None:
+    op.add_column("memories", sa.Column("transcript", sa.Text(), nullable=True))
+    _copy_transcripts_back()
+
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("DROP INDEX ix_memories_search_vector")
+        op.drop_column("memories", "search_vector")
+        op.execute(
+            "ALTER TABLE memories ADD COLUMN search_vector tsvector "
+            f"GENERATED ALWAYS AS ({SEARCH_VECTOR_EXPRESSION}) STORED"
+        )
+        op.execute(
+            "CREATE INDEX ix_memories_search_vector ON memories USING GIN (search_vector)"
+        )
+    else:
+        with op.batch_alter_table("memories") as batch:
+            batch.drop_column("search_vector")
+    op.drop_table("memory_transcripts")
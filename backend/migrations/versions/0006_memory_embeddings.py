@@ -0,0 +1,45 @@
+"""Add memory embeddings for semantic search.
+
+One float32 vector per memory, written by the processing worker. The
+API's vector index syncs new vectors by (updated_at, memory_id).
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-19 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "memory_embeddings",
+        sa.Column("memory_id", sa.Uuid(), nullable=False),
+        sa.Column("model", sa.String(length=100), nullable=False),
+        sa.Column("dimensions", sa.Integer(), nullable=False),
+        sa.Column("vector", sa.LargeBinary(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["memory_id"], ["memories.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("memory_id"),
+    )
+    op.create_index(
+        "ix_memory_embeddings_updated_at_id",
+        "memory_embeddings",
+        ["updated_at", "memory_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_memory_embeddings_updated_at_id", table_name="memory_embeddings"
+    )
+    op.drop_table("memory_embeddings")
@@ -0,0 +1,45 @@
+"""Add the memory_daily_stats materialized view (Postgres only).
+
+Counts and durations per (creation day, status) for GET /memories/stats.
+The API refreshes it concurrently on a schedule; the unique index on
+(day, status) is required for REFRESH MATERIALIZED VIEW CONCURRENTLY.
+SQLite has no materialized views and aggregates memories directly.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-19 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0007"
+down_revision: Union[str, None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute(
+        "CREATE MATERIALIZED VIEW memory_daily_stats AS "
+        "SELECT date(created_at) AS day, status, "
+        "count(*) AS memory_count, "
+        "sum(duration) AS duration_total, "
+        "count(duration) AS duration_count, "
+        "(now() AT TIME ZONE 'UTC') AS refreshed_at "
+        "FROM memories GROUP BY 1, 2"
+    )
+    op.execute(
+        "CREATE UNIQUE INDEX ix_memory_daily_stats_day_status "
+        "ON memory_daily_stats (day, status)"
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS memory_daily_stats")
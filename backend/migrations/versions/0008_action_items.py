@@ -0,0 +1,114 @@
+"""Add the action_items table and backfill it from memories.action_items.
+
+Each entry of a memory's action_items JSON list becomes a row with its
+own open/done status, so action items can be listed and filtered without
+loading memories. Backfilled items are "open" and dated by the memory's
+updated_at (when its processing results were written).
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-19 00:00:00
+
+"""
+import json
+import uuid
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0008"
+down_revision: Union[str, None] = "0007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 500
+
+memories = sa.table(
+    "memories",
+    sa.column("id", sa.Uuid()),
+    sa.column("action_items", sa.JSON()),
+    sa.column("updated_at", sa.DateTime()),
+)
+action_items = sa.table(
+    "action_items",
+    sa.column("id", sa.Uuid()),
+    sa.column("memory_id", sa.Uuid()),
+    sa.column("position", sa.Integer()),
+    sa.column("text", sa.Text()),
+    sa.column("status", sa.String()),
+    sa.column("created_at", sa.DateTime()),
+    sa.column("updated_at", sa.DateTime()),
+)
+
+
+def _backfill() -> None:
+    """Copy every memory's action_items list into rows, by id batches."""
+    bind = op.get_bind()
+    last_id = None
+    while True:
+        stmt = (
+            sa.select(memories.c.id, memories.c.action_items, memories.c.updated_at)
+            .where(memories.c.action_items.isnot(None))
+            .order_by(memories.c.id)
+            .limit(BATCH_SIZE)
+        )
+        if last_id is not None:
+            stmt = stmt.where(memories.c.id > last_id)
+        rows = bind.execute(stmt).all()
+        if not rows:
+            return
+        items = []
+        for memory_id, texts, updated_at in rows:
+            if isinstance(texts, str):
+                texts = json.loads(texts)
+            items.extend(
+                {
+                    "id": uuid.uuid4(),
+                    "memory_id": memory_id,
+                    "position": position,
+                    "text": str(text),
+                    "status": "open",
+                    "created_at": updated_at,
+                    "updated_at": updated_at,
+                }
+                for position, text in enumerate(texts or [])
+            )
+        if items:
+            bind.execute(action_items.insert(), items)
+        last_id = rows[-1].id
+
+
+def upgrade() -> None:
+    op.create_table(
+        "action_items",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("memory_id", sa.Uuid(), nullable=False),
+        sa.Column("position", sa.Integer(), nullable=False),
+        sa.Column("text", sa.Text(), nullable=False),
+        sa.Column("status", sa.String(length=10), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["memory_id"], ["memories.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_action_items_created_at_id",
+        "action_items",
+        [sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+    op.create_index(
+        "ix_action_items_status_created_at_id",
+        "action_items",
+        ["status", sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+    op.create_index("ix_action_items_memory_id", "action_items", ["memory_id"])
+    _backfill()
+
+
+def downgrade() -> None:
+    op.drop_index("ix_action_items_memory_id", table_name="action_items")
+    op.drop_index("ix_action_items_status_created_at_id", table_name="action_items")
+    op.drop_index("ix_action_items_created_at_id", table_name="action_items")
+    op.drop_table("action_items")
@@ -0,0 +1,48 @@
+"""Add content hashes to memories for upload deduplication.
+
+Existing memories get no hash, so only audio uploaded from now on is
+deduplicated.
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-19 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0010"
+down_revision: Union[str, None] = "0009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("memories", sa.Column("content_hash", sa.String(length=64), nullable=True))
+    op.add_column("memories", sa.Column("duplicate_of", sa.Uuid(), nullable=True))
+    op.create_index(
+        "ux_memories_content_hash",
+        "memories",
+        ["content_hash"],
+        unique=True,
+        postgresql_where=sa.text("duplicate_of IS NULL"),
+        sqlite_where=sa.text("duplicate_of IS NULL"),
+    )
+    op.create_index(
+        "ix_memories_duplicate_of",
+        "memories",
+        ["duplicate_of"],
+        postgresql_where=sa.text("duplicate_of IS NOT NULL"),
+        sqlite_where=sa.text("duplicate_of IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_memories_duplicate_of", table_name="memories")
+    op.drop_index("ux_memories_content_hash", table_name="memories")
+    with op.batch_alter_table("memories") as batch:
+        batch.drop_column("duplicate_of")
+        batch.drop_column("content_hash")
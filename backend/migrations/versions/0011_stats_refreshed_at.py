@@ -0,0 +1,64 @@
+"""Record stats refresh times outside the materialized view.
+
+memory_daily_stats carried ``refreshed_at`` on every row, so each
+REFRESH ... CONCURRENTLY saw every row change and rewrote all of them.
+The view is recreated without it, and refresh times move to the
+one-row-per-view materialized_view_refreshes table.
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-19 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0011"
+down_revision: Union[str, None] = "0010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+VIEW_COLUMNS = (
+    "SELECT date(created_at) AS day, status, "
+    "count(*) AS memory_count, "
+    "sum(duration) AS duration_total, "
+    "count(duration) AS duration_count"
+)
+
+
+def _create_view(extra_columns: str = "") -> None:
+    op.execute("DROP MATERIALIZED VIEW memory_daily_stats")
+    op.execute(
+        f"CREATE MATERIALIZED VIEW memory_daily_stats AS {VIEW_COLUMNS}{extra_columns} "
+        "FROM memories GROUP BY 1, 2"
+    )
+    op.execute(
+        "CREATE UNIQUE INDEX ix_memory_daily_stats_day_status "
+        "ON memory_daily_stats (day, status)"
+    )
+
+
+def upgrade() -> None:
+    op.create_table(
+        "materialized_view_refreshes",
+        sa.Column("view_name", sa.String(length=63), nullable=False),
+        sa.Column("refreshed_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("view_name"),
+    )
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    _create_view()
+    # CREATE MATERIALIZED VIEW populated it just now
+    op.execute(
+        "INSERT INTO materialized_view_refreshes (view_name, refreshed_at) "
+        "VALUES ('memory_daily_stats', now() AT TIME ZONE 'UTC')"
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        _create_view(", (now() AT TIME ZONE 'UTC') AS refreshed_at")
+    op.drop_table("materialized_view_refreshes")
@@ -0,0 +1,97 @@
+"""Benchmark the semantic search vector index.
+
+Builds an index of random unit vectors, saves it, memory-maps it back and
+times top-k queries against the loaded base, then again with an
+in-memory append segment of recent upserts.
+
+Usage (from backend/):
+    python scripts/benchmark_vector_index.py [--rows 100000 250000] [--dimensions 512]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+from uuid import uuid4
+
+import numpy as np
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from app.utils.vector_index import VectorIndex  # noqa: E402
+
+# Rows generated per batch, to bound memory while building
+_BUILD_BATCH = 50_000
+
+
+def _unit_vectors(rng: np.random.Generator, rows: int, dimensions: int) -> np.ndarray:
+    vectors = rng.standard_normal((rows, dimensions), dtype=np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors
+
+
+def _time_queries(index: VectorIndex, queries: np.ndarray, k: int) -> float:
+    """Return the median query latency in milliseconds."""
+    index.search(queries[0], k)  # warm the page cache
+    latencies = []
+    for query in queries:
+        start = time.perf_counter()
+        index.search(query, k)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return float(np.median(latencies))
+
+
+def run(rows: int, dimensions: int, k: int, queries: int, appended: int) -> None:
+    rng = np.random.default_rng(0)
+    index = VectorIndex(dimensions)
+    start = time.perf_counter()
+    for offset in range(0, rows, _BUILD_BATCH):
+        count = min(_BUILD_BATCH, rows - offset)
+        index.upsert([uuid4() for _ in range(count)], _unit_vectors(rng, count, dimensions))
+    build_seconds = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as directory:
+        start = time.perf_counter()
+        index.save(directory)
+        save_seconds = time.perf_counter() - start
+        del index
+
+        start = time.perf_counter()
+        loaded, _ = VectorIndex.load(directory, dimensions)
+        load_seconds = time.perf_counter() - start
+
+        query_vectors = _unit_vectors(rng, queries, dimensions)
+        base_ms = _time_queries(loaded, query_vectors, k)
+        loaded.upsert(
+            [uuid4() for _ in range(appended)], _unit_vectors(rng, appended, dimensions)
+        )
+        mixed_ms = _time_queries(loaded, query_vectors, k)
+
+    size_mb = rows * dimensions * 4 / 2**20
+    print(
+        f"{rows:>9,} x {dimensions} ({size_mb:,.0f} MB): "
+        f"build {build_seconds:.2f}s, save {save_seconds:.2f}s, "
+        f"load {load_seconds * 1000:.0f} ms, "
+        f"top-{k} p50 {base_ms:.1f} ms "
+        f"({mixed_ms:.1f} ms with {appended:,} appended)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000, 250_000])
+    parser.add_argument("--dimensions", type=int, default=512)
+    parser.add_argument("--k", type=int, default=20)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--appended", type=int, default=5_000)
+    args = parser.parse_args()
+    for rows in args.rows:
+        run(rows, args.dimensions, args.k, args.queries, args.appended)
+
+
+if __name__ == "__main__":
+    main()
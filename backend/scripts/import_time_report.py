@@ -0,0 +1,75 @@
+"""Import-time report for the Lambda worker entry point.
+
+Runs a fresh interpreter with ``-X importtime`` for two stages and prints
+the import cost (self time of every module) grouped by top-level package:
+
+    entry     importing app.workers.sqs_handler (Lambda init phase)
+    pipeline  resolving the handler's lazy pipeline imports (first invocation)
+
+Usage (from backend/):
+    python scripts/import_time_report.py [--top N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+STAGES = {
+    "entry": "import app.workers.sqs_handler",
+    "pipeline": (
+        "import app.workers.sqs_handler as h\n"
+        "for name in h._LAZY_IMPORTS: getattr(h, name)"
+    ),
+}
+
+
+def measure(code: str) -> Tuple[Dict[str, int], int]:
+    """Run ``code`` under -X importtime.
+
+    Returns:
+        Tuple of (self-time microseconds per top-level package, module count).
+    """
+    probe = code + "\nimport sys; print(len(sys.modules))"
+    env = {**os.environ, "PYTHONDONTWRITEBYTECODE": "1"}
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", probe],
+        cwd=BACKEND_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    per_package: Dict[str, int] = defaultdict(int)
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        per_package[name.strip().split(".")[0]] += int(self_us)
+    return dict(per_package), int(proc.stdout.strip().splitlines()[-1])
+
+
+def main(argv: List[str]) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--top", type=int, default=15, help="packages to list per stage")
+    args = parser.parse_args(argv)
+
+    for stage, code in STAGES.items():
+        per_package, module_count = measure(code)
+        total_ms = sum(per_package.values()) / 1000
+        print(f"== {stage}: {total_ms:.1f} ms, {module_count} modules")
+        ranked = sorted(per_package.items(), key=lambda kv: kv[1], reverse=True)
+        for package, micros in ranked[: args.top]:
+            print(f"   {micros / 1000:8.1f} ms  {package}")
+        print()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
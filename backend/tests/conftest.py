@@ -80,6 +80,7 @@ def mock_s3_client() -> AsyncMock:
     client.upload_file.return_value = "s3://test-bucket/audio/test.webm"
     client.get_file.return_value = b"fake-audio-bytes"
     client.generate_presigned_url.return_value = "https://test-bucket.s3.amazonaws.com/audio/test.webm?signed"
+    client.delete_objects.return_value = []
     return client
 
 
@@ -88,6 +89,7 @@ def mock_sqs_client() -> AsyncMock:
     """Mocked SQSClient."""
     client = AsyncMock(spec=SQSClient)
     client.send_message.return_value = "msg-id-123"
+    client.send_message_batch.return_value = []
     return client
 
 
@@ -3,6 +3,8 @@
 import pytest
 from httpx import AsyncClient
 
+from app.repositories.memory_repository import MemoryRepository
+
 
 class TestHealthEndpoint:
     @pytest.mark.asyncio
@@ -40,6 +42,23 @@ class TestUploadEndpoint:
         assert data["message"] == "Audio uploaded and processing enqueued"
 
 
+class TestBulkUploadEndpoint:
+    @pytest.mark.asyncio
+    async def test_bulk_upload_returns_per_file_results(self, async_client: AsyncClient):
+        response = await async_client.post(
+            "/upload/bulk",
+            files=[
+                ("files", ("a.webm", b"audio", "audio/webm")),
+                ("files", ("notes.txt", b"text", "text/plain")),
+            ],
+        )
+        assert response.status_code == 201
+        data = response.json()
+        assert (data["succeeded"], data["failed"]) == (1, 1)
+        assert data["items"][0]["status"] == "processing"
+        assert data["items"][1]["memory_id"] is None
+
+
 class TestMemoriesEndpoint:
     @pytest.mark.asyncio
     async def test_list_empty(self, async_client: AsyncClient):
@@ -60,6 +79,24 @@ class TestMemoriesEndpoint:
         assert response.status_code == 200
         data = response.json()
         assert data["total"] == 1
+        assert "transcript" not in data["items"][0]
+
+    @pytest.mark.asyncio
+    async def test_list_include_heavy_fields(self, async_client: AsyncClient):
+        await async_client.post(
+            "/upload",
+            files={"file": ("test.webm", b"audio", "audio/webm")},
+        )
+        response = await async_client.get("/memories", params={"include": "transcript"})
+        assert response.status_code == 200
+        item = response.json()["items"][0]
+        assert "transcript" in item
+        assert "key_points" not in item
+
+    @pytest.mark.asyncio
+    async def test_list_unknown_include_returns_400(self, async_client: AsyncClient):
+        response = await async_client.get("/memories", params={"include": "everything"})
+        assert response.status_code == 400
 
     @pytest.mark.asyncio
     async def test_get_memory_by_id(self, async_client: AsyncClient):
@@ -74,6 +111,76 @@ class TestMemoriesEndpoint:
         assert response.status_code == 200
         assert response.json()["id"] == memory_id
 
+    @pytest.mark.asyncio
+    async def test_changes_feed(self, async_client: AsyncClient):
+        upload_resp = await async_client.post(
+            "/upload",
+            files={"file": ("test.webm", b"audio", "audio/webm")},
+        )
+        memory_id = upload_resp.json()["memory_id"]
+
+        first = (await async_client.get("/memories/changes")).json()
+        assert [item["id"] for item in first["items"]] == [memory_id]
+        assert "transcript" not in first["items"][0]
+
+        await async_client.delete(f"/memories/{memory_id}")
+        response = await async_client.get(
+            "/memories/changes", params={"since": first["next_cursor"]},
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["items"] == []
+        assert data["deleted"] == [memory_id]
+        assert data["has_more"] is False
+
+    @pytest.mark.asyncio
+    async def test_changes_invalid_since_returns_400(self, async_client: AsyncClient):
+        response = await async_client.get("/memories/changes", params={"since": "garbage"})
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_bulk_delete(self, async_client: AsyncClient):
+        upload_resp = await async_client.post(
+            "/upload",
+            files={"file": ("test.webm", b"audio", "audio/webm")},
+        )
+        memory_id = upload_resp.json()["memory_id"]
+
+        response = await async_client.post("/memories/bulk-delete", json={"ids": [memory_id]})
+        assert response.status_code == 200
+        assert response.json() == {"processed": 1, "succeeded": 1, "failed": [], "has_more": False}
+        assert (await async_client.get(f"/memories/{memory_id}")).status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_bulk_delete_requires_a_filter(self, async_client: AsyncClient):
+        response = await async_client.post("/memories/bulk-delete", json={})
+        assert response.status_code == 422
+
+    @pytest.mark.asyncio
+    async def test_batch_get_memories(self, async_client: AsyncClient):
+        ids = []
+        for _ in range(2):
+            upload_resp = await async_client.post(
+                "/upload",
+                files={"file": ("test.webm", b"audio", "audio/webm")},
+            )
+            ids.append(upload_resp.json()["memory_id"])
+        missing = "00000000-0000-0000-0000-000000000000"
+
+        response = await async_client.post(
+            "/memories/batch-get", json={"ids": [ids[1], missing, ids[0]]},
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["id"] for item in data["items"]] == [ids[1], ids[0]]
+        assert data["missing"] == [missing]
+
+    @pytest.mark.asyncio
+    async def test_batch_get_rejects_too_many_ids(self, async_client: AsyncClient):
+        ids = [f"00000000-0000-0000-0000-{i:012d}" for i in range(101)]
+        response = await async_client.post("/memories/batch-get", json={"ids": ids})
+        assert response.status_code == 422
+
     @pytest.mark.asyncio
     async def test_list_with_search_param(self, async_client: AsyncClient):
         response = await async_client.get("/memories", params={"search": "test"})
@@ -81,6 +188,40 @@ class TestMemoriesEndpoint:
         data = response.json()
         assert "items" in data
 
+    @pytest.mark.asyncio
+    async def test_search_endpoint(self, async_client: AsyncClient):
+        response = await async_client.get("/memories/search", params={"q": "planning"})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["query"] == "planning"
+        assert data["items"] == []
+
+    @pytest.mark.asyncio
+    async def test_search_requires_query(self, async_client: AsyncClient):
+        response = await async_client.get("/memories/search")
+        assert response.status_code == 422
+
+    @pytest.mark.asyncio
+    async def test_stats_endpoint(self, async_client: AsyncClient):
+        await async_client.post(
+            "/upload", files={"file": ("test.webm", b"audio", "audio/webm")}
+        )
+        response = await async_client.get(
+            "/memories/stats", params={"date_from": "2000-01-01"}
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 1
+        assert data["date_from"] == "2000-01-01"
+        assert len(data["daily"]) == 1
+
+    @pytest.mark.asyncio
+    async def test_semantic_search_disabled_returns_503(self, async_client: AsyncClient):
+        response = await async_client.get(
+            "/memories/search/semantic", params={"q": "planning"}
+        )
+        assert response.status_code == 503
+
     @pytest.mark.asyncio
     async def test_list_with_status_filter(self, async_client: AsyncClient):
         response = await async_client.get("/memories", params={"status": "ready"})
@@ -88,12 +229,117 @@ class TestMemoriesEndpoint:
         data = response.json()
         assert data["total"] == 0
 
+    @pytest.mark.asyncio
+    async def test_list_with_cursor(self, async_client: AsyncClient):
+        for _ in range(3):
+            await async_client.post(
+                "/upload",
+                files={"file": ("test.webm", b"audio", "audio/webm")},
+            )
+        first = (await async_client.get("/memories", params={"page_size": 2})).json()
+        assert first["next_cursor"]
+
+        response = await async_client.get(
+            "/memories", params={"page_size": 2, "cursor": first["next_cursor"]},
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["items"]) == 1
+        assert data["total"] is None
+        assert data["next_cursor"] is None
+
+    @pytest.mark.asyncio
+    async def test_list_with_invalid_cursor_returns_400(self, async_client: AsyncClient):
+        response = await async_client.get("/memories", params={"cursor": "garbage"})
+        assert response.status_code == 400
+
     @pytest.mark.asyncio
     async def test_get_nonexistent_memory_returns_404(self, async_client: AsyncClient):
         response = await async_client.get("/memories/00000000-0000-0000-0000-000000000000")
         assert response.status_code == 404
 
 
+class TestConditionalGet:
+    @pytest.mark.asyncio
+    async def test_memory_etag_and_304(self, async_client: AsyncClient):
+        upload = await async_client.post(
+            "/upload", files={"file": ("test.webm", b"audio", "audio/webm")}
+        )
+        url = f"/memories/{upload.json()['memory_id']}"
+
+        first = await async_client.get(url)
+        etag = first.headers["etag"]
+        assert first.headers["cache-control"] == "private, no-cache"
+
+        second = await async_client.get(url, headers={"If-None-Match": etag})
+        assert second.status_code == 304
+        assert second.content == b""
+        assert second.headers["etag"] == etag
+
+        stale = await async_client.get(url, headers={"If-None-Match": '"stale"'})
+        assert stale.status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_list_etag_changes_with_content(self, async_client: AsyncClient):
+        first = await async_client.get("/memories", params={"status": "processing"})
+        etag = first.headers["etag"]
+        unchanged = await async_client.get(
+            "/memories", params={"status": "processing"}, headers={"If-None-Match": etag}
+        )
+        assert unchanged.status_code == 304
+
+        await async_client.post(
+            "/upload", files={"file": ("test.webm", b"audio", "audio/webm")}
+        )
+        changed = await async_client.get(
+            "/memories", params={"status": "processing"}, headers={"If-None-Match": etag}
+        )
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != etag
+
+
+class TestActionItemsEndpoint:
+    @pytest.mark.asyncio
+    async def test_list_filter_and_mark_done(
+        self, async_client: AsyncClient, db_session
+    ):
+        repository = MemoryRepository(db_session)
+        memory = await repository.create(audio_url="s3://bucket/a.webm")
+        await repository.update_processing_results(
+            memory.id, action_items=["Send notes", "Book room"]
+        )
+
+        response = await async_client.get("/action-items", params={"status": "open"})
+        assert response.status_code == 200
+        items = response.json()["items"]
+        assert {item["text"] for item in items} == {"Send notes", "Book room"}
+
+        response = await async_client.patch(
+            f"/action-items/{items[0]['id']}", json={"status": "done"}
+        )
+        assert response.status_code == 200
+        assert response.json()["status"] == "done"
+
+        response = await async_client.get("/action-items", params={"status": "open"})
+        assert len(response.json()["items"]) == 1
+
+    @pytest.mark.asyncio
+    async def test_invalid_status_and_cursor(self, async_client: AsyncClient):
+        assert (
+            await async_client.get("/action-items", params={"status": "later"})
+        ).status_code == 422
+        assert (
+            await async_client.get("/action-items", params={"cursor": "garbage"})
+        ).status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_patch_unknown_item_returns_404(self, async_client: AsyncClient):
+        response = await async_client.patch(
+            "/action-items/00000000-0000-0000-0000-000000000000", json={"status": "done"}
+        )
+        assert response.status_code == 404
+
+
 class TestProcessEndpoint:
     @pytest.mark.asyncio
     async def test_trigger_nonexistent_returns_404(self, async_client: AsyncClient):
@@ -111,3 +357,17 @@ class TestProcessEndpoint:
         response = await async_client.post(f"/process/{memory_id}")
         assert response.status_code == 200
         assert response.json()["status"] == "processing"
+
+    @pytest.mark.asyncio
+    async def test_bulk_trigger_failed_memories(self, async_client: AsyncClient, mock_sqs_client):
+        response = await async_client.post(
+            "/process/bulk",
+            json={"status": "failed", "created_from": "2026-01-01T00:00:00Z"},
+        )
+        assert response.status_code == 200
+        assert response.json()["processed"] == 0
+
+    @pytest.mark.asyncio
+    async def test_bulk_trigger_rejects_ready_status(self, async_client: AsyncClient):
+        response = await async_client.post("/process/bulk", json={"status": "ready"})
+        assert response.status_code == 400
@@ -0,0 +1,23 @@
+"""Tests for app.utils.compression."""
+
+import pytest
+
+from app.utils import compression
+from app.utils.compression import compress_text, decompress_text
+
+
+class TestCompression:
+    def test_gzip_round_trip(self):
+        encoding, data = compress_text("héllo " * 100)
+        assert encoding == "gzip"
+        assert decompress_text(encoding, data) == "héllo " * 100
+
+    def test_zstd_falls_back_to_gzip_without_zstandard(self, monkeypatch):
+        monkeypatch.setattr(compression, "zstandard", None)
+        encoding, data = compress_text("text", "zstd")
+        assert encoding == "gzip"
+        assert decompress_text(encoding, data) == "text"
+
+    def test_unknown_encoding_rejected(self):
+        with pytest.raises(ValueError):
+            compress_text("text", "brotli")
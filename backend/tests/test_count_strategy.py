@@ -0,0 +1,133 @@
+"""Tests for the list-total count strategy."""
+
+from typing import Dict, List, Optional
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.clients.redis_client import close_shared_redis_client
+from app.dependencies import get_count_strategy, get_redis_client
+from app.repositories.memory_repository import MemoryRepository
+from app.services.count_strategy import MemoryCountStrategy
+
+
+class FakeRedis:
+    """In-memory stand-in for the RedisClient cache methods."""
+
+    def __init__(self) -> None:
+        self.store: Dict[str, str] = {}
+
+    async def cache_get(self, key: str) -> Optional[str]:
+        return self.store.get(key)
+
+    async def cache_set(self, key: str, value: str, ttl_seconds: int) -> None:
+        self.store[key] = value
+
+    async def cache_delete(self, *keys: str) -> None:
+        for key in keys:
+            self.store.pop(key, None)
+
+    async def cache_incr(self, key: str) -> int:
+        value = int(self.store.get(key, "0")) + 1
+        self.store[key] = str(value)
+        return value
+
+    async def cache_get_many(self, *keys: str) -> List[Optional[str]]:
+        return [self.store.get(key) for key in keys]
+
+    async def cache_bump(self, keys: List[str], ttl_seconds: int) -> None:
+        for key in keys:
+            await self.cache_incr(key)
+
+
+@pytest.fixture
+def repository() -> AsyncMock:
+    repo = AsyncMock(spec=MemoryRepository)
+    repo.estimate_count.return_value = None
+    repo.count.return_value = 7
+    return repo
+
+
+class TestMemoryCountStrategy:
+    @pytest.mark.asyncio
+    async def test_exact_count_without_estimate(self, repository: AsyncMock):
+        result = await MemoryCountStrategy(repository).count(status="ready")
+        assert (result.total, result.exact) == (7, True)
+
+    @pytest.mark.asyncio
+    async def test_large_estimate_skips_exact_count(self, repository: AsyncMock):
+        repository.estimate_count.return_value = 250_000
+        strategy = MemoryCountStrategy(repository, exact_threshold=10_000)
+
+        result = await strategy.count()
+
+        assert (result.total, result.exact) == (250_000, False)
+        repository.count.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_small_estimate_falls_back_to_exact(self, repository: AsyncMock):
+        repository.estimate_count.return_value = 12
+        result = await MemoryCountStrategy(repository).count()
+        assert (result.total, result.exact) == (7, True)
+
+    @pytest.mark.asyncio
+    async def test_cached_per_filter(self, repository: AsyncMock):
+        strategy = MemoryCountStrategy(repository, FakeRedis())
+
+        await strategy.count(status="ready")
+        await strategy.count(status="ready")
+        await strategy.count(status="failed")
+
+        assert repository.count.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_drops_cached_counts(self, repository: AsyncMock):
+        strategy = MemoryCountStrategy(repository, FakeRedis())
+
+        await strategy.count(status="ready")
+        repository.count.return_value = 8
+        await strategy.invalidate()
+        result = await strategy.count(status="ready")
+
+        assert result.total == 8
+        assert repository.count.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_sqlite_has_no_estimate(self, memory_repository: MemoryRepository):
+        assert await memory_repository.estimate_count() is None
+
+
+class _FakeConnection:
+    """Stands in for a redis.asyncio.Redis connection pool."""
+
+    def __init__(self) -> None:
+        self.values: Dict[str, str] = {}
+
+    async def get(self, key: str) -> Optional[str]:
+        return self.values.get(key)
+
+    async def set(self, key: str, value: str, ex: int) -> None:
+        self.values[key] = value
+
+    async def close(self) -> None:
+        pass
+
+
+@pytest.mark.asyncio
+async def test_list_requests_share_one_connection_pool(
+    repository: AsyncMock, settings, monkeypatch
+):
+    pools = []
+
+    async def from_url(url: str, **kwargs) -> _FakeConnection:
+        pools.append(_FakeConnection())
+        return pools[-1]
+
+    monkeypatch.setattr("redis.asyncio.from_url", from_url)
+    for _ in range(3):  # one count strategy per list request
+        strategy = get_count_strategy(repository, get_redis_client(settings), settings)
+        await strategy.count(status="ready")
+    await close_shared_redis_client()
+
+    assert len(pools) == 1
+    repository.count.assert_awaited_once()
@@ -0,0 +1,47 @@
+"""Tests for ETag and Cache-Control helpers."""
+
+from datetime import datetime
+from uuid import UUID
+
+from app.utils.http_cache import (
+    READY_CACHE_CONTROL,
+    REVALIDATE_CACHE_CONTROL,
+    etag_matches,
+    list_etag,
+    memory_cache_control,
+    memory_etag,
+)
+
+MEMORY_ID = UUID("12345678-1234-5678-1234-567812345678")
+T1 = datetime(2026, 1, 1, 12, 0, 0)
+T2 = datetime(2026, 1, 1, 12, 0, 1)
+
+
+class TestEtags:
+    def test_memory_etag_is_quoted_and_versioned(self):
+        etag = memory_etag(MEMORY_ID, T1)
+        assert etag.startswith('"') and etag.endswith('"')
+        assert etag == memory_etag(MEMORY_ID, T1)
+        assert etag != memory_etag(MEMORY_ID, T2)
+
+    def test_list_etag_depends_on_filters_items_and_total(self):
+        base = list_etag({"status": "ready"}, [(MEMORY_ID, T1)], 1)
+        assert base == list_etag({"status": "ready", "search": None}, [(MEMORY_ID, T1)], 1)
+        assert base != list_etag({"status": "failed"}, [(MEMORY_ID, T1)], 1)
+        assert base != list_etag({"status": "ready"}, [(MEMORY_ID, T2)], 1)
+        assert base != list_etag({"status": "ready"}, [(MEMORY_ID, T1)], 2)
+        assert base != list_etag({"status": "ready"}, [], 1)
+
+
+class TestEtagMatches:
+    def test_matching(self):
+        etag = memory_etag(MEMORY_ID, T1)
+        assert etag_matches(etag, etag)
+        assert etag_matches(f'"other", W/{etag}', etag)
+        assert etag_matches("*", etag)
+        assert not etag_matches(None, etag)
+        assert not etag_matches('"other"', etag)
+
+    def test_cache_control_by_status(self):
+        assert memory_cache_control("ready") == READY_CACHE_CONTROL
+        assert memory_cache_control("processing") == REVALIDATE_CACHE_CONTROL
@@ -0,0 +1,102 @@
+"""Import-time budgets for the Lambda worker entry point.
+
+Each check runs in a fresh interpreter so modules already imported by the
+test session do not hide regressions. Run scripts/import_time_report.py
+for a per-package breakdown when a budget trips.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# Modules added / seconds spent importing app.workers.sqs_handler (init phase)
+ENTRY_MODULE_BUDGET = 100
+ENTRY_SECONDS_BUDGET = 0.5
+
+# Modules added by resolving the handler's lazy pipeline imports (first invoke)
+PIPELINE_MODULE_BUDGET = 1150
+
+HEAVY_PACKAGES = (
+    "aioboto3",
+    "asyncpg",
+    "botocore",
+    "fastapi",
+    "openai",
+    "pydantic",
+    "redis",
+    "sqlalchemy",
+)
+
+_PROBE = """
+import json, sys, time
+before = set(sys.modules)
+start = time.perf_counter()
+import app.workers.sqs_handler as handler
+entry_seconds = time.perf_counter() - start
+entry_modules = set(sys.modules) - before
+for name in handler._LAZY_IMPORTS:
+    getattr(handler, name)
+pipeline_modules = set(sys.modules) - before
+print(json.dumps({
+    "entry_seconds": entry_seconds,
+    "entry_modules": sorted(entry_modules),
+    "pipeline_modules": sorted(pipeline_modules),
+}))
+"""
+
+
+def _root_packages(modules):
+    return {name.split(".")[0] for name in modules}
+
+
+@pytest.fixture(scope="module")
+def probe() -> dict:
+    proc = subprocess.run(
+        [sys.executable, "-c", _PROBE],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(proc.stdout)
+
+
+class TestWorkerImportBudget:
+    def test_entry_point_imports_no_heavy_packages(self, probe: dict):
+        loaded = _root_packages(probe["entry_modules"]) & set(HEAVY_PACKAGES)
+        assert loaded == set()
+
+    def test_entry_point_module_count(self, probe: dict):
+        assert len(probe["entry_modules"]) <= ENTRY_MODULE_BUDGET
+
+    def test_entry_point_import_time(self, probe: dict):
+        assert probe["entry_seconds"] <= ENTRY_SECONDS_BUDGET
+
+    def test_pipeline_skips_fastapi_and_redis(self, probe: dict):
+        loaded = _root_packages(probe["pipeline_modules"])
+        assert "fastapi" not in loaded
+        assert "redis" not in loaded
+
+    def test_pipeline_module_count(self, probe: dict):
+        assert len(probe["pipeline_modules"]) <= PIPELINE_MODULE_BUDGET
+
+    def test_preinitialized_environments_load_the_pipeline_during_init(self):
+        proc = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, app.workers.sqs_handler; print('sqlalchemy' in sys.modules)",
+            ],
+            cwd=BACKEND_DIR,
+            env={**os.environ, "AWS_LAMBDA_INITIALIZATION_TYPE": "provisioned-concurrency"},
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert proc.stdout.strip() == "True"
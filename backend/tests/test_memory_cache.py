@@ -0,0 +1,171 @@
+"""Tests for the GET /memories/{id} read-through cache."""
+
+from typing import Dict, List
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from app.clients.redis_client import NullRedisClient, RedisClient, close_shared_redis_client
+from app.dependencies import get_redis_client
+from app.exceptions import ResourceNotFoundError
+from app.repositories.database import commit
+from app.repositories.memory_repository import MemoryRepository
+from app.services.memory_cache import MEMORY_CACHE_REQUESTS, MemoryCache, memory_cache_key
+from app.services.memory_service import MemoryService
+from app.services.processing_service import ProcessingService
+from tests.test_count_strategy import FakeRedis
+
+
+class RecordingRedis(FakeRedis):
+    """FakeRedis that also records TTLs and published events."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.ttls: Dict[str, int] = {}
+        self.events: List[str] = []
+
+    async def cache_set(self, key: str, value: str, ttl_seconds: int) -> None:
+        await super().cache_set(key, value, ttl_seconds)
+        self.ttls[key] = ttl_seconds
+
+    async def publish_memory_event(self, memory_id: str, status: str, updated_at: str) -> None:
+        self.events.append(status)
+
+
+@pytest.fixture
+def redis() -> RecordingRedis:
+    return RecordingRedis()
+
+
+@pytest.fixture
+def cached_service(
+    memory_repository: MemoryRepository, mock_s3_client, mock_sqs_client, redis
+) -> MemoryService:
+    cache = MemoryCache(redis, ready_ttl_seconds=600, pending_ttl_seconds=5)
+    return MemoryService(
+        memory_repository, mock_s3_client, mock_sqs_client, redis, memory_cache=cache
+    )
+
+
+def _lookups(result: str) -> float:
+    return MEMORY_CACHE_REQUESTS.value(result=result)
+
+
+class TestMemoryCache:
+    @pytest.mark.asyncio
+    async def test_second_read_is_a_hit(
+        self, cached_service: MemoryService, memory_repository: MemoryRepository, redis
+    ):
+        memory = await memory_repository.create(audio_url="s3://bucket/a.webm")
+        hits, misses = _lookups("hit"), _lookups("miss")
+        memory_repository.get_by_id = AsyncMock(wraps=memory_repository.get_by_id)
+
+        first = await cached_service.get_memory(memory.id)
+        second = await cached_service.get_memory(memory.id)
+
+        assert second == first
+        memory_repository.get_by_id.assert_awaited_once_with(
+            memory.id, with_transcript=True, primary=True
+        )
+        assert (_lookups("hit") - hits, _lookups("miss") - misses) == (1, 1)
+        assert redis.ttls[memory_cache_key(memory.id)] == 5
+
+    @pytest.mark.asyncio
+    async def test_ready_memories_get_the_long_ttl(
+        self, cached_service: MemoryService, memory_repository: MemoryRepository, redis
+    ):
+        memory = await memory_repository.create(audio_url="s3://bucket/a.webm")
+        await memory_repository.update_status(memory.id, "ready")
+
+        await cached_service.get_memory(memory.id)
+
+        assert redis.ttls[memory_cache_key(memory.id)] == 600
+
+    @pytest.mark.asyncio
+    async def test_missing_memory_is_not_cached(self, cached_service: MemoryService, redis):
+        with pytest.raises(ResourceNotFoundError):
+            await cached_service.get_memory(uuid4())
+        assert redis.store == {}
+
+    @pytest.mark.asyncio
+    async def test_status_events_and_deletes_invalidate_after_commit(
+        self,
+        db_session,
+        cached_service: MemoryService,
+        memory_repository: MemoryRepository,
+        mock_s3_client,
+        mock_openai_client,
+        redis,
+    ):
+        memory = await memory_repository.create(audio_url="s3://test-bucket/audio/a.webm")
+        key = memory_cache_key(memory.id)
+        await cached_service.get_memory(memory.id)
+        assert key in redis.store
+
+        mock_s3_client._settings = type("S", (), {"s3_bucket_name": "test-bucket"})()
+        processing = ProcessingService(
+            memory_repository, mock_s3_client, mock_openai_client, redis
+        )
+        await processing.process_memory(memory.id, memory.audio_url, "corr-1")
+        assert redis.events == [] and key in redis.store
+        await commit(db_session)
+        assert redis.events == ["processing", "ready"] and key not in redis.store
+
+        assert (await cached_service.get_memory(memory.id)).status == "ready"
+        await cached_service.delete_memory(memory.id)
+        assert key in redis.store
+        await commit(db_session)
+        assert key not in redis.store
+
+    @pytest.mark.asyncio
+    async def test_fill_racing_a_delete_is_not_served(
+        self,
+        db_session,
+        cached_service: MemoryService,
+        memory_repository: MemoryRepository,
+        redis,
+    ):
+        memory = await memory_repository.create(audio_url="s3://bucket/a.webm")
+        await memory_repository.update_status(memory.id, "ready")
+        read_row = memory_repository.get_by_id
+
+        async def read_then_delete(*args, **kwargs):
+            # The fill has read the row; the delete commits before it writes
+            row = await read_row(*args, **kwargs)
+            await cached_service.delete_memory(memory.id)
+            await commit(db_session)
+            return row
+
+        memory_repository.get_by_id = read_then_delete
+        assert (await cached_service.get_memory(memory.id)).status == "ready"
+        assert memory_cache_key(memory.id) in redis.store
+        memory_repository.get_by_id = read_row
+
+        with pytest.raises(ResourceNotFoundError):
+            await cached_service.get_memory(memory.id)
+
+    @pytest.mark.asyncio
+    async def test_null_redis_bypasses_cache(
+        self, memory_repository: MemoryRepository, mock_s3_client, mock_sqs_client
+    ):
+        service = MemoryService(
+            memory_repository, mock_s3_client, mock_sqs_client, NullRedisClient()
+        )
+        memory = await memory_repository.create(audio_url="s3://bucket/a.webm")
+        misses = _lookups("miss")
+
+        await service.get_memory(memory.id)
+        await service.get_memory(memory.id)
+
+        assert _lookups("miss") == misses
+
+
+@pytest.mark.asyncio
+async def test_requests_share_one_redis_client(settings):
+    first = get_redis_client(settings)
+
+    assert isinstance(first, RedisClient) and get_redis_client(settings) is first
+    await close_shared_redis_client()
+    assert get_redis_client(settings) is not first
+    await close_shared_redis_client()
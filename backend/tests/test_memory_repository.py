@@ -1,10 +1,30 @@
 """Tests for MemoryRepository against in-memory SQLite."""
 
 import pytest
-from uuid import UUID
+from datetime import date, datetime, timedelta
+from uuid import UUID, uuid4
 
-from app.exceptions import ResourceNotFoundError
-from app.repositories.memory_repository import MemoryRepository
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.exceptions import (
+    DuplicateContentError,
+    ResourceNotFoundError,
+    StatusConflictError,
+)
+from app.repositories.database import Base
+from app.repositories.memory_repository import (
+    HEAVY_FIELDS,
+    MemoryRepository,
+    _list_select,
+)
+from app.repositories.models import (
+    MemoryORM,
+    MemoryTombstoneORM,
+    MemoryTranscriptORM,
+    _utcnow,
+)
+from app.repositories.replica import ReplicaHealth
 
 
 class TestMemoryRepository:
@@ -15,10 +35,48 @@ class TestMemoryRepository:
         assert memory.audio_url == "s3://bucket/test.webm"
         assert memory.status == "uploading"
 
+    @pytest.mark.asyncio
+    async def test_create_many_inserts_in_one_statement(
+        self, memory_repository: MemoryRepository
+    ):
+        ids = [uuid4() for _ in range(3)]
+        changes = await memory_repository.create_many(
+            {memory_id: f"s3://bucket/{memory_id}.webm" for memory_id in ids},
+            status="processing",
+        )
+
+        assert [change.id for change in changes] == ids
+        assert {change.status for change in changes} == {"processing"}
+        stored = await memory_repository.get_many(ids)
+        assert [memory.audio_url for memory in stored] == [
+            f"s3://bucket/{memory_id}.webm" for memory_id in ids
+        ]
+        assert await memory_repository.create_many({}) == []
+
+    @pytest.mark.asyncio
+    async def test_content_hash_is_unique_among_originals(
+        self, memory_repository: MemoryRepository
+    ):
+        digest = "ab" * 32
+        original = await memory_repository.create(audio_url="s3://bucket/a.webm", content_hash=digest)
+
+        with pytest.raises(DuplicateContentError):
+            await memory_repository.create(audio_url="", content_hash=digest)
+        # The savepoint keeps the transaction usable, and duplicates may share the hash
+        await memory_repository.create_duplicate(uuid4(), original)
+        await memory_repository.create_duplicate(uuid4(), original)
+
+        found = await memory_repository.get_by_content_hash(digest)
+        assert found.id == original.id
+        assert len(await memory_repository.list_waiting_duplicates(original.id)) == 2
+        assert await memory_repository.audio_urls_in_use(
+            ["s3://bucket/a.webm", "s3://bucket/gone.webm"]
+        ) == ["s3://bucket/a.webm"]
+
     @pytest.mark.asyncio
     async def test_get_by_id_found(self, memory_repository: MemoryRepository):
         memory = await memory_repository.create(audio_url="s3://bucket/test.webm")
-        found = await memory_repository.get_by_id(UUID(memory.id))
+        found = await memory_repository.get_by_id(memory.id)
         assert found is not None
         assert found.id == memory.id
 
@@ -27,6 +85,105 @@ class TestMemoryRepository:
         result = await memory_repository.get_by_id(UUID("00000000-0000-0000-0000-000000000000"))
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_get_many_preserves_request_order(self, memory_repository: MemoryRepository):
+        first = await memory_repository.create(audio_url="s3://bucket/a.webm")
+        second = await memory_repository.create(audio_url="s3://bucket/b.webm")
+        missing = UUID("00000000-0000-0000-0000-000000000000")
+
+        found = await memory_repository.get_many([second.id, missing, first.id, second.id])
+        assert [m.id for m in found] == [second.id, first.id]
+
+    @pytest.mark.asyncio
+    async def test_list_changes_merges_updates_and_tombstones(self, memory_repository: MemoryRepository):
+        first = await memory_repository.create(audio_url="s3://bucket/a.webm")
+        second = await memory_repository.create(audio_url="s3://bucket/b.webm")
+        await memory_repository.delete(first.id)
+        await memory_repository.update_status(second.id, "ready")
+
+        changes, has_more = await memory_repository.list_changes()
+        assert [(c.id, c.deleted) for c in changes] == [(first.id, True), (second.id, False)]
+        assert has_more is False
+
+        changes, _ = await memory_repository.list_changes(since=changes[0].position)
+        assert [c.id for c in changes] == [second.id]
+
+    @pytest.mark.asyncio
+    async def test_list_changes_holds_back_unsettled_changes(
+        self, memory_repository: MemoryRepository, monkeypatch
+    ):
+        kept = await memory_repository.create(audio_url="s3://bucket/a.webm")
+        deleted = await memory_repository.create(audio_url="s3://bucket/b.webm")
+        await memory_repository.delete(deleted.id)
+
+        changes, _ = await memory_repository.list_changes(settle_seconds=30)
+        assert changes == []
+
+        later = _utcnow() + timedelta(seconds=31)
+        monkeypatch.setattr("app.repositories.memory_repository._utcnow", lambda: later)
+        changes, _ = await memory_repository.list_changes(settle_seconds=30)
+        assert {(c.id, c.deleted) for c in changes} == {(kept.id, False), (deleted.id, True)}
+
+    @pytest.mark.asyncio
+    async def test_list_changes_limit(self, memory_repository: MemoryRepository):
+        for i in range(3):
+            await memory_repository.create(audio_url=f"s3://bucket/{i}.webm")
+
+        changes, has_more = await memory_repository.list_changes(limit=2)
+        assert len(changes) == 2
+        assert has_more is True
+
+    @pytest.mark.asyncio
+    async def test_delete_matching_leaves_tombstones(self, memory_repository: MemoryRepository):
+        failed = [await memory_repository.create(audio_url=f"s3://bucket/{i}.webm") for i in range(3)]
+        kept = await memory_repository.create(audio_url="s3://bucket/kept.webm")
+        for memory in failed:
+            await memory_repository.update_status(memory.id, "failed")
+
+        deleted = await memory_repository.delete_matching(limit=2, statuses=["failed"])
+
+        assert deleted == [(m.id, m.audio_url) for m in failed[:2]]
+        assert await memory_repository.exists_matching(statuses=["failed"]) is True
+        changes, _ = await memory_repository.list_changes()
+        assert {c.id for c in changes if c.deleted} == {m.id for m in failed[:2]}
+        assert await memory_repository.get_by_id(kept.id) is not None
+
+    @pytest.mark.asyncio
+    async def test_prune_tombstones_keeps_recent_deletions(
+        self, memory_repository: MemoryRepository
+    ):
+        old = await memory_repository.create(audio_url="s3://bucket/old.webm")
+        recent = await memory_repository.create(audio_url="s3://bucket/recent.webm")
+        await memory_repository.delete(old.id)
+        await memory_repository.delete(recent.id)
+        await memory_repository._session.execute(
+            update(MemoryTombstoneORM)
+            .where(MemoryTombstoneORM.memory_id == old.id)
+            .values(deleted_at=_utcnow() - timedelta(days=31))
+        )
+
+        pruned = await memory_repository.prune_tombstones(_utcnow() - timedelta(days=30))
+
+        assert pruned == 1
+        changes, _ = await memory_repository.list_changes()
+        assert [(c.id, c.deleted) for c in changes] == [(recent.id, True)]
+
+    @pytest.mark.asyncio
+    async def test_transition_matching_is_compare_and_set(self, memory_repository: MemoryRepository):
+        failed = await memory_repository.create(audio_url="s3://bucket/a.webm")
+        ready = await memory_repository.create(audio_url="s3://bucket/b.webm")
+        await memory_repository.update_status(failed.id, "failed")
+        await memory_repository.update_status(ready.id, "ready")
+
+        moved = await memory_repository.transition_matching(
+            "processing", from_status="failed", limit=10, ids=[failed.id, ready.id],
+        )
+
+        assert [(change.id, change.status, url) for change, url in moved] == [
+            (failed.id, "processing", "s3://bucket/a.webm")
+        ]
+        assert (await memory_repository.get_by_id(ready.id)).status == "ready"
+
     @pytest.mark.asyncio
     async def test_list_all_empty(self, memory_repository: MemoryRepository):
         items, total = await memory_repository.list_all()
@@ -56,6 +213,71 @@ class TestMemoryRepository:
         items2, _ = await memory_repository.list_all(page=3, page_size=2)
         assert len(items2) == 1  # 5th item on page 3
 
+    @pytest.mark.asyncio
+    async def test_list_page_selects_light_columns_by_default(self, memory_repository: MemoryRepository, db_session):
+        memory = await memory_repository.create(audio_url="s3://bucket/a.webm", title="Sync")
+        await memory_repository.update_processing_results(
+            memory.id, transcript="Long transcript", key_points=["a"], status="ready",
+        )
+        await db_session.flush()
+
+        items, _ = await memory_repository.list_page()
+        assert items[0].title == "Sync"
+        assert "transcript" not in items[0]._fields
+
+        items, _ = await memory_repository.list_page(include=("key_points",))
+        assert items[0].key_points == ["a"]
+        assert "transcript" not in items[0]._fields
+
+        items, _ = await memory_repository.list_page(include=("transcript",))
+        assert items[0].transcript == "Long transcript"
+        # The transcript is attached after the query, not selected as a column
+        assert "NULL" not in str(_list_select(("transcript",)))
+        assert HEAVY_FIELDS == ("transcript", "key_points", "action_items")
+
+    @pytest.mark.asyncio
+    async def test_transcript_stored_compressed_and_loaded_on_request(self, memory_repository: MemoryRepository, db_session):
+        memory = await memory_repository.create(audio_url="s3://bucket/a.webm")
+        text = "word " * 2000
+        await memory_repository.update_processing_results(memory.id, transcript=text)
+        await memory_repository.update_processing_results(memory.id, transcript=text + "again")
+
+        stored = (await db_session.execute(select(MemoryTranscriptORM))).scalars().all()
+        assert len(stored) == 1
+        assert stored[0].encoding == "gzip"
+        assert len(stored[0].content) < len(text) // 10
+        assert stored[0].size_bytes == len(text) + len("again")
+
+        assert (await memory_repository.get_by_id(memory.id)).transcript is None
+        loaded = await memory_repository.get_by_id(memory.id, with_transcript=True)
+        assert loaded.transcript == text + "again"
+
+    @pytest.mark.asyncio
+    async def test_list_after_walks_all_pages(self, memory_repository: MemoryRepository, db_session):
+        for i in range(5):
+            await memory_repository.create(audio_url=f"s3://bucket/{i}.webm")
+        await db_session.flush()
+
+        seen, after, has_next = [], None, True
+        while has_next:
+            items, has_next = await memory_repository.list_after(after=after, page_size=2)
+            seen.extend(m.id for m in items)
+            after = (items[-1].created_at, items[-1].id)
+
+        expected, _ = await memory_repository.list_all(page_size=10)
+        assert seen == [m.id for m in expected]
+
+    @pytest.mark.asyncio
+    async def test_list_after_applies_filters(self, memory_repository: MemoryRepository, db_session):
+        m1 = await memory_repository.create(audio_url="s3://bucket/a.webm", title="Sprint Planning")
+        await memory_repository.create(audio_url="s3://bucket/b.webm", title="Daily Standup")
+        await db_session.flush()
+
+        items, has_next = await memory_repository.list_after(search="sprint")
+        assert [m.id for m in items] == [m1.id]
+        assert has_next is False
+        assert await memory_repository.count(search="sprint") == 1
+
     @pytest.mark.asyncio
     async def test_list_all_search_by_title(self, memory_repository: MemoryRepository, db_session):
         m1 = await memory_repository.create(audio_url="s3://bucket/a.webm", title="Sprint Planning")
@@ -72,22 +294,73 @@ class TestMemoryRepository:
         m2 = await memory_repository.create(audio_url="s3://bucket/b.webm")
         await db_session.flush()
         await memory_repository.update_processing_results(
-            UUID(m1.id), summary="Discussed budget allocation", status="ready",
+            m1.id, summary="Discussed budget allocation", status="ready",
         )
         await memory_repository.update_processing_results(
-            UUID(m2.id), summary="Team building activities", status="ready",
+            m2.id, summary="Team building activities", status="ready",
         )
         await db_session.flush()
 
         items, total = await memory_repository.list_all(search="budget")
         assert total == 1
 
+    @pytest.mark.asyncio
+    async def test_list_all_search_matches_transcript_and_key_points(self, memory_repository: MemoryRepository, db_session):
+        m1 = await memory_repository.create(audio_url="s3://bucket/a.webm")
+        m2 = await memory_repository.create(audio_url="s3://bucket/b.webm")
+        await db_session.flush()
+        await memory_repository.update_processing_results(
+            m1.id, transcript="We should migrate the database next week", status="ready",
+        )
+        await memory_repository.update_processing_results(
+            m2.id, key_points=["Hiring plan approved"], status="ready",
+        )
+        await db_session.flush()
+
+        items, total = await memory_repository.list_all(search="migrat")
+        assert total == 1
+        assert items[0].id == m1.id
+
+        items, total = await memory_repository.list_all(search="hiring approved")
+        assert total == 1
+        assert items[0].id == m2.id
+
+    @pytest.mark.asyncio
+    async def test_list_all_search_requires_every_term(self, memory_repository: MemoryRepository, db_session):
+        await memory_repository.create(audio_url="s3://bucket/a.webm", title="Sprint Planning")
+        await db_session.flush()
+
+        _, total = await memory_repository.list_all(search="sprint retro")
+        assert total == 0
+
+    @pytest.mark.asyncio
+    async def test_search_ranks_title_matches_first(self, memory_repository: MemoryRepository, db_session):
+        in_transcript = await memory_repository.create(audio_url="s3://bucket/a.webm", title="Weekly sync")
+        in_title = await memory_repository.create(audio_url="s3://bucket/b.webm", title="Budget review")
+        await memory_repository.create(audio_url="s3://bucket/c.webm", title="Unrelated")
+        await db_session.flush()
+        await memory_repository.update_processing_results(
+            in_transcript.id, transcript="Quick note about the budget.", status="ready",
+        )
+        await db_session.flush()
+
+        hits = await memory_repository.search("budget")
+
+        assert [m["id"] for m, _, _ in hits] == [in_title.id, in_transcript.id]
+        assert "transcript" not in hits[1][0]
+        assert hits[0][1] > hits[1][1]
+        assert hits[1][2] == "Quick note about the <mark>budget</mark>."
+
+    @pytest.mark.asyncio
+    async def test_search_blank_query_returns_nothing(self, memory_repository: MemoryRepository):
+        assert await memory_repository.search("  ?! ") == []
+
     @pytest.mark.asyncio
     async def test_list_all_filter_by_status(self, memory_repository: MemoryRepository, db_session):
         m1 = await memory_repository.create(audio_url="s3://bucket/a.webm")
         m2 = await memory_repository.create(audio_url="s3://bucket/b.webm")
         await db_session.flush()
-        await memory_repository.update_status(UUID(m1.id), "ready")
+        await memory_repository.update_status(m1.id, "ready")
         await db_session.flush()
 
         items, total = await memory_repository.list_all(status="ready")
@@ -99,7 +372,7 @@ class TestMemoryRepository:
         m1 = await memory_repository.create(audio_url="s3://bucket/a.webm", title="Sprint Planning")
         m2 = await memory_repository.create(audio_url="s3://bucket/b.webm", title="Sprint Review")
         await db_session.flush()
-        await memory_repository.update_status(UUID(m1.id), "ready")
+        await memory_repository.update_status(m1.id, "ready")
         await db_session.flush()
 
         # Both match "sprint" but only m1 has status "ready"
@@ -110,8 +383,25 @@ class TestMemoryRepository:
     @pytest.mark.asyncio
     async def test_update_status(self, memory_repository: MemoryRepository):
         memory = await memory_repository.create(audio_url="s3://bucket/test.webm")
-        updated = await memory_repository.update_status(UUID(memory.id), "processing")
-        assert updated.status == "processing"
+        change = await memory_repository.update_status(memory.id, "processing")
+        assert change.id == memory.id
+        assert change.status == "processing"
+        assert change.updated_at >= memory.created_at
+
+    @pytest.mark.asyncio
+    async def test_update_status_compare_and_set(self, memory_repository: MemoryRepository):
+        memory = await memory_repository.create(audio_url="")
+        change = await memory_repository.update_status(
+            memory.id, "processing",
+            expected_status="uploading", audio_url="s3://bucket/a.webm",
+        )
+        assert change.status == "processing"
+        assert (await memory_repository.get_by_id(memory.id)).audio_url == "s3://bucket/a.webm"
+
+        with pytest.raises(StatusConflictError):
+            await memory_repository.update_status(
+                memory.id, "processing", expected_status=("uploading", "failed"),
+            )
 
     @pytest.mark.asyncio
     async def test_update_status_not_found(self, memory_repository: MemoryRepository):
@@ -123,8 +413,8 @@ class TestMemoryRepository:
     @pytest.mark.asyncio
     async def test_update_processing_results(self, memory_repository: MemoryRepository):
         memory = await memory_repository.create(audio_url="s3://bucket/test.webm")
-        updated = await memory_repository.update_processing_results(
-            UUID(memory.id),
+        change = await memory_repository.update_processing_results(
+            memory.id,
             transcript="Hello world",
             summary="A greeting",
             key_points=["Said hello"],
@@ -132,9 +422,137 @@ class TestMemoryRepository:
             title="Greeting Meeting",
             status="ready",
         )
+        assert change.status == "ready"
+
+        updated = await memory_repository.get_by_id(memory.id, with_transcript=True)
         assert updated.transcript == "Hello world"
         assert updated.summary == "A greeting"
         assert updated.key_points == ["Said hello"]
         assert updated.action_items == ["Wave back"]
         assert updated.title == "Greeting Meeting"
         assert updated.status == "ready"
+
+    @pytest.mark.asyncio
+    async def test_daily_stats_groups_by_day_and_status(
+        self, memory_repository: MemoryRepository
+    ):
+        days = (datetime(2026, 3, 1, 9), datetime(2026, 3, 1, 23), datetime(2026, 3, 2, 8))
+        for created_at, duration in zip(days, (60.0, None, 30.0)):
+            memory = await memory_repository.create(
+                audio_url="s3://bucket/a.webm", duration=duration
+            )
+            memory.created_at = created_at
+        await memory_repository._session.flush()
+        await memory_repository.update_status(memory.id, "ready")
+
+        rows = await memory_repository.daily_stats()
+        assert [(r.day, r.status, r.memory_count) for r in rows] == [
+            (date(2026, 3, 1), "uploading", 2),
+            (date(2026, 3, 2), "ready", 1),
+        ]
+        assert (rows[0].duration_total, rows[0].duration_count) == (60.0, 1)
+        assert rows[0].refreshed_at is None
+
+        rows = await memory_repository.daily_stats(date_from=date(2026, 3, 2))
+        assert [r.day for r in rows] == [date(2026, 3, 2)]
+        assert await memory_repository.refresh_daily_stats() is False
+
+
+    @pytest.mark.asyncio
+    async def test_action_items_follow_processing_results(
+        self, memory_repository: MemoryRepository
+    ):
+        memory = await memory_repository.create(audio_url="s3://bucket/a.webm")
+        await memory_repository.update_processing_results(
+            memory.id, action_items=["Send notes", "Book room"]
+        )
+        page, has_more = await memory_repository.list_action_items()
+        assert not has_more
+        send_notes = next(row for row in page if row.text == "Send notes")
+        await memory_repository.update_action_item_status(send_notes.id, "done")
+
+        # Reprocessing keeps matching items (and their status), drops the rest
+        await memory_repository.update_processing_results(
+            memory.id, action_items=["Draft plan", "Send notes"]
+        )
+        page, _ = await memory_repository.list_action_items(memory_id=memory.id)
+        by_text = {row.text: row for row in page}
+        assert set(by_text) == {"Draft plan", "Send notes"}
+        assert by_text["Send notes"].id == send_notes.id
+        assert (by_text["Send notes"].status, by_text["Send notes"].position) == ("done", 1)
+
+        done, _ = await memory_repository.list_action_items(status="done")
+        assert [row.id for row in done] == [send_notes.id]
+
+    @pytest.mark.asyncio
+    async def test_action_items_keyset_pages(self, memory_repository: MemoryRepository):
+        for n in range(3):
+            memory = await memory_repository.create(audio_url=f"s3://bucket/{n}.webm")
+            await memory_repository.update_processing_results(
+                memory.id, action_items=[f"Item {n}"], title=f"Memory {n}"
+            )
+        first, has_more = await memory_repository.list_action_items(page_size=2)
+        assert has_more and [row.text for row in first] == ["Item 2", "Item 1"]
+        assert first[0].memory_title == "Memory 2"
+
+        last = first[-1]
+        rest, has_more = await memory_repository.list_action_items(
+            after=(last.created_at, last.id), page_size=2
+        )
+        assert not has_more and [row.text for row in rest] == ["Item 0"]
+
+    @pytest.mark.asyncio
+    async def test_update_missing_action_item_raises(self, memory_repository: MemoryRepository):
+        with pytest.raises(ResourceNotFoundError):
+            await memory_repository.update_action_item_status(
+                UUID("00000000-0000-0000-0000-000000000000"), "done"
+            )
+
+
+@pytest.fixture
+async def replica_session():
+    """A separate, empty SQLite database standing in for a lagging replica."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(engine, class_=AsyncSession)() as session:
+        yield session
+    await engine.dispose()
+
+
+class TestReplicaRouting:
+    @pytest.mark.asyncio
+    async def test_reads_go_to_replica(self, db_session, replica_session):
+        db_session.add(MemoryORM(audio_url="s3://bucket/a.webm"))
+        await db_session.commit()
+        db_session.info.clear()
+        repo = MemoryRepository(db_session, replica_session, ReplicaHealth())
+
+        items, total = await repo.list_all()
+
+        assert (items, total) == ([], 0)
+
+    @pytest.mark.asyncio
+    async def test_reads_stick_to_primary_after_write(self, db_session, replica_session):
+        repo = MemoryRepository(db_session, replica_session, ReplicaHealth())
+
+        memory = await repo.create(audio_url="s3://bucket/a.webm")
+
+        assert (await repo.get_by_id(memory.id)).id == memory.id
+        assert await repo.count() == 1
+
+    @pytest.mark.asyncio
+    async def test_unreachable_replica_falls_back_to_primary(self, db_session, tmp_path):
+        broken = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/missing/replica.db")
+        health = ReplicaHealth(retry_seconds=60)
+        memory = await MemoryRepository(db_session).create(audio_url="s3://bucket/a.webm")
+        await db_session.commit()
+        db_session.info.clear()
+
+        async with async_sessionmaker(broken, class_=AsyncSession)() as replica:
+            repo = MemoryRepository(db_session, replica, health)
+            found = await repo.get_by_id(memory.id)
+        await broken.dispose()
+
+        assert found.id == memory.id
+        assert health.available is False
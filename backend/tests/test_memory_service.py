@@ -1,49 +1,455 @@
 """Tests for MemoryService with mocked AWS clients."""
 
+import asyncio
+import hashlib
 import io
+import zipfile
 import pytest
+from datetime import date, timedelta
+from types import SimpleNamespace
 from unittest.mock import AsyncMock
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from fastapi import UploadFile
+from sqlalchemy import delete
 
-from app.exceptions import ResourceNotFoundError, SQSPublishError
-from app.models.memory import MemoryStatus
+from app.exceptions import (
+    DatabaseError,
+    FeatureDisabledError,
+    InvalidRequestError,
+    ResourceNotFoundError,
+    S3UploadError,
+    SQSPublishError,
+    StatusConflictError,
+    SyncCursorExpiredError,
+)
+from app.models.memory import MemoryBulkFilter, MemoryStatus
+from app.repositories.database import commit, rollback
+from app.repositories.models import MemoryEmbeddingORM, _utcnow
+from app.services.embeddings import HashingEmbeddingProvider, pack_vector
 from app.services.memory_service import MemoryService
+from app.services.semantic_index import SemanticIndex
+from app.utils.pagination import encode_cursor
 
 
 class TestUploadAudio:
     @pytest.mark.asyncio
-    async def test_upload_creates_memory_and_enqueues(
-        self, memory_service: MemoryService, mock_s3_client: AsyncMock, mock_sqs_client: AsyncMock
+    async def test_upload_enqueues_after_commit(
+        self, db_session, memory_service: MemoryService, mock_s3_client: AsyncMock,
+        mock_sqs_client: AsyncMock,
     ):
         file = UploadFile(filename="meeting.webm", file=io.BytesIO(b"fake-audio"))
         result = await memory_service.upload_audio(file)
 
         assert result.memory_id is not None
-        assert result.status in (MemoryStatus.PROCESSING, MemoryStatus.UPLOADING)
+        assert result.status == MemoryStatus.PROCESSING
         mock_s3_client.upload_file.assert_called_once()
+        mock_sqs_client.send_message.assert_not_called()
+        await commit(db_session)
         mock_sqs_client.send_message.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_upload_survives_sqs_failure(
-        self, memory_service: MemoryService, mock_sqs_client: AsyncMock
+        self, db_session, memory_service: MemoryService, memory_repository,
+        mock_sqs_client: AsyncMock,
     ):
         mock_sqs_client.send_message.side_effect = SQSPublishError(detail="Queue down")
 
         file = UploadFile(filename="meeting.webm", file=io.BytesIO(b"fake-audio"))
         result = await memory_service.upload_audio(file)
+        await commit(db_session)
 
         # Memory is still created — just not enqueued
-        assert result.memory_id is not None
+        memory = await memory_repository.get_by_id(result.memory_id)
+        assert memory.status == "uploading" and memory.audio_url
+
+    @pytest.mark.asyncio
+    async def test_upload_and_insert_overlap(
+        self, memory_service: MemoryService, memory_repository, mock_s3_client: AsyncMock
+    ):
+        upload_started = asyncio.Event()
+        create = memory_repository.create
+
+        async def upload(data, key, content_type):
+            upload_started.set()
+            return f"s3://test-bucket/{key}"
+
+        async def create_after_upload_starts(**kwargs):
+            # Deadlocks (and times out) if the insert had to finish first
+            await asyncio.wait_for(upload_started.wait(), timeout=1)
+            return await create(**kwargs)
+
+        mock_s3_client.upload_file.side_effect = upload
+        memory_repository.create = create_after_upload_starts
+        file = UploadFile(filename="meeting.webm", file=io.BytesIO(b"fake-audio"))
+        result = await memory_service.upload_audio(file)
+
+        memory = await memory_repository.get_by_id(result.memory_id)
+        assert memory.audio_url == f"s3://test-bucket/audio/{result.memory_id}.webm"
+        assert memory.status == "processing"
+
+    @pytest.mark.asyncio
+    async def test_s3_failure_discards_memory(
+        self, memory_service: MemoryService, memory_repository, mock_s3_client: AsyncMock,
+        mock_sqs_client: AsyncMock,
+    ):
+        mock_s3_client.upload_file.side_effect = S3UploadError(detail="S3 down")
+
+        file = UploadFile(filename="meeting.webm", file=io.BytesIO(b"fake-audio"))
+        with pytest.raises(S3UploadError):
+            await memory_service.upload_audio(file)
+
+        assert await memory_repository.count() == 0
+        mock_sqs_client.send_message.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_insert_failure_deletes_uploaded_object(
+        self, memory_service: MemoryService, memory_repository, mock_s3_client: AsyncMock
+    ):
+        memory_repository.create = AsyncMock(side_effect=DatabaseError())
+
+        file = UploadFile(filename="meeting.webm", file=io.BytesIO(b"fake-audio"))
+        with pytest.raises(DatabaseError):
+            await memory_service.upload_audio(file)
+
+        key = mock_s3_client.upload_file.await_args.args[1]
+        mock_s3_client.delete_objects.assert_awaited_once_with([key])
+
+    @pytest.mark.asyncio
+    async def test_status_update_failure_deletes_uploaded_object(
+        self, memory_service: MemoryService, memory_repository, mock_s3_client: AsyncMock
+    ):
+        memory_repository.update_status = AsyncMock(side_effect=DatabaseError())
+
+        with pytest.raises(DatabaseError):
+            await memory_service.upload_audio(_audio())
+
+        key = mock_s3_client.upload_file.await_args.args[1]
+        mock_s3_client.delete_objects.assert_awaited_once_with([key])
+
+    @pytest.mark.asyncio
+    async def test_rollback_sends_no_job(
+        self, db_session, memory_service: MemoryService, mock_sqs_client: AsyncMock
+    ):
+        await memory_service.upload_audio(_audio())
+        await rollback(db_session)
+        await commit(db_session)
+
+        mock_sqs_client.send_message.assert_not_called()
+
+
+def _audio(data: bytes = b"fake-audio") -> UploadFile:
+    return UploadFile(filename="meeting.webm", file=io.BytesIO(data))
+
+
+class TestUploadDeduplication:
+    @pytest.fixture
+    def service(self, memory_repository, mock_s3_client, mock_sqs_client):
+        def make(policy: str) -> MemoryService:
+            return MemoryService(
+                memory_repository, mock_s3_client, mock_sqs_client, dedup_policy=policy
+            )
+
+        return make
+
+    @pytest.mark.asyncio
+    async def test_existing_policy_returns_original(
+        self, db_session, service, memory_repository, mock_s3_client: AsyncMock, mock_sqs_client: AsyncMock
+    ):
+        first = await service("existing").upload_audio(_audio())
+        again = await service("existing").upload_audio(_audio())
+        other = await service("existing").upload_audio(_audio(b"other-audio"))
+
+        assert again.memory_id == first.memory_id
+        assert again.status == MemoryStatus.PROCESSING
+        assert other.memory_id != first.memory_id
+        assert mock_s3_client.upload_file.await_count == 2
+        await commit(db_session)
+        assert mock_sqs_client.send_message.await_count == 2
+        memory = await memory_repository.get_by_id(first.memory_id)
+        assert memory.content_hash == hashlib.sha256(b"fake-audio").hexdigest()
+
+    @pytest.mark.asyncio
+    async def test_reuse_policy_copies_ready_results(
+        self, db_session, service, memory_repository, mock_s3_client: AsyncMock, mock_sqs_client: AsyncMock
+    ):
+        first = await service("reuse").upload_audio(_audio())
+        await memory_repository.update_processing_results(
+            first.memory_id,
+            transcript="hello",
+            summary="A greeting",
+            action_items=["Say hi"],
+            title="Hello",
+        )
+
+        again = await service("reuse").upload_audio(_audio())
+
+        assert again.memory_id != first.memory_id
+        assert again.status == MemoryStatus.READY
+        assert mock_s3_client.upload_file.await_count == 1
+        await commit(db_session)
+        assert mock_sqs_client.send_message.await_count == 1
+        duplicate = await memory_repository.get_by_id(again.memory_id, with_transcript=True)
+        assert duplicate.duplicate_of == first.memory_id
+        original = await memory_repository.get_by_id(first.memory_id)
+        assert duplicate.audio_url == original.audio_url
+        assert (duplicate.transcript, duplicate.title) == ("hello", "Hello")
+        assert duplicate.action_items == ["Say hi"]
+
+    @pytest.mark.asyncio
+    async def test_reuse_policy_waits_for_processing_original(
+        self, db_session, service, memory_repository, mock_sqs_client: AsyncMock
+    ):
+        first = await service("reuse").upload_audio(_audio())
+
+        again = await service("reuse").upload_audio(_audio())
+
+        assert again.status == MemoryStatus.PROCESSING
+        await commit(db_session)
+        assert mock_sqs_client.send_message.await_count == 1
+        assert await memory_repository.list_waiting_duplicates(first.memory_id) == [
+            again.memory_id
+        ]
+
+    @pytest.mark.asyncio
+    async def test_reuse_rechecks_original_under_lock(
+        self, service, memory_repository, db_session
+    ):
+        first = await service("reuse").upload_audio(_audio())
+        memory = await memory_repository.get_by_id(first.memory_id)
+        stale = SimpleNamespace(id=memory.id, status=memory.status, audio_url=memory.audio_url)
+        # The original's worker finishes after the upload looked it up
+        await memory_repository.update_processing_results(
+            first.memory_id, transcript="hello", title="Hello"
+        )
+        memory_repository.get_by_content_hash = AsyncMock(return_value=stale)
+
+        again = await service("reuse").upload_audio(_audio())
+
+        assert again.status == MemoryStatus.READY
+        assert await memory_repository.list_waiting_duplicates(first.memory_id) == []
+
+    @pytest.mark.asyncio
+    async def test_failed_original_is_retriggered(
+        self, db_session, service, memory_repository, mock_sqs_client: AsyncMock
+    ):
+        first = await service("existing").upload_audio(_audio())
+        await memory_repository.update_status(first.memory_id, "failed")
+
+        again = await service("existing").upload_audio(_audio())
+
+        assert again.memory_id == first.memory_id
+        assert again.status == MemoryStatus.PROCESSING
+        await commit(db_session)
+        assert mock_sqs_client.send_message.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_losing_concurrent_upload_becomes_duplicate(
+        self, service, memory_repository, mock_s3_client: AsyncMock
+    ):
+        first = await service("existing").upload_audio(_audio())
+        # Simulate a concurrent upload whose lookup ran before the insert
+        memory_repository.get_by_content_hash = AsyncMock(
+            side_effect=[None, await memory_repository.get_by_id(first.memory_id)]
+        )
+
+        again = await service("existing").upload_audio(_audio())
+
+        assert again.memory_id == first.memory_id
+        key = mock_s3_client.upload_file.await_args.args[1]
+        mock_s3_client.delete_objects.assert_awaited_once_with([key])
+
+    @pytest.mark.asyncio
+    async def test_bulk_upload_is_deduplicated(
+        self, db_session, service, memory_repository, mock_s3_client: AsyncMock, mock_sqs_client: AsyncMock
+    ):
+        first = await service("existing").upload_audio(_audio())
+        files = [
+            UploadFile(filename="again.webm", file=io.BytesIO(b"fake-audio")),
+            UploadFile(filename="new.webm", file=io.BytesIO(b"new-audio")),
+            UploadFile(filename="calls.zip", file=io.BytesIO(_zip({"copy.mp3": b"new-audio"}))),
+        ]
+
+        result = await service("existing").bulk_upload(files)
+
+        again, new, copy = result.items
+        assert again.memory_id == first.memory_id
+        assert copy.memory_id == new.memory_id != first.memory_id
+        assert (result.succeeded, result.failed) == (3, 0)
+        assert mock_s3_client.upload_file.await_count == 2
+        await commit(db_session)
+        assert mock_sqs_client.send_message.await_count == 2
+        assert mock_sqs_client.send_message.await_args.args[0].memory_id == new.memory_id
+        memory = await memory_repository.get_by_id(new.memory_id)
+        assert memory.content_hash == hashlib.sha256(b"new-audio").hexdigest()
+
+    @pytest.mark.asyncio
+    async def test_bulk_upload_losing_the_hash_race_becomes_duplicate(
+        self, service, memory_repository, mock_s3_client: AsyncMock
+    ):
+        content_hash = hashlib.sha256(b"fake-audio").hexdigest()
+        original = await memory_repository.create(
+            audio_url="s3://test-bucket/audio/first.webm", content_hash=content_hash
+        )
+        await memory_repository.update_status(original.id, "processing")
+        # The concurrent upload inserts between this file's lookup and insert
+        memory_repository.get_by_content_hash = AsyncMock(side_effect=[None, original])
+        mock_s3_client.upload_file.side_effect = (
+            lambda data, key, content_type: f"s3://test-bucket/{key}"
+        )
+
+        result = await service("existing").bulk_upload([_audio()])
+
+        assert result.items[0].memory_id == original.id
+        key = mock_s3_client.upload_file.await_args.args[1]
+        mock_s3_client.delete_objects.assert_awaited_once_with([key])
+
+    @pytest.mark.asyncio
+    async def test_off_policy_stores_every_upload(self, service, memory_repository):
+        first = await service("off").upload_audio(_audio())
+        again = await service("off").upload_audio(_audio())
+
+        assert again.memory_id != first.memory_id
+        assert (await memory_repository.get_by_id(again.memory_id)).content_hash is None
+
+    def test_unknown_policy_is_rejected(self, service):
+        with pytest.raises(ValueError):
+            service("sometimes")
+
+
+def _zip(entries) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for name, data in entries.items():
+            archive.writestr(name, data)
+    return buffer.getvalue()
+
+
+class TestBulkUpload:
+    @pytest.mark.asyncio
+    async def test_files_and_archive_entries_are_uploaded(
+        self,
+        db_session,
+        memory_service: MemoryService,
+        memory_repository,
+        mock_s3_client: AsyncMock,
+        mock_sqs_client: AsyncMock,
+    ):
+        archive = _zip(
+            {
+                "calls/a.mp3": b"a",
+                "calls/notes.txt": b"skip me",
+                "__MACOSX/calls/._a.mp3": b"skip me",
+                "b.wav": b"b",
+            }
+        )
+        files = [
+            UploadFile(filename="one.webm", file=io.BytesIO(b"1")),
+            UploadFile(filename="backlog.zip", file=io.BytesIO(archive)),
+            UploadFile(filename="slides.pdf", file=io.BytesIO(b"%PDF")),
+        ]
+
+        result = await memory_service.bulk_upload(files)
+
+        assert [item.filename for item in result.items] == [
+            "one.webm", "backlog.zip/calls/a.mp3", "backlog.zip/b.wav", "slides.pdf",
+        ]
+        assert (result.succeeded, result.failed) == (3, 1)
+        assert result.items[3].error == "Unsupported file type"
+        assert mock_s3_client.upload_file.await_count == 3
+        uploaded = {call.args[0] for call in mock_s3_client.upload_file.await_args_list}
+        assert uploaded == {b"1", b"a", b"b"}
+        mock_sqs_client.send_message_batch.assert_not_awaited()
+        await commit(db_session)
+        mock_sqs_client.send_message_batch.assert_awaited_once()
+
+        stored = await memory_repository.get_many([item.memory_id for item in result.items[:3]])
+        assert {memory.status for memory in stored} == {"processing"}
+
+    @pytest.mark.asyncio
+    async def test_upload_failure_only_fails_its_file(
+        self, memory_service: MemoryService, mock_s3_client: AsyncMock
+    ):
+        async def upload(data, key, content_type):
+            if data == b"bad":
+                raise S3UploadError(detail="S3 down")
+            return f"s3://test-bucket/{key}"
+
+        mock_s3_client.upload_file.side_effect = upload
+        files = [
+            UploadFile(filename="good.webm", file=io.BytesIO(b"good")),
+            UploadFile(filename="bad.webm", file=io.BytesIO(b"bad")),
+            UploadFile(filename="broken.zip", file=io.BytesIO(b"not a zip")),
+        ]
+
+        result = await memory_service.bulk_upload(files)
+
+        good, bad, broken = result.items
+        assert good.status == MemoryStatus.PROCESSING and good.error is None
+        assert bad.memory_id is None and bad.error == "Upload failed: S3 down"
+        assert broken.error.startswith("Unreadable zip")
+
+    @pytest.mark.asyncio
+    async def test_unenqueued_files_go_back_to_uploading(
+        self,
+        db_session,
+        memory_service: MemoryService,
+        memory_repository,
+        mock_sqs_client: AsyncMock,
+    ):
+        mock_sqs_client.send_message_batch.side_effect = lambda payloads, **_: [
+            payloads[0].memory_id
+        ]
+        files = [
+            UploadFile(filename=f"{n}.webm", file=io.BytesIO(b"audio")) for n in range(2)
+        ]
+
+        result = await memory_service.bulk_upload(files)
+        await commit(db_session)
+
+        first, second = result.items
+        assert (await memory_repository.get_by_id(first.memory_id)).status == "uploading"
+        assert (await memory_repository.get_by_id(second.memory_id)).status == "processing"
+
+    @pytest.mark.asyncio
+    async def test_insert_failure_deletes_uploads(
+        self, memory_service: MemoryService, memory_repository, mock_s3_client: AsyncMock
+    ):
+        mock_s3_client.upload_file.side_effect = (
+            lambda data, key, content_type: f"s3://test-bucket/{key}"
+        )
+        memory_repository.create_many = AsyncMock(side_effect=RuntimeError("db down"))
+
+        with pytest.raises(RuntimeError):
+            await memory_service.bulk_upload(
+                [UploadFile(filename="a.webm", file=io.BytesIO(b"a"))]
+            )
+
+        (keys,), _ = mock_s3_client.delete_objects.await_args
+        assert len(keys) == 1 and keys[0].startswith("audio/")
+
+    @pytest.mark.asyncio
+    async def test_too_many_files_raises(
+        self, memory_repository, mock_s3_client: AsyncMock, mock_sqs_client: AsyncMock
+    ):
+        service = MemoryService(
+            memory_repository, mock_s3_client, mock_sqs_client, bulk_max_items=1
+        )
+        files = [
+            UploadFile(filename=f"{n}.webm", file=io.BytesIO(b"audio")) for n in range(2)
+        ]
+
+        with pytest.raises(InvalidRequestError):
+            await service.bulk_upload(files)
+        mock_s3_client.upload_file.assert_not_called()
 
 
 class TestGetMemory:
     @pytest.mark.asyncio
     async def test_get_existing_memory(self, memory_service: MemoryService, memory_repository):
         mem = await memory_repository.create(audio_url="s3://bucket/test.webm")
-        result = await memory_service.get_memory(UUID(mem.id))
-        assert str(result.id) == mem.id
+        result = await memory_service.get_memory(mem.id)
+        assert result.id == mem.id
 
     @pytest.mark.asyncio
     async def test_get_nonexistent_memory_raises(self, memory_service: MemoryService):
@@ -51,6 +457,247 @@ class TestGetMemory:
             await memory_service.get_memory(UUID("00000000-0000-0000-0000-000000000000"))
 
 
+class TestGetMemories:
+    @pytest.mark.asyncio
+    async def test_reports_missing_ids(self, memory_service: MemoryService, memory_repository):
+        mem = await memory_repository.create(audio_url="s3://bucket/test.webm")
+        missing = UUID("00000000-0000-0000-0000-000000000000")
+
+        result = await memory_service.get_memories([missing, mem.id])
+
+        assert [m.id for m in result.items] == [mem.id]
+        assert result.missing == [missing]
+
+
+class TestBulkOperations:
+    @pytest.mark.asyncio
+    async def test_bulk_retrigger_reverts_unsent_jobs(
+        self, memory_service: MemoryService, memory_repository, mock_sqs_client: AsyncMock
+    ):
+        memories = [await memory_repository.create(audio_url=f"s3://bucket/{i}.webm") for i in range(3)]
+        for memory in memories:
+            await memory_repository.update_status(memory.id, "failed")
+        mock_sqs_client.send_message_batch.return_value = [memories[1].id]
+
+        report = await memory_service.bulk_retrigger(MemoryBulkFilter(status="failed"))
+
+        assert (report.processed, report.succeeded, report.failed) == (3, 2, [memories[1].id])
+        assert report.has_more is True  # the unsent memory is failed again
+        sent = mock_sqs_client.send_message_batch.await_args.args[0]
+        assert [p.memory_id for p in sent] == [m.id for m in memories]
+        assert (await memory_repository.get_by_id(memories[0].id)).status == "processing"
+        assert (await memory_repository.get_by_id(memories[1].id)).status == "failed"
+
+    @pytest.mark.asyncio
+    async def test_bulk_retrigger_rejects_ready_status(self, memory_service: MemoryService):
+        with pytest.raises(InvalidRequestError):
+            await memory_service.bulk_retrigger(MemoryBulkFilter(status="ready"))
+
+    @pytest.mark.asyncio
+    async def test_bulk_delete_removes_audio_in_batches(
+        self, db_session, memory_repository, mock_s3_client: AsyncMock, mock_sqs_client: AsyncMock
+    ):
+        service = MemoryService(memory_repository, mock_s3_client, mock_sqs_client, bulk_max_items=2)
+        memories = [
+            await memory_repository.create(audio_url=f"s3://test-bucket/audio/{i}.webm") for i in range(3)
+        ]
+
+        report = await service.bulk_delete(MemoryBulkFilter(ids=[m.id for m in memories]))
+
+        assert (report.processed, report.succeeded, report.has_more) == (2, 2, True)
+        mock_s3_client.delete_objects.assert_not_awaited()
+        await commit(db_session)
+        mock_s3_client.delete_objects.assert_awaited_once_with(["audio/0.webm", "audio/1.webm"])
+        assert await memory_repository.get_by_id(memories[0].id) is None
+
+    @pytest.mark.asyncio
+    async def test_bulk_delete_keeps_audio_until_commit(
+        self, db_session, memory_service: MemoryService, memory_repository, mock_s3_client: AsyncMock
+    ):
+        memory = await memory_repository.create(audio_url="s3://test-bucket/audio/0.webm")
+
+        await memory_service.bulk_delete(MemoryBulkFilter(ids=[memory.id]))
+        await rollback(db_session)
+        await commit(db_session)
+
+        mock_s3_client.delete_objects.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_bulk_delete_keeps_audio_shared_with_duplicates(
+        self, db_session, memory_service: MemoryService, memory_repository, mock_s3_client: AsyncMock
+    ):
+        original = await memory_repository.create(
+            audio_url="s3://test-bucket/audio/shared.webm", content_hash="cd" * 32
+        )
+        duplicate = await memory_repository.create_duplicate(uuid4(), original)
+
+        await memory_service.bulk_delete(MemoryBulkFilter(ids=[original.id]))
+        await commit(db_session)
+        mock_s3_client.delete_objects.assert_not_awaited()
+
+        await memory_service.bulk_delete(MemoryBulkFilter(ids=[duplicate.id]))
+        await commit(db_session)
+        mock_s3_client.delete_objects.assert_awaited_once_with(["audio/shared.webm"])
+
+
+class TestListChanges:
+    @pytest.mark.asyncio
+    async def test_sync_reports_only_new_changes(self, memory_service: MemoryService, memory_repository):
+        kept = await memory_repository.create(audio_url="s3://bucket/a.webm")
+        removed = await memory_repository.create(audio_url="s3://bucket/b.webm")
+
+        initial = await memory_service.list_changes()
+        assert {m.id for m in initial.items} == {kept.id, removed.id}
+
+        await memory_service.delete_memory(removed.id)
+        delta = await memory_service.list_changes(since=initial.next_cursor)
+        assert delta.items == []
+        assert delta.deleted == [removed.id]
+
+        idle = await memory_service.list_changes(since=delta.next_cursor)
+        assert (idle.items, idle.deleted) == ([], [])
+        assert idle.next_cursor == delta.next_cursor
+
+    @pytest.mark.asyncio
+    async def test_cursor_older_than_tombstone_retention_is_rejected(
+        self, memory_repository, mock_s3_client, mock_sqs_client
+    ):
+        service = MemoryService(
+            memory_repository, mock_s3_client, mock_sqs_client,
+            tombstone_retention_seconds=30 * 24 * 3600,
+        )
+        stale = encode_cursor(_utcnow() - timedelta(days=31), uuid4())
+        fresh = encode_cursor(_utcnow() - timedelta(days=29), uuid4())
+
+        with pytest.raises(SyncCursorExpiredError):
+            await service.list_changes(since=stale)
+        assert (await service.list_changes(since=fresh)).next_cursor == fresh
+
+    @pytest.mark.asyncio
+    async def test_invalid_since_raises(self, memory_service: MemoryService):
+        with pytest.raises(InvalidRequestError):
+            await memory_service.list_changes(since="garbage")
+
+
+class TestGetStats:
+    @pytest.mark.asyncio
+    async def test_aggregates_daily_rows(self, memory_service: MemoryService, memory_repository):
+        for duration in (40.0, 20.0):
+            mem = await memory_repository.create(audio_url="s3://bucket/a.webm", duration=duration)
+        await memory_repository.update_status(mem.id, "failed")
+
+        stats = await memory_service.get_stats()
+
+        assert stats.total == 2
+        assert stats.by_status == {"uploading": 1, "failed": 1}
+        assert stats.average_duration == 30.0
+        assert len(stats.daily) == 1 and stats.daily[0].count == 2
+
+    @pytest.mark.asyncio
+    async def test_inverted_range_raises(self, memory_service: MemoryService):
+        with pytest.raises(InvalidRequestError):
+            await memory_service.get_stats(date(2026, 2, 1), date(2026, 1, 1))
+
+
+class TestSemanticSearch:
+    @pytest.fixture
+    def provider(self) -> HashingEmbeddingProvider:
+        return HashingEmbeddingProvider(64)
+
+    @pytest.fixture
+    def semantic_service(
+        self, memory_repository, mock_s3_client, mock_sqs_client, provider, tmp_path
+    ) -> MemoryService:
+        index = SemanticIndex(
+            tmp_path, provider.model, provider.dimensions,
+            sync_interval_seconds=0, persist_every=2,
+        )
+        return MemoryService(
+            memory_repository, mock_s3_client, mock_sqs_client,
+            embedding_provider=provider, semantic_index=index,
+        )
+
+    async def _embedded(self, repository, provider, summary: str, status="ready"):
+        mem = await repository.create(audio_url="s3://bucket/a.webm")
+        await repository.update_status(mem.id, status)
+        [vector] = await provider.embed([summary])
+        await repository.save_embedding(
+            mem.id, provider.model, provider.dimensions, pack_vector(vector)
+        )
+        return mem
+
+    @pytest.mark.asyncio
+    async def test_ranks_by_similarity_and_drops_deleted(
+        self, semantic_service: MemoryService, memory_repository, provider
+    ):
+        budget = await self._embedded(memory_repository, provider, "quarterly budget review")
+        lunch = await self._embedded(memory_repository, provider, "team lunch order")
+        hiring = await self._embedded(memory_repository, provider, "hiring plan for engineers")
+
+        result = await semantic_service.semantic_search("budget review", limit=2)
+        assert [item.id for item in result.items][0] == budget.id
+        assert len(result.items) == 2
+        assert result.items[0].score > result.items[1].score
+
+        await semantic_service.delete_memory(budget.id)
+        result = await semantic_service.semantic_search("budget review", limit=5)
+        assert {item.id for item in result.items} == {lunch.id, hiring.id}
+
+    @pytest.mark.asyncio
+    async def test_status_filter(
+        self, semantic_service: MemoryService, memory_repository, provider
+    ):
+        await self._embedded(memory_repository, provider, "budget review", status="failed")
+        ready = await self._embedded(memory_repository, provider, "budget planning")
+
+        result = await semantic_service.semantic_search("budget review", status="ready")
+        assert [item.id for item in result.items] == [ready.id]
+
+    @pytest.mark.asyncio
+    async def test_index_persists_between_instances(
+        self, semantic_service: MemoryService, memory_repository, provider, tmp_path
+    ):
+        mem = await self._embedded(memory_repository, provider, "budget review")
+        await self._embedded(memory_repository, provider, "lunch order")
+        await semantic_service.semantic_search("budget")
+
+        reopened = SemanticIndex(tmp_path, provider.model, provider.dimensions)
+        [vector] = await provider.embed(["budget review"])
+        await reopened.sync(memory_repository, force=True)
+        assert reopened._position is not None
+        assert (await reopened.search(memory_repository, vector, 1))[0][0] == mem.id
+
+    @pytest.mark.asyncio
+    async def test_index_older_than_tombstone_retention_is_rebuilt(
+        self, semantic_service: MemoryService, memory_repository, provider, tmp_path
+    ):
+        kept = await self._embedded(memory_repository, provider, "budget review")
+        gone = await self._embedded(memory_repository, provider, "lunch order")
+        await semantic_service.semantic_search("budget")
+        # The saved position is older than the retention, and the
+        # tombstone of a later deletion has been pruned
+        await memory_repository.delete(gone.id)
+        # Postgres cascades the delete; the SQLite test schema does not
+        await memory_repository._session.execute(
+            delete(MemoryEmbeddingORM).where(MemoryEmbeddingORM.memory_id == gone.id)
+        )
+        await memory_repository.prune_tombstones(_utcnow() + timedelta(seconds=1))
+
+        reopened = SemanticIndex(
+            tmp_path, provider.model, provider.dimensions, tombstone_retention_seconds=0
+        )
+        await reopened.sync(memory_repository, force=True)
+
+        [vector] = await provider.embed(["budget review"])
+        hits = await reopened.search(memory_repository, vector, 5)
+        assert [memory_id for memory_id, _ in hits] == [kept.id]
+
+    @pytest.mark.asyncio
+    async def test_disabled_raises(self, memory_service: MemoryService):
+        with pytest.raises(FeatureDisabledError):
+            await memory_service.semantic_search("budget")
+
+
 class TestListMemories:
     @pytest.mark.asyncio
     async def test_list_empty(self, memory_service: MemoryService):
@@ -67,6 +714,7 @@ class TestListMemories:
 
         result = await memory_service.list_memories()
         assert result.total == 2
+        assert result.total_is_exact is True
         assert len(result.items) == 2
 
     @pytest.mark.asyncio
@@ -79,18 +727,100 @@ class TestListMemories:
         assert result.total == 5
         assert len(result.items) == 2
         assert result.has_next is True
+        assert result.next_cursor is not None
+
+    @pytest.mark.asyncio
+    async def test_list_cursor_continues_page_listing(self, memory_service: MemoryService, memory_repository, db_session):
+        for i in range(5):
+            await memory_repository.create(audio_url=f"s3://bucket/{i}.webm")
+        await db_session.flush()
+
+        first = await memory_service.list_memories(page=1, page_size=2)
+        second = await memory_service.list_memories(page_size=2, cursor=first.next_cursor)
+        third = await memory_service.list_memories(page_size=2, cursor=second.next_cursor)
+
+        ids = [m.id for page in (first, second, third) for m in page.items]
+        assert len(set(ids)) == 5
+        assert second.total is None
+        assert second.page is None
+        assert third.has_next is False
+        assert third.next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_list_cursor_with_total(self, memory_service: MemoryService, memory_repository, db_session):
+        for i in range(3):
+            await memory_repository.create(audio_url=f"s3://bucket/{i}.webm")
+        await db_session.flush()
+
+        first = await memory_service.list_memories(page_size=1)
+        result = await memory_service.list_memories(
+            page_size=1, cursor=first.next_cursor, include_total=True,
+        )
+        assert result.total == 3
+
+    @pytest.mark.asyncio
+    async def test_list_invalid_cursor_raises(self, memory_service: MemoryService):
+        with pytest.raises(InvalidRequestError):
+            await memory_service.list_memories(cursor="not-a-cursor")
+
+    @pytest.mark.asyncio
+    async def test_list_items_omit_heavy_fields_unless_included(self, memory_service: MemoryService, memory_repository, db_session):
+        memory = await memory_repository.create(audio_url="s3://bucket/a.webm")
+        await memory_repository.update_processing_results(
+            memory.id, transcript="Hello", action_items=["Call Ana"], status="ready",
+        )
+        await db_session.flush()
+
+        light = await memory_service.list_memories()
+        assert "transcript" not in light.items[0].model_dump(exclude_unset=True)
+
+        full = await memory_service.list_memories(include="transcript, action_items")
+        assert full.items[0].transcript == "Hello"
+        assert full.items[0].action_items == ["Call Ana"]
+        assert "key_points" not in full.items[0].model_dump(exclude_unset=True)
+
+    @pytest.mark.asyncio
+    async def test_list_unknown_include_raises(self, memory_service: MemoryService):
+        with pytest.raises(InvalidRequestError):
+            await memory_service.list_memories(include="audio_blob")
 
 
 class TestTriggerProcessing:
     @pytest.mark.asyncio
     async def test_trigger_existing_memory(
-        self, memory_service: MemoryService, memory_repository, mock_sqs_client: AsyncMock
+        self,
+        db_session,
+        memory_service: MemoryService,
+        memory_repository,
+        mock_sqs_client: AsyncMock,
     ):
         mem = await memory_repository.create(audio_url="s3://bucket/test.webm")
-        result = await memory_service.trigger_processing(UUID(mem.id))
+        result = await memory_service.trigger_processing(mem.id)
         assert result.status == MemoryStatus.PROCESSING
+        mock_sqs_client.send_message.assert_not_called()
+        await commit(db_session)
         mock_sqs_client.send_message.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_lost_status_race_enqueues_nothing(
+        self,
+        db_session,
+        memory_service: MemoryService,
+        memory_repository,
+        mock_sqs_client: AsyncMock,
+    ):
+        mem = await memory_repository.create(audio_url="s3://bucket/test.webm")
+        # Another request claims the memory after this one read it
+        memory_repository.get_by_id = AsyncMock(return_value=SimpleNamespace(
+            id=mem.id, audio_url=mem.audio_url, status=MemoryStatus.UPLOADING.value
+        ))
+        await memory_repository.update_status(mem.id, MemoryStatus.PROCESSING.value)
+
+        with pytest.raises(StatusConflictError):
+            await memory_service.trigger_processing(mem.id)
+        await rollback(db_session)
+        mock_sqs_client.send_message.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_trigger_nonexistent_raises(self, memory_service: MemoryService):
         with pytest.raises(ResourceNotFoundError):
@@ -0,0 +1,103 @@
+"""Tests for the metrics registry and database instrumentation."""
+
+import logging
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.repositories.instrumentation import (
+    POOL_CHECKOUT_TIMEOUTS,
+    POOL_CHECKOUT_WAIT,
+    QUERY_DURATION,
+    SLOW_QUERIES,
+    InstrumentedAsyncQueuePool,
+    forget_engine,
+    instrument_engine,
+)
+from app.utils.metrics import Counter, Histogram, MetricsRegistry
+
+
+class TestMetricsRegistry:
+    def test_counter_renders_per_label(self):
+        registry = MetricsRegistry()
+        hits = Counter("cache_hits_total", "Cache hits.", ("cache",), registry=registry)
+
+        hits.inc(cache="memory")
+        hits.inc(2, cache="memory")
+
+        assert 'cache_hits_total{cache="memory"} 3.0' in registry.render()
+
+    def test_histogram_buckets_are_cumulative(self):
+        registry = MetricsRegistry()
+        latency = Histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0), registry=registry)
+
+        for value in (0.05, 0.5, 5.0):
+            latency.observe(value)
+
+        rendered = registry.render()
+        assert 'latency_seconds_bucket{le="0.1"} 1' in rendered
+        assert 'latency_seconds_bucket{le="1.0"} 2' in rendered
+        assert 'latency_seconds_bucket{le="+Inf"} 3' in rendered
+        assert "latency_seconds_count 3" in rendered
+
+    def test_wrong_labels_rejected(self):
+        counter = Counter("things_total", "Things.", ("kind",), registry=MetricsRegistry())
+        with pytest.raises(ValueError):
+            counter.inc(other="x")
+
+
+@pytest.fixture
+async def instrumented_engine(tmp_path):
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path}/metrics.db",
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    yield instrument_engine(engine, "test", slow_query_ms=0.000001)
+    forget_engine("test")
+    await engine.dispose()
+
+
+class TestDatabaseInstrumentation:
+    @pytest.mark.asyncio
+    async def test_query_latency_and_slow_log(self, instrumented_engine, caplog):
+        queries = QUERY_DURATION.count(engine="test")
+        slow = SLOW_QUERIES.value(engine="test")
+
+        with caplog.at_level(logging.WARNING, logger="app.repositories.instrumentation"):
+            async with instrumented_engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+
+        assert QUERY_DURATION.count(engine="test") == queries + 1
+        assert SLOW_QUERIES.value(engine="test") == slow + 1
+        assert "SELECT 1" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_checkout_wait_and_timeout(self, instrumented_engine):
+        waits = POOL_CHECKOUT_WAIT.count(engine="test")
+        timeouts = POOL_CHECKOUT_TIMEOUTS.value(engine="test")
+
+        async with instrumented_engine.connect():
+            with pytest.raises(PoolTimeoutError):
+                async with instrumented_engine.connect():
+                    pass
+
+        assert POOL_CHECKOUT_WAIT.count(engine="test") == waits + 2
+        assert POOL_CHECKOUT_TIMEOUTS.value(engine="test") == timeouts + 1
+
+
+class TestMetricsEndpoint:
+    @pytest.mark.asyncio
+    async def test_metrics_exposes_pool_gauges(self, instrumented_engine, async_client: AsyncClient):
+        async with instrumented_engine.connect():
+            response = await async_client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert 'db_pool_connections{engine="test",state="checked_out"} 1.0' in response.text
+        assert "# TYPE db_query_duration_seconds histogram" in response.text
@@ -0,0 +1,131 @@
+"""Tests that the Alembic migrations build the schema the ORM declares."""
+
+import asyncio
+import os
+from pathlib import Path
+
+import pytest
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.config import Config
+from alembic.migration import MigrationContext
+import gzip
+
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.repositories.database import Base
+
+ALEMBIC_INI = Path(__file__).resolve().parents[1] / "alembic.ini"
+
+POSTGRES_URL = os.environ.get("TEST_DATABASE_URL", "")
+
+
+def alembic_config(url: str) -> Config:
+    """Alembic config pointed at ``url`` without touching test logging."""
+    config = Config(str(ALEMBIC_INI))
+    config.set_main_option("script_location", str(ALEMBIC_INI.parent / "migrations"))
+    config.set_main_option("sqlalchemy.url", url)
+    config.attributes["configure_logger"] = False
+    return config
+
+
+class TestMigrations:
+    def test_upgrade_head_matches_models(self, tmp_path: Path):
+        db_file = tmp_path / "migrated.db"
+        command.upgrade(alembic_config(f"sqlite+aiosqlite:///{db_file}"), "head")
+
+        engine = create_engine(f"sqlite:///{db_file}")
+        with engine.connect() as conn:
+            diff = compare_metadata(MigrationContext.configure(conn), Base.metadata)
+            indexes = {index["name"] for index in inspect(conn).get_indexes("memories")}
+        engine.dispose()
+
+        assert diff == []
+        assert {"ix_memories_created_at_id", "ix_memories_status_created_at_id"} <= indexes
+
+    def test_downgrade_to_base(self, tmp_path: Path):
+        db_file = tmp_path / "migrated.db"
+        config = alembic_config(f"sqlite+aiosqlite:///{db_file}")
+        command.upgrade(config, "head")
+        command.downgrade(config, "base")
+
+        engine = create_engine(f"sqlite:///{db_file}")
+        with engine.connect() as conn:
+            assert "memories" not in inspect(conn).get_table_names()
+        engine.dispose()
+
+    def test_transcripts_move_to_compressed_table(self, tmp_path: Path):
+        db_file = tmp_path / "migrated.db"
+        config = alembic_config(f"sqlite+aiosqlite:///{db_file}")
+        command.upgrade(config, "0004")
+        engine = create_engine(f"sqlite:///{db_file}")
+        with engine.begin() as conn:
+            conn.execute(text(
+                "INSERT INTO memories (id, title, audio_url, status, transcript, "
+                "created_at, updated_at) VALUES ('0123456789abcdef0123456789abcdef', "
+                "'Standup', 's3://bucket/a.webm', 'ready', 'Budget review', "
+                "'2026-01-01', '2026-01-01')"
+            ))
+
+        command.upgrade(config, "head")
+        with engine.connect() as conn:
+            encoding, content = conn.execute(
+                text("SELECT encoding, content FROM memory_transcripts")
+            ).one()
+            search_vector = conn.execute(text("SELECT search_vector FROM memories")).scalar()
+        assert (encoding, gzip.decompress(content)) == ("gzip", b"Budget review")
+        assert "Standup" in search_vector and "Budget review" in search_vector
+
+        command.downgrade(config, "0004")
+        with engine.connect() as conn:
+            assert conn.execute(text("SELECT transcript FROM memories")).scalar() == "Budget review"
+        engine.dispose()
+
+    def test_action_items_backfilled_from_memories(self, tmp_path: Path):
+        db_file = tmp_path / "migrated.db"
+        config = alembic_config(f"sqlite+aiosqlite:///{db_file}")
+        command.upgrade(config, "0007")
+        engine = create_engine(f"sqlite:///{db_file}")
+        with engine.begin() as conn:
+            conn.execute(text(
+                "INSERT INTO memories (id, audio_url, status, action_items, "
+                "created_at, updated_at) VALUES ('0123456789abcdef0123456789abcdef', "
+                "'s3://bucket/a.webm', 'ready', '[\"Send notes\", \"Book room\"]', "
+                "'2026-01-01', '2026-01-02')"
+            ))
+
+        command.upgrade(config, "head")
+        with engine.connect() as conn:
+            rows = conn.execute(text(
+                "SELECT position, text, status, created_at FROM action_items ORDER BY position"
+            )).all()
+        engine.dispose()
+        assert [tuple(row[:3]) for row in rows] == [
+            (0, "Send notes", "open"), (1, "Book room", "open"),
+        ]
+        assert rows[0].created_at.startswith("2026-01-02")
+
+    @pytest.mark.skipif(
+        not POSTGRES_URL.startswith("postgresql"),
+        reason="TEST_DATABASE_URL is not set to a Postgres database",
+    )
+    def test_stamped_init_db_database_upgrades_on_postgres(self):
+        async def columns() -> set:
+            engine = create_async_engine(POSTGRES_URL)
+            async with engine.connect() as conn:
+                names = await conn.run_sync(
+                    lambda sync: {c["name"] for c in inspect(sync).get_columns("memories")}
+                )
+            await engine.dispose()
+            return names
+
+        config = alembic_config(POSTGRES_URL)
+        # 0001 is the original init_db schema, without search_vector
+        command.upgrade(config, "0001")
+        assert "search_vector" not in asyncio.run(columns())
+        try:
+            command.upgrade(config, "head")
+            assert "search_vector" in asyncio.run(columns())
+        finally:
+            command.downgrade(config, "base")
@@ -2,13 +2,15 @@
 
 import pytest
 from unittest.mock import AsyncMock
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from app.clients.openai import OpenAIClient
 from app.clients.s3 import S3Client
-from app.exceptions import AIProcessingError, S3UploadError
+from app.exceptions import AIProcessingError, ResourceNotFoundError, S3UploadError
 from app.models.ai import LLMAnalysisResult, TranscriptionResult
+from app.repositories.database import commit
 from app.repositories.memory_repository import MemoryRepository
+from app.services.embeddings import HashingEmbeddingProvider
 from app.services.processing_service import ProcessingService
 
 
@@ -32,7 +34,7 @@ class TestProcessMemory:
         mock_openai_client: AsyncMock,
     ):
         mem = await memory_repository.create(audio_url="s3://test-bucket/audio/test.webm")
-        memory_id = UUID(mem.id)
+        memory_id = mem.id
 
         await processing_service.process_memory(
             memory_id=memory_id,
@@ -40,7 +42,7 @@ class TestProcessMemory:
             correlation_id="corr-123",
         )
 
-        updated = await memory_repository.get_by_id(memory_id)
+        updated = await memory_repository.get_by_id(memory_id, with_transcript=True)
         assert updated.status == "ready"
         assert updated.transcript is not None
         assert updated.summary is not None
@@ -57,7 +59,7 @@ class TestProcessMemory:
         mock_s3_client.get_file.side_effect = S3UploadError(detail="S3 down")
 
         mem = await memory_repository.create(audio_url="s3://test-bucket/audio/test.webm")
-        memory_id = UUID(mem.id)
+        memory_id = mem.id
 
         await processing_service.process_memory(
             memory_id=memory_id,
@@ -65,7 +67,7 @@ class TestProcessMemory:
             correlation_id="corr-123",
         )
 
-        updated = await memory_repository.get_by_id(memory_id)
+        updated = await memory_repository.get_by_id(memory_id, with_transcript=True)
         assert updated.status == "failed"
         assert updated.transcript is None
 
@@ -79,7 +81,7 @@ class TestProcessMemory:
         mock_openai_client.transcribe_audio.side_effect = AIProcessingError(detail="Whisper down")
 
         mem = await memory_repository.create(audio_url="s3://test-bucket/audio/test.webm")
-        memory_id = UUID(mem.id)
+        memory_id = mem.id
 
         await processing_service.process_memory(
             memory_id=memory_id,
@@ -87,7 +89,7 @@ class TestProcessMemory:
             correlation_id="corr-123",
         )
 
-        updated = await memory_repository.get_by_id(memory_id)
+        updated = await memory_repository.get_by_id(memory_id, with_transcript=True)
         assert updated.status == "failed"
 
     @pytest.mark.asyncio
@@ -100,7 +102,7 @@ class TestProcessMemory:
         mock_openai_client.analyze_transcript.side_effect = Exception("LLM exploded")
 
         mem = await memory_repository.create(audio_url="s3://test-bucket/audio/test.webm")
-        memory_id = UUID(mem.id)
+        memory_id = mem.id
 
         await processing_service.process_memory(
             memory_id=memory_id,
@@ -108,7 +110,219 @@ class TestProcessMemory:
             correlation_id="corr-123",
         )
 
-        updated = await memory_repository.get_by_id(memory_id)
+        updated = await memory_repository.get_by_id(memory_id, with_transcript=True)
         assert updated.status == "ready"
         assert updated.transcript is not None
         assert updated.summary is None  # LLM failed, no summary
+
+    @pytest.mark.asyncio
+    async def test_redelivery_of_ready_memory_is_skipped(
+        self,
+        processing_service: ProcessingService,
+        memory_repository: MemoryRepository,
+        mock_s3_client: AsyncMock,
+    ):
+        mem = await memory_repository.create(audio_url="s3://test-bucket/audio/test.webm")
+        memory_id = mem.id
+        await memory_repository.update_status(memory_id, "ready")
+
+        await processing_service.process_memory(
+            memory_id=memory_id,
+            audio_url="s3://test-bucket/audio/test.webm",
+            correlation_id="corr-123",
+        )
+
+        mock_s3_client.get_file.assert_not_called()
+        assert (await memory_repository.get_by_id(memory_id)).status == "ready"
+
+    @pytest.mark.asyncio
+    async def test_missing_memory_fails_the_message(
+        self, processing_service: ProcessingService, mock_s3_client: AsyncMock
+    ):
+        with pytest.raises(ResourceNotFoundError):
+            await processing_service.process_memory(
+                memory_id=uuid4(),
+                audio_url="s3://test-bucket/audio/test.webm",
+                correlation_id="corr-123",
+            )
+
+        mock_s3_client.get_file.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_events_use_returned_row_state(
+        self,
+        db_session,
+        memory_repository: MemoryRepository,
+        mock_s3_client: AsyncMock,
+        mock_openai_client: AsyncMock,
+    ):
+        redis = AsyncMock()
+        mock_s3_client._settings = type("S", (), {"s3_bucket_name": "test-bucket"})()
+        service = ProcessingService(memory_repository, mock_s3_client, mock_openai_client, redis)
+        mem = await memory_repository.create(audio_url="s3://test-bucket/audio/test.webm")
+
+        await service.process_memory(
+            memory_id=mem.id,
+            audio_url="s3://test-bucket/audio/test.webm",
+            correlation_id="corr-123",
+        )
+        redis.publish_memory_event.assert_not_awaited()
+        await commit(db_session)
+
+        statuses = [c.kwargs["status"] for c in redis.publish_memory_event.await_args_list]
+        assert statuses == ["processing", "ready"]
+        assert all(c.kwargs["memory_id"] == str(mem.id) for c in redis.publish_memory_event.await_args_list)
+        assert all(c.kwargs["updated_at"] for c in redis.publish_memory_event.await_args_list)
+
+    @pytest.mark.asyncio
+    async def test_saves_embedding_of_results(
+        self,
+        memory_repository: MemoryRepository,
+        mock_s3_client: AsyncMock,
+        mock_openai_client: AsyncMock,
+    ):
+        mock_s3_client._settings = type("S", (), {"s3_bucket_name": "test-bucket"})()
+        provider = HashingEmbeddingProvider(32)
+        service = ProcessingService(
+            memory_repository, mock_s3_client, mock_openai_client,
+            embedding_provider=provider,
+        )
+        mem = await memory_repository.create(audio_url="s3://test-bucket/audio/test.webm")
+
+        await service.process_memory(
+            memory_id=mem.id,
+            audio_url="s3://test-bucket/audio/test.webm",
+            correlation_id="corr-123",
+        )
+
+        changes, _ = await memory_repository.list_embedding_changes("hashing-v1", 32)
+        assert [change.id for change in changes] == [mem.id]
+        assert len(changes[0].vector) == 32 * 4
+
+    @pytest.mark.asyncio
+    async def test_ready_is_committed_before_embedding(
+        self,
+        memory_repository: MemoryRepository,
+        mock_s3_client: AsyncMock,
+        mock_openai_client: AsyncMock,
+    ):
+        mock_s3_client._settings = type("S", (), {"s3_bucket_name": "test-bucket"})()
+        commit = AsyncMock()
+        provider = AsyncMock(model="m", dimensions=8)
+        provider.embed.side_effect = lambda texts: [[0.0] * 8] if commit.await_count else 1 / 0
+        service = ProcessingService(
+            memory_repository, mock_s3_client, mock_openai_client,
+            embedding_provider=provider, commit=commit,
+        )
+        mem = await memory_repository.create(audio_url="s3://test-bucket/audio/test.webm")
+
+        await service.process_memory(
+            memory_id=mem.id,
+            audio_url="s3://test-bucket/audio/test.webm",
+            correlation_id="corr-123",
+        )
+
+        commit.assert_awaited_once()
+        changes, _ = await memory_repository.list_embedding_changes("m", 8)
+        assert [change.id for change in changes] == [mem.id]
+
+    @pytest.mark.asyncio
+    async def test_embedding_failure_keeps_results(
+        self,
+        memory_repository: MemoryRepository,
+        mock_s3_client: AsyncMock,
+        mock_openai_client: AsyncMock,
+    ):
+        mock_s3_client._settings = type("S", (), {"s3_bucket_name": "test-bucket"})()
+        provider = AsyncMock(model="m", dimensions=8)
+        provider.embed.side_effect = AIProcessingError(detail="Embeddings down")
+        service = ProcessingService(
+            memory_repository, mock_s3_client, mock_openai_client,
+            embedding_provider=provider,
+        )
+        mem = await memory_repository.create(audio_url="s3://test-bucket/audio/test.webm")
+
+        await service.process_memory(
+            memory_id=mem.id,
+            audio_url="s3://test-bucket/audio/test.webm",
+            correlation_id="corr-123",
+        )
+
+        updated = await memory_repository.get_by_id(mem.id)
+        assert updated.status == "ready"
+        assert updated.summary is not None
+
+
+class TestDuplicateUploads:
+    @pytest.mark.asyncio
+    async def test_results_are_shared_with_waiting_duplicates(
+        self,
+        processing_service: ProcessingService,
+        memory_repository: MemoryRepository,
+        mock_openai_client: AsyncMock,
+    ):
+        mem = await memory_repository.create(
+            audio_url="s3://test-bucket/audio/test.webm", content_hash="ef" * 32
+        )
+        duplicate = await memory_repository.create_duplicate(uuid4(), mem)
+
+        await processing_service.process_memory(
+            memory_id=mem.id,
+            audio_url="s3://test-bucket/audio/test.webm",
+            correlation_id="corr-123",
+        )
+
+        mock_openai_client.transcribe_audio.assert_awaited_once()
+        original = await memory_repository.get_by_id(mem.id, with_transcript=True)
+        copy = await memory_repository.get_by_id(duplicate.id, with_transcript=True)
+        assert copy.status == "ready"
+        assert (copy.transcript, copy.summary, copy.title) == (
+            original.transcript, original.summary, original.title
+        )
+        assert copy.action_items == original.action_items
+
+    @pytest.mark.asyncio
+    async def test_redelivery_finishes_waiting_duplicates(
+        self,
+        processing_service: ProcessingService,
+        memory_repository: MemoryRepository,
+        mock_openai_client: AsyncMock,
+    ):
+        mem = await memory_repository.create(
+            audio_url="s3://test-bucket/audio/test.webm", content_hash="ef" * 32
+        )
+        duplicate = await memory_repository.create_duplicate(uuid4(), mem)
+        await memory_repository.update_processing_results(
+            mem.id, transcript="hello", status="ready"
+        )
+
+        await processing_service.process_memory(
+            memory_id=mem.id,
+            audio_url="s3://test-bucket/audio/test.webm",
+            correlation_id="corr-123",
+        )
+
+        mock_openai_client.transcribe_audio.assert_not_called()
+        copy = await memory_repository.get_by_id(duplicate.id, with_transcript=True)
+        assert (copy.status, copy.transcript) == ("ready", "hello")
+
+    @pytest.mark.asyncio
+    async def test_failure_fails_waiting_duplicates(
+        self,
+        processing_service: ProcessingService,
+        memory_repository: MemoryRepository,
+        mock_openai_client: AsyncMock,
+    ):
+        mock_openai_client.transcribe_audio.side_effect = AIProcessingError(detail="Whisper down")
+        mem = await memory_repository.create(
+            audio_url="s3://test-bucket/audio/test.webm", content_hash="ef" * 32
+        )
+        duplicate = await memory_repository.create_duplicate(uuid4(), mem)
+
+        await processing_service.process_memory(
+            memory_id=mem.id,
+            audio_url="s3://test-bucket/audio/test.webm",
+            correlation_id="corr-123",
+        )
+
+        assert (await memory_repository.get_by_id(duplicate.id)).status == "failed"
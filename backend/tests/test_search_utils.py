@@ -0,0 +1,27 @@
+"""Tests for app.utils.search."""
+
+from app.utils.search import highlight_snippet, to_prefix_tsquery, tokenize_query
+
+
+class TestTokenizeQuery:
+    def test_strips_operators_and_duplicates(self):
+        assert tokenize_query("Sprint & sprint | (plan)!") == ["sprint", "plan"]
+
+    def test_prefix_tsquery(self):
+        assert to_prefix_tsquery(["sprint", "plan"]) == "sprint:* & plan:*"
+
+
+class TestHighlightSnippet:
+    def test_marks_prefix_matches(self):
+        snippet = highlight_snippet("Planning the planned sprint", ["plan"])
+        assert snippet == "<mark>Planning</mark> the <mark>planned</mark> sprint"
+
+    def test_windows_long_text(self):
+        text = "filler " * 100 + "budget" + " filler" * 100
+        snippet = highlight_snippet(text, ["budget"], max_chars=60)
+        assert snippet.startswith("...") and snippet.endswith("...")
+        assert "<mark>budget</mark>" in snippet
+
+    def test_no_match_returns_none(self):
+        assert highlight_snippet("nothing here", ["budget"]) is None
+        assert highlight_snippet(None, ["budget"]) is None
@@ -0,0 +1,146 @@
+"""Tests for in-process read coalescing."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.exceptions import ResourceNotFoundError
+from app.repositories.memory_repository import MemoryRepository
+from app.services.memory_service import MemoryService
+from app.utils.single_flight import SINGLE_FLIGHT_CALLS, SingleFlight
+from app.utils.metrics import REGISTRY
+
+
+def _calls(operation: str, result: str) -> float:
+    return SINGLE_FLIGHT_CALLS.value(operation=operation, result=result)
+
+
+class TestSingleFlight:
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_result(self):
+        group = SingleFlight()
+        release = asyncio.Event()
+        runs = 0
+
+        async def call():
+            nonlocal runs
+            runs += 1
+            await release.wait()
+            return object()
+
+        leaders, shared = _calls("test", "leader"), _calls("test", "shared")
+        tasks = [asyncio.create_task(group.do("test", "k", call)) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert runs == 1
+        assert all(result is results[0] for result in results)
+        assert _calls("test", "leader") - leaders == 1
+        assert _calls("test", "shared") - shared == 4
+        assert len(group) == 0
+        assert 'single_flight_dedup_ratio{operation="test"}' in REGISTRY.render()
+
+    @pytest.mark.asyncio
+    async def test_finished_calls_are_not_reused(self):
+        group = SingleFlight()
+        call = AsyncMock(side_effect=[1, 2])
+
+        assert await group.do("test", "k", call) == 1
+        assert await group.do("test", "k", call) == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_reach_every_caller(self):
+        group = SingleFlight()
+        release = asyncio.Event()
+
+        async def call():
+            await release.wait()
+            raise ValueError("boom")
+
+        tasks = [asyncio.create_task(group.do("test", "k", call)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert all(isinstance(result, ValueError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_hands_over_to_a_follower(self):
+        group = SingleFlight()
+        release = asyncio.Event()
+        runs = 0
+
+        async def call():
+            nonlocal runs
+            runs += 1
+            await release.wait()
+            return runs
+
+        leader = asyncio.create_task(group.do("test", "k", call))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(group.do("test", "k", call))
+        await asyncio.sleep(0)
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await follower == 2
+        assert leader.cancelled()
+
+
+class TestMemoryServiceCoalescing:
+    @pytest.fixture
+    def service(
+        self, memory_repository: MemoryRepository, mock_s3_client, mock_sqs_client
+    ) -> MemoryService:
+        return MemoryService(
+            memory_repository,
+            mock_s3_client,
+            mock_sqs_client,
+            single_flight=SingleFlight(),
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_memory_burst_runs_one_query(
+        self, service: MemoryService, memory_repository: MemoryRepository
+    ):
+        memory = await memory_repository.create(audio_url="s3://bucket/a.webm")
+        memory_repository.get_by_id = AsyncMock(wraps=memory_repository.get_by_id)
+
+        results = await asyncio.gather(
+            *(service.get_memory(memory.id) for _ in range(10))
+        )
+
+        memory_repository.get_by_id.assert_awaited_once()
+        assert {result.id for result in results} == {memory.id}
+
+    @pytest.mark.asyncio
+    async def test_get_memory_not_found_is_shared(
+        self, service: MemoryService, memory_repository: MemoryRepository
+    ):
+        memory = await memory_repository.create(audio_url="s3://bucket/a.webm")
+        await memory_repository.discard(memory.id)
+
+        results = await asyncio.gather(
+            *(service.get_memory(memory.id) for _ in range(3)), return_exceptions=True
+        )
+
+        assert all(isinstance(result, ResourceNotFoundError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_identical_lists_share_one_query(
+        self, service: MemoryService, memory_repository: MemoryRepository
+    ):
+        await memory_repository.create(audio_url="s3://bucket/a.webm")
+        memory_repository.list_page = AsyncMock(wraps=memory_repository.list_page)
+
+        same = await asyncio.gather(
+            *(service.list_memories(page=1, page_size=10) for _ in range(5))
+        )
+        other = await service.list_memories(page=1, page_size=5)
+
+        assert memory_repository.list_page.await_count == 2
+        assert all(result is same[0] for result in same)
+        assert other.page_size == 5
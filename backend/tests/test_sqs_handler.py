@@ -0,0 +1,160 @@
+"""Tests for the Lambda SQS batch handler."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any, Dict, List, Set
+from uuid import uuid4
+
+import pytest
+
+from app.workers import sqs_handler
+
+
+class _FakeSession:
+    def __init__(self) -> None:
+        self.info: Dict[str, Any] = {}
+
+    async def __aenter__(self) -> "_FakeSession":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> bool:
+        return False
+
+    async def commit(self) -> None:
+        pass
+
+
+class _FakeContext:
+    def __init__(self, remaining_ms: int) -> None:
+        self._remaining_ms = remaining_ms
+
+    def get_remaining_time_in_millis(self) -> int:
+        return self._remaining_ms
+
+
+class _Tracker:
+    """Records in-flight concurrency of the fake processing service."""
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.processed: List[str] = []
+        self.failing: Set[str] = set()
+        self.released: List[str] = []
+
+
+def _record(message_id: str) -> Dict[str, Any]:
+    body = {"memory_id": str(uuid4()), "audio_url": "s3://bucket/audio/x.webm"}
+    return {
+        "messageId": message_id,
+        "receiptHandle": f"handle-{message_id}",
+        "body": json.dumps(body),
+    }
+
+
+@pytest.fixture
+def tracker(monkeypatch) -> _Tracker:
+    tracker = _Tracker()
+
+    class FakeProcessingService:
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            pass
+
+        async def process_memory(self, memory_id, audio_url, correlation_id) -> None:
+            tracker.in_flight += 1
+            tracker.max_in_flight = max(tracker.max_in_flight, tracker.in_flight)
+            try:
+                await asyncio.sleep(0.01)
+                if str(memory_id) in tracker.failing:
+                    raise RuntimeError("boom")
+                tracker.processed.append(str(memory_id))
+            finally:
+                tracker.in_flight -= 1
+
+    async def fake_dispose() -> None:
+        pass
+
+    class FakeSQSClient:
+        def __init__(self, settings: Any) -> None:
+            pass
+
+        async def release_messages(self, receipt_handles: List[str]) -> None:
+            tracker.released.extend(receipt_handles)
+
+    monkeypatch.setenv("REDIS_ENABLED", "false")
+    monkeypatch.setenv("WORKER_MAX_CONCURRENCY", "3")
+    # The handler imports its pipeline lazily, so patch the source modules
+    monkeypatch.setattr(
+        "app.services.processing_service.ProcessingService", FakeProcessingService
+    )
+    monkeypatch.setattr("app.clients.s3.S3Client", lambda settings: object())
+    monkeypatch.setattr("app.clients.openai.OpenAIClient", lambda settings: object())
+    monkeypatch.setattr("app.clients.sqs.SQSClient", FakeSQSClient)
+    monkeypatch.setattr(
+        "app.repositories.database._get_session_factory",
+        lambda settings=None: _FakeSession,
+    )
+    monkeypatch.setattr("app.repositories.database.dispose_engine", fake_dispose)
+    return tracker
+
+
+class TestSQSHandler:
+    def test_processes_batch_concurrently(self, tracker: _Tracker):
+        records = [_record(f"msg-{i}") for i in range(6)]
+
+        result = sqs_handler.handler({"Records": records}, _FakeContext(300_000))
+
+        assert result == {"batchItemFailures": []}
+        assert len(tracker.processed) == 6
+        assert tracker.max_in_flight == 3  # bounded by WORKER_MAX_CONCURRENCY
+
+    def test_reports_only_failed_records(self, tracker: _Tracker):
+        records = [_record(f"msg-{i}") for i in range(4)]
+        tracker.failing.add(json.loads(records[2]["body"])["memory_id"])
+
+        result = sqs_handler.handler({"Records": records}, _FakeContext(300_000))
+
+        assert result == {"batchItemFailures": [{"itemIdentifier": "msg-2"}]}
+        assert len(tracker.processed) == 3
+
+    def test_invalid_body_is_reported(self, tracker: _Tracker):
+        records = [_record("msg-ok"), {"messageId": "msg-bad", "body": "not-json"}]
+
+        result = sqs_handler.handler({"Records": records}, _FakeContext(300_000))
+
+        assert result == {"batchItemFailures": [{"itemIdentifier": "msg-bad"}]}
+
+    def test_skips_records_when_time_budget_exhausted(self, tracker: _Tracker):
+        records = [_record(f"msg-{i}") for i in range(2)]
+
+        # Less time left than the default safety margin
+        result = sqs_handler.handler({"Records": records}, _FakeContext(1_000))
+
+        assert result == {
+            "batchItemFailures": [
+                {"itemIdentifier": "msg-0"},
+                {"itemIdentifier": "msg-1"},
+            ]
+        }
+        assert tracker.processed == []
+        assert tracker.released == ["handle-msg-0", "handle-msg-1"]
+
+    def test_failed_records_are_not_released(self, tracker: _Tracker):
+        records = [_record("msg-0")]
+        tracker.failing.add(json.loads(records[0]["body"])["memory_id"])
+
+        sqs_handler.handler({"Records": records}, _FakeContext(300_000))
+
+        assert tracker.released == []
+
+    def test_empty_event(self, tracker: _Tracker):
+        assert sqs_handler.handler({}, None) == {"batchItemFailures": []}
+
+    def test_lazy_attributes_keep_module_surface(self):
+        from app.services.processing_service import ProcessingService
+
+        assert sqs_handler.ProcessingService is ProcessingService
+        with pytest.raises(AttributeError):
+            sqs_handler.does_not_exist
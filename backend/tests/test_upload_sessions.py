@@ -0,0 +1,233 @@
+"""Tests for resumable chunked uploads."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.exceptions import (
+    InvalidRequestError,
+    StatusConflictError,
+    UploadOffsetConflictError,
+    UploadSessionExpiredError,
+)
+from app.models.memory import MemoryStatus
+from app.models.upload_session import UploadSessionCreate, UploadSessionStatus
+from app.repositories.database import commit
+from app.repositories.memory_repository import MemoryRepository
+from app.repositories.upload_session_repository import UploadSessionRepository
+from app.services.memory_service import MemoryService
+from app.services.upload_session_service import (
+    MIN_CHUNK_SIZE,
+    UploadSessionService,
+    expire_sessions,
+)
+
+CHUNK = MIN_CHUNK_SIZE
+SIZE = CHUNK + 10
+
+
+@pytest.fixture
+def s3(mock_s3_client: AsyncMock) -> AsyncMock:
+    mock_s3_client.create_multipart_upload.return_value = "upload-1"
+    mock_s3_client.upload_part.side_effect = (
+        lambda key, upload_id, part_number, data: f'"etag-{part_number}"'
+    )
+    mock_s3_client.complete_multipart_upload.side_effect = (
+        lambda key, upload_id, parts: f"s3://test-bucket/{key}"
+    )
+    mock_s3_client.abort_multipart_upload.return_value = True
+    return mock_s3_client
+
+
+@pytest.fixture
+def sessions(db_session: AsyncSession) -> UploadSessionRepository:
+    return UploadSessionRepository(db_session)
+
+
+@pytest.fixture
+def service(
+    sessions: UploadSessionRepository, memory_service: MemoryService, s3: AsyncMock
+) -> UploadSessionService:
+    return UploadSessionService(sessions, memory_service, s3, chunk_size=CHUNK)
+
+
+async def _start(service: UploadSessionService):
+    return await service.create_session(
+        UploadSessionCreate(filename="long-meeting.m4a", size=SIZE)
+    )
+
+
+class TestUploadSessionService:
+    @pytest.mark.asyncio
+    async def test_chunks_resume_and_complete(
+        self,
+        db_session,
+        service: UploadSessionService,
+        memory_repository: MemoryRepository,
+        s3: AsyncMock,
+        mock_sqs_client: AsyncMock,
+    ):
+        upload = await _start(service)
+        assert (upload.offset, upload.chunk_size) == (0, CHUNK)
+
+        await service.put_chunk(upload.id, 0, b"a" * CHUNK)
+        resumed = await service.get_session(upload.id)
+        assert resumed.offset == CHUNK
+        done = await service.put_chunk(upload.id, CHUNK, b"b" * 10)
+        assert done.offset == SIZE
+
+        result = await service.complete(upload.id)
+
+        assert result.memory_id == upload.memory_id
+        assert result.status == MemoryStatus.PROCESSING
+        (key, upload_id, parts), _ = s3.complete_multipart_upload.await_args
+        assert key == f"audio/{upload.memory_id}.m4a" and upload_id == "upload-1"
+        assert parts == [
+            {"PartNumber": 1, "ETag": '"etag-1"'},
+            {"PartNumber": 2, "ETag": '"etag-2"'},
+        ]
+        await commit(db_session)
+        mock_sqs_client.send_message.assert_awaited_once()
+        memory = await memory_repository.get_by_id(upload.memory_id)
+        assert memory.audio_url == f"s3://test-bucket/{key}"
+        assert (await service.get_session(upload.id)).status == UploadSessionStatus.COMPLETED
+
+    @pytest.mark.asyncio
+    async def test_complete_is_idempotent(self, service: UploadSessionService):
+        upload = await _start(service)
+        await service.put_chunk(upload.id, 0, b"a" * CHUNK)
+        await service.put_chunk(upload.id, CHUNK, b"b" * 10)
+
+        first = await service.complete(upload.id)
+        again = await service.complete(upload.id)
+
+        assert again.memory_id == first.memory_id
+        assert again.message == "Upload already completed"
+
+    @pytest.mark.asyncio
+    async def test_chunk_must_start_at_committed_offset(
+        self, service: UploadSessionService, s3: AsyncMock
+    ):
+        upload = await _start(service)
+        await service.put_chunk(upload.id, 0, b"a" * CHUNK)
+
+        with pytest.raises(UploadOffsetConflictError):
+            await service.put_chunk(upload.id, 0, b"a" * CHUNK)
+        assert s3.upload_part.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_chunk_locks_the_session_before_uploading(
+        self, service: UploadSessionService, sessions: UploadSessionRepository, s3: AsyncMock
+    ):
+        upload = await _start(service)
+        calls = []
+        lock, upload_part = sessions.lock, s3.upload_part.side_effect
+
+        async def record_lock(session_id):
+            calls.append("lock")
+            return await lock(session_id)
+
+        def record_upload(*args):
+            calls.append("upload_part")
+            return upload_part(*args)
+
+        sessions.lock = record_lock
+        s3.upload_part.side_effect = record_upload
+        await service.put_chunk(upload.id, 0, b"a" * CHUNK)
+
+        assert calls == ["lock", "upload_part"]
+
+    @pytest.mark.asyncio
+    async def test_chunk_length_is_checked(self, service: UploadSessionService):
+        upload = await _start(service)
+
+        with pytest.raises(InvalidRequestError):
+            await service.put_chunk(upload.id, 0, b"short")
+        with pytest.raises(InvalidRequestError):
+            await service.complete(upload.id)
+
+    @pytest.mark.asyncio
+    async def test_abort_discards_parts(
+        self, service: UploadSessionService, s3: AsyncMock
+    ):
+        upload = await _start(service)
+
+        await service.abort(upload.id)
+        await service.abort(upload.id)
+
+        s3.abort_multipart_upload.assert_awaited_once()
+        with pytest.raises(UploadSessionExpiredError):
+            await service.put_chunk(upload.id, 0, b"a" * CHUNK)
+
+    @pytest.mark.asyncio
+    async def test_completed_session_cannot_be_aborted(self, service: UploadSessionService):
+        upload = await _start(service)
+        await service.put_chunk(upload.id, 0, b"a" * CHUNK)
+        await service.put_chunk(upload.id, CHUNK, b"b" * 10)
+        await service.complete(upload.id)
+
+        with pytest.raises(StatusConflictError):
+            await service.abort(upload.id)
+
+    @pytest.mark.asyncio
+    async def test_expired_sessions_are_reaped(
+        self,
+        sessions: UploadSessionRepository,
+        memory_service: MemoryService,
+        s3: AsyncMock,
+    ):
+        service = UploadSessionService(
+            sessions, memory_service, s3, chunk_size=CHUNK, ttl_seconds=-1
+        )
+        stale = await _start(service)
+        fresh = await UploadSessionService(
+            sessions, memory_service, s3, chunk_size=CHUNK
+        ).create_session(UploadSessionCreate(filename="b.m4a", size=10))
+
+        with pytest.raises(UploadSessionExpiredError):
+            await service.put_chunk(stale.id, 0, b"a" * CHUNK)
+        assert await expire_sessions(sessions, s3) == 1
+        assert await expire_sessions(sessions, s3) == 0
+
+        s3.abort_multipart_upload.assert_awaited_once()
+        assert (await service.get_session(stale.id)).status == UploadSessionStatus.EXPIRED
+        assert (await service.get_session(fresh.id)).status == UploadSessionStatus.OPEN
+
+    def test_chunk_size_below_s3_minimum_is_rejected(
+        self, sessions, memory_service, s3
+    ):
+        with pytest.raises(ValueError):
+            UploadSessionService(sessions, memory_service, s3, chunk_size=1024)
+
+
+class TestUploadSessionEndpoints:
+    @pytest.mark.asyncio
+    async def test_single_chunk_upload(self, async_client: AsyncClient, s3: AsyncMock):
+        created = await async_client.post(
+            "/upload/sessions", json={"filename": "note.webm", "size": 5}
+        )
+        assert created.status_code == 201
+        session_id = created.json()["id"]
+
+        conflict = await async_client.put(
+            f"/upload/sessions/{session_id}", params={"offset": 3}, content=b"hello"
+        )
+        assert conflict.status_code == 409
+
+        put = await async_client.put(
+            f"/upload/sessions/{session_id}", params={"offset": 0}, content=b"hello"
+        )
+        assert put.json()["offset"] == 5
+
+        completed = await async_client.post(f"/upload/sessions/{session_id}/complete")
+        assert completed.status_code == 200
+        assert completed.json()["memory_id"] == created.json()["memory_id"]
+
+    @pytest.mark.asyncio
+    async def test_unknown_session_returns_404(self, async_client: AsyncClient):
+        response = await async_client.get(
+            "/upload/sessions/00000000-0000-0000-0000-000000000000"
+        )
+        assert response.status_code == 404
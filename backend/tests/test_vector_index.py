@@ -0,0 +1,122 @@
+"""Tests for the NumPy vector index and the embedding providers."""
+
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from app.services.embeddings import (
+    HashingEmbeddingProvider,
+    memory_embedding_text,
+    pack_vector,
+)
+from app.utils.vector_index import VectorIndex
+
+
+def _unit(rows: int, dimensions: int, seed: int = 0) -> np.ndarray:
+    vectors = np.random.default_rng(seed).standard_normal((rows, dimensions))
+    return (vectors / np.linalg.norm(vectors, axis=1, keepdims=True)).astype(np.float32)
+
+
+class TestVectorIndex:
+    def test_search_returns_best_first(self):
+        index = VectorIndex(8)
+        ids = [uuid4() for _ in range(20)]
+        vectors = _unit(20, 8)
+        index.upsert(ids, vectors)
+
+        hits = index.search(vectors[7], k=3)
+
+        assert hits[0][0] == ids[7]
+        assert hits[0][1] == pytest.approx(1.0, abs=1e-5)
+        assert [score for _, score in hits] == sorted(
+            (score for _, score in hits), reverse=True
+        )
+
+    def test_upsert_replaces_and_remove_drops(self):
+        index = VectorIndex(4)
+        a, b = uuid4(), uuid4()
+        index.upsert([a, b], np.eye(4, dtype=np.float32)[:2])
+        index.upsert([a], np.eye(4, dtype=np.float32)[2:3])
+        index.remove([b, uuid4()])
+
+        assert len(index) == 1 and b not in index
+        assert index.dead_rows == 2
+        assert index.search([0, 0, 1, 0], k=5) == [(a, pytest.approx(1.0))]
+
+    def test_save_and_load_round_trip(self, tmp_path):
+        index = VectorIndex(16)
+        ids = [uuid4() for _ in range(50)]
+        vectors = _unit(50, 16, seed=1)
+        index.upsert(ids, vectors)
+        index.remove(ids[:10])
+        index.save(tmp_path, {"position": "p"})
+
+        loaded, meta = VectorIndex.load(tmp_path, 16)
+
+        assert meta["position"] == "p"
+        assert isinstance(loaded._base, np.memmap)
+        assert len(loaded) == 40 and loaded.dead_rows == 0
+        assert loaded.search(vectors[25], k=1)[0][0] == ids[25]
+
+        # The loaded base stays read-only; changes go to the append segment
+        loaded.upsert([ids[25]], vectors[:1])
+        assert loaded.search(vectors[0], k=1)[0][0] == ids[25]
+
+    def test_load_rejects_missing_or_mismatched_index(self, tmp_path):
+        assert VectorIndex.load(tmp_path, 8) is None
+        VectorIndex(8).save(tmp_path)
+        assert VectorIndex.load(tmp_path, 16) is None
+        assert len(VectorIndex.load(tmp_path, 8)[0]) == 0
+
+
+    def test_save_replaces_the_previous_generation(self, tmp_path):
+        index = VectorIndex(4)
+        index.upsert([uuid4()], np.eye(4, dtype=np.float32)[:1])
+        first = index.save(tmp_path)
+        index.upsert([uuid4()], np.eye(4, dtype=np.float32)[1:2])
+        second = index.save(tmp_path)
+
+        loaded, meta = VectorIndex.load(tmp_path, 4)
+        assert meta["generation"] == second != first
+        assert len(loaded) == 2
+        assert sorted(path.name for path in tmp_path.glob("*.npy")) == [
+            f"ids-{second}.npy", f"vectors-{second}.npy"
+        ]
+
+    def test_load_rejects_ids_that_fail_the_checksum(self, tmp_path):
+        index = VectorIndex(4)
+        index.upsert([uuid4()], np.eye(4, dtype=np.float32)[:1])
+        generation = index.save(tmp_path)
+        np.save(tmp_path / f"ids-{generation}.npy", np.zeros((1, 16), dtype=np.uint8))
+
+        assert VectorIndex.load(tmp_path, 4) is None
+
+class TestEmbeddings:
+    @pytest.mark.asyncio
+    async def test_hashing_provider_is_deterministic_and_normalized(self):
+        provider = HashingEmbeddingProvider(64)
+        [first, second] = await provider.embed(["budget review", "budget review"])
+
+        assert first == second
+        assert sum(value * value for value in first) == pytest.approx(1.0)
+
+    @pytest.mark.asyncio
+    async def test_hashing_provider_ranks_shared_vocabulary_higher(self):
+        provider = HashingEmbeddingProvider(256)
+        query, near, far = await provider.embed(
+            [
+                "quarterly budget review",
+                "we reviewed the quarterly budget numbers",
+                "lunch order for the offsite",
+            ]
+        )
+        assert np.dot(query, near) > np.dot(query, far)
+
+    def test_pack_vector_is_little_endian_float32(self):
+        packed = pack_vector([1.0, -0.5])
+        assert np.frombuffer(packed, dtype="<f4").tolist() == [1.0, -0.5]
+
+    def test_embedding_text_uses_transcript_only_without_summary(self):
+        assert memory_embedding_text(summary="S", transcript="T") == "S"
+        assert memory_embedding_text(title="A", transcript="T") == "A\nT"
@@ -38,6 +38,7 @@ resource "aws_iam_role_policy" "lambda_permissions" {
         Action = [
           "sqs:ReceiveMessage",
           "sqs:DeleteMessage",
+          "sqs:ChangeMessageVisibility",
           "sqs:GetQueueAttributes"
         ]
         Resource = aws_sqs_queue.processing.arn
@@ -101,7 +102,8 @@ resource "aws_iam_role_policy" "ec2_api_permissions" {
         Effect = "Allow"
         Action = [
           "s3:PutObject",
-          "s3:GetObject"
+          "s3:GetObject",
+          "s3:DeleteObject"
         ]
         Resource = "${aws_s3_bucket.audio.arn}/*"
       },
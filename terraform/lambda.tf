@@ -1,3 +1,9 @@
+locals {
+  # Records processed at once per invocation; also the SQS batch size, so
+  # every record of a batch starts immediately with the full time budget
+  worker_max_concurrency = 5
+}
+
 resource "aws_lambda_function" "sqs_processor" {
   function_name = "${var.app_name}-sqs-processor"
   role          = aws_iam_role.lambda_execution.arn
@@ -21,9 +27,15 @@ resource "aws_lambda_function" "sqs_processor" {
       DB_USER          = "postgres"
       DB_PASSWORD      = var.db_password
       S3_BUCKET_NAME   = aws_s3_bucket.audio.id
+      SQS_QUEUE_URL    = aws_sqs_queue.processing.url
       OPENAI_API_KEY   = var.openai_api_key
+      # Keep in step with the API (ssm.tf): with Redis enabled the worker
+      # drops the API's cached responses when a memory changes
       REDIS_ENABLED    = "false"
       ENVIRONMENT      = "production"
+
+      WORKER_MAX_CONCURRENCY     = tostring(local.worker_max_concurrency)
+      WORKER_TIME_MARGIN_SECONDS = "15"
     }
   }
 
@@ -41,7 +53,10 @@ resource "aws_lambda_function" "sqs_processor" {
 resource "aws_lambda_event_source_mapping" "sqs_trigger" {
   event_source_arn = aws_sqs_queue.processing.arn
   function_name    = aws_lambda_function.sqs_processor.arn
-  batch_size       = 1
+  batch_size       = local.worker_max_concurrency
+
+  # Wait briefly to fill batches; records are processed concurrently
+  maximum_batching_window_in_seconds = 5
 
   function_response_types = ["ReportBatchItemFailures"]
 
@@ -34,6 +34,18 @@ resource "aws_s3_bucket_lifecycle_configuration" "audio" {
       days = 90
     }
   }
+
+  # Backstop for resumable uploads the API's reaper could not abort
+  rule {
+    id     = "abort-incomplete-multipart-uploads"
+    status = "Enabled"
+
+    filter {}
+
+    abort_incomplete_multipart_upload {
+      days_after_initiation = 7
+    }
+  }
 }
 
 resource "aws_s3_bucket_versioning" "audio" {
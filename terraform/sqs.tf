@@ -10,7 +10,7 @@ resource "aws_sqs_queue" "processing_dlq" {
 
 resource "aws_sqs_queue" "processing" {
   name                       = "${var.app_name}-processing"
-  visibility_timeout_seconds = 300
+  visibility_timeout_seconds = 1800    # 6x Lambda timeout (AWS guidance for batched triggers)
   message_retention_seconds  = 345600  # 4 days
   receive_wait_time_seconds  = 20      # Long polling
 
@@ -7,7 +7,7 @@ import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
 import { StatusBadge } from "@/components/ui/status-badge";
 import { ProgressIndicator } from "@/components/ui/progress-indicator";
 import { Button } from "@/components/ui/button";
-import { MemoryResponse, MemoryStatus } from "@/types/memory";
+import { MemoryListItem, MemoryStatus } from "@/types/memory";
 import { retryMemoryProcessing, deleteMemory } from "@/lib/api";
 import { RefreshCw, Trash2 } from "lucide-react";
 
@@ -27,7 +27,7 @@ function formatDuration(seconds: number): string {
   return mins > 0 ? `${mins}m ${secs}s` : `${secs}s`;
 }
 
-export function MemoryCard({ memory }: { memory: MemoryResponse }) {
+export function MemoryCard({ memory }: { memory: MemoryListItem }) {
   const queryClient = useQueryClient();
   const router = useRouter();
   const title = memory.title || "Untitled Memory";
@@ -60,7 +60,7 @@ export function MemoryCard({ memory }: { memory: MemoryResponse }) {
           if (!old) return old;
           return {
             ...old,
-            items: old.items.filter((m: MemoryResponse) => m.id !== memory.id),
+            items: old.items.filter((m: MemoryListItem) => m.id !== memory.id),
             total: old.total - 1,
           };
         }
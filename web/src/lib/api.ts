@@ -41,6 +41,8 @@ export async function getMemories(params?: {
   if (params?.page_size) searchParams.set("page_size", String(params.page_size));
   if (params?.search) searchParams.set("search", params.search);
   if (params?.status) searchParams.set("status", params.status);
+  // List items omit heavy fields by default; the card shows the key point count
+  searchParams.set("include", "key_points");
 
   const query = searchParams.toString();
   return fetchApi<MemoryListResponse>(`/memories${query ? `?${query}` : ""}`);
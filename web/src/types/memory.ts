@@ -19,10 +19,18 @@ export interface MemoryResponse {
   updated_at: string;
 }
 
+// List rows omit heavy fields unless requested with `include=`
+export type MemoryListItem = Omit<
+  MemoryResponse,
+  "transcript" | "key_points" | "action_items"
+> &
+  Partial<Pick<MemoryResponse, "transcript" | "key_points" | "action_items">>;
+
 export interface MemoryListResponse {
-  items: MemoryResponse[];
+  items: MemoryListItem[];
   total: number;
   page: number;
   page_size: number;
   has_next: boolean;
+  next_cursor?: string | null;
 }